@@ -0,0 +1,92 @@
+/*
+The scalar multiplication backends that `crypto_scalarmult` and
+`crypto_scalarmult_base` dispatch to (see dispatch.c), and the fallbacks of the
+other entry points on CPUs without AVX2
+*/
+
+#ifndef CURVE13318_BACKEND_H_
+#define CURVE13318_BACKEND_H_
+
+#define crypto_scalarmult_avx2 crypto_scalarmult_curve13318_avx2_scalarmult_avx2
+#define crypto_scalarmult_base_avx2 crypto_scalarmult_curve13318_avx2_scalarmult_base_avx2
+#define crypto_scalarmult_fe51 crypto_scalarmult_curve13318_avx2_scalarmult_fe51
+#define crypto_scalarmult_fe51_affine crypto_scalarmult_curve13318_avx2_scalarmult_fe51_affine
+#define crypto_scalarmult_portable crypto_scalarmult_curve13318_avx2_scalarmult_portable
+#define backend_has_avx2 crypto_scalarmult_curve13318_avx2_backend_has_avx2
+#define generic_projective crypto_scalarmult_curve13318_avx2_generic_projective
+#define generic_base_projective crypto_scalarmult_curve13318_avx2_generic_base_projective
+#define generic_compressed crypto_scalarmult_curve13318_avx2_generic_compressed
+#define generic_ecdh crypto_scalarmult_curve13318_avx2_generic_ecdh
+#define generic_ecdh_compressed crypto_scalarmult_curve13318_avx2_generic_ecdh_compressed
+#define generic_batch crypto_scalarmult_curve13318_avx2_generic_batch
+#define generic_windowed crypto_scalarmult_curve13318_avx2_generic_windowed
+#define generic_double crypto_scalarmult_curve13318_avx2_generic_double
+#define generic_multi crypto_scalarmult_curve13318_avx2_generic_multi
+
+#include <inttypes.h>
+#include <stddef.h>
+
+/*
+The AVX2 ladder and the fixed-base comb, see scalarmult.c. These need a CPU
+that supports AVX2.
+*/
+int crypto_scalarmult_avx2(uint8_t *out, const uint8_t *k, const uint8_t *p);
+int crypto_scalarmult_base_avx2(uint8_t *out, const uint8_t *k);
+
+/*
+The same ladder on top of the amd64-51 field arithmetic (fe51_*.S), which only
+needs baseline x86-64 instructions
+*/
+int crypto_scalarmult_fe51(uint8_t *out, const uint8_t *k, const uint8_t *p);
+
+/*
+Same as `crypto_scalarmult_fe51`, but with the lookup table in affine
+coordinates and mixed additions in the ladder
+*/
+int crypto_scalarmult_fe51_affine(uint8_t *out, const uint8_t *k, const uint8_t *p);
+
+/*
+The same ladder in plain C (fe51_portable.c)
+*/
+int crypto_scalarmult_portable(uint8_t *out, const uint8_t *k, const uint8_t *p);
+
+/*
+Return 1 if the CPU supports AVX2, 0 otherwise
+
+Only the files in AVX2_SRCS (see the Makefile) are compiled for Haswell. Every
+public function in those files must call this function before it runs any
+other code, and otherwise hand the call to one of the `generic_*` functions
+below (or fail). Their compiler may use AVX2, BMI2 or MOVBE anywhere.
+*/
+int backend_has_avx2(void);
+
+/*
+Fallbacks for the AVX2-only entry points, see scalarmult_generic.c
+
+These compute the same results as the functions that they replace, from
+`crypto_scalarmult` and `crypto_scalarmult_base`. So they run on the backend
+that was selected by dispatch.c. The projective outputs are normalized to
+Z = 1 (or Z = 0 for the point at infinity).
+*/
+int generic_projective(uint8_t *out, const uint8_t *k, const uint8_t *p);
+int generic_base_projective(uint8_t *out, const uint8_t *k);
+int generic_compressed(uint8_t *out, const uint8_t *k, const uint8_t *p);
+int generic_ecdh(uint8_t *out, const uint8_t *k, const uint8_t *p);
+int generic_ecdh_compressed(uint8_t *out, const uint8_t *k, const uint8_t *p);
+int generic_batch(uint8_t *out, const uint8_t *k, const uint8_t *p, size_t n);
+int generic_windowed(uint8_t *out, const uint8_t *k, const uint8_t *p, unsigned int width);
+
+/*
+Compute k * p + l * q, to the 64-byte encoding or to a projective point if
+`projective` is nonzero
+*/
+int generic_double(uint8_t *out, const uint8_t *k, const uint8_t *p,
+                   const uint8_t *l, const uint8_t *q, int projective);
+
+/*
+Compute sum(k[i] * p[i]), to the 64-byte encoding or to a projective point if
+`projective` is nonzero
+*/
+int generic_multi(uint8_t *out, const uint8_t *k, const uint8_t *p, size_t n, int projective);
+
+#endif // CURVE13318_BACKEND_H_
@@ -0,0 +1,5017 @@
+/*
+Precomputed comb table for fixed-base scalar multiplication
+
+This file is generated by gen_base_table.py. Do not edit.
+*/
+
+#include "base_table.h"
+
+__attribute__((aligned(32)))
+const ge_opt base_table[51][16] = {
+    /* 32^50 * G */ {
+        {
+            0x0BAF4E6, 0x1EEC9A1, 0x2631457, 0x003A9FD, 0x0B91F38, 0x0DB43BB, 0x1EDA922, 0x0AF9B00,
+            0x1852130, 0x011E6FB, 0x2402620, 0x1AEEEE1, 0x2FDDCD8, 0x0E29276, 0x27AD2B1, 0x0CA66AC,
+            0x12CE81E, 0x01531BF, 0x34EE1B1, 0x13E3294, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x22A03B0, 0x1E967EA, 0x122CF92, 0x1D4CEE1, 0x1B4F679, 0x1E48604, 0x17773FF, 0x00B394B,
+            0x213CDF0, 0x1E01125, 0x31E24F3, 0x1E6C1F3, 0x00F5C17, 0x1533F70, 0x1E77733, 0x122003A,
+            0x1CDA071, 0x005231E, 0x0F00677, 0x1331D20, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1A96CD7, 0x16BBA16, 0x1B13C0B, 0x02CA1F7, 0x2BFBCAB, 0x17C349B, 0x2BA02A4, 0x06E6B20,
+            0x0F7EF34, 0x1895C94, 0x1554E5F, 0x07916BE, 0x117FF2E, 0x1BE5FBC, 0x315CC72, 0x1467DEF,
+            0x1496496, 0x1366D52, 0x1AF5E15, 0x1A68E0B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x11192E1, 0x08DD973, 0x15A1FD4, 0x10495F5, 0x0E1576A, 0x19C3955, 0x26853B8, 0x063185E,
+            0x3C6B44A, 0x039547D, 0x3FEA424, 0x0659115, 0x1CBCB7A, 0x0836CDC, 0x2DB7609, 0x140309E,
+            0x1E2E34E, 0x0D13F82, 0x0A99D93, 0x093F967, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x037920B, 0x0CA3974, 0x19DE250, 0x18C07CD, 0x3925A85, 0x07440F9, 0x25AB2F0, 0x13A9F5E,
+            0x1ABC3AC, 0x0C7CEB0, 0x0D7A265, 0x094E97C, 0x0025BE8, 0x1C45D3E, 0x0FAB71F, 0x02ED1F8,
+            0x2616390, 0x188F99E, 0x225E933, 0x1A63256, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1AA29B9, 0x0813A70, 0x138C1AE, 0x182FF9A, 0x114DD6C, 0x15CFD49, 0x17C590F, 0x0800DBE,
+            0x0A1FA50, 0x0BAD09E, 0x39AE5B9, 0x00A5049, 0x0B20D9B, 0x046A39F, 0x2D61B6A, 0x0084321,
+            0x0ADD6D7, 0x12754B3, 0x2C5CEDA, 0x183A83A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x06767C7, 0x0936582, 0x3264CB4, 0x0DA2DBA, 0x1AD3CB4, 0x00FEE39, 0x0D38B6F, 0x1022C79,
+            0x3CD8B23, 0x170FF4B, 0x21A637D, 0x04D3390, 0x2F56C44, 0x035EF87, 0x3B25284, 0x19510D8,
+            0x1922777, 0x1E0FA57, 0x2BF13F2, 0x0DC4FA0, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1738A46, 0x1FF6B14, 0x151366C, 0x023CC96, 0x3398749, 0x02051F0, 0x10E9ACE, 0x01F2015,
+            0x133E440, 0x0574B7F, 0x0BA1AF0, 0x0A49897, 0x1FFFCAB, 0x13DFBBA, 0x29B6B2A, 0x0311C58,
+            0x3D1311B, 0x1340419, 0x2C6C86D, 0x087101C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x26967F1, 0x137D129, 0x25DF782, 0x04224B1, 0x1162D9B, 0x1953FBE, 0x3191D67, 0x1F9C1AA,
+            0x0037CBE, 0x02FB71A, 0x0593C6E, 0x0F47CA3, 0x2B6DAE2, 0x0C9A615, 0x15DA8F8, 0x007898C,
+            0x111533D, 0x1DE44DA, 0x30B1A30, 0x185ABD9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2FF3DA3, 0x1C1CF11, 0x2BF71C8, 0x18C7144, 0x1C4BBEA, 0x14037F8, 0x16C3A3C, 0x112A039,
+            0x373F4A9, 0x1BDF10F, 0x3F14662, 0x0844849, 0x3398AA0, 0x1F6B0D2, 0x18F759C, 0x099F34E,
+            0x3DB2261, 0x0E5BC6D, 0x22D941E, 0x0113771, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x02CA485, 0x13AC432, 0x153D68A, 0x0CC74A1, 0x0DB618F, 0x027B12D, 0x299D590, 0x1EE800D,
+            0x3F0543D, 0x025FB66, 0x0C494F5, 0x0C2BFAD, 0x3DF7E19, 0x19C4537, 0x0BE3D2A, 0x01C58EF,
+            0x214BF20, 0x0CE8AB9, 0x354C265, 0x1F8DDB1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x359887D, 0x063CA5C, 0x038286F, 0x093128B, 0x0B10951, 0x0DEFF18, 0x27DEAEC, 0x026EFDD,
+            0x3877C4D, 0x078E3A2, 0x00F49AA, 0x14F610F, 0x0504FF2, 0x0020FC6, 0x34BC452, 0x027D4E2,
+            0x1F3DDDD, 0x012A891, 0x20A5A54, 0x1DE59CD, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x04C150F, 0x0583C00, 0x0A673BF, 0x1538D39, 0x1E8C388, 0x19AD20F, 0x1CDCE4F, 0x0B78DB1,
+            0x3665DB9, 0x0446085, 0x2329AA1, 0x0E70E7A, 0x20E894E, 0x123BB8D, 0x247563C, 0x00924AC,
+            0x33E06F9, 0x12B4E89, 0x3C64C70, 0x19DA78C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1B64589, 0x194D599, 0x37421F8, 0x0688468, 0x07F8049, 0x0173577, 0x2DC7D7E, 0x0F721A4,
+            0x24B5FFF, 0x1B770BB, 0x08D39D3, 0x1849B8E, 0x1A6A3E3, 0x044EF26, 0x192372B, 0x0A16049,
+            0x0607FAF, 0x0CD8D85, 0x148DBD1, 0x1B94213, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x26115C6, 0x144FA2C, 0x126CD78, 0x04479C6, 0x30266F9, 0x14808F2, 0x2E4BB66, 0x10FE104,
+            0x0A3C95B, 0x08B1945, 0x2FD81DA, 0x0E5CEE1, 0x2390E5E, 0x186054C, 0x1D113EC, 0x080FA57,
+            0x323CB91, 0x1152C36, 0x0B06765, 0x1EC8DF0, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1EF11CF, 0x1F57086, 0x219F6EC, 0x0ED43D2, 0x1F22B84, 0x05BDA40, 0x1C13BC0, 0x1C7703C,
+            0x213C8CC, 0x0265F47, 0x365FC2D, 0x0C75A43, 0x3AA72F6, 0x0F90010, 0x3FA77D0, 0x0E842F1,
+            0x0B03560, 0x16E1CD3, 0x1E410D7, 0x0C75968, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^49 * G */ {
+        {
+            0x3CDAF4E, 0x1B44669, 0x2D30169, 0x0FBAB26, 0x222D353, 0x1AE50CA, 0x25FAE44, 0x1D4E980,
+            0x09AAE05, 0x1332E15, 0x09DDEF1, 0x011684C, 0x3E00F6A, 0x1D7368A, 0x1802D71, 0x05ADA45,
+            0x3034294, 0x00E1659, 0x3D88E7F, 0x03E4E7F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x01EFA54, 0x1ED50E5, 0x3E35CCC, 0x1DC2CDB, 0x31D1B68, 0x1BE8A13, 0x2863D68, 0x108E2D9,
+            0x0F51DF0, 0x1A29BAE, 0x1126E95, 0x1EB7248, 0x0CEF13E, 0x0664FCC, 0x16CE67A, 0x01FBE8F,
+            0x0DCF7DC, 0x1E92930, 0x22C5537, 0x1077DA5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x282B714, 0x1553C6E, 0x04EC5B5, 0x10F9DB5, 0x1A24FF6, 0x1BAC20A, 0x329A2AD, 0x1B32FB7,
+            0x3EE7CCD, 0x1952169, 0x1BC8B15, 0x00392B5, 0x00D6776, 0x06E21D6, 0x12F5FD6, 0x0DF988A,
+            0x009CBB1, 0x16B0312, 0x01C7E24, 0x18ADB34, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3A344BD, 0x0E80970, 0x010DD64, 0x038C4D8, 0x0D1868B, 0x19453F3, 0x2F480A1, 0x1EC1B25,
+            0x1793F5E, 0x171996F, 0x3E3D945, 0x17FAE74, 0x2471C61, 0x1BA50F1, 0x1CB990D, 0x1EA8A96,
+            0x1A3170A, 0x1541280, 0x3C7BC1C, 0x1D422EF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x109E718, 0x1F88D27, 0x0DE2B60, 0x13C0C0B, 0x00149C9, 0x008B621, 0x39B90D0, 0x0615213,
+            0x2748D1C, 0x0B93B42, 0x07F8C8E, 0x01CFD64, 0x042E49D, 0x0506033, 0x2423662, 0x1382CD7,
+            0x3466D15, 0x1790AFE, 0x11A8317, 0x0B9311D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x081C994, 0x18F0E3E, 0x16D6B97, 0x0C06552, 0x369070E, 0x00E52C6, 0x26DC58D, 0x0CF1686,
+            0x225B4B4, 0x08A273C, 0x00D73EF, 0x102F05A, 0x0D9AF82, 0x1C1FCFD, 0x1229424, 0x177CC90,
+            0x2BADD46, 0x157E5EB, 0x11DCC8A, 0x129301B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x122AB2F, 0x1DF2F9B, 0x1E67DFC, 0x1DCBBA3, 0x0BE837F, 0x044EBC9, 0x1DB96C8, 0x0D5C2AB,
+            0x13ECF57, 0x1F5A633, 0x2A971D8, 0x08FC232, 0x276EC29, 0x1C58D67, 0x26F309F, 0x0A8C206,
+            0x085505A, 0x0E981E5, 0x0FA584F, 0x07EB61F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x17F42BE, 0x0DE29AD, 0x21088DB, 0x181E56C, 0x021EE02, 0x12C55CC, 0x3DC9D3D, 0x131F04C,
+            0x17EF9FD, 0x0C4EE52, 0x1BCD1E8, 0x1B8518E, 0x3518701, 0x1F836E7, 0x0DF0142, 0x185CA86,
+            0x0FD6B2D, 0x1127BE4, 0x13FEEC8, 0x0C0C9E1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x02CF3AC, 0x071B6AE, 0x26E87BB, 0x0DD557E, 0x33A017E, 0x0BB9B26, 0x33D1441, 0x0C6C009,
+            0x1C2DD9F, 0x019307D, 0x1F25D26, 0x154485C, 0x1F82DE0, 0x146DFB1, 0x18CD957, 0x162425B,
+            0x13C833B, 0x1040BCE, 0x3889EF3, 0x011B433, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3A128DE, 0x0C2A8E8, 0x186454F, 0x0D5A373, 0x13A576B, 0x1AE8038, 0x194ADB7, 0x0D6DFA6,
+            0x2C76D88, 0x0664809, 0x1A85C6E, 0x0205D4D, 0x22F81E8, 0x048A5D7, 0x0BD7392, 0x0D720D9,
+            0x221268E, 0x1C808AD, 0x0115CBA, 0x1B1EA43, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2DE4578, 0x1640215, 0x25BE104, 0x0A73E71, 0x19F473F, 0x1CE51D3, 0x1B5F221, 0x07180C3,
+            0x2007086, 0x02F55EC, 0x2014E4A, 0x05A84DF, 0x10C9E39, 0x1B780A9, 0x3D2A515, 0x1A27DC6,
+            0x3E2B085, 0x0449C7A, 0x339CE4E, 0x1D4D7C5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1BAE53E, 0x05EDE66, 0x005A352, 0x0FEE5D6, 0x02D10CA, 0x09E437B, 0x2C14F17, 0x1825FF5,
+            0x025572E, 0x0A3D9D0, 0x3AD488C, 0x10E7ECD, 0x3D6B843, 0x1EC2F2A, 0x3E8C3F5, 0x11ECCAB,
+            0x2BD79D5, 0x0623C19, 0x31C6B10, 0x1394D51, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0DEFEE0, 0x0569871, 0x2B688A8, 0x0287250, 0x232A31D, 0x001F009, 0x349D07D, 0x008D3DF,
+            0x2B545D0, 0x0BCE132, 0x21F60DF, 0x0166BD1, 0x28A31A8, 0x1AE71EA, 0x11C6723, 0x1169D3B,
+            0x26843C6, 0x01ECCE6, 0x316D49F, 0x1AD0101, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3015023, 0x09CDDCF, 0x322187F, 0x0EEAEAA, 0x228A97B, 0x158BA36, 0x01BB046, 0x1A941A7,
+            0x3EFEF48, 0x0B3A3B9, 0x1296171, 0x0F61EC9, 0x0861DD4, 0x1104473, 0x25722DA, 0x0C7FC1F,
+            0x1C6800B, 0x04CC6D9, 0x1E75D62, 0x01E0241, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x349F362, 0x136B032, 0x1536D36, 0x05B1FF1, 0x1599D03, 0x19D4A0C, 0x09671D6, 0x0C5F4B1,
+            0x217EF35, 0x01709CC, 0x14BFC27, 0x12C6A61, 0x186B5D5, 0x1CB60B8, 0x24E8284, 0x1F9C244,
+            0x03A191E, 0x0BBB9AB, 0x35A2569, 0x15C3156, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x109ADF4, 0x1CA31F9, 0x3D199D7, 0x0FAA1DC, 0x1A43F27, 0x1FC9A80, 0x0AE9817, 0x0F62BD6,
+            0x24AA718, 0x18661CF, 0x1C0C1A4, 0x1262035, 0x2BCE2EE, 0x1FA64EF, 0x0C0E14B, 0x0BA5B69,
+            0x285F81F, 0x08E7576, 0x2EE6F8C, 0x11B489D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^48 * G */ {
+        {
+            0x3028AB5, 0x08CAA04, 0x16C9D86, 0x18D0E60, 0x2783A88, 0x1AA31F4, 0x1284B87, 0x106FF17,
+            0x2F8FFEA, 0x041AEE6, 0x35E52E8, 0x181D5B3, 0x13F8EEC, 0x106F595, 0x1A264A3, 0x08D8281,
+            0x2EF535A, 0x09A1FCC, 0x31BE27A, 0x1F66F92, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x06F5F3C, 0x0F0D3B6, 0x33C5D23, 0x0CDB347, 0x32E088F, 0x10C2DA4, 0x0B7F447, 0x10445A2,
+            0x35CFE33, 0x19AA4AD, 0x1EA3B29, 0x170E9B8, 0x3FD1280, 0x0879225, 0x2F2B225, 0x07C877D,
+            0x0E8AD2F, 0x01402A4, 0x37E622F, 0x06D8658, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2A09B82, 0x033C998, 0x0732EEE, 0x022840B, 0x21133B2, 0x11EA855, 0x0D7BE2E, 0x18DAB45,
+            0x08D849D, 0x171A5E7, 0x137ACC3, 0x06D8AE6, 0x1FB3A16, 0x1DF18A8, 0x3104599, 0x0267DFE,
+            0x25D54E8, 0x14CF224, 0x0549CCF, 0x03C3F79, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x25538B9, 0x0D3457D, 0x3D46BC7, 0x14022D6, 0x3D7C6C8, 0x1E2F250, 0x3137FE7, 0x095C6B7,
+            0x11263EB, 0x062E493, 0x19A4B07, 0x12D0E5F, 0x16E8D96, 0x1291922, 0x0161BC6, 0x12C8128,
+            0x327FCDD, 0x0A8F7A8, 0x05F3C31, 0x0B033B9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x298563B, 0x0AC1E97, 0x2C8C03F, 0x1FDB3E8, 0x29CCEE1, 0x07CD2B1, 0x1BE249A, 0x0854B86,
+            0x1233952, 0x02E1445, 0x2037689, 0x176A410, 0x0E9C1C3, 0x0C6C9ED, 0x017A5E0, 0x17F3B85,
+            0x02C6796, 0x024EC61, 0x09111C9, 0x1912D9B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x06CBB41, 0x0DCFCDF, 0x31069B5, 0x1D21077, 0x3A66CBF, 0x18AF9D5, 0x0607677, 0x03BD974,
+            0x063A18F, 0x1FBB389, 0x13FB282, 0x145BC21, 0x03A25CE, 0x0A75E8E, 0x1CEA92D, 0x01AE7A7,
+            0x09F57FC, 0x138A56D, 0x201E713, 0x0881FBF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1771283, 0x056DA8F, 0x1C78549, 0x082FC5E, 0x0FEBE72, 0x1532B58, 0x0B5CEFB, 0x14B8F94,
+            0x1C03B59, 0x12C58A5, 0x121C13F, 0x0FFC8CB, 0x0AB5FE6, 0x01998A9, 0x192DBE9, 0x000705A,
+            0x057308E, 0x114C2CC, 0x1560850, 0x01F1398, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3B6AA4D, 0x0D01C03, 0x03D1FA1, 0x1A33033, 0x1F3DB36, 0x1DB06F4, 0x13D09E1, 0x1D3A2A6,
+            0x2025E79, 0x15DD493, 0x16B6393, 0x0AA3FAB, 0x3BE97CD, 0x0BABA81, 0x3210407, 0x1549D39,
+            0x1DFAAEE, 0x1A02883, 0x28805ED, 0x1F49500, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2FE5BBF, 0x17464DF, 0x25C58D7, 0x0A1DD10, 0x2F1C0E8, 0x12C8B90, 0x0398A0E, 0x0ABCCB3,
+            0x0AB5B33, 0x037845B, 0x39CEFAF, 0x001FD5F, 0x17BECE5, 0x1D9F447, 0x059EEB9, 0x048F22F,
+            0x0ABF9EC, 0x0015752, 0x18A4DCC, 0x11F1EAA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x132259D, 0x1E38250, 0x20F5B12, 0x02AEA22, 0x0086B20, 0x05AE47B, 0x0392427, 0x1C64072,
+            0x34E1D9B, 0x036323F, 0x35DEEC6, 0x0DAAB6B, 0x2F3D5B9, 0x01E9390, 0x1713D7B, 0x086E8F3,
+            0x1157979, 0x0211954, 0x2E15E7E, 0x1BF965D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x246143B, 0x1E20A17, 0x079D775, 0x01CF62D, 0x1ADACFF, 0x15E0667, 0x01150F2, 0x0F3D120,
+            0x1263060, 0x097C3E3, 0x01FFB0A, 0x11AE1B1, 0x2F8B8AA, 0x05E1FCD, 0x137B19B, 0x0E585F3,
+            0x2A3BCCF, 0x0999462, 0x3FC45E0, 0x1B50D3F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1B7076A, 0x0394EBE, 0x1D7C90A, 0x13CDCD4, 0x25CD836, 0x03FF931, 0x2F0BF97, 0x1663C63,
+            0x1011935, 0x0F4522C, 0x20911CA, 0x0CC2620, 0x225AADD, 0x0CBA4E5, 0x35432B9, 0x0C7B055,
+            0x2A76EF7, 0x13C05B4, 0x2BC1E37, 0x059842C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3AF18CA, 0x0DC9CD0, 0x1D9DD2D, 0x01930F3, 0x2701183, 0x0D70BE1, 0x14E1C2C, 0x1FEC69E,
+            0x218D321, 0x0329EA3, 0x0D9FAD6, 0x19801A9, 0x00546CD, 0x1F0458E, 0x3299EFC, 0x0C086F0,
+            0x14FF5DD, 0x16F9B2D, 0x1FCCE62, 0x1F96F3D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x294F621, 0x1AE32A5, 0x1E1EB5A, 0x19782B1, 0x17DCA7F, 0x04DF390, 0x13AE9DB, 0x0109C41,
+            0x207D92C, 0x128C032, 0x07CDA1A, 0x0DAEE34, 0x32D2BD1, 0x0E876A6, 0x16D950E, 0x0368C3A,
+            0x192CC92, 0x1128DA3, 0x39D5D5C, 0x04DDC37, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1C0DCFA, 0x197F4E0, 0x3E21391, 0x1972469, 0x3BAFCC5, 0x1A3CB94, 0x3505114, 0x02D8BFB,
+            0x38ADE7B, 0x048AB00, 0x0CC7D50, 0x0D1A336, 0x067BC59, 0x17EF621, 0x0C4DAA1, 0x006A727,
+            0x058EB18, 0x0324A57, 0x0DB47DD, 0x1635168, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x27FE112, 0x0089B97, 0x30CB6DC, 0x0A116FF, 0x00FE1D1, 0x0FBCCD3, 0x02F7E5F, 0x1F8B796,
+            0x2A03B84, 0x1254011, 0x36DC2FF, 0x0AED52C, 0x28D291F, 0x0489114, 0x0616DC5, 0x1EDC3BF,
+            0x15EC03F, 0x1312295, 0x12578EA, 0x0902E5B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^47 * G */ {
+        {
+            0x1ACABA1, 0x1B2ED09, 0x22105C9, 0x165DF5B, 0x0733419, 0x1DEA518, 0x23E575D, 0x1A0213C,
+            0x0E1D3B4, 0x0DEB891, 0x082070C, 0x092C584, 0x0D59679, 0x18AEFDD, 0x2C4A3B5, 0x14502BE,
+            0x243B3EC, 0x0C8F6D1, 0x384F9C9, 0x0421F98, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x14235AC, 0x16FFAD8, 0x08BC45F, 0x191BDE8, 0x0CCB961, 0x030A037, 0x349D855, 0x1E46BBB,
+            0x1B6A3E8, 0x18E67DC, 0x296FB94, 0x1556AA9, 0x3997167, 0x1ED9394, 0x12D0495, 0x1C9C015,
+            0x38DCA8F, 0x179B91F, 0x35D2DC8, 0x12796A3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x278FE07, 0x0F0FCEA, 0x1DFCC80, 0x071EC7C, 0x12130D4, 0x1358CC4, 0x3CBC3BB, 0x08E5849,
+            0x244CECD, 0x0B87289, 0x38A661F, 0x04C40C8, 0x141C979, 0x09553BB, 0x2DA4CA3, 0x07F38C2,
+            0x3361CE7, 0x1BC0004, 0x037AADF, 0x1B68607, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1B769BC, 0x002D0A9, 0x1685B60, 0x0A6A15A, 0x065841C, 0x148313A, 0x31F4707, 0x19B9165,
+            0x130E6AF, 0x162E135, 0x2BE1721, 0x02429DA, 0x2E755F6, 0x09BDA97, 0x26C3D34, 0x0460114,
+            0x221E066, 0x0CF90CD, 0x065F703, 0x05E0A11, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x160937B, 0x06AC712, 0x2326699, 0x0A717DD, 0x36CC61D, 0x1E1D8FD, 0x1DB7719, 0x06E4CEF,
+            0x01EF075, 0x1A92923, 0x1CC5263, 0x1686E4B, 0x3E080B7, 0x106C1A0, 0x00D57E9, 0x15AF3CB,
+            0x3EB5074, 0x1ECBF64, 0x2E57711, 0x06B6391, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x25C91C4, 0x0EF7B9D, 0x1937440, 0x1C525BB, 0x0DFE11B, 0x184C055, 0x13D0BD2, 0x1985B28,
+            0x0CBE27E, 0x1A31CA4, 0x3013095, 0x0B1A893, 0x20D266F, 0x00FA051, 0x1D3459F, 0x138D099,
+            0x04C465E, 0x0F4BACD, 0x359FA8B, 0x1858162, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x22849B5, 0x075361F, 0x0EA4D18, 0x1B19E9C, 0x3867261, 0x05F210D, 0x05D2F1E, 0x1E8A10D,
+            0x28D6170, 0x0A67641, 0x0F97695, 0x090F493, 0x2FBFC36, 0x0BC2786, 0x080FA65, 0x15021AB,
+            0x278EEF2, 0x0FA3AF7, 0x1587FC1, 0x0EAF139, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0C80BE9, 0x1E82F65, 0x1E4FEBB, 0x11AF33B, 0x22E9C6F, 0x01326EE, 0x08FF04D, 0x1BED548,
+            0x3EE955F, 0x035A52F, 0x2955859, 0x094536D, 0x0740157, 0x170DE7C, 0x342F850, 0x1784CB8,
+            0x17F00B7, 0x0C00D2E, 0x3AAACCA, 0x09D67C3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x22DB900, 0x198CFF4, 0x1DEB0A9, 0x01537AE, 0x2FB405F, 0x05A2FAE, 0x29050B3, 0x0D20D71,
+            0x058BF03, 0x04D0841, 0x2A48B29, 0x00F55D0, 0x32EBEAF, 0x0668E8D, 0x2090D16, 0x1FC3269,
+            0x12D0F84, 0x1376029, 0x3E353A2, 0x0488D71, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x326E539, 0x0830DDA, 0x296D6E8, 0x1C11CC5, 0x2AEBFAF, 0x0A3F5ED, 0x32373DC, 0x08784F3,
+            0x2CBCDBE, 0x0CCC2B8, 0x0ED6787, 0x0889AA0, 0x146FD44, 0x1BA455A, 0x21317CE, 0x1937985,
+            0x0D49591, 0x12953AA, 0x322BE3E, 0x02E2E5A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3C7013D, 0x0B9A68A, 0x1C46557, 0x1558441, 0x1030CDB, 0x06F6F6E, 0x33FCE74, 0x1CE3295,
+            0x15CA60B, 0x08CFF28, 0x1D96700, 0x1A122C6, 0x09DBFEE, 0x122CD12, 0x29C65B2, 0x0C38340,
+            0x01DD661, 0x0F91ED8, 0x1E40D2B, 0x1B24823, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3A3F5D8, 0x090DAFB, 0x32DAAAF, 0x10D41EE, 0x0D8C1EB, 0x0576844, 0x2E1481A, 0x08619D0,
+            0x02DBB59, 0x0FF8632, 0x2291CC5, 0x133F2AB, 0x3D2FC81, 0x1C8EEFF, 0x37E81AF, 0x0DD6E64,
+            0x2E7D7C6, 0x1714E4F, 0x061CA7B, 0x09EF542, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x08206E9, 0x0E4466E, 0x38A938B, 0x1B784D8, 0x2420A67, 0x0068377, 0x3EA52D2, 0x187FFAB,
+            0x1C37FA4, 0x0A4F67D, 0x220FAAA, 0x07550B9, 0x2CEBE9E, 0x15B1AB6, 0x1331213, 0x1272CC5,
+            0x1436B35, 0x06A4328, 0x162A2F8, 0x18EE71C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x343DECF, 0x19A0123, 0x124B4A4, 0x194AE00, 0x37E8674, 0x1FE53B1, 0x29499B2, 0x121EC60,
+            0x2F40AD5, 0x09DB29D, 0x2AE7EA8, 0x0BC07BC, 0x299C60F, 0x0B29F1A, 0x2DE18B9, 0x1B93934,
+            0x3EDDF68, 0x1B25B6E, 0x1A6DA6D, 0x003AC68, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2F1CD31, 0x10424CA, 0x073C371, 0x0D25D04, 0x2C5BC1C, 0x177DCC9, 0x1276F83, 0x01EBE60,
+            0x06EC6E8, 0x1BFDEF6, 0x0AAA098, 0x1BF9667, 0x1C45064, 0x0F4D788, 0x3ADD5D5, 0x0F6B3D5,
+            0x3B4EA7E, 0x163ABC7, 0x3AACC18, 0x10DE221, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0AD14F9, 0x0DA26F3, 0x03106E9, 0x081E0DE, 0x3D8B006, 0x1319168, 0x37CC102, 0x16E60D1,
+            0x22D12A1, 0x16146EE, 0x0A5E714, 0x1D47276, 0x1DE8A64, 0x15021F4, 0x037BE5A, 0x0180669,
+            0x0F78B28, 0x0D6AE28, 0x226A211, 0x0136BAE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^46 * G */ {
+        {
+            0x36D75DB, 0x113725E, 0x38A1365, 0x0AF4296, 0x28A0217, 0x0C2BB78, 0x02F783E, 0x0D1D9D0,
+            0x3D30345, 0x0C41895, 0x06357F3, 0x128BC7D, 0x0D6C4F8, 0x01FB911, 0x01EE71C, 0x1415AE9,
+            0x1905BE3, 0x12E397E, 0x1BF3DDB, 0x1AEAC08, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x29F9588, 0x19472EC, 0x0F0ABD0, 0x0353B16, 0x06BAD09, 0x1E45218, 0x1B6D200, 0x0E37D9F,
+            0x162AE86, 0x1E87174, 0x3FA790B, 0x1038EE0, 0x094B06A, 0x0C2A4D9, 0x1BEA2ED, 0x0FF737C,
+            0x0A70100, 0x0EBF7CC, 0x3090705, 0x1423075, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1373EA9, 0x1A0D111, 0x229AD9F, 0x170C64D, 0x2272D52, 0x138D2EA, 0x00D79BD, 0x01B925F,
+            0x282D10A, 0x0C31DE7, 0x0639344, 0x025A574, 0x13B2C07, 0x15FDF8D, 0x04A9AE0, 0x0A0429B,
+            0x13C2DB3, 0x01C1561, 0x398F2EB, 0x00CAE3D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x03B68F6, 0x1D756B4, 0x381CC89, 0x0E991AD, 0x38EC43E, 0x15245DE, 0x1192936, 0x1260504,
+            0x3FF31B2, 0x16B21CA, 0x1D4C04D, 0x14300C4, 0x12DE857, 0x11E119F, 0x1221FAE, 0x1F957EB,
+            0x15D6F9B, 0x0043E4B, 0x3FEBA8A, 0x01FBA62, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x332DE7B, 0x07DA881, 0x1CCB6F9, 0x0CD6992, 0x19680DF, 0x140DA1C, 0x3520775, 0x091EB56,
+            0x3492840, 0x052849F, 0x2B1E766, 0x036B75A, 0x2BB2E23, 0x0FCA5A5, 0x1789951, 0x05BDF35,
+            0x2674E77, 0x14F3317, 0x3BFC53B, 0x15133CC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x056894C, 0x03F0D7A, 0x13FEE05, 0x0EE985E, 0x1904E37, 0x0C2E1D2, 0x2DF8948, 0x1CEAE52,
+            0x2D2E7E3, 0x06F3E0C, 0x1B88C75, 0x08E2FC0, 0x0536BA4, 0x03AB353, 0x067CA8C, 0x1CCEB40,
+            0x20EE00D, 0x1E9D235, 0x35F4B63, 0x054D5EE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x28B4FE1, 0x19514FC, 0x1134F73, 0x110DD86, 0x3181210, 0x04F175F, 0x0AEBF36, 0x084AB67,
+            0x05D2662, 0x19E93CF, 0x21A1D7D, 0x19F3A19, 0x38B48C7, 0x0E665F2, 0x18ECBD9, 0x078040C,
+            0x1B5C64B, 0x1982261, 0x30057A0, 0x1FF9E83, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0440372, 0x12438A7, 0x17D69ED, 0x005173C, 0x0CEDF6F, 0x03B4330, 0x2D0E5B1, 0x1205B4E,
+            0x312E487, 0x023D47D, 0x0590422, 0x1DF19FA, 0x21D395D, 0x18B6DBA, 0x037CCEC, 0x010256C,
+            0x3B3170C, 0x06709AA, 0x351000A, 0x09C4D59, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x106EEB2, 0x0F81595, 0x11C81F4, 0x19DB8D9, 0x16E0280, 0x0ED5997, 0x3AF0C3A, 0x034242D,
+            0x379693F, 0x0AD31C9, 0x0A2AF44, 0x0B76AB3, 0x19601D8, 0x1FDD885, 0x219AB91, 0x0673EA7,
+            0x394DE43, 0x02A576E, 0x268B9BC, 0x0B1F748, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3687134, 0x09242DC, 0x119DDD2, 0x0BC983E, 0x37E68BE, 0x0B8A54A, 0x247D931, 0x11E5876,
+            0x0B24FE6, 0x15A0D56, 0x2A94D89, 0x00CF346, 0x33E62F0, 0x06568AD, 0x25EE211, 0x0E50E2A,
+            0x09A7532, 0x08AA310, 0x07793BE, 0x10BB2CB, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3F71863, 0x007B35E, 0x05A666E, 0x1ACC83D, 0x0B0217B, 0x16FDB23, 0x0B7DADA, 0x13A01B0,
+            0x37A8210, 0x1FD6C00, 0x36FD0C9, 0x12E7EFA, 0x1382933, 0x1FED3FD, 0x2081E4B, 0x08780B6,
+            0x16AAF23, 0x0077362, 0x265257C, 0x1DBAC3A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0539CC2, 0x02BB612, 0x3F3ED27, 0x0834D5C, 0x3969E4C, 0x091E5F1, 0x3ABC1E4, 0x04F8DFC,
+            0x28D8724, 0x0D7836F, 0x1860E19, 0x1C0D24E, 0x17E034D, 0x07FD91B, 0x3CC2BC3, 0x00F33E8,
+            0x1A83912, 0x18066D9, 0x0972168, 0x0F20A3B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x304F7D5, 0x053FC33, 0x39D3608, 0x058D8E6, 0x261B768, 0x001F9E4, 0x234CA4D, 0x08A5A46,
+            0x2DC4342, 0x0C38E4D, 0x30F4D86, 0x1654009, 0x0649377, 0x1AD9272, 0x38E56DF, 0x0FE2E20,
+            0x162FF44, 0x16DC6FB, 0x1AF5D55, 0x1C40D9A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x109EA4E, 0x0A6C1EF, 0x317FC2B, 0x110344D, 0x233B872, 0x19809EC, 0x14EDFB2, 0x1171D39,
+            0x1560EED, 0x0394257, 0x0E28C19, 0x07460F5, 0x1499FA3, 0x0E81A34, 0x3359D43, 0x082ED77,
+            0x22B1D64, 0x1A10862, 0x11C7116, 0x03F9D00, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3F0A2FC, 0x01EAB39, 0x32EC87C, 0x0258388, 0x00C0A94, 0x0B1F7DB, 0x2BDEB7C, 0x13BD237,
+            0x0CC4800, 0x1FA1852, 0x0D87477, 0x12D031D, 0x2ADC437, 0x06B1CEA, 0x239400B, 0x0392999,
+            0x0E3B63C, 0x09A4931, 0x2339C19, 0x183E866, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2A1C7D2, 0x1B7C8A7, 0x31A4850, 0x02AB365, 0x0889585, 0x1F1A2FE, 0x33334FF, 0x10DFA92,
+            0x12F49AD, 0x0B140A6, 0x345DA64, 0x03D71ED, 0x260C79E, 0x04DBCB9, 0x382BE1C, 0x09471FE,
+            0x341A0ED, 0x1781DDB, 0x3E335E4, 0x0F5623F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^45 * G */ {
+        {
+            0x233BA38, 0x166E4C0, 0x1D66D45, 0x0DFAE03, 0x054F2E7, 0x1C025E4, 0x170A02A, 0x01BC08C,
+            0x278AC39, 0x17EF9AD, 0x37D0287, 0x174E551, 0x299FB7C, 0x19E92E8, 0x24A958F, 0x12692E6,
+            0x19F3C13, 0x01C5E37, 0x3B0224E, 0x1053287, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x24CEB7F, 0x121B132, 0x3EAE59A, 0x1E109DA, 0x29EE1A3, 0x047501F, 0x0CB9EFD, 0x0190568,
+            0x33877C3, 0x0D92563, 0x2853798, 0x10BD6AF, 0x1DF744D, 0x1CBD153, 0x32E0176, 0x0DDE525,
+            0x3BD1EE2, 0x1197090, 0x349A379, 0x1B0B73C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x12C9234, 0x05D6ECF, 0x3951388, 0x091AE83, 0x3BEADD3, 0x1DF2F13, 0x04D6642, 0x09022EA,
+            0x1DEE36D, 0x126CF61, 0x0C0550E, 0x0F40464, 0x34D0D1B, 0x165A105, 0x0170558, 0x129C087,
+            0x0B7524C, 0x0AC50B1, 0x0E2430B, 0x1A210EC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x063177F, 0x1859480, 0x297E885, 0x010B0A3, 0x0D6C9F4, 0x1B2568C, 0x0470110, 0x0C8DEB5,
+            0x1D2CC25, 0x1EEB941, 0x2590290, 0x0043FB8, 0x22AE7A6, 0x08D56E2, 0x1F18AA1, 0x10BC483,
+            0x1650F6B, 0x09D5743, 0x3B5E3A5, 0x0708DC9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2900765, 0x0DFFFDF, 0x195ACF9, 0x1BD7170, 0x0BDA42B, 0x0D3A2C3, 0x35518F3, 0x1701480,
+            0x137C2D9, 0x0E0DA19, 0x0CAAC97, 0x158B64C, 0x1DEB945, 0x1CB8D75, 0x1EF13D7, 0x11061AD,
+            0x1421EF7, 0x1B871FE, 0x1AD2027, 0x1B622BD, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x222DB29, 0x0B1BE67, 0x3CD8237, 0x1FDF6F8, 0x0B2B57B, 0x18D69F4, 0x04DC4F3, 0x0D2C489,
+            0x1B6D2DD, 0x1AE531D, 0x3EF9BF8, 0x0D8B276, 0x1E2F753, 0x08044AE, 0x1860972, 0x192AD40,
+            0x1844387, 0x1815BCC, 0x3E70CB5, 0x0B30D1C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x09E503B, 0x01A47D7, 0x33A2FD5, 0x0124755, 0x284FB38, 0x1D91D52, 0x334E484, 0x06D640E,
+            0x1880481, 0x0257565, 0x08BF630, 0x0A3841B, 0x1EEE70D, 0x0E4CB1E, 0x0D593E7, 0x1750782,
+            0x0B434BF, 0x00B7573, 0x19E9E2E, 0x1863F0B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x34E503D, 0x060569D, 0x29F835E, 0x1C05809, 0x1D21441, 0x1FEECC9, 0x0EAFE94, 0x11B446F,
+            0x275E3A2, 0x01F97D7, 0x1713AE5, 0x0E54828, 0x137D826, 0x0DDC4AB, 0x08C1F66, 0x13C70CF,
+            0x1CAD934, 0x0E6918A, 0x304FEDF, 0x04E4EC9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0E75AE5, 0x18233EC, 0x3147BF1, 0x1E4AB23, 0x248AAC9, 0x19577D7, 0x2329112, 0x1BC9A41,
+            0x1686693, 0x147BBCF, 0x2B0B427, 0x0B64D0C, 0x32ED457, 0x00FBB90, 0x39B544D, 0x16AFF91,
+            0x30EE93F, 0x17D18EE, 0x37D36DE, 0x0180AC2, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x304C637, 0x18B68C2, 0x0953966, 0x0FC0814, 0x0BF5E41, 0x04F9373, 0x128D7A8, 0x182FE3C,
+            0x17B8F6C, 0x08B111B, 0x11EA980, 0x040E18B, 0x11F34A7, 0x1636C21, 0x0D37A4E, 0x142BFF1,
+            0x353A8CB, 0x0299B3B, 0x3FB3649, 0x0EA3E9B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x345F3A3, 0x0D5715F, 0x036EFC5, 0x162D23B, 0x00E5DC9, 0x0E12E77, 0x1809B84, 0x12FC09A,
+            0x2597A6F, 0x037B9DC, 0x1FDF00D, 0x0AF8007, 0x2E3D8C5, 0x08803E2, 0x399C9DD, 0x0A4DC92,
+            0x35D022F, 0x039543B, 0x2AD7AE2, 0x0FB607B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x30FC4B5, 0x0EFF450, 0x0C600BE, 0x0AE0C53, 0x07A2F13, 0x090A556, 0x2AD1500, 0x1D8651A,
+            0x17A2087, 0x019EFD2, 0x3273DCC, 0x181D9BD, 0x02B58A0, 0x1C5F093, 0x3EB4393, 0x12C91F2,
+            0x1254E5A, 0x04A2F40, 0x21DA782, 0x12CB985, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x274472B, 0x0653F1D, 0x2DC81D7, 0x03D5353, 0x38C0B6B, 0x007B652, 0x3E78E92, 0x063051D,
+            0x30C43A5, 0x144A5EF, 0x16FF2EA, 0x0E126D8, 0x02361C0, 0x118407D, 0x330A239, 0x1D4F3E0,
+            0x1A64EDB, 0x09FB7E5, 0x0197788, 0x16E6EF7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3521194, 0x1328FCC, 0x16E69FB, 0x1022681, 0x1611DFC, 0x0052E18, 0x3FFDE58, 0x0F2E713,
+            0x34AA3F3, 0x091D392, 0x1199CB6, 0x1419ABE, 0x27B2B4D, 0x0377DF9, 0x0F0D12E, 0x0AE9187,
+            0x31F973E, 0x03A72D0, 0x32CD585, 0x1FF3E9D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3A39811, 0x06E7890, 0x024270B, 0x16556C1, 0x1027729, 0x0E1B9E8, 0x2EFE186, 0x1F17546,
+            0x063D583, 0x0996E27, 0x09CC3B6, 0x0EC8FAA, 0x329392A, 0x13EDC95, 0x2662730, 0x11F9550,
+            0x268FBAF, 0x1DD6F65, 0x315BB99, 0x00A3BF9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x06FE029, 0x1130DE6, 0x3DD93F8, 0x1FD7F0D, 0x3232DCF, 0x0387959, 0x13151F9, 0x08FA09A,
+            0x3F978DD, 0x1676CBD, 0x39B8DD7, 0x1C9711E, 0x327C3DD, 0x0486DB1, 0x0EB3979, 0x194DDA8,
+            0x047981F, 0x009188B, 0x0D3AB6D, 0x0910645, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^44 * G */ {
+        {
+            0x2C5F35E, 0x06B1D64, 0x2608C52, 0x0AA41E8, 0x0177622, 0x0214366, 0x3AC98D9, 0x0CF74CB,
+            0x14EA8C8, 0x07046D9, 0x133947C, 0x13E9F68, 0x1041129, 0x084148D, 0x21D6D1F, 0x15EA3D0,
+            0x31F7412, 0x0ABE4DA, 0x2311E70, 0x1CCC4BD, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x000910A, 0x1C4EE64, 0x0287745, 0x04991A0, 0x1D5AB6C, 0x0735C80, 0x187E409, 0x1A91C65,
+            0x18931D2, 0x1203A3B, 0x1567723, 0x1425E50, 0x0D37E0F, 0x1C62B5D, 0x2523AE3, 0x0E4C5D1,
+            0x2BD1C98, 0x1BA9F92, 0x3EA848E, 0x049EACB, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x24FAB21, 0x030F541, 0x101E0F3, 0x0A74DE4, 0x19C5C0B, 0x1779D23, 0x28F9165, 0x1C73583,
+            0x38F4CBD, 0x0C4880F, 0x2B67B15, 0x0E29481, 0x347EFAA, 0x0B73824, 0x28B7A30, 0x0F13998,
+            0x210492E, 0x1BB6283, 0x29B8DC2, 0x07B3200, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2361144, 0x153C6B1, 0x043E336, 0x0B02B5D, 0x35F76B9, 0x12DE0D6, 0x1EAFD35, 0x1AA06E1,
+            0x320EF95, 0x038B9A6, 0x0816613, 0x082B1D3, 0x0B5E315, 0x183E908, 0x2AC26B1, 0x10A12F4,
+            0x3FAF368, 0x1A50768, 0x0E5D470, 0x139F233, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2B072F8, 0x1BCC617, 0x34E015D, 0x1CF0D17, 0x1C9F0B3, 0x1FA8FD6, 0x28CEC2B, 0x09E0AEC,
+            0x3FFC118, 0x18ECFAC, 0x1A6B4FD, 0x0C93C19, 0x1664ED6, 0x06CEB77, 0x3EE7B6F, 0x025AC35,
+            0x15D36D3, 0x13C12AA, 0x0ED2F77, 0x1EA5293, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2F422E1, 0x166FD30, 0x2D7682F, 0x17D9D8F, 0x35E93A6, 0x126984A, 0x2D128AB, 0x1771243,
+            0x2C5D0B8, 0x1F91D9C, 0x373A454, 0x0A47B2A, 0x18C70C4, 0x03489C1, 0x2B8BCC6, 0x1CC2C0B,
+            0x167CB5E, 0x1B24DF0, 0x17AE627, 0x0FF562F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x39AA986, 0x02A8B54, 0x26AE8D5, 0x15FD0A2, 0x21F1067, 0x138F2CB, 0x3ECA9FB, 0x14825EC,
+            0x15B6228, 0x1F498C7, 0x3752ED1, 0x033F0A4, 0x0542D64, 0x08A5CB4, 0x2A4A559, 0x0592A25,
+            0x1D2277F, 0x01B74D2, 0x17D045C, 0x1A6ECF7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1F5989A, 0x0504E86, 0x1D4B02F, 0x015D7A7, 0x1F696EE, 0x0C15CFC, 0x1D74FFE, 0x0522E9F,
+            0x03E0EA4, 0x04126F3, 0x113C8AA, 0x1667FCD, 0x1B8700A, 0x0B07ADE, 0x0E6F4C8, 0x1AF5021,
+            0x19C8EAA, 0x01272F0, 0x258CD1B, 0x06DEA2B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x378CE89, 0x1815EAB, 0x1770E18, 0x00561D8, 0x19C1D23, 0x078A1C8, 0x29097DA, 0x092D516,
+            0x3E1248E, 0x12A9E76, 0x0D64CB5, 0x0B0A4D9, 0x3116DE7, 0x042F4DB, 0x25C7C67, 0x083AD40,
+            0x2437AFB, 0x04F182C, 0x088BB3A, 0x1A58712, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3E4C7E6, 0x1DD02AC, 0x2168D9C, 0x032423E, 0x1938F9C, 0x01F91DF, 0x37B77C5, 0x0AA1BAE,
+            0x26AEB5B, 0x0D80E92, 0x3409058, 0x0B21BCA, 0x356960B, 0x11C5EE6, 0x12C4034, 0x1425554,
+            0x0344FAC, 0x008A388, 0x26301F6, 0x1E47202, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2EDD8BE, 0x0F13D4C, 0x13EDDE3, 0x1D8C0D5, 0x0522B2A, 0x02C6BF9, 0x15A91DA, 0x0794EF3,
+            0x365AD94, 0x0BD3872, 0x180AEDD, 0x0718B3C, 0x05130AB, 0x1ABB822, 0x10A7739, 0x102F4E2,
+            0x2E2359B, 0x06E26A5, 0x13C0DC7, 0x1F18926, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2D22381, 0x1964E7F, 0x0C8C9A3, 0x02F5C7F, 0x21D42A1, 0x070EBAF, 0x1B16E9F, 0x15468D9,
+            0x3584425, 0x00CA987, 0x0EBB2D6, 0x18F54C2, 0x3996172, 0x1C0DBF4, 0x017F0F0, 0x1C64FD9,
+            0x087A0A2, 0x1BD829C, 0x082B984, 0x17C9CE2, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0EF14B5, 0x167E567, 0x327DAFA, 0x19FB66E, 0x22E499A, 0x125C43C, 0x0088497, 0x1BB8433,
+            0x397AD7B, 0x06FE6FB, 0x3D76D43, 0x00FBA11, 0x130AC49, 0x1AB4FEC, 0x28DAB62, 0x10FEEA0,
+            0x371B9B2, 0x159411E, 0x3FE0B3D, 0x0C8F87A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x375B9C7, 0x165BEBB, 0x3CA801F, 0x0C6685F, 0x01640CC, 0x1313F65, 0x18E2649, 0x03729F5,
+            0x19FC64E, 0x1645F8D, 0x29DD68B, 0x1865268, 0x154466D, 0x138D4C6, 0x293312C, 0x0314BED,
+            0x3867C12, 0x12E2FC9, 0x017C66A, 0x175F0E7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x13D3EE6, 0x11B9D7E, 0x31F08C9, 0x14A9669, 0x12614BA, 0x1004344, 0x04A93C4, 0x163982F,
+            0x20311B4, 0x0B0A2C3, 0x330E5DA, 0x1F03443, 0x1F1920A, 0x0F108FD, 0x1BFD47A, 0x13CEF7B,
+            0x10258DA, 0x0693C9F, 0x0D7806C, 0x13DFFFB, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0CD0F4E, 0x1BFC85B, 0x2AC3B88, 0x0D30D7D, 0x2EE486F, 0x09CCC9A, 0x14CE93A, 0x0A49677,
+            0x264CE8C, 0x1AA8F67, 0x24E86B0, 0x1DC6CB4, 0x3FD9381, 0x1D1D5A1, 0x37063F5, 0x0329D2E,
+            0x00E2D23, 0x14E1FE8, 0x0D6CD51, 0x12F8E76, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^43 * G */ {
+        {
+            0x1E7FCA1, 0x139FBA5, 0x2A27311, 0x08689BE, 0x20FC342, 0x09F5E35, 0x1B746E9, 0x08A3D28,
+            0x10AA7D1, 0x0B71E44, 0x2E9F057, 0x13AD871, 0x1050A69, 0x0ADD4FB, 0x18126E2, 0x043058B,
+            0x06EC660, 0x1DF88A7, 0x04D6379, 0x0678D21, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x38E157F, 0x0155E9A, 0x305FBEB, 0x107FF73, 0x2DDDFB5, 0x0EF9601, 0x03E85B5, 0x1228C87,
+            0x182A133, 0x17FF8A2, 0x03C186A, 0x006926D, 0x0CCECC7, 0x18412D4, 0x05DB47A, 0x162D7AD,
+            0x2B9554C, 0x024842C, 0x1928341, 0x07AA388, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x12CCCF8, 0x170CCD2, 0x3DB9354, 0x0666BC3, 0x30A77B7, 0x14F488C, 0x3763E0A, 0x0CAE08C,
+            0x321E2EB, 0x04D14A5, 0x305BFD3, 0x1E48EFB, 0x1899442, 0x1FDB619, 0x089A0DE, 0x0D926DE,
+            0x018DADB, 0x065E5AB, 0x308C96E, 0x0BF576A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x38C0091, 0x0BBC566, 0x285C0EC, 0x06FB104, 0x2114495, 0x0B5E71C, 0x3DA742E, 0x1650424,
+            0x202692B, 0x0205E36, 0x11BDEF5, 0x1029A3A, 0x386E554, 0x0991179, 0x19038E2, 0x1A6558F,
+            0x31A4C5B, 0x0F90DCF, 0x3D085EC, 0x0767771, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2FEA3AC, 0x0151B10, 0x2020DA7, 0x1731C7D, 0x3A66C40, 0x02D9C69, 0x2F65F7F, 0x1B295CA,
+            0x0729BED, 0x13E5FCC, 0x0FAACBE, 0x1A563B8, 0x022B247, 0x1F71258, 0x386B5D6, 0x16BD222,
+            0x3D663E6, 0x0C931B7, 0x2EF75E8, 0x17F90D5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2ABFE9A, 0x1BEB068, 0x13AFB50, 0x1D3F10E, 0x3B65D09, 0x09ED603, 0x20498F9, 0x1397869,
+            0x3EE406E, 0x07D5917, 0x3814CC6, 0x1D0C58E, 0x3BCC451, 0x10B72C4, 0x2632BFF, 0x1C042EA,
+            0x045DD97, 0x164A8E5, 0x2E8BE80, 0x0D479EC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3AF8647, 0x19AD801, 0x0EA0A6D, 0x017469F, 0x310250A, 0x0C32B61, 0x183E5F9, 0x0BA9426,
+            0x2EEB152, 0x15186AD, 0x2456E92, 0x125AFCF, 0x2F8A0B2, 0x00BF4DF, 0x130C213, 0x0B55E15,
+            0x042384D, 0x0553ACE, 0x245CA59, 0x13E1392, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0571F5D, 0x06AFD4B, 0x3D6F553, 0x112BA45, 0x114C16E, 0x0AE24B9, 0x1CD4CE5, 0x190684D,
+            0x02EA8CC, 0x1F56659, 0x21D9B13, 0x1819344, 0x32B5B5D, 0x011A467, 0x2B92FEA, 0x1A12132,
+            0x308E049, 0x060BA0C, 0x35E1AC5, 0x1FBA52B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0108000, 0x0397B9C, 0x2369CD3, 0x1FC68AE, 0x2E05744, 0x17FA64D, 0x15DE5C3, 0x1BFFA69,
+            0x0F5F7FB, 0x0931471, 0x0A23E9D, 0x1B00349, 0x0D77994, 0x06B9858, 0x140274A, 0x1D50A59,
+            0x0696405, 0x01D63BA, 0x344BA78, 0x150AC0E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1253F7C, 0x0E49ED4, 0x08509CA, 0x00FD4D5, 0x06643AF, 0x0D7A036, 0x1C05679, 0x0D07927,
+            0x35315ED, 0x106396D, 0x0BECF65, 0x1E813D5, 0x21D8CCF, 0x1E70059, 0x229476E, 0x0C6B23D,
+            0x258B20C, 0x1F2276D, 0x078E455, 0x0B8FBAC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x160E565, 0x06D955A, 0x31852B3, 0x18F3AAD, 0x020E80C, 0x185F61D, 0x2B573AC, 0x11A9790,
+            0x2EC9A6E, 0x0825923, 0x05F5DB2, 0x17E09AF, 0x0D9C963, 0x0283AAD, 0x248FCD8, 0x0953AED,
+            0x0147481, 0x15CCEBF, 0x2CFE140, 0x089A799, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x36EDDA0, 0x0044DFC, 0x1C2C609, 0x0D96794, 0x345CC45, 0x04FE89D, 0x25EEDF7, 0x11D32B1,
+            0x2FACFB3, 0x17FE568, 0x3ABBB27, 0x1EBB41D, 0x320231D, 0x0CCDCD0, 0x288AD7C, 0x0339808,
+            0x18C8A91, 0x0BEFCCA, 0x3EBB7E6, 0x1083469, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0067370, 0x1B7E20D, 0x183D5F7, 0x15B17AC, 0x33BF90A, 0x1A671B2, 0x3935103, 0x02CE411,
+            0x2044A07, 0x1594EAA, 0x119471E, 0x15BC64B, 0x213A343, 0x1B69F69, 0x16E4213, 0x0B58AE3,
+            0x036D93E, 0x0CD9D96, 0x119D3BF, 0x0FDD793, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x09A1A82, 0x0FAC049, 0x34DC71F, 0x14A4871, 0x39D90A0, 0x1BF7F82, 0x20C6260, 0x0C48928,
+            0x3F6486F, 0x0B596D8, 0x0BB5AB6, 0x058E912, 0x1DDEF9C, 0x015B28B, 0x0A3EB39, 0x025331E,
+            0x397EE6E, 0x108416D, 0x189C6DB, 0x123B994, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x184B49C, 0x0581242, 0x173DD43, 0x19F4093, 0x383430A, 0x0B09EF0, 0x18FA353, 0x0003746,
+            0x2EC2EEE, 0x0688860, 0x34B2E71, 0x07796D6, 0x33DC4C0, 0x09856B8, 0x370E447, 0x08C5454,
+            0x2946690, 0x1637E38, 0x3B5C01B, 0x07895CD, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x12A93D4, 0x0461DEC, 0x136E8D1, 0x086921A, 0x15F1238, 0x09796E8, 0x38A45E5, 0x0C14D1A,
+            0x33366A6, 0x1E30034, 0x333F9DD, 0x15C96BE, 0x14101C2, 0x01A577B, 0x16E9198, 0x1A57B9D,
+            0x09184ED, 0x1320861, 0x1244639, 0x0F09B74, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^42 * G */ {
+        {
+            0x1DC3C5C, 0x01369EB, 0x1D2B332, 0x10594CE, 0x0DBE862, 0x001C8BA, 0x19CAB3D, 0x17AAB27,
+            0x1011685, 0x0E8FED1, 0x3526899, 0x1CF762B, 0x05E4C63, 0x115801A, 0x2C2A472, 0x1C41E62,
+            0x2820AB7, 0x08C7593, 0x1E2ED02, 0x168626E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3C78F8F, 0x187D0ED, 0x263CB76, 0x0F9FFDD, 0x183EED2, 0x0066398, 0x1DD59CC, 0x0C3A74F,
+            0x2521CB2, 0x02A63D1, 0x00C5732, 0x173FC1B, 0x010C779, 0x160563F, 0x3922AC4, 0x0DC2164,
+            0x2A458BF, 0x1F47C7A, 0x2BF3A04, 0x1AEFF7C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3FA926D, 0x1EC2A38, 0x38B37F4, 0x0A516A6, 0x24E4850, 0x11A858F, 0x2C259CB, 0x09187D7,
+            0x10CD196, 0x1308E30, 0x33A1C40, 0x0C927E1, 0x3675920, 0x1A52E61, 0x3D5264D, 0x1A3D715,
+            0x013F98F, 0x0ED981C, 0x2278BC3, 0x167DDCE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0F4CB23, 0x1405F84, 0x36C040F, 0x079C5D3, 0x31BC28F, 0x1BF61C4, 0x03E5183, 0x10962FD,
+            0x097113C, 0x04C9AD9, 0x0AD0F04, 0x0982EAC, 0x39C5001, 0x0D31862, 0x240134B, 0x0EF6D20,
+            0x36681FB, 0x0F4B375, 0x1A80899, 0x0EC6371, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0C17DB2, 0x1BFF173, 0x34DE302, 0x067B4FD, 0x2F84B0C, 0x1123E14, 0x3FC5CA8, 0x0C24712,
+            0x0A9506A, 0x17708AB, 0x2EBC170, 0x1F090E4, 0x116E07F, 0x1B54268, 0x0CDDD7A, 0x0AD9E64,
+            0x268212E, 0x08ABEE6, 0x2A7EFC2, 0x1D1B4BF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x13FB488, 0x0FAA572, 0x183B1F5, 0x103389A, 0x193A7C7, 0x00A2EC7, 0x03A26B9, 0x006E44D,
+            0x3C3F1B7, 0x09E34E0, 0x0F03B5F, 0x001C457, 0x34E3812, 0x1722E0E, 0x3C939F1, 0x0959589,
+            0x0BE5BF9, 0x10E80FA, 0x2932D0B, 0x0E0BBC3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2F0D2B4, 0x00653B0, 0x02D54E6, 0x1AC593C, 0x34213E0, 0x0B43583, 0x1297213, 0x1CCCD59,
+            0x3B68281, 0x00FCBB3, 0x32705CF, 0x0C5B211, 0x0C0A0B8, 0x0A01AB1, 0x2C2D108, 0x0E8F897,
+            0x0008C13, 0x139EEE9, 0x06ACA26, 0x1140516, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x09DC080, 0x0A2D098, 0x06209F6, 0x03D995B, 0x0D42AC0, 0x1DB6B7B, 0x0A0DF2B, 0x134429F,
+            0x1EACA94, 0x10BCCBF, 0x1FEB51C, 0x177DC87, 0x104D2AF, 0x0164B8C, 0x0A50468, 0x0229663,
+            0x2DCC29E, 0x1E494AF, 0x2B6C3E4, 0x1DDEF48, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x04670BA, 0x0D65CB6, 0x26ED0F3, 0x1D42421, 0x318F682, 0x1139340, 0x23EB2E7, 0x039C3C2,
+            0x18B9895, 0x0B3BB92, 0x3B6467A, 0x1360CDC, 0x1956EBE, 0x020F97C, 0x22603B9, 0x0628AEF,
+            0x1BEEE38, 0x0DBDC84, 0x37F328A, 0x1009712, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2FC91E5, 0x15AF48B, 0x268BF33, 0x039F948, 0x237A0B5, 0x1363611, 0x053E199, 0x149D770,
+            0x3614FA1, 0x07A2A8F, 0x3953A17, 0x02EE990, 0x19D8CB6, 0x0714D2B, 0x17CC1D7, 0x1699368,
+            0x20213E8, 0x1FCC6CD, 0x1A55497, 0x1B8E134, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x29DC14C, 0x117D3F0, 0x1CD0896, 0x0B3EF29, 0x2A74B6C, 0x0B0DB4D, 0x22911F2, 0x07DD164,
+            0x3355DD6, 0x19F3CE0, 0x212F2C6, 0x12C1B57, 0x1ABE58C, 0x0D52968, 0x11D7B11, 0x1CE571D,
+            0x06E0BBB, 0x10C4105, 0x096EB40, 0x1715A57, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0E455C4, 0x1FE65D5, 0x3F90176, 0x1502509, 0x2B2F6C9, 0x0D99FA6, 0x18DE16E, 0x18AEF13,
+            0x07938D4, 0x11C5580, 0x3D52674, 0x06FEF21, 0x073DCEE, 0x00EB588, 0x01293DA, 0x0931FB8,
+            0x128436E, 0x039A5FE, 0x207070C, 0x050EAF1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0F237B0, 0x136E642, 0x289A3A9, 0x1D28B48, 0x1E4B70D, 0x0ECD32A, 0x20524FD, 0x076214C,
+            0x13D3301, 0x09097D2, 0x1A36C0C, 0x121AF5A, 0x0E5988C, 0x0063E54, 0x28D0B44, 0x0BBE41A,
+            0x39E6B2A, 0x1CD31A8, 0x0A4CB88, 0x043699F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2B72029, 0x03A2771, 0x2A52B8F, 0x100B047, 0x0774290, 0x1BB78A0, 0x05E9229, 0x12B0840,
+            0x0E3CD62, 0x0A5AA64, 0x3069B62, 0x124EAE9, 0x059D593, 0x15D512E, 0x1147AA6, 0x1EF1A03,
+            0x17C0907, 0x022697C, 0x2DB8873, 0x002D152, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x37248AD, 0x07EADA9, 0x161F800, 0x0D072EA, 0x0206710, 0x10765C4, 0x2132175, 0x136B62D,
+            0x3786E0C, 0x0F31092, 0x388493D, 0x1368D50, 0x26A4127, 0x196C0C4, 0x30A3654, 0x1B134A6,
+            0x049BE95, 0x06B8F10, 0x199B73A, 0x1DAF0FA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2D2630E, 0x0F4A390, 0x283161F, 0x103D8A4, 0x1A8643E, 0x091DDBF, 0x0EB7618, 0x0E1A89B,
+            0x3C4CA94, 0x0D25C80, 0x33A6656, 0x0125F36, 0x362BBF1, 0x138BABE, 0x35E3C04, 0x013FF5C,
+            0x19770F2, 0x1BE3EE1, 0x2902E48, 0x038C7FA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^41 * G */ {
+        {
+            0x265356F, 0x11CFDD9, 0x2D4A34D, 0x131024E, 0x232738C, 0x161FB25, 0x14DA1D4, 0x1A6AAA6,
+            0x3BCB7A7, 0x0617F3E, 0x174C255, 0x028F4F8, 0x071B262, 0x17CF0DC, 0x2CAD19A, 0x18F40E0,
+            0x09B3742, 0x090DA1A, 0x09F7022, 0x1E29BC1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2308E2C, 0x0689AB1, 0x155634E, 0x0BA0BA8, 0x3C0D1B0, 0x0D52B7B, 0x2FD0A08, 0x1684451,
+            0x33B7DC3, 0x1E39880, 0x20054F4, 0x13B518A, 0x27F6361, 0x1BCD922, 0x3749993, 0x0EED641,
+            0x10C8D22, 0x14016EA, 0x1B5621B, 0x0D6AE3B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x135EEC9, 0x1A4F49D, 0x2716AD7, 0x0BBF32C, 0x2E4BA44, 0x1F87CCD, 0x339024E, 0x12B7A42,
+            0x3ED28F8, 0x15711CD, 0x3374E66, 0x13385C1, 0x3336AB2, 0x0076A43, 0x08136B7, 0x0CE09EC,
+            0x04BF42F, 0x17DFB8F, 0x3EFCAB0, 0x0798F60, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0BD7D0B, 0x1BB7F90, 0x2B0A0E0, 0x0D2C0EA, 0x1831E10, 0x1E6CDF2, 0x013A517, 0x1C3AE09,
+            0x19DA96A, 0x0707EBF, 0x0EF5FD6, 0x1639B8A, 0x219F2F4, 0x1ECA458, 0x1E53C2B, 0x0AA26BB,
+            0x3B28F56, 0x0220835, 0x0D9953F, 0x0E38BE1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3F628C9, 0x1DED259, 0x08CC27D, 0x1B11F1B, 0x04D7181, 0x1540DCD, 0x38F5A80, 0x1F61586,
+            0x0D61736, 0x15FBB30, 0x1EC9B72, 0x196C6BE, 0x22A1810, 0x17E71A9, 0x0471CEE, 0x164E7C3,
+            0x18EB2BD, 0x0564E05, 0x16BC1EF, 0x19F71DF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0D80A62, 0x165468A, 0x21F1A87, 0x0840258, 0x17C0E76, 0x13323D8, 0x1882619, 0x13E8A3A,
+            0x2B875B7, 0x0F22ADE, 0x149C12B, 0x18F7235, 0x245AC26, 0x128067D, 0x324EBE1, 0x00D61E4,
+            0x339E0AF, 0x109D037, 0x01D814E, 0x08AB676, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2C72D24, 0x01D30CD, 0x0D29DFD, 0x0446CE9, 0x24E7C97, 0x1AB75BA, 0x0EFCCD4, 0x0B2ECC1,
+            0x31C7B33, 0x11CC17C, 0x33C5F86, 0x1097EC6, 0x1429A07, 0x183422E, 0x01AE2EB, 0x12A528C,
+            0x0E3BF11, 0x0151B2F, 0x0803EB1, 0x18331E8, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0D2A9D0, 0x0F15911, 0x041A4EC, 0x083CC03, 0x1BE1A65, 0x006B3E1, 0x1CB5CA0, 0x15F804F,
+            0x29EDC64, 0x099CF6A, 0x121B0EF, 0x01BC004, 0x1F66B22, 0x0B7E5AD, 0x1E5EE9C, 0x14134D4,
+            0x3AD48AA, 0x0D06524, 0x1C03A77, 0x0EF1649, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2675B3B, 0x0E24994, 0x391326E, 0x029CA5C, 0x0849D03, 0x1E66586, 0x2040E44, 0x0CE5086,
+            0x0534597, 0x12598C5, 0x3D9E590, 0x181E2C7, 0x322D7B8, 0x1EA8973, 0x318E790, 0x1863315,
+            0x105A27B, 0x1B04C04, 0x1E43630, 0x166AD03, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0365300, 0x0EE76C0, 0x12A9EE0, 0x0FD1EE1, 0x22FC886, 0x14D40AA, 0x13E6AD9, 0x15CC0CA,
+            0x1AC2DDE, 0x0F24CFF, 0x09B2244, 0x039CA59, 0x3CBEDE2, 0x0462AE1, 0x37E5536, 0x1C94A9B,
+            0x2FAACE7, 0x19974B6, 0x2FC114D, 0x180ECCB, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0CD00BC, 0x050C4B6, 0x14AC0EC, 0x1FB9FF8, 0x1CF92B3, 0x0E855B1, 0x07C5ACC, 0x0EFE727,
+            0x27C2D4D, 0x07FA472, 0x23A5355, 0x0E6B7CE, 0x0364B45, 0x019A808, 0x2A56996, 0x1ABAE05,
+            0x2DCAD16, 0x0F2A34E, 0x2F6758A, 0x0687B68, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x36134D6, 0x1364F21, 0x1CE41A9, 0x00F64F5, 0x2E5DF9D, 0x096C1A5, 0x2A3D6C1, 0x17CC251,
+            0x36058A9, 0x13774AC, 0x3A51A7E, 0x021EE9F, 0x1C4F8ED, 0x00DAC09, 0x0DC4931, 0x1EFD377,
+            0x2B49FA1, 0x054F981, 0x3D80BCF, 0x0195922, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0C3DE8E, 0x1522ED7, 0x27B8D54, 0x096AB24, 0x04E9DDE, 0x1FA6D46, 0x208440E, 0x048C822,
+            0x344C438, 0x1B1A999, 0x0514382, 0x03D4B73, 0x3479D5A, 0x152166B, 0x1287867, 0x1D07DC7,
+            0x1652327, 0x13E579D, 0x0F65CD5, 0x0939595, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0A4CEFF, 0x1040246, 0x2F73624, 0x1EB994A, 0x11AA3BE, 0x09B04E3, 0x23AE7B6, 0x0F3E607,
+            0x02BF461, 0x17031ED, 0x0FA2B63, 0x01CD0C8, 0x1B561B7, 0x1E4EFA0, 0x1794693, 0x08ED43D,
+            0x11016C8, 0x143142B, 0x0F100BF, 0x1AF18DA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x15BD830, 0x0223715, 0x2726F13, 0x0BC238D, 0x22C4BF3, 0x1C385D9, 0x13D0C5F, 0x003CCBE,
+            0x3C5EB64, 0x1ED361E, 0x38A6890, 0x1A682D7, 0x146EB86, 0x1E52CA7, 0x100240F, 0x19DE897,
+            0x0B3FF7F, 0x0E79785, 0x13F9691, 0x17AD58E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1D347B7, 0x0BEE19D, 0x3E64F60, 0x003789A, 0x16C3114, 0x095FD58, 0x339D390, 0x00208F2,
+            0x01FFF7D, 0x05C0370, 0x12A4DE5, 0x0A8E2C6, 0x29F3B88, 0x1963205, 0x3BFE36D, 0x0DF07DC,
+            0x3C10A1A, 0x17EDEBD, 0x3917003, 0x1D3C1F6, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^40 * G */ {
+        {
+            0x2C00B7A, 0x1BC33FA, 0x1BE1DCF, 0x1068A0B, 0x2C78A48, 0x01D7C7C, 0x35BBBF9, 0x00086BC,
+            0x2B898E0, 0x03DFED1, 0x38020BC, 0x0860F24, 0x3371223, 0x0ACE5AE, 0x276D323, 0x0D99A32,
+            0x06EFCA8, 0x1CBABCB, 0x2F3433E, 0x073F7B9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x26A27D7, 0x1C473AF, 0x2C429E6, 0x1331FE1, 0x20ECC61, 0x116F87B, 0x2AC3B5C, 0x093C830,
+            0x12EC8C5, 0x0293871, 0x231881C, 0x09960DF, 0x155A037, 0x132F926, 0x34DC7C3, 0x013D560,
+            0x2218EB1, 0x15AE5E3, 0x2612937, 0x181EF2E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3758C99, 0x136DCF7, 0x1E71B3C, 0x1574507, 0x3BE402E, 0x09D87D0, 0x348E5B2, 0x1DC66B2,
+            0x1264C16, 0x10B48AD, 0x2C61ED0, 0x01040E0, 0x2105BEA, 0x017DCA9, 0x3DABA13, 0x14D5B33,
+            0x05F1BF5, 0x0407E99, 0x2DB3826, 0x0EF4C8C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x34AA201, 0x1ED195C, 0x288D0B2, 0x16D06D0, 0x297C545, 0x141B520, 0x15E49A1, 0x055F7C0,
+            0x3E5535A, 0x0574471, 0x1D76214, 0x116A8E1, 0x28E0216, 0x0F7F72F, 0x18CCEB4, 0x0558A1A,
+            0x0FB66B5, 0x0538975, 0x0B09C39, 0x1A74C76, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x339A28E, 0x1D1F0C6, 0x1265B37, 0x0676AB4, 0x047286E, 0x1A95CF3, 0x3C6927D, 0x15EB9E3,
+            0x3F61106, 0x1FA9475, 0x0FE5BA1, 0x06F7870, 0x0752662, 0x1901105, 0x3CA78BC, 0x0615808,
+            0x0576738, 0x12D0114, 0x103607C, 0x138F970, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x22CD1EB, 0x084F7D9, 0x2ECA9DB, 0x015455B, 0x23386A2, 0x000BEB3, 0x10AAF19, 0x1F7B937,
+            0x054D99D, 0x0E66A70, 0x1046B7A, 0x176326D, 0x2631C84, 0x1A8BFE8, 0x1FBE90B, 0x19F450C,
+            0x22C9AF4, 0x19A8649, 0x0D07212, 0x137BAB4, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1EA09E8, 0x0812192, 0x206EBCF, 0x00812A8, 0x21F7E3A, 0x038E49B, 0x2E765EC, 0x0D1ED52,
+            0x372E932, 0x0EDB2A9, 0x2A4404C, 0x0859214, 0x1CFD604, 0x0AAF49C, 0x2200322, 0x1BC46DE,
+            0x0D6404A, 0x143F5DF, 0x3BB2D62, 0x0565373, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2054A27, 0x1B1576F, 0x22CACD1, 0x18011C9, 0x3398D5C, 0x17990D9, 0x10170E1, 0x1B56FF0,
+            0x3B31F38, 0x0C893EA, 0x0C11018, 0x0C463D4, 0x35A0E02, 0x19F0C6E, 0x35C7E4F, 0x00BC651,
+            0x0E44750, 0x1322681, 0x1636137, 0x07DBB27, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x09B60FA, 0x124DF49, 0x3E9D90D, 0x03C705C, 0x3D1185F, 0x0BD47ED, 0x3F7878F, 0x14AEBB9,
+            0x0E923F7, 0x180479C, 0x2E6C777, 0x0BDD292, 0x2C158A7, 0x193788F, 0x27D432A, 0x117B11F,
+            0x251F555, 0x1DD000B, 0x3D2921E, 0x1DDDC19, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x09AD70A, 0x0AFCB5A, 0x005C3AB, 0x1D0D858, 0x06BC420, 0x0CB4D8B, 0x182A23E, 0x1311E26,
+            0x368FE99, 0x0DBD9F8, 0x342CE5E, 0x0392D7B, 0x3BA32EC, 0x0C68CFA, 0x2F23205, 0x097358D,
+            0x2F2A91B, 0x00BBCD8, 0x0E6D001, 0x10BB8A4, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1CC9AC5, 0x1747E8E, 0x2CF561A, 0x0C87448, 0x2DF19B6, 0x1B9C9D9, 0x3B5DB90, 0x04CB4CB,
+            0x2C8F310, 0x107DB40, 0x1AF5E4F, 0x1307EF1, 0x10E4A1C, 0x1FE4531, 0x20C8ECE, 0x0A7DCB0,
+            0x1429285, 0x0DFA43D, 0x0A408E3, 0x1C85164, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x23682D3, 0x0F5CAEF, 0x140544F, 0x107BB58, 0x036918C, 0x1D219A6, 0x125BC01, 0x14E0C3B,
+            0x091E464, 0x0DD2291, 0x1E02536, 0x1DBA96C, 0x2BEB164, 0x07448E2, 0x36B64C8, 0x0289F4D,
+            0x28D5B24, 0x0459567, 0x011AB6F, 0x1ED913B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x102C2DB, 0x115601B, 0x19875F7, 0x18AF818, 0x37AE59A, 0x1EA59AF, 0x1AD51B4, 0x1D49F2E,
+            0x146B313, 0x0422D3F, 0x2F51966, 0x1A4FBD6, 0x1327356, 0x0C531CA, 0x37905DA, 0x19DB770,
+            0x23F5414, 0x1A25BEE, 0x0DFCE85, 0x00D89C3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x249F667, 0x024C47B, 0x2952874, 0x1BE1FAE, 0x020A9BE, 0x1B7F5B5, 0x246364E, 0x09F1CBD,
+            0x2B6AD85, 0x149B556, 0x2B42E58, 0x0199436, 0x2BC257F, 0x16FB0AB, 0x09EE268, 0x04A816F,
+            0x3F2938B, 0x1808017, 0x053C605, 0x0A56831, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x37EB5F9, 0x08859AB, 0x3DFCBA3, 0x1253E3A, 0x043D186, 0x0996D82, 0x1E92990, 0x0C0BEA0,
+            0x2E31B8F, 0x0F4153E, 0x2B88AE0, 0x10AAC72, 0x044CDBD, 0x1E7290C, 0x070D237, 0x16092C2,
+            0x3EB9CD7, 0x1246C4C, 0x0395B50, 0x1E9EC03, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x22C2F0A, 0x1C5635C, 0x094451C, 0x1979C8C, 0x2E370DA, 0x0DC758B, 0x3255789, 0x128B43F,
+            0x1D9CD38, 0x0CA9E1B, 0x2A67EFF, 0x027FDE2, 0x1A7F917, 0x1EAEF7C, 0x3031F20, 0x01B1702,
+            0x1316E0A, 0x1AEA5D3, 0x0EB6450, 0x13C60AE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^39 * G */ {
+        {
+            0x0F3524A, 0x1A94B26, 0x3F72D09, 0x11AAA2C, 0x2C0A5B6, 0x14AA990, 0x1EB264A, 0x1B8B06F,
+            0x2B34E30, 0x1EF9487, 0x0F2DBCA, 0x10AE8AD, 0x3867BC6, 0x1AFCF5F, 0x2E370F5, 0x032346F,
+            0x1215131, 0x1A59FFC, 0x11FA926, 0x05155B0, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2C0E931, 0x17C0905, 0x28711BA, 0x190673D, 0x19FDB57, 0x122E9A2, 0x19E0C80, 0x0C42BB7,
+            0x1F80C5F, 0x05A4B39, 0x2CF69EC, 0x1C9404F, 0x178B9F5, 0x0BB00A1, 0x3603658, 0x1ACBC1C,
+            0x3649295, 0x1D3619F, 0x3E42357, 0x1ABED31, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x09A5D78, 0x16E3971, 0x1F8CA29, 0x1FE48AF, 0x3DD6043, 0x1FB734E, 0x2088FB4, 0x0BD3651,
+            0x344BC14, 0x0E074D8, 0x13C5702, 0x11A311C, 0x35866C7, 0x0CF6273, 0x32A6414, 0x1F8A195,
+            0x3109881, 0x1941A27, 0x34CCC72, 0x116C5EF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0E7877A, 0x0FDBACB, 0x1A5979B, 0x0A2F44B, 0x1E4D4E8, 0x09C7D66, 0x029B240, 0x0B647DA,
+            0x1EC5B7F, 0x11B685C, 0x2A327CE, 0x1D142EA, 0x350C5D7, 0x048C94E, 0x1626B4F, 0x13F41CC,
+            0x3C5C296, 0x02A23B7, 0x1E1B949, 0x009310D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x114825A, 0x1E9C2A0, 0x1BB3565, 0x0246156, 0x0DF006C, 0x024574D, 0x186AB41, 0x1109CC0,
+            0x391B296, 0x1C9C59F, 0x3A63938, 0x1EE83FA, 0x3F3356A, 0x17BF11E, 0x2484A05, 0x1203381,
+            0x3AA7D09, 0x1760761, 0x12CE8FF, 0x0C785DA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2E6B88F, 0x183FE6D, 0x24E47C2, 0x1A4CEB8, 0x391E8F0, 0x0CE1612, 0x2CE8FF9, 0x0A87C6F,
+            0x193FDAD, 0x0B1F249, 0x1E5D874, 0x032B62B, 0x37ED1BC, 0x10A5BE2, 0x1444A08, 0x170EF19,
+            0x19E35E6, 0x1BF4AC2, 0x375B034, 0x1886DD1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x113D548, 0x04404E7, 0x06F83FD, 0x1AE6C83, 0x24EB82E, 0x0132152, 0x3A49639, 0x1A02BF0,
+            0x2060933, 0x0BCC8A3, 0x0A1E445, 0x0CB3D8B, 0x00D421E, 0x0FD52C2, 0x365DA61, 0x17B8C10,
+            0x3453051, 0x1F876E7, 0x32552B8, 0x18B76CE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1E8B6B8, 0x09189CB, 0x0268D85, 0x00A180F, 0x2E4D18E, 0x0125809, 0x27C7743, 0x193AFCC,
+            0x1FF6175, 0x12D8C9B, 0x0F8EEDE, 0x0EB1F3D, 0x1382A08, 0x1023A40, 0x133E58C, 0x0617690,
+            0x30A551A, 0x0A39D3A, 0x05316BC, 0x1DD8804, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2358BE9, 0x19B5B85, 0x1CF6BC6, 0x1B25C5F, 0x35ABB8C, 0x05E8890, 0x0CDAC68, 0x1901CD7,
+            0x1FDC7C4, 0x080EFA5, 0x282D645, 0x16A75AC, 0x11B9917, 0x1E64A1A, 0x33DB4A7, 0x042EB0A,
+            0x16B50FD, 0x1032875, 0x24D1374, 0x1515EA8, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x084C37B, 0x029D2EE, 0x06D27E2, 0x0435769, 0x226F2EA, 0x1AECCE8, 0x32FA604, 0x146DE5C,
+            0x19E1804, 0x1672E8C, 0x34E15E4, 0x0DD2592, 0x2C28B02, 0x04012F9, 0x0068178, 0x166052E,
+            0x2E09090, 0x0112914, 0x365A2F6, 0x123E874, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3CE4911, 0x105DBF4, 0x2A429A2, 0x17D3DC3, 0x0D087A7, 0x047C3D1, 0x3EB8BB9, 0x056D681,
+            0x2EDFEA8, 0x16AF9F2, 0x10027C0, 0x1C7EE76, 0x134D8AB, 0x05D9E9C, 0x32499D1, 0x1AAA739,
+            0x04F1609, 0x1AA61A6, 0x02D41DE, 0x00277BF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0A85292, 0x045BAEE, 0x21C93F9, 0x17F6E79, 0x1D77830, 0x1F367E4, 0x0026E16, 0x040D660,
+            0x15FAFB5, 0x0243DB3, 0x1C8DB9B, 0x0B486DF, 0x05FBD34, 0x16A1E75, 0x2262468, 0x1B3444A,
+            0x35E3269, 0x04A6668, 0x12CB2DF, 0x1CA14D5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3CAD9C0, 0x0BACB09, 0x01BB121, 0x18F7DA5, 0x263B332, 0x0D8A473, 0x1F6D8DF, 0x06378EC,
+            0x15AF649, 0x1A56B3B, 0x3BE95F0, 0x1BE4D06, 0x2295648, 0x0EC1493, 0x10BC2D5, 0x02E7791,
+            0x39056C1, 0x04F722F, 0x1B70F30, 0x01D219F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x368C1F0, 0x19A3569, 0x2039B94, 0x09C0A0C, 0x20C2A7E, 0x1EF6BE9, 0x1A7EB95, 0x0EBB053,
+            0x1DCCF64, 0x164C012, 0x2FD7F1A, 0x1D0A305, 0x32DCA72, 0x167EAA1, 0x2852ABA, 0x0BAFE44,
+            0x1AD16D5, 0x14A509B, 0x0CFEFC7, 0x1B8725C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1799717, 0x14074A1, 0x3ED6FD1, 0x0DE1469, 0x2AEC8B0, 0x1C2F7A8, 0x24D44C0, 0x1990E3B,
+            0x28CC9D8, 0x1E3FFF0, 0x2695AD0, 0x0CB890C, 0x2B36FB6, 0x1F5170D, 0x3EF4269, 0x1ED0E57,
+            0x11F763C, 0x0FC27EA, 0x0A47E2C, 0x134EEA6, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x29B1352, 0x0ACCF36, 0x209BE5B, 0x03433CE, 0x07D8C16, 0x0287ED5, 0x14F955D, 0x19B1314,
+            0x13A0601, 0x1A50AD2, 0x287F16C, 0x0610AC4, 0x07CA01D, 0x1831529, 0x1FEC901, 0x0C0DD47,
+            0x0FFB10D, 0x1BB7A1E, 0x0D24D68, 0x0B8DFA5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^38 * G */ {
+        {
+            0x31E96E1, 0x1A7428C, 0x0CE2AA5, 0x0615EDA, 0x197618D, 0x1681192, 0x0B36DCA, 0x114AD78,
+            0x15BCB72, 0x077C58A, 0x1F47DDA, 0x040BE94, 0x084F5D5, 0x129AC91, 0x2CE62F2, 0x0907F18,
+            0x2A44716, 0x1EFCAFE, 0x24E315C, 0x09591E6, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x368CBBD, 0x016ADD6, 0x2215BF7, 0x15B5DA1, 0x3080E8A, 0x123F516, 0x1CAC833, 0x0128163,
+            0x0F05483, 0x10DA205, 0x184A61F, 0x094C603, 0x3C9136D, 0x1554793, 0x30B3672, 0x09A2C07,
+            0x11FE909, 0x19BBD9B, 0x0C1333F, 0x1450920, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1F70755, 0x19872D0, 0x1CFC5A5, 0x05082A1, 0x2E786C1, 0x15834AF, 0x304E033, 0x0A6ADB7,
+            0x1FEEF30, 0x1A61448, 0x17A7515, 0x054B6C6, 0x04B8282, 0x05F1620, 0x1BAAC1F, 0x05792EC,
+            0x34AB59E, 0x1973E49, 0x3471B54, 0x1B38904, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x22F9A03, 0x0BC0B8E, 0x27B5F9D, 0x0657ABB, 0x01BB417, 0x101C217, 0x0B30F07, 0x19545FA,
+            0x273C47B, 0x0D6B5BE, 0x2872AF2, 0x12743C9, 0x2EBAB96, 0x0F132F8, 0x00D27AA, 0x1440208,
+            0x351DF74, 0x1EECD7D, 0x2A7EFBA, 0x020D62A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3789C1C, 0x1219777, 0x15BE5D8, 0x1D55E0F, 0x0BACCAB, 0x1E5C2DD, 0x3F1E676, 0x1C78AA6,
+            0x1FB9D02, 0x13ACFD8, 0x05BB292, 0x1D96660, 0x1BF2C20, 0x050A58D, 0x0B52F09, 0x0B892B7,
+            0x3CF53F9, 0x1D23B02, 0x049B0AF, 0x0C1A5E4, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x162D911, 0x1087DF2, 0x11AA7D2, 0x12CF6B5, 0x1D86E90, 0x0EF2BB6, 0x3DC13CF, 0x095A99B,
+            0x0BED471, 0x19C35A4, 0x125A97F, 0x1700ECD, 0x3C6B20C, 0x1AA9CE5, 0x05D96DF, 0x132CDB5,
+            0x3A94E37, 0x1BAF083, 0x00B75AC, 0x051B854, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x14C3126, 0x0D868F4, 0x3189DAB, 0x02D0E1F, 0x2EB915D, 0x042905A, 0x0BB78C5, 0x0E33386,
+            0x19010CA, 0x19C51B1, 0x23619B0, 0x17EC443, 0x3EDC9CA, 0x08E0F68, 0x3E34EFC, 0x1C32EF2,
+            0x3494E92, 0x1DC0111, 0x17C6CEE, 0x0E1D344, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2A7BF33, 0x1EAF102, 0x3C1345D, 0x12A146B, 0x2C32C3B, 0x1BC6215, 0x230537C, 0x1272594,
+            0x04F9288, 0x17394BD, 0x1D51AC1, 0x1421EE4, 0x2C4C992, 0x11EFCBF, 0x3A1B0B6, 0x0B2BEE7,
+            0x3FDC3D1, 0x02127C5, 0x299D04C, 0x118C377, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0A70225, 0x0CC99A7, 0x02EB04F, 0x041217F, 0x3980F3D, 0x1C5D6FC, 0x097212E, 0x1EB49DE,
+            0x0FD0063, 0x01667C2, 0x316795A, 0x00904F3, 0x1B0CB14, 0x09B66E3, 0x2D874E4, 0x1DF761E,
+            0x01C4974, 0x151C333, 0x012CC6F, 0x10ABC69, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0855BB3, 0x0EA38D7, 0x36EBFC0, 0x02DC2A6, 0x19CD1B2, 0x13E2432, 0x16B96FD, 0x11345DD,
+            0x12B766C, 0x0AAE4CB, 0x36C5F5D, 0x1277849, 0x2DB5F0F, 0x166D9D2, 0x3DDDD97, 0x1695BBD,
+            0x1525D0B, 0x05656ED, 0x3384E61, 0x0DA492A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x11B80AA, 0x094C6AB, 0x02805E0, 0x193F118, 0x06D912F, 0x0B5F3D5, 0x33CF07E, 0x00232F3,
+            0x20F6A1B, 0x03E83DD, 0x01478A3, 0x02E9B4B, 0x37C38D4, 0x0A7711F, 0x1F916EE, 0x1D9E5F6,
+            0x20FFCCB, 0x1508A23, 0x2DFD3C8, 0x134705C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1EA4BB9, 0x15D02B1, 0x3E287C7, 0x05AFA06, 0x2FBCDE2, 0x029B824, 0x324DB38, 0x1364C68,
+            0x2660025, 0x1973AFE, 0x0198727, 0x1683ED0, 0x0AA8567, 0x15C479A, 0x2B7EEB3, 0x191C798,
+            0x21CECF4, 0x12D619F, 0x19C571A, 0x1D37A73, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0CCDC45, 0x137D455, 0x1A98AEE, 0x0D60608, 0x3145BDC, 0x1BA3613, 0x283BAD9, 0x1B37011,
+            0x29784EB, 0x126E698, 0x2E878B1, 0x16E11DF, 0x1BADFE9, 0x1AB32E4, 0x3DB63C8, 0x09FADC1,
+            0x11854D8, 0x12EC6AD, 0x33EF22D, 0x1F5E450, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2B6E764, 0x1A7B449, 0x14C62F2, 0x0434DF5, 0x05794B4, 0x1A9B4DE, 0x0DB866D, 0x07EBFBB,
+            0x36C6F1C, 0x1ECD64A, 0x2A08A42, 0x0132E81, 0x3630BCF, 0x164D0B7, 0x0E73A2F, 0x101FE2A,
+            0x1E4EA30, 0x1007942, 0x2A26A1A, 0x1D1E4DC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0592B8A, 0x1DF7CA2, 0x371E09D, 0x03D0509, 0x385CA28, 0x06AC0B9, 0x1C35360, 0x1434C6D,
+            0x12A20B1, 0x1ED1496, 0x349BD50, 0x1CA930E, 0x2D954D5, 0x08248DA, 0x16E0819, 0x1A9DD21,
+            0x351D715, 0x13A7124, 0x203410C, 0x1EA9783, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x057F4EB, 0x12F90E4, 0x04A75FD, 0x0D7977D, 0x36C4E8A, 0x0F5D417, 0x161142A, 0x0F6C8AA,
+            0x2AAA5A6, 0x0EDB9FA, 0x21F1D9A, 0x093900A, 0x1DADBF7, 0x12A4C46, 0x3CA551D, 0x1ECB437,
+            0x3A84658, 0x045620A, 0x0F5FC6B, 0x1C477A8, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^37 * G */ {
+        {
+            0x39FDEE7, 0x0282AF3, 0x21C40F3, 0x1D891E9, 0x07B266F, 0x066AE70, 0x040C52A, 0x1FC233A,
+            0x26E01B7, 0x182DB94, 0x368044C, 0x0D10235, 0x01EEE7F, 0x108F719, 0x191B24B, 0x14C4416,
+            0x3718DD1, 0x0945858, 0x1FB3475, 0x0BA90C3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x125EF32, 0x1247162, 0x0CB9DAA, 0x04CF7DB, 0x0C3DACF, 0x13105A1, 0x1A919B1, 0x1A09FB4,
+            0x270E458, 0x14D5DC3, 0x2DED180, 0x091DB5F, 0x2E727B7, 0x150A8FB, 0x2654B69, 0x078025B,
+            0x04A50AB, 0x0DCD7C7, 0x205F2B2, 0x1B00048, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1E71F03, 0x188E7F8, 0x30BED27, 0x1C2B412, 0x027146D, 0x0A2A74C, 0x2374404, 0x1F335C3,
+            0x29E8AD7, 0x1219103, 0x017FA1B, 0x17792F1, 0x15CFFEF, 0x02FA3B5, 0x1C0E005, 0x13040B7,
+            0x2926F47, 0x0BBD8BA, 0x093FD17, 0x1B1D93D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x054F313, 0x072B95B, 0x0C908E7, 0x1F6D842, 0x0C65E6E, 0x1AF176D, 0x2644A0C, 0x1AA3909,
+            0x3FD74DB, 0x017A3A0, 0x317B7CF, 0x1212AFB, 0x2A17059, 0x10E1506, 0x283D035, 0x0934EB8,
+            0x36B039C, 0x1F13C48, 0x10EA18C, 0x0E93F9E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0DA4EFE, 0x1493259, 0x29A1D80, 0x0E97F3D, 0x3C05F2B, 0x1EE0CBD, 0x372F272, 0x1FDB500,
+            0x20A2DFD, 0x1A06EBE, 0x2940036, 0x0EA0CC9, 0x00959CE, 0x1492FF4, 0x3182860, 0x11128D7,
+            0x349F360, 0x16F8610, 0x03C28A2, 0x116353C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1C389B6, 0x1721489, 0x159B59B, 0x015B45F, 0x3838D08, 0x0FDA1FA, 0x08640BC, 0x0335527,
+            0x01FC791, 0x113A6E4, 0x04DDE76, 0x0BF6CC1, 0x2C3483A, 0x16F81E3, 0x0ECD227, 0x04A7C24,
+            0x0F93F10, 0x0C400EA, 0x028B1DA, 0x173023C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2D332B2, 0x0EDEE1D, 0x19141BE, 0x062E63F, 0x11633FC, 0x13BC4C2, 0x0F9A98D, 0x0BC211B,
+            0x373A5C7, 0x0FCF604, 0x29F7A8A, 0x1D04BF0, 0x3B9D29D, 0x167E4A2, 0x1C8F202, 0x1BEDE6D,
+            0x19FDF8B, 0x1B3E8B2, 0x174333D, 0x0F819CC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x20B2F58, 0x15EE037, 0x149C4BD, 0x13D04AA, 0x0B3CF29, 0x142528C, 0x2CF6A30, 0x1EF45E9,
+            0x3A7A952, 0x07F54B1, 0x3259708, 0x05A8CF1, 0x1390016, 0x00B6575, 0x3E1140F, 0x0F60E06,
+            0x3A640D4, 0x0FED0E9, 0x3955CDC, 0x19C503A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0F28E6E, 0x01B721F, 0x2B6927A, 0x01BD534, 0x2C70297, 0x0611AF4, 0x38B829F, 0x07B767D,
+            0x304F470, 0x17B20A0, 0x3F81A5C, 0x1BED8BB, 0x20CFF7D, 0x015B1F2, 0x04BE868, 0x06C0C36,
+            0x23046F3, 0x087196A, 0x1EDDC99, 0x1040196, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0E5AF2F, 0x03367C4, 0x2BBBC12, 0x03A1CB8, 0x2DF0F1E, 0x072E76F, 0x1832A76, 0x1BADD81,
+            0x2921E4B, 0x1F4F08F, 0x39E9B62, 0x0463184, 0x3074451, 0x15875BD, 0x1008BC3, 0x030C493,
+            0x20AF876, 0x1CCE41D, 0x02E9ED7, 0x1CC319E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x030594D, 0x069B036, 0x3E11897, 0x0282605, 0x387D770, 0x12AFDDE, 0x3330735, 0x11320AF,
+            0x277EE78, 0x1CD6FC9, 0x0E0FE54, 0x1BAA94C, 0x1E0CAFA, 0x0C25CD7, 0x16422BB, 0x12D8BC8,
+            0x046F3B5, 0x1B6F260, 0x2B68F7B, 0x0C73355, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x175BE56, 0x009875D, 0x18CDB90, 0x04C36E6, 0x05E146E, 0x0FBF08E, 0x04DD03F, 0x0D538A6,
+            0x20BAB42, 0x0D7466D, 0x358B734, 0x01087F4, 0x04FE7EB, 0x1600D18, 0x0AC915D, 0x06710C0,
+            0x3AFF3FB, 0x194B5A3, 0x2EFEB50, 0x1C73F0D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0B05686, 0x07F969D, 0x3931104, 0x1890B09, 0x3B79534, 0x197CC81, 0x18F6826, 0x172202D,
+            0x3D1EA15, 0x1CDE6EB, 0x0C5CA6B, 0x1237724, 0x1CB8E3F, 0x04539D6, 0x25310E1, 0x03051A8,
+            0x1EF5CE1, 0x00DAF0C, 0x072AE93, 0x0DC5275, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x348D681, 0x0F31F62, 0x02AD8D6, 0x1FF1BA5, 0x31D6D2D, 0x133ECC8, 0x16FE2CF, 0x119A303,
+            0x1DD6006, 0x1054CED, 0x3952849, 0x13AC820, 0x242EB2B, 0x1CB68CD, 0x0BD5C54, 0x0BBD3A8,
+            0x064B4FE, 0x15F6B49, 0x2BB987E, 0x0CA65C3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x18EFAE0, 0x0905C30, 0x0FC0BC3, 0x0BC78C5, 0x092BBE0, 0x17A4FAA, 0x322BCBA, 0x136875C,
+            0x0944F2E, 0x132BE6F, 0x3284556, 0x053A773, 0x11412A2, 0x0ADC75E, 0x1694C67, 0x11462A7,
+            0x1985165, 0x17DAD56, 0x291F94A, 0x04A0A16, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x188ED97, 0x01570F6, 0x2C6ED9F, 0x0B2B881, 0x0D41763, 0x1413911, 0x3C4F5D6, 0x0157A6F,
+            0x1F5794D, 0x1B2B6FB, 0x1131155, 0x03B35DD, 0x32E6000, 0x090DEA6, 0x2ECF191, 0x0BDBC90,
+            0x339BD55, 0x1386D4F, 0x1D7943D, 0x17C01C0, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^36 * G */ {
+        {
+            0x2D58263, 0x12869AD, 0x123036F, 0x1B0065D, 0x1225657, 0x17B2623, 0x02B67B5, 0x02AD9DB,
+            0x169AC56, 0x0B5DD50, 0x2717993, 0x09606BA, 0x0CE2C14, 0x0037BCC, 0x09AAEEE, 0x08C0B09,
+            0x1C129AC, 0x020652D, 0x0EA70BF, 0x1F99AA3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1F2FD8A, 0x138D5C7, 0x26B778E, 0x0BA8B09, 0x023A4C6, 0x04A242B, 0x35492FD, 0x10E4975,
+            0x2921062, 0x0B8A8BB, 0x3B6B3AC, 0x09EEC79, 0x08D3708, 0x1F1BF8E, 0x0D6D199, 0x0E6E0F2,
+            0x27C6FDD, 0x1B49E04, 0x3E2E4E5, 0x1A5E6A8, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1571AD0, 0x0D16CAD, 0x3E08C8C, 0x0CB93C0, 0x097190A, 0x16A10CF, 0x09402F2, 0x1580365,
+            0x0225FFA, 0x0A6A81C, 0x19398A3, 0x1CBF95D, 0x208722C, 0x138D221, 0x093C896, 0x1E3EE1D,
+            0x2855744, 0x1C50CF4, 0x029098E, 0x189FC75, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x089990C, 0x0677E1D, 0x02D7762, 0x145824F, 0x23909AA, 0x016AF8D, 0x19D6531, 0x1FCB478,
+            0x3AD6D49, 0x0737CA8, 0x149B032, 0x1C5026D, 0x391D82C, 0x0C8A2CE, 0x25DF3CA, 0x101BDAD,
+            0x1ABE422, 0x15BEBE5, 0x3AAA65A, 0x1904BD9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x162C4B3, 0x02B11E8, 0x177C9AA, 0x14AD829, 0x3F66986, 0x0D4A5F6, 0x2A1CA3F, 0x1ABC982,
+            0x2D2AF7F, 0x14F3941, 0x2B53B74, 0x1BC8BE0, 0x3A3A7A5, 0x01D13A8, 0x3873074, 0x071814C,
+            0x001D9D8, 0x03544C8, 0x3D3E8CC, 0x15F9D26, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x02A7954, 0x0D6F37C, 0x3F79518, 0x0E6AFBD, 0x0B2334A, 0x0927068, 0x322216A, 0x0F07817,
+            0x136F531, 0x11EDAE3, 0x00D8191, 0x16AEAB0, 0x350E98B, 0x0A8A9E5, 0x0D4DE5D, 0x11AD255,
+            0x2540C6A, 0x0149958, 0x3C12020, 0x0DCB0D3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3467327, 0x18E6EF6, 0x3C78BC8, 0x13B29CA, 0x0DEE0AC, 0x1D362CA, 0x2024424, 0x0256BAB,
+            0x0B2BF61, 0x1F38989, 0x2F90299, 0x15161A1, 0x2644836, 0x0B7474C, 0x1653223, 0x0F8E9B5,
+            0x285C950, 0x01DB81B, 0x1B298AB, 0x1347060, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x29E34EF, 0x165235C, 0x09A60F5, 0x1B78664, 0x29B7D7F, 0x1D43DF3, 0x138C632, 0x06EB9C8,
+            0x27E0AAD, 0x1105BAC, 0x24DBCFE, 0x020BEF4, 0x00A406C, 0x04C7380, 0x1BC1EE6, 0x1C001CE,
+            0x01A30B0, 0x1074E86, 0x21F1919, 0x0F36B05, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x28BDCBB, 0x079A143, 0x11058C0, 0x19B0323, 0x3CB0435, 0x0D09D9C, 0x34174F0, 0x1081D60,
+            0x2D28BED, 0x1F2EC06, 0x0B34185, 0x01B2C00, 0x2E27B3F, 0x13AF16C, 0x0A4A2DC, 0x0808DEE,
+            0x1CC8E04, 0x0DB66FD, 0x3F82470, 0x14CB158, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x132F5A5, 0x173EBAD, 0x3F26E2D, 0x0F7734E, 0x00DE285, 0x09165B5, 0x2591539, 0x1CB3186,
+            0x144332F, 0x1348D3D, 0x3DE5676, 0x0989A7B, 0x3787BBD, 0x1A819C0, 0x0C70ACE, 0x05EFFE1,
+            0x1353DA5, 0x13826F5, 0x34EC978, 0x01CE530, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2D6E924, 0x12F2C58, 0x3579873, 0x1A0340B, 0x09D22BB, 0x1EBFD3F, 0x2D05DD7, 0x08F230C,
+            0x140992E, 0x0E46574, 0x0108A34, 0x1A06A2E, 0x21BEF9A, 0x17A0646, 0x162D623, 0x1C14E2C,
+            0x0B3A207, 0x08F0911, 0x0EABC4E, 0x10A5B0B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1CE5697, 0x1DD0D9C, 0x3993CB9, 0x169754E, 0x3B4DF81, 0x067E81B, 0x3E1583F, 0x0DBE39F,
+            0x04BF107, 0x1452E3D, 0x0472588, 0x19155AB, 0x2B1B882, 0x0004480, 0x0C7045A, 0x01D11D8,
+            0x000018C, 0x06CA2B2, 0x169F8C0, 0x01ACC52, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x26C3D43, 0x0735AD3, 0x0C6563C, 0x1E3CBBE, 0x3F599F5, 0x1DCB429, 0x0D8D0E5, 0x115A690,
+            0x257E298, 0x1885A6D, 0x346E88E, 0x0EDE7FB, 0x3B04F6A, 0x0AAD24E, 0x2E3E11D, 0x1827055,
+            0x1B5F71B, 0x1E7E0ED, 0x236FDCC, 0x006644E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x327D22D, 0x0DAF214, 0x15BDF22, 0x08EB875, 0x3ED663B, 0x0955D0F, 0x2329FA7, 0x000E035,
+            0x31426E6, 0x13FA591, 0x06BE0F2, 0x0F7B679, 0x025207D, 0x0EE0B69, 0x3E73FEB, 0x020E194,
+            0x0ACE779, 0x0A6D74D, 0x2044C76, 0x08AC815, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1D02421, 0x1718F88, 0x1FE33CD, 0x19E581F, 0x0B91E52, 0x1938EBE, 0x27610C3, 0x1821E6C,
+            0x1797A63, 0x05FB893, 0x04FC968, 0x1405305, 0x0B17AB0, 0x015F4C3, 0x1B5BFF0, 0x003F15D,
+            0x213122A, 0x1DC5E68, 0x054CFE6, 0x1043388, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x000F51D, 0x11B6037, 0x136FFA7, 0x02FFB21, 0x1CB1413, 0x1A41A3C, 0x1F13C7C, 0x14C2F26,
+            0x113F57F, 0x0519184, 0x3CC5E88, 0x0F8C894, 0x226F819, 0x014C203, 0x3B90180, 0x10303AF,
+            0x152CA24, 0x18D3B6A, 0x05679AE, 0x04AFC1A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^35 * G */ {
+        {
+            0x0C96CF5, 0x095C76E, 0x0FCEC21, 0x1897B37, 0x2A9CA12, 0x1C1E56E, 0x09D3700, 0x08AE1F2,
+            0x29AA51C, 0x0CA86F8, 0x1BB5BE1, 0x1221DA2, 0x3D8A074, 0x18447A6, 0x278B76D, 0x109A9C4,
+            0x3755AFB, 0x0E6DC0D, 0x305910C, 0x15FDB89, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x293164B, 0x03F6C66, 0x27B7A5A, 0x1E8E323, 0x0EFBFC3, 0x0135B70, 0x17EC3F0, 0x03C8842,
+            0x32EAD2D, 0x19B03B8, 0x03AC59E, 0x188D3E6, 0x357B28C, 0x1990857, 0x00D7A5D, 0x19C7464,
+            0x3652B65, 0x13FA055, 0x2DAB16A, 0x1FAE8BE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3F4AA39, 0x0EAC41E, 0x34DC1D9, 0x08B824F, 0x1C6A79D, 0x1528CD4, 0x3BD9C28, 0x118B22D,
+            0x1892194, 0x0D6524A, 0x028EF28, 0x1572088, 0x11FDB49, 0x0E27E93, 0x056AF09, 0x0E9F8D4,
+            0x283DD86, 0x1AA6820, 0x288F3C8, 0x1992713, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0D3A3D4, 0x1ABDB5F, 0x37244C5, 0x19499F3, 0x08DBC90, 0x18BFE74, 0x1156F57, 0x13D2345,
+            0x31710E4, 0x1F2016E, 0x11B0A3F, 0x0E97511, 0x1C97667, 0x1CE36F2, 0x3AEFB0A, 0x06A0643,
+            0x0EF6628, 0x1DB4118, 0x39184A1, 0x18D3F0E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x151F04B, 0x0D68792, 0x0FEED17, 0x024DCF6, 0x015B445, 0x0F68D6C, 0x05D5CF2, 0x148C278,
+            0x1E7EB8D, 0x1D1A044, 0x065CAAD, 0x1946C80, 0x128CA10, 0x105729D, 0x3B26295, 0x1A0C48B,
+            0x0405560, 0x06EC351, 0x3E27D89, 0x09B9652, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x18BCCFF, 0x143FBE6, 0x2805ECC, 0x0A55EF3, 0x1D625DF, 0x0746DF4, 0x38B5278, 0x07FE316,
+            0x18AA53A, 0x171D67B, 0x0F42F5D, 0x05CE27B, 0x2699FB6, 0x0D24B09, 0x2E12835, 0x04A592A,
+            0x0F5A6C9, 0x15D6B98, 0x09378C7, 0x0B92C6A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0CBF4DF, 0x0CBFC92, 0x201CB49, 0x150EB8F, 0x3628227, 0x1EBB08B, 0x1B2BCFF, 0x1679C56,
+            0x2042ECC, 0x0791AC9, 0x118688F, 0x168C4D8, 0x2289DAC, 0x1C62A4D, 0x39929A1, 0x112F775,
+            0x23E4945, 0x12F7194, 0x12BFDD0, 0x0ADC602, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x24F0F20, 0x04C5CB5, 0x0E7B96B, 0x09EE9D5, 0x232A348, 0x187B5A1, 0x37C7066, 0x138BFC4,
+            0x2077150, 0x102CD0C, 0x02F3F3E, 0x189393F, 0x3F4660C, 0x14A9D72, 0x3DCFFA9, 0x103530E,
+            0x02BAA5A, 0x06EFF9B, 0x3EE4E6E, 0x09F8585, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1812B99, 0x19C12E1, 0x27EE3EB, 0x00FBD3F, 0x08B088F, 0x0824A6B, 0x2E16192, 0x07278EB,
+            0x3429A70, 0x0D83EE5, 0x3AC7244, 0x0662081, 0x26D2E16, 0x0DA368A, 0x21A2353, 0x13E448B,
+            0x1D47500, 0x0CAD5DD, 0x2CDF257, 0x00F6A6E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2CB523D, 0x1D180B4, 0x1ABF5DA, 0x187D84D, 0x1C52830, 0x1E18225, 0x2453351, 0x017F3DD,
+            0x20219EB, 0x072D664, 0x262F403, 0x0764D04, 0x16CAD5F, 0x196A9D5, 0x3109A74, 0x0038377,
+            0x13223FC, 0x17CBC6A, 0x1B6B7E0, 0x0F7B62A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x265C192, 0x074BEE3, 0x1F33EAF, 0x148059A, 0x0C0953B, 0x091BAC4, 0x2D38A56, 0x0571BC4,
+            0x3745401, 0x1C79876, 0x1DD7569, 0x0A2BFDD, 0x168BE5C, 0x05699A8, 0x1EDAD00, 0x1BB1F40,
+            0x1CA5CDF, 0x1748F47, 0x373E946, 0x0C70269, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3CEACF0, 0x036706B, 0x253AB7F, 0x18A6559, 0x342D14F, 0x1354E74, 0x29D00B0, 0x0D1EF85,
+            0x1A03FD2, 0x17ADBD2, 0x260DF98, 0x1F0FFF4, 0x22B4BE8, 0x08E6048, 0x35E18AF, 0x01D6435,
+            0x0CCF18A, 0x0ADA616, 0x1005AC1, 0x0F43AEA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3ABD5E7, 0x1EDC03B, 0x1361EE6, 0x0134992, 0x2421078, 0x07B05A1, 0x3613C5D, 0x199F5C1,
+            0x1E909AE, 0x17FD316, 0x1E9A912, 0x025ED28, 0x18F7BFB, 0x1EE71B2, 0x3304A46, 0x1D78905,
+            0x07CC3B7, 0x1C1507C, 0x3B27504, 0x0955A3A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x355DB2D, 0x1F69869, 0x11593A6, 0x0207C26, 0x1DB0A19, 0x0F5231A, 0x08B88BA, 0x0511B80,
+            0x04AF7C4, 0x03A9FB0, 0x2FE809B, 0x120E6D4, 0x23BB4EB, 0x0B9F56C, 0x08AD462, 0x1A092B7,
+            0x3BCA5C1, 0x178BA45, 0x397DEA3, 0x03E7558, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x00FA0DF, 0x020861C, 0x0250EA2, 0x1EFBFAE, 0x1114DC9, 0x03FCD37, 0x33364EC, 0x15F9F1D,
+            0x0A78991, 0x1AB86E4, 0x18BDD3E, 0x129ECC5, 0x0CEA66A, 0x04C4D6D, 0x3334210, 0x05FE922,
+            0x1388A32, 0x147C561, 0x2044F8B, 0x0866697, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x03D2789, 0x05DA9EC, 0x2D833CF, 0x0116428, 0x2C0D7DB, 0x0F63191, 0x086560C, 0x103715F,
+            0x3E95B29, 0x0D3AE51, 0x22AC55A, 0x1C36BCE, 0x13333F6, 0x0993B07, 0x2D670A6, 0x16D9676,
+            0x01B626D, 0x142AFE5, 0x06D815C, 0x0826E20, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^34 * G */ {
+        {
+            0x00AAD79, 0x1B40B44, 0x26AE5E9, 0x00856FF, 0x37D9FA3, 0x172ED6D, 0x0053CC9, 0x0AA9F97,
+            0x279C808, 0x0410A9B, 0x3B553D6, 0x06D6B8E, 0x376EAE9, 0x07C4822, 0x16965BF, 0x07C3AF1,
+            0x2D17151, 0x05E73CB, 0x360F117, 0x1EEF8C5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x16F8C23, 0x03B829D, 0x161A3E6, 0x17EC12C, 0x220406F, 0x06FD1FD, 0x256E6A9, 0x15DC0D4,
+            0x3ADC640, 0x1959A4A, 0x33B5E15, 0x0B58E3F, 0x3C993B5, 0x1CF6A8E, 0x0CB7ACE, 0x09D6B33,
+            0x3754787, 0x03DA7A5, 0x10157BE, 0x0DEDECB, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1B1A1CE, 0x06AC766, 0x2AC4BE1, 0x03CC25C, 0x3B5B83A, 0x09D5140, 0x235605F, 0x0A8A20D,
+            0x32F975B, 0x05AF826, 0x1C5B0B4, 0x06B317C, 0x360BBF8, 0x11125C8, 0x1344DBE, 0x1C2EF80,
+            0x2A81FB5, 0x137D6F2, 0x1592CDB, 0x063DD46, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1F80303, 0x0175CEC, 0x34C9DE8, 0x16976A3, 0x0CF55D5, 0x1EFBC7F, 0x23DC986, 0x0FBE0F6,
+            0x2AD1FFB, 0x1B2FD48, 0x1FFA8E6, 0x1C5F80D, 0x0639568, 0x02CD5C3, 0x30D7206, 0x078E354,
+            0x3FCCB40, 0x101B2D3, 0x3D243A6, 0x09A4886, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x07D82D5, 0x1B9114E, 0x0561079, 0x15056BC, 0x384B7BB, 0x0CD5077, 0x24469E2, 0x14B8807,
+            0x13F7A35, 0x171F752, 0x3F5A4F7, 0x1893DA1, 0x0E9B6B1, 0x190EDDC, 0x31493D8, 0x18295CE,
+            0x3B68786, 0x19E8E48, 0x23EE6B4, 0x18A217F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x10BB8D5, 0x05BF714, 0x3D1F0CE, 0x18C5889, 0x3623237, 0x1AE8D4C, 0x0FF4E06, 0x19BF2D8,
+            0x22B5BD2, 0x01E8A0D, 0x0303A7C, 0x19D9870, 0x1040530, 0x1078559, 0x04584CC, 0x0FB4C35,
+            0x28F0D34, 0x03B8385, 0x31198E5, 0x0A20754, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2C20804, 0x1A77194, 0x12C1D43, 0x09089C3, 0x16D54F8, 0x0235319, 0x1E2F6DD, 0x150BB85,
+            0x0812DB6, 0x143E14A, 0x2C208C1, 0x1779FB6, 0x11141DA, 0x1A2AAC7, 0x38F29EA, 0x0864882,
+            0x042E7D1, 0x1786581, 0x2158E5D, 0x13F8E44, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x31C92D2, 0x158FC59, 0x0748882, 0x1220250, 0x209E081, 0x0A267D5, 0x3DEF009, 0x17A0280,
+            0x2BFF261, 0x1D016C0, 0x2B85F1C, 0x0C2966B, 0x0C203A3, 0x1EFFFE5, 0x2FA3B22, 0x0BC4B5C,
+            0x0AD4011, 0x0172433, 0x11BC629, 0x0F648A7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x268FB29, 0x1FEEFDD, 0x3FABF59, 0x1DC515E, 0x0D28BCB, 0x0321A30, 0x39A523D, 0x18DC08C,
+            0x04E0AFC, 0x140BE87, 0x1C3EB57, 0x16B7FDB, 0x3640CD0, 0x1BE09C3, 0x0F74A97, 0x0D77549,
+            0x11DA5DE, 0x1AC1FEF, 0x0E5BCEF, 0x0F0119B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0E855EE, 0x01503AB, 0x2D695E5, 0x0FE185B, 0x131D045, 0x06A7499, 0x0F88F72, 0x03E7F48,
+            0x2E7B072, 0x1C11FA5, 0x2379FBE, 0x049C034, 0x380AD77, 0x0C99DB0, 0x2058CCC, 0x10B04F6,
+            0x2B2B28D, 0x06E7E9B, 0x3EA1A7F, 0x0C2A4BF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x023A92D, 0x064B1F7, 0x1702049, 0x144D06F, 0x12595B6, 0x132AB47, 0x1350BCF, 0x116DB28,
+            0x0CF4630, 0x11852D7, 0x1E86595, 0x0269E54, 0x08CB20F, 0x013F580, 0x186DAEA, 0x1AD0292,
+            0x0AEC161, 0x04365D2, 0x253446A, 0x1F92305, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1170B86, 0x08BB922, 0x014F70D, 0x0A75147, 0x3767F6F, 0x046E72F, 0x001F8DB, 0x0DDA8EF,
+            0x120382C, 0x1D22225, 0x3F3608B, 0x11E0EC5, 0x336F05B, 0x1A80063, 0x2CFF57F, 0x0F95D23,
+            0x1FBB57C, 0x1831486, 0x1A2D5D7, 0x1A1D495, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1B44444, 0x167F4B7, 0x0532F8D, 0x0F2A1D6, 0x3F3F8C8, 0x055D49B, 0x1046543, 0x01F92E4,
+            0x1D66CE5, 0x0CDBA2C, 0x2A77723, 0x127A38B, 0x2A8C1E6, 0x1F5937E, 0x2F76C92, 0x1062425,
+            0x2F1128D, 0x00622E5, 0x325800B, 0x013E37D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x32952A2, 0x029A26C, 0x13E9B46, 0x0ED53CF, 0x1F57D8F, 0x0112BDC, 0x325FBA6, 0x0B25350,
+            0x150F7F1, 0x0059D9F, 0x3D22075, 0x1C1CB97, 0x36C99C9, 0x0FC1B53, 0x23752E0, 0x10B7CE0,
+            0x05E611B, 0x190F3BC, 0x204ED87, 0x1CB02D1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0FBA299, 0x04F7C3C, 0x2B511D3, 0x0EB9EB1, 0x0375F3A, 0x1EE4712, 0x05AA288, 0x03C008A,
+            0x3A70D87, 0x1E41003, 0x2FDCA66, 0x15051B9, 0x369F7F6, 0x126A558, 0x387FC39, 0x02CE1CB,
+            0x14C1C3F, 0x07688BD, 0x192AA28, 0x05C1C4B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0CD90FA, 0x13B8CD2, 0x2CEA337, 0x137F365, 0x02940F8, 0x182FFFA, 0x3C95EEC, 0x0A5CAD7,
+            0x20398F1, 0x1C2B9CE, 0x2EC1CFF, 0x039DD47, 0x261BC29, 0x065AEA6, 0x28CBE4E, 0x1725B0F,
+            0x37345CB, 0x1DE0959, 0x2988E32, 0x04ED190, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^33 * G */ {
+        {
+            0x153CFD9, 0x1C09818, 0x2AE9E2F, 0x01F512C, 0x065BFF1, 0x0ECF3A4, 0x26C39F0, 0x08DE5AF,
+            0x355DA79, 0x12376CD, 0x398041F, 0x03CDE6A, 0x255F22D, 0x1CD4FC8, 0x24F95DE, 0x18C28C1,
+            0x0471DF0, 0x13961B3, 0x2546AC3, 0x07F535D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3ACC9C7, 0x1BC806C, 0x244A5B0, 0x0BC2327, 0x166A6BC, 0x007BA1F, 0x381F33A, 0x1978F3D,
+            0x243E0D0, 0x1769F8E, 0x1C8857B, 0x1C0BC06, 0x1595B89, 0x051F46D, 0x3674D11, 0x13C3F85,
+            0x367D274, 0x1EA1C12, 0x36658F3, 0x0744BCD, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x117A320, 0x0721F18, 0x2E4F3F8, 0x1C71AA5, 0x2576CE5, 0x137EF44, 0x3F8F5B5, 0x00865AE,
+            0x32DAD60, 0x06A11FA, 0x236FA97, 0x1FD2FD5, 0x36462C9, 0x097924C, 0x3F7F24B, 0x0DBE722,
+            0x1A8BFF6, 0x174DDB7, 0x1D6B8AB, 0x093685C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x00781F3, 0x10822EF, 0x3051D11, 0x03B1D66, 0x06AE43E, 0x008D35D, 0x08CE918, 0x1DDBE05,
+            0x0694C49, 0x0DE89C6, 0x3EC97D8, 0x187EE2E, 0x0F4CD95, 0x19DCAF5, 0x3BA7029, 0x1B03FF9,
+            0x22C6EA0, 0x1E43F19, 0x004EA6C, 0x09C397D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2895A23, 0x1AF13BE, 0x08246A1, 0x1B353B3, 0x19470CE, 0x1A78B20, 0x231EC3E, 0x163C875,
+            0x11CBAE3, 0x1BF754A, 0x3DE0244, 0x0EA3BC6, 0x18729BC, 0x15A92B0, 0x2198FC3, 0x1E4C09C,
+            0x0FA6E2C, 0x0AA5797, 0x2ABFED7, 0x090B476, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3A87252, 0x0DDE30A, 0x20C367C, 0x049C656, 0x2110B61, 0x00C5C64, 0x257B2DA, 0x086CEEE,
+            0x2F7BD64, 0x0245093, 0x14EE01C, 0x09E3B7C, 0x182797E, 0x04FDC6F, 0x1F3424F, 0x1DA69A5,
+            0x09CF34A, 0x1D7B3F7, 0x291D70D, 0x12CCB16, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2BBB49D, 0x019ED46, 0x3587026, 0x0DDCB27, 0x1CE3915, 0x1F07701, 0x33DC835, 0x0410F83,
+            0x15CEED3, 0x0864F10, 0x0BC9F5F, 0x0D33BDC, 0x38BE4B1, 0x1EFF947, 0x1A1B255, 0x0897420,
+            0x31F2228, 0x1861D51, 0x3DC0AC9, 0x17BA48A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2FA5479, 0x192F1DA, 0x03E4483, 0x19A683F, 0x2A7C0C7, 0x08444FD, 0x12955AC, 0x17B6CE2,
+            0x1F438ED, 0x0DC437D, 0x34CB8BE, 0x0C722C3, 0x14604BB, 0x0728527, 0x370385D, 0x02B2CDD,
+            0x3B4680E, 0x05E99FE, 0x153BC95, 0x1F7ADBC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x084C94C, 0x12513BA, 0x2448815, 0x1DBD913, 0x0C87F16, 0x0DA22B5, 0x38E97CD, 0x13D2D0D,
+            0x0526C4A, 0x0FFEAED, 0x03DD287, 0x1C74CCF, 0x20074E3, 0x1D1DDC9, 0x2E72D5B, 0x03F8688,
+            0x12C965E, 0x0CF5D1E, 0x3DDE386, 0x1A67B3D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3082A78, 0x1D97E3B, 0x05E6506, 0x14E029E, 0x2AF2CCD, 0x11E17A5, 0x216D8FA, 0x0E68250,
+            0x132B89E, 0x1950034, 0x0642572, 0x08D5444, 0x07FC564, 0x09CC311, 0x1A36597, 0x1B8BAB7,
+            0x25AAA47, 0x104B87D, 0x3991141, 0x1CE66E7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1A6EC9F, 0x01AF134, 0x1AA82D5, 0x0EE67BF, 0x256E9B3, 0x04F33F3, 0x371E7AB, 0x1184F1D,
+            0x1E12F21, 0x116F4CC, 0x1EC34A4, 0x065F049, 0x1A83166, 0x03B479C, 0x3A67227, 0x14CC527,
+            0x1D5B615, 0x0A7392B, 0x37C01D4, 0x120524E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0982F21, 0x154336A, 0x30F97C4, 0x0F0B6D4, 0x119B598, 0x06BD775, 0x090BD13, 0x0FD6755,
+            0x0F996E6, 0x152E557, 0x0A2764C, 0x0784A6F, 0x0A2D1ED, 0x1645EA3, 0x125A6F2, 0x06E2D05,
+            0x1885781, 0x132406B, 0x0E24B00, 0x060951C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0407FFD, 0x1C92A03, 0x0818F58, 0x114AAD0, 0x32CE77A, 0x114E188, 0x1749156, 0x18C03BF,
+            0x2774A84, 0x07B7631, 0x3BA0EA7, 0x13B4822, 0x255220F, 0x14B30CA, 0x1C6BC79, 0x0E72696,
+            0x068FFA8, 0x059AD41, 0x079DB98, 0x05B3B1A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x10D901C, 0x07B1BBB, 0x1C26D21, 0x07667A6, 0x03AAAA7, 0x0F3D754, 0x1AF95E4, 0x0598B28,
+            0x2560E2D, 0x06345BE, 0x2391A27, 0x193FBAF, 0x18AA49F, 0x0144D79, 0x2ABD3AA, 0x1BB8159,
+            0x3B184C4, 0x099E961, 0x38ADE4D, 0x03D6E68, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x16459E1, 0x1C1D0C1, 0x3356884, 0x1E8AF56, 0x3153089, 0x0D01016, 0x3F8B654, 0x0014DDE,
+            0x0E57D98, 0x0992BFF, 0x2447955, 0x0A4781F, 0x0DF9F6A, 0x01ADDB2, 0x1874F60, 0x10E433F,
+            0x3B0B110, 0x1682BC8, 0x2DB0E84, 0x06FCA69, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3799DDD, 0x0D91F1A, 0x21E2DA4, 0x1D7BCAC, 0x373D57B, 0x09E41D0, 0x3055BBD, 0x12418E6,
+            0x2FCEE90, 0x18F6234, 0x3146098, 0x1D74CC8, 0x27C6E70, 0x10CCB25, 0x3CB8D51, 0x1AF21B4,
+            0x3AF9040, 0x09EFDAC, 0x289E1C6, 0x13A6690, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^32 * G */ {
+        {
+            0x255586D, 0x1C26529, 0x3C18284, 0x16F6830, 0x004B64C, 0x07E1010, 0x1C2AF96, 0x1553BA2,
+            0x226CF55, 0x16C8BDF, 0x3797B93, 0x0746163, 0x15CCDD0, 0x0AF72A3, 0x353FCFF, 0x19EF162,
+            0x2225F83, 0x05A400F, 0x21B3577, 0x171E177, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x22E3900, 0x1D08DEF, 0x2FF467A, 0x1043888, 0x0140577, 0x1DC93B9, 0x2D8F4EA, 0x0BEE474,
+            0x04621FC, 0x0B32054, 0x375551E, 0x11F6740, 0x01C634A, 0x0A721BB, 0x044B835, 0x003E6F6,
+            0x0DACBC8, 0x029B3B1, 0x2EE48EE, 0x1A94367, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x02942CE, 0x1319902, 0x202BB4D, 0x1B63C67, 0x35DF3DE, 0x1DB9B5E, 0x2279F40, 0x1463CC6,
+            0x15E9C06, 0x1DDF2F4, 0x304AD08, 0x174A1DD, 0x3CC9015, 0x196C41B, 0x18BA284, 0x0977682,
+            0x39B3814, 0x16FF4ED, 0x2F8AAC3, 0x198EBD9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1A73E23, 0x1E3AC79, 0x3FD26E0, 0x1F08852, 0x2DB0CDB, 0x060046D, 0x1499D9C, 0x16CF869,
+            0x1E4E28F, 0x128367F, 0x31940FC, 0x1242E1C, 0x04355E7, 0x1017AF7, 0x0D17491, 0x1ECDEE3,
+            0x3DEFDB0, 0x08EC814, 0x049F240, 0x11DF13F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2B83558, 0x031A29E, 0x3ED17A8, 0x1C87FF2, 0x1528184, 0x0127524, 0x3EA977D, 0x13CC957,
+            0x0350D3A, 0x1F90633, 0x2C9F235, 0x1F5CFC4, 0x27DC3AB, 0x0A29801, 0x1342290, 0x07AF6C4,
+            0x049E9C8, 0x1ECF8C1, 0x3C9DDC7, 0x130CFE5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x109DA7F, 0x1A30BC3, 0x3F0A8AC, 0x1AEDE8E, 0x06257C0, 0x14D80FA, 0x1FABB77, 0x1BFEAFA,
+            0x16EF920, 0x1DCAE26, 0x0256236, 0x18863C7, 0x1A50FE3, 0x01039F2, 0x2795629, 0x05D75BC,
+            0x3442CCD, 0x16620FE, 0x260F968, 0x121A79B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2F8D3FA, 0x069C561, 0x0830D19, 0x1B67BAE, 0x3DD2967, 0x1B66F97, 0x3981793, 0x1CF7207,
+            0x3A8FCF4, 0x1660769, 0x242D9D7, 0x1461101, 0x101ED97, 0x0F59904, 0x0C042A0, 0x0685026,
+            0x18B22E5, 0x0C85E89, 0x03E3494, 0x198A1C6, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1ABC6F9, 0x010197B, 0x17AD9D7, 0x0BDAE77, 0x02613FB, 0x04D7FBE, 0x287E001, 0x0C96991,
+            0x0CE1669, 0x0C80E57, 0x0E8BFC7, 0x1567DC6, 0x3E99AA1, 0x0363053, 0x0A078CB, 0x06E6A29,
+            0x344B438, 0x064596E, 0x3739DBE, 0x0F8AAA2, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0781CD2, 0x08F2F4F, 0x31F4FE3, 0x06EC8B7, 0x0CAA4A1, 0x012A275, 0x1DE88ED, 0x0AF4EBE,
+            0x36D0596, 0x03BA369, 0x15E37D9, 0x0B6F2D9, 0x3FCD8AC, 0x0251A55, 0x15F7BA6, 0x156C425,
+            0x200CB89, 0x0CC5F81, 0x317454F, 0x15AAB44, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x088046C, 0x156F261, 0x12180CC, 0x17D4CC9, 0x203A4FA, 0x1A436BE, 0x379BCF5, 0x1004AE5,
+            0x34A39E5, 0x028ED31, 0x03C398A, 0x1E7F5C1, 0x1AD5BFA, 0x1C8ECBB, 0x33D5FF5, 0x0517CBF,
+            0x1D936B3, 0x19845C4, 0x2133895, 0x01847AE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2493335, 0x19CCCDC, 0x0889A3A, 0x0AA1571, 0x1BD7692, 0x0874E31, 0x21D0CD4, 0x0CE9913,
+            0x0A3853B, 0x1923E2D, 0x046ACBF, 0x1C0452D, 0x260841A, 0x1C684CB, 0x07F2F4B, 0x05FDBAB,
+            0x12F5695, 0x1D95E7F, 0x2E70FB0, 0x1920AD4, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1DE4B34, 0x14AB6A1, 0x332E75A, 0x155B49B, 0x3D59899, 0x14C6B91, 0x2651542, 0x1889711,
+            0x3378A1A, 0x04153FB, 0x356B335, 0x01EC757, 0x172B2EB, 0x1A610A1, 0x266B9DA, 0x0358C75,
+            0x006B4B4, 0x0641FE0, 0x3A874F3, 0x0C6FA97, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x31F53D6, 0x15A0980, 0x11E874B, 0x1384DB5, 0x1615DCB, 0x0DF82BB, 0x3935FBD, 0x1119E2F,
+            0x25C67B0, 0x1C80E70, 0x23B4D64, 0x08D19A4, 0x15CAAAB, 0x1EBC9EA, 0x11A56A4, 0x1EF60D1,
+            0x06628BC, 0x0FA8CB7, 0x1B5C856, 0x1E23560, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x320C85D, 0x0A8009C, 0x3BB4BD2, 0x02E3DB2, 0x32C8916, 0x0F4E313, 0x161C3FF, 0x04858F7,
+            0x104268F, 0x03D71B1, 0x21D1D34, 0x02F03B8, 0x0467F07, 0x031B489, 0x313B1BA, 0x1DCDA72,
+            0x1A50D99, 0x0A8FF9C, 0x213C71D, 0x19478C1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1BE0742, 0x0B85DBB, 0x3591E35, 0x1355754, 0x1B10BCB, 0x18F7FD0, 0x3160983, 0x078A83A,
+            0x3A1531E, 0x180B854, 0x26FB7F9, 0x10FEF30, 0x20F76B7, 0x1FF863C, 0x0426AD7, 0x1DBE659,
+            0x25831F7, 0x0765596, 0x0025AA2, 0x125B96F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2318330, 0x12D0EF2, 0x17FF0D5, 0x1008464, 0x27B66C0, 0x08DDEC1, 0x24D3F60, 0x0903ED7,
+            0x3210B75, 0x00F762D, 0x2AE94E5, 0x0340053, 0x10774AE, 0x17A10F4, 0x38A5FC4, 0x0259027,
+            0x11183E2, 0x0805D9E, 0x2D0B0F8, 0x03B4149, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^31 * G */ {
+        {
+            0x21E282B, 0x1C12DAA, 0x0224A93, 0x08501FA, 0x02FD235, 0x0290D42, 0x08D1054, 0x13DE608,
+            0x29CF542, 0x04A9AE0, 0x2945922, 0x0932F7A, 0x0450CD0, 0x01D1A33, 0x2BB6E0C, 0x131E9F2,
+            0x38E57F3, 0x03C031A, 0x07F20B3, 0x1E6B094, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1B332C3, 0x1D71358, 0x21077AB, 0x1FEBEF0, 0x1AADF18, 0x009D7AB, 0x3C3989B, 0x0EB54C7,
+            0x38D50CC, 0x137648D, 0x198F957, 0x0D493B5, 0x366F47C, 0x167E49C, 0x2AD9E3C, 0x0BE69AD,
+            0x15092E5, 0x1268225, 0x245138F, 0x047A2FF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3F7BBA1, 0x155F634, 0x2B8C460, 0x0B23E22, 0x339484D, 0x1FD333E, 0x2B5F016, 0x05438AC,
+            0x3F7970E, 0x18DE090, 0x2B7E53B, 0x1B93CAE, 0x0D3C469, 0x0F9D92A, 0x1BE1436, 0x146E3F7,
+            0x1C723A3, 0x0279A0E, 0x326556B, 0x032012B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x12BF39C, 0x0757AC2, 0x04D0822, 0x16B49CF, 0x1B6990D, 0x03EE71C, 0x3B569A7, 0x088B5FC,
+            0x1199C81, 0x0FFD89D, 0x1D02E15, 0x0E1FE93, 0x216FD2A, 0x02E2CEB, 0x38BB240, 0x16BFD0A,
+            0x15C5A7B, 0x1F99849, 0x17B2772, 0x15761BB, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x177DAD3, 0x1878E3C, 0x2326A0F, 0x0BFB78C, 0x06D55D7, 0x0B4AA6E, 0x1722F81, 0x1C30F62,
+            0x21F7CC8, 0x105B07C, 0x0AD6DBE, 0x03416D9, 0x3E7E993, 0x197ADB4, 0x1EE7301, 0x0E75493,
+            0x2331761, 0x13ABE85, 0x200D56C, 0x1EE9459, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x01885DC, 0x09A2A67, 0x2164752, 0x0E4B87D, 0x2E0F4DF, 0x06C0A80, 0x25A0AD4, 0x1C044D0,
+            0x262A714, 0x15FE921, 0x03EA3C3, 0x023A1F2, 0x214253A, 0x08ECB56, 0x140AC92, 0x05F617A,
+            0x2C69FFF, 0x102D7A9, 0x2CA17C3, 0x170B9B7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3B8165C, 0x12646EA, 0x324EBA0, 0x0493852, 0x3B703F9, 0x1482599, 0x365D0F7, 0x16D878F,
+            0x0C7C870, 0x0504171, 0x077626D, 0x0C206E6, 0x366B435, 0x1835BF5, 0x245F47D, 0x1E76CA0,
+            0x3083E4D, 0x0AB8D65, 0x01AAE81, 0x0650930, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x154319F, 0x06B5298, 0x1ECFF3D, 0x139F05F, 0x149D69E, 0x0F2D326, 0x33FE10E, 0x1C2774C,
+            0x03C4617, 0x1F39827, 0x369A846, 0x0C211CE, 0x2228639, 0x1C93FC3, 0x2FC4369, 0x1EB68DE,
+            0x05039CC, 0x17DCDB1, 0x1D83A89, 0x0847000, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1730E1A, 0x1156116, 0x33C0783, 0x0A5F230, 0x28D1642, 0x006B1EF, 0x18B5E54, 0x044B5C2,
+            0x1CA988D, 0x0F242C3, 0x27E15B7, 0x1F5C681, 0x23C45AD, 0x0D25FA9, 0x3C8BABB, 0x0412AD3,
+            0x0606E0E, 0x1F0A4A0, 0x1B207E6, 0x0862E27, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0369AC4, 0x16BB978, 0x081DA87, 0x07A3E76, 0x1F56FD7, 0x10F4DD3, 0x22CF56F, 0x0ABD78D,
+            0x332978D, 0x13D951E, 0x2F4BC88, 0x013BB85, 0x1C67B5B, 0x1E6AFE6, 0x0E81287, 0x064D75F,
+            0x121864D, 0x1A3555A, 0x27EB097, 0x197A6F2, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x12DF82D, 0x0010C31, 0x234B357, 0x1B88761, 0x0530E5E, 0x11D57E1, 0x2642057, 0x1C0374B,
+            0x0168CD7, 0x074F9E7, 0x325A88B, 0x1A4ABFD, 0x11B4B71, 0x1211061, 0x19F90CE, 0x04ED4C9,
+            0x0AFBC58, 0x01A5DC6, 0x1F35904, 0x11B2690, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3C3F0C8, 0x0885309, 0x3615440, 0x0722243, 0x2910173, 0x005AF7B, 0x3B4A38F, 0x0AE2005,
+            0x34BC6E3, 0x0C3D853, 0x33185F9, 0x1AA2557, 0x340039C, 0x11C00B3, 0x38EC965, 0x1E0DBAA,
+            0x3788A2F, 0x1C8A2E7, 0x105F35C, 0x1BE38F9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x181F4CF, 0x091794F, 0x263B441, 0x1C89112, 0x015E8D7, 0x197B45A, 0x1A283BB, 0x02FC65C,
+            0x039CCC7, 0x0C95074, 0x058D4D0, 0x0541BD5, 0x1DBD3A4, 0x1FB7D35, 0x290A7C5, 0x1824323,
+            0x3444741, 0x1C9F77C, 0x3D655D9, 0x0BD09DE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2C23131, 0x0EB6177, 0x068EE3D, 0x1CEABFD, 0x0185C12, 0x137DDD8, 0x39897D8, 0x02EC229,
+            0x19E1FE4, 0x074F523, 0x36AFC70, 0x14E8972, 0x28B9BC7, 0x103F0DE, 0x2B4A260, 0x1D7EF8F,
+            0x2B3BD27, 0x09BC19D, 0x34BFA9B, 0x01BEF58, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x32973ED, 0x1262D73, 0x29D893C, 0x1E44E9D, 0x047FB76, 0x1E32525, 0x02F5685, 0x1ECEF26,
+            0x3F453CA, 0x02A46FF, 0x20A2EAD, 0x1494BFB, 0x059015A, 0x0C1286D, 0x2D17926, 0x08F7DA5,
+            0x0DD2B5C, 0x054B3CB, 0x2D92D62, 0x05AE556, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x22DFDDB, 0x12BCE5A, 0x1FDEE46, 0x1F82E07, 0x16A194B, 0x03C0A94, 0x01F7966, 0x037CD30,
+            0x319F929, 0x0076182, 0x15A93F2, 0x09858B1, 0x177364A, 0x1F61C18, 0x06B261B, 0x0730572,
+            0x094588E, 0x13511E3, 0x2B87A20, 0x0072F38, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^30 * G */ {
+        {
+            0x32825CF, 0x07BBF86, 0x2CB4CB2, 0x17F85EA, 0x22DCC6C, 0x06A8B76, 0x26138C9, 0x00A7FB0,
+            0x0B5F08F, 0x14DF4D4, 0x10CC1E3, 0x088F764, 0x2891105, 0x1A147AD, 0x0F369CE, 0x0916B02,
+            0x2D829CE, 0x1FD0DBD, 0x1C3CCD1, 0x0D29FAE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1A76C23, 0x11C61FE, 0x2DCBD55, 0x1947905, 0x21CFDE6, 0x0776AE2, 0x04FCE7F, 0x05E4FB1,
+            0x2D4AEB9, 0x02008CF, 0x0484F18, 0x1861BDE, 0x29E43A6, 0x01F5890, 0x33C7178, 0x1504A71,
+            0x00B93D0, 0x0C04A4B, 0x24638BF, 0x0F5E60A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3058F30, 0x0B59F4F, 0x051BED5, 0x0DB4FFC, 0x332EB30, 0x12BB217, 0x09ED288, 0x0697526,
+            0x34DBCB4, 0x0B1B121, 0x125D57D, 0x0149407, 0x108F228, 0x001821D, 0x0572461, 0x17E14EB,
+            0x1CA4D66, 0x0EE1B43, 0x2DE5458, 0x0A9EC3E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x22650BB, 0x1F86FEC, 0x2586E1F, 0x026CECA, 0x1B7FC22, 0x0E59CA7, 0x0D635F7, 0x11AE582,
+            0x1D8679B, 0x0592E45, 0x080F044, 0x11DCBD8, 0x11DBF0A, 0x0C57657, 0x2C8E336, 0x197490B,
+            0x3792C80, 0x04159B7, 0x23C32AC, 0x078E1C2, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0CAE411, 0x1573CF0, 0x2B86A42, 0x10A3D51, 0x1A35820, 0x0809266, 0x1FE8CE5, 0x08FB57E,
+            0x2DF2B5E, 0x0DB4F39, 0x1C15A85, 0x02E469D, 0x02F5C7E, 0x16DAE0F, 0x26F9BD5, 0x0A4C2A8,
+            0x17B4944, 0x043761C, 0x1CC1BB8, 0x10726AE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x030DD81, 0x1899090, 0x270601E, 0x1739B32, 0x3B049AF, 0x1923413, 0x196D0DE, 0x06D2AFE,
+            0x3AEFF01, 0x13813B5, 0x3B9036E, 0x0740DB4, 0x2ABF63F, 0x05100B5, 0x127A0FC, 0x0EBCCEB,
+            0x08DD1BC, 0x14C1652, 0x3526AA5, 0x0985919, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x153774A, 0x10C4D9A, 0x3C7ED15, 0x1426CB5, 0x216D4B6, 0x1DCE867, 0x3EB4B63, 0x09F162D,
+            0x3B01F08, 0x17C6185, 0x2912551, 0x0D06973, 0x357D987, 0x0CACD55, 0x2D6F72F, 0x05E5B23,
+            0x1FBF949, 0x10B3DC4, 0x337B5CD, 0x02A39BC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x19B3FD7, 0x0D4EC9D, 0x39E1896, 0x02A8614, 0x1750C83, 0x13C602F, 0x3EA38A2, 0x172FAFE,
+            0x2B0F3DA, 0x15DD388, 0x2A28EED, 0x0C3A1A9, 0x09B0E7F, 0x0FBE031, 0x22C3FA9, 0x11D6EC7,
+            0x2437F4E, 0x10499DE, 0x00B284B, 0x0A52EA9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1E18C16, 0x035C0B7, 0x2BEE93F, 0x1C4F97A, 0x2630EE1, 0x0986EF0, 0x05DACDE, 0x1ECE802,
+            0x1EF070B, 0x0C92D04, 0x33279B5, 0x0EC8801, 0x3D7191B, 0x0BFC148, 0x030144D, 0x049E5CC,
+            0x1B3EFD9, 0x020D1DA, 0x0479680, 0x0F3FE8D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1A88CF7, 0x102D4F1, 0x2AB835E, 0x0A9278E, 0x38A8733, 0x0E6D7DD, 0x04AF9A8, 0x0683EFF,
+            0x28349CD, 0x0B42ADC, 0x1911323, 0x1360974, 0x3D670D2, 0x04A00A9, 0x03B5FF6, 0x0373353,
+            0x01499BC, 0x08B6C41, 0x2232177, 0x0684A42, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3BF9113, 0x1B1D50E, 0x0BFA87B, 0x1C42F1B, 0x1EF3FF8, 0x16C5FDE, 0x28970A7, 0x0B70495,
+            0x36D9D73, 0x06A3D57, 0x0DC8FA8, 0x052DC58, 0x05C29BB, 0x106D934, 0x1B184E3, 0x140CAC0,
+            0x01A93AE, 0x1221043, 0x0671275, 0x11842BF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x115691C, 0x03ABEF7, 0x16D5CE6, 0x02D27A9, 0x35A53DA, 0x1C530C9, 0x3BF4C60, 0x10B5D05,
+            0x1D453DA, 0x1A82D6F, 0x159870B, 0x1512BD9, 0x085F642, 0x17B4390, 0x3850414, 0x1717A26,
+            0x0BC85B7, 0x06693AE, 0x027DB93, 0x00368E0, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1EB508E, 0x1FE5B2A, 0x057E768, 0x17961A3, 0x16DD769, 0x12B00F8, 0x10A79BB, 0x0CE14D3,
+            0x33E085B, 0x0A51C80, 0x1C2EC1B, 0x1521A66, 0x3064455, 0x1D2DF2D, 0x361F65D, 0x168EE0D,
+            0x259BAAC, 0x0ACBB2B, 0x3A36925, 0x1C12E4B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x34C5D03, 0x174B7FB, 0x283D8B6, 0x0D6EC4C, 0x3186639, 0x12C66C1, 0x3E4BFF0, 0x1C56BC5,
+            0x008193A, 0x0D58BD7, 0x1DAD68F, 0x0B2CC2E, 0x1E9E97E, 0x0D0457A, 0x05B1ABB, 0x06B37C7,
+            0x0EA8EAE, 0x00F16AD, 0x297BAF1, 0x197001F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2038F56, 0x0992FC2, 0x092DF22, 0x1D7F2E7, 0x184BA52, 0x16E84EC, 0x1269405, 0x19E168E,
+            0x0D77503, 0x0B17DFF, 0x0EF2D26, 0x0DE5A7D, 0x0381241, 0x1A091AC, 0x06F5644, 0x18081C4,
+            0x00CC85C, 0x100ED9D, 0x39A9736, 0x0BBD01E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x07AF3EC, 0x01ED5CF, 0x225213D, 0x054ED3E, 0x082E7BF, 0x03431E9, 0x1D1A22B, 0x099DA71,
+            0x0625139, 0x01786FF, 0x2076A1E, 0x0091553, 0x0E94A48, 0x138E7AE, 0x3E2D21F, 0x06FB208,
+            0x3564003, 0x081BF6B, 0x3832DA1, 0x0177006, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^29 * G */ {
+        {
+            0x34E8405, 0x1560D9F, 0x0CC308C, 0x02A6265, 0x1D63BC4, 0x0FA326B, 0x3DBC07D, 0x07A035C,
+            0x2E67F76, 0x01C0BB7, 0x200C0FD, 0x177F86D, 0x1AD5EF6, 0x11E2C87, 0x16D1971, 0x14C43C6,
+            0x1C0A4C9, 0x1FAB450, 0x0199C48, 0x1B3AB20, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x196A1BD, 0x1FDD53A, 0x1C650F5, 0x0DA8D29, 0x2BB7B46, 0x136DD6F, 0x312EEF7, 0x005E038,
+            0x09C2A9D, 0x14C128B, 0x0CCE127, 0x1BBB04D, 0x3FD15A1, 0x0BBB484, 0x1E16C2B, 0x079C57B,
+            0x1D26278, 0x05B159D, 0x11E07FC, 0x116E7CE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2BF4D9B, 0x1A37214, 0x23B01E3, 0x030D589, 0x3395980, 0x0B63832, 0x2DF8CD0, 0x032DF15,
+            0x3609188, 0x1175AAE, 0x03B16B8, 0x19CE9D7, 0x131F184, 0x1C47E80, 0x1AF3A2B, 0x1C3124D,
+            0x3102A16, 0x00E73C1, 0x096B8C9, 0x0FF5A7E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0A19E94, 0x0C3141A, 0x305905D, 0x15C8074, 0x0D28D88, 0x152D792, 0x3C796B9, 0x17D7A4F,
+            0x3EFF33E, 0x0BFADF5, 0x0909E6D, 0x0EE96F2, 0x03292E7, 0x084AF58, 0x2DD8455, 0x087D15C,
+            0x3FE03B5, 0x0313854, 0x0DAB9ED, 0x082CB86, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x090005C, 0x1BF6835, 0x359BC0F, 0x0C7D731, 0x24E43BB, 0x1FABC49, 0x10136D0, 0x18BD4D3,
+            0x2871EAC, 0x17CE7FC, 0x204017C, 0x0C811C1, 0x3971F15, 0x07A7B8B, 0x03EB500, 0x08F2982,
+            0x1B0AE10, 0x1FB63D5, 0x0AC9C4E, 0x0F4BCDB, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x048E1B4, 0x0DD3486, 0x326A935, 0x06A6702, 0x041B62C, 0x0CB2B7F, 0x0695EB4, 0x04A9ED0,
+            0x2ED0333, 0x0DA3836, 0x3578B9E, 0x05FFCD4, 0x23DB2B0, 0x05264C2, 0x01D8638, 0x1F86503,
+            0x135144E, 0x0C68E89, 0x17FA23C, 0x0559CC0, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3733BA8, 0x07D64AC, 0x3A25675, 0x0D1F67F, 0x24CA0EE, 0x098E98F, 0x3B0EA6A, 0x13623C4,
+            0x1E2D272, 0x0D7C62D, 0x086FA1E, 0x06B88A8, 0x008E88A, 0x0DB9236, 0x0953F0F, 0x0A37F9B,
+            0x00EEF2B, 0x0AB2007, 0x13A62D2, 0x056AFF8, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3E1FAE0, 0x1206ED3, 0x0375C54, 0x1226F74, 0x08EA70C, 0x0D0EFD2, 0x002C9A6, 0x05DD13E,
+            0x19B8598, 0x1A68BC7, 0x385CA56, 0x16C276C, 0x29BAA0B, 0x0F841BE, 0x0C4F906, 0x1AC6FF9,
+            0x3E215F3, 0x1E4B499, 0x0A9087D, 0x0008E8F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3504266, 0x052F077, 0x14BDF37, 0x0867FD3, 0x3CDF43F, 0x044A62D, 0x32E6B63, 0x1CCC93E,
+            0x1E0AFA7, 0x0483903, 0x0EC2D4E, 0x05A46B4, 0x1A49A4B, 0x1CEF132, 0x3F9B85B, 0x146E446,
+            0x0D0BE2A, 0x1E198D7, 0x36CE291, 0x1FA7B96, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3F18E6C, 0x1CF059F, 0x3438269, 0x1F3F241, 0x1707218, 0x012B00F, 0x030F098, 0x0DFA7F9,
+            0x344B274, 0x02A50E1, 0x242A805, 0x16D9A4A, 0x3C379F4, 0x1BA7BA8, 0x1EDE8EF, 0x07596DB,
+            0x092E79A, 0x1888819, 0x18820F9, 0x10B8F25, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x214A161, 0x1D60C0D, 0x21058E1, 0x078EDA0, 0x1F90486, 0x1366B38, 0x195F2BB, 0x1EB3D33,
+            0x3F5A57A, 0x080424B, 0x1223547, 0x13DB0A7, 0x0C0E669, 0x10B140D, 0x08E8605, 0x1C5B928,
+            0x0CC452C, 0x187C80F, 0x09961F4, 0x0AA0535, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2CC41B2, 0x07653A8, 0x2637993, 0x09DCB48, 0x29CC661, 0x138C983, 0x0B3CF06, 0x1F8504E,
+            0x11F9A2F, 0x0E401A3, 0x0F5E8C5, 0x0F23B01, 0x1F9EA36, 0x00CE7D2, 0x2BC2EB2, 0x032DFE8,
+            0x127BBEB, 0x0EAEC8C, 0x0E7ECC3, 0x19359AA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x369E5A2, 0x05F4C10, 0x297059E, 0x1290B83, 0x079E136, 0x03F259A, 0x2AC7B8A, 0x0C0C73F,
+            0x01F99D5, 0x1B7F3CA, 0x130DCFE, 0x0D10541, 0x341284E, 0x17E79FD, 0x37BA20D, 0x0F11253,
+            0x2E6C05A, 0x02ED830, 0x2B47162, 0x0AE1EEF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x35C17EF, 0x072E879, 0x1C464BF, 0x0084CD2, 0x04A66C1, 0x13F0694, 0x2768326, 0x0631464,
+            0x3027C07, 0x0C9E4BE, 0x0C440F7, 0x0CCB555, 0x1E8E07B, 0x1BC0655, 0x13EC02C, 0x0B25921,
+            0x3F7032F, 0x1167388, 0x1A6B4F6, 0x026609E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1874AAC, 0x178D9C2, 0x1F0F0A6, 0x1C97B7C, 0x3763378, 0x0810288, 0x258B12A, 0x055AC52,
+            0x2682FA9, 0x01C3E60, 0x2DDF30B, 0x09E1AF2, 0x368964D, 0x1CF957E, 0x3EA0419, 0x11A7A60,
+            0x3361C1D, 0x04DF929, 0x0434CAB, 0x1DF09ED, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x12C33B4, 0x0C5D19D, 0x0EACEE4, 0x1FFC063, 0x2C0AD56, 0x1D2AAA2, 0x0D31EE8, 0x1AE2B71,
+            0x1F3F539, 0x11DA88B, 0x2756923, 0x1322EAB, 0x05F9F40, 0x182DD1C, 0x0441B29, 0x1AE393C,
+            0x0A319C2, 0x135BB26, 0x03994B9, 0x0A47C87, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^28 * G */ {
+        {
+            0x0D7ABE7, 0x1525C27, 0x18271B7, 0x007424A, 0x3EE2747, 0x1ED8EC1, 0x22A7870, 0x09244A8,
+            0x1E3F7FE, 0x175D26D, 0x19A0E63, 0x00979C1, 0x1356A22, 0x09374AE, 0x23AF705, 0x0947883,
+            0x048121A, 0x1023FC1, 0x3EA20FC, 0x0C599AD, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x296FDE7, 0x0C01D09, 0x1A263AF, 0x1403E90, 0x2C85102, 0x03C71AC, 0x25705F9, 0x00E0BCF,
+            0x144335A, 0x11EA5D9, 0x040DB12, 0x188CD81, 0x3F51C21, 0x1F26151, 0x3187DB8, 0x02F8DC4,
+            0x09047B3, 0x0836625, 0x2564436, 0x13F17F0, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x03EC9EF, 0x0FC811B, 0x20BC5BC, 0x0A793EE, 0x28FC742, 0x026AA7A, 0x1BBAA29, 0x091CAF7,
+            0x16A2662, 0x01D8F99, 0x2327642, 0x0368F24, 0x0373BC7, 0x0116C05, 0x2BFEEC4, 0x1CB3D74,
+            0x29F9878, 0x089FE55, 0x0175DF4, 0x031F630, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x00EDC4A, 0x05AF309, 0x3C9239B, 0x0207A56, 0x12B3410, 0x085DD58, 0x24ACA80, 0x13DD7CC,
+            0x09507FA, 0x1CCE88D, 0x17E3AD7, 0x1E543B1, 0x3B81DAE, 0x140F0FF, 0x08B1220, 0x0972A90,
+            0x0FE5763, 0x10E7564, 0x28BB110, 0x17BF315, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2BC7B21, 0x0F35805, 0x1AB6D1F, 0x0707BC8, 0x01F987D, 0x00DABAA, 0x37895E3, 0x0C48569,
+            0x1DCEB0A, 0x121B989, 0x2CE19E2, 0x062B9F8, 0x1B8A47C, 0x0670C06, 0x022B378, 0x1695330,
+            0x20C48D5, 0x06941EB, 0x1328231, 0x10DCB5A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1799D80, 0x139D6B0, 0x266F664, 0x0C5C4E4, 0x0F4AB8F, 0x0D88129, 0x00F45D1, 0x1EA3712,
+            0x30FCC69, 0x023748E, 0x32CFFD6, 0x1539D2A, 0x36856B1, 0x08857E9, 0x20CC38F, 0x1B95B9B,
+            0x3488C91, 0x0A6EE91, 0x02A1E0E, 0x19AA124, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x01F35B9, 0x0E8A8A3, 0x324CFEB, 0x0B630A1, 0x11E6125, 0x05104EE, 0x3860A86, 0x07B6BBE,
+            0x3A71F8C, 0x0B5F8CE, 0x25A40E9, 0x1D786AC, 0x0F521CD, 0x0CE2089, 0x1E59C61, 0x11A3988,
+            0x3DE5AAF, 0x16C2D94, 0x1327642, 0x1C6E1C1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1C272AD, 0x0A4BDAE, 0x261B924, 0x1B28E23, 0x28DDDD5, 0x19A66DC, 0x33FDEB5, 0x16F2C94,
+            0x1E30C95, 0x16055DE, 0x02E69EB, 0x0C22CF8, 0x21764E5, 0x12B0CC4, 0x0D620E1, 0x13320BC,
+            0x172887F, 0x17F850F, 0x3C02DBE, 0x1277E93, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1885522, 0x0D33E9A, 0x27C9BFB, 0x1484676, 0x0AD45B8, 0x14F59C1, 0x2CB0508, 0x121C327,
+            0x294869B, 0x1A2363A, 0x2B6AFE6, 0x14619CB, 0x2CA1EAF, 0x02EB705, 0x33EBA5A, 0x0E8BF29,
+            0x196ACA4, 0x120BD29, 0x36C23AE, 0x1E0FD40, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x34EFCA6, 0x0A4DFD3, 0x33F7807, 0x0C34239, 0x3F10740, 0x168C485, 0x3F263E6, 0x1E54DDF,
+            0x165B92F, 0x0ADCCA6, 0x05A33FE, 0x001C495, 0x3D7B015, 0x111EE28, 0x2DBE9DA, 0x1FA42E5,
+            0x08E3D53, 0x1BCE036, 0x040AD73, 0x0B9B0F5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x03DF645, 0x151BC84, 0x202C852, 0x109B8B7, 0x2F88985, 0x18DE3BC, 0x2BA9AAB, 0x056F561,
+            0x2FE932F, 0x03CDFCA, 0x2CDECC1, 0x12F6180, 0x0309CED, 0x0031528, 0x2889041, 0x14D846B,
+            0x3538DAD, 0x18ECA28, 0x09DEC42, 0x0C13473, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1DF85D4, 0x182973D, 0x3B39277, 0x1C943A7, 0x3E4D6F5, 0x1A78768, 0x087FA4F, 0x0E8C4AD,
+            0x300B348, 0x0B2CB38, 0x3C56886, 0x1F61F9C, 0x39411FD, 0x1E45C49, 0x1B99530, 0x138877F,
+            0x17EF3B4, 0x1E8594E, 0x1C407F2, 0x0D48264, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x270CE9E, 0x0CCBDC9, 0x0955290, 0x09FA2DA, 0x2D4050F, 0x1A47E54, 0x0505361, 0x14FABBB,
+            0x2AD6F12, 0x1C648E4, 0x1B48F7A, 0x0BF256A, 0x3A0E111, 0x0EBDABD, 0x01FB0FC, 0x0E685A0,
+            0x0F61E86, 0x1C0DC99, 0x3E14B69, 0x16ECE4F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2E1C2C5, 0x0D2D760, 0x3B0B97D, 0x1F6E256, 0x1C08E57, 0x0A3BCC5, 0x29FF279, 0x0D8F5B2,
+            0x2491288, 0x1C490BB, 0x1B05CA0, 0x052A0E6, 0x206C0E6, 0x15A8DED, 0x1A6FB73, 0x0736A87,
+            0x25FEBEA, 0x0D9FFD1, 0x2106ABD, 0x102B6FD, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x221EBE3, 0x1EE6D9D, 0x1FE582A, 0x1661C86, 0x3A00123, 0x13CC0EF, 0x13DB4FD, 0x08BA42A,
+            0x2B64335, 0x0ABE3B4, 0x032A468, 0x02D0F17, 0x086FAAF, 0x0B92A56, 0x06FC055, 0x04BEA5F,
+            0x3741B23, 0x1E88CF2, 0x36C4FAA, 0x17C27FA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x32CABD3, 0x02805A2, 0x186556D, 0x11057E1, 0x025466D, 0x13B4490, 0x33ACCE2, 0x172E8A6,
+            0x385769B, 0x0FF8649, 0x2024640, 0x1FE70D6, 0x38F1730, 0x1296476, 0x2AD419F, 0x0776AD3,
+            0x1453666, 0x0BEE99C, 0x0A8CC4A, 0x06DF9F0, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^27 * G */ {
+        {
+            0x0EE2ED0, 0x119EF74, 0x06D6DE5, 0x0FE91EA, 0x3009D3D, 0x06A1152, 0x2241CD1, 0x0A03570,
+            0x207DB6D, 0x1308435, 0x091C34D, 0x0C7ED9B, 0x310156C, 0x1791E59, 0x0B266EA, 0x0806B35,
+            0x3C669AF, 0x0D2102F, 0x203CA88, 0x0FC282B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x215BEE9, 0x1CB42AC, 0x138B880, 0x15BA75A, 0x2B528A4, 0x10C2EF1, 0x0E9120E, 0x1E031AE,
+            0x0375AD7, 0x1898B9B, 0x3BB9F24, 0x0C0D505, 0x020424D, 0x107DE84, 0x21F673E, 0x14FCFEF,
+            0x04642F8, 0x1763BFE, 0x04230AD, 0x1750D50, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x07F2159, 0x1A7068D, 0x0DD4F23, 0x05F7E7D, 0x146D23D, 0x039388F, 0x2B97415, 0x154F60F,
+            0x24DA7DD, 0x1FBA139, 0x2F88CB0, 0x0A05306, 0x0FDCF3D, 0x0E2F964, 0x17123AA, 0x03CD82F,
+            0x085CC8A, 0x1300582, 0x3888C72, 0x10680F5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x040D13F, 0x0D4A660, 0x0BE3315, 0x1C77221, 0x3C6DEC1, 0x15E4FE7, 0x38BCCD9, 0x0F69B1D,
+            0x0AF9EA9, 0x0035FE9, 0x28121E7, 0x11A6DFD, 0x03610F9, 0x1BD15AF, 0x25DE6FF, 0x13A73B5,
+            0x0B9049E, 0x19AADB1, 0x3ADBF1B, 0x07B1FE5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x31A2DB0, 0x065C20A, 0x02136B7, 0x0D68EE1, 0x0B9A7FD, 0x04EAADA, 0x0FCBFC9, 0x17505A5,
+            0x107055F, 0x0CEAA64, 0x22B4541, 0x05013D0, 0x3576D64, 0x0B17E60, 0x38D377D, 0x1105087,
+            0x0041863, 0x03A6FCC, 0x0DD0CFD, 0x0597062, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x03B2866, 0x1652CA6, 0x16C49DD, 0x05D51EF, 0x12E3E2A, 0x181217E, 0x1EA7102, 0x12D9322,
+            0x261CCB4, 0x1770B4B, 0x012B113, 0x142E337, 0x381F8A6, 0x0C0AA5E, 0x1FC6D4D, 0x0F45D45,
+            0x1F9A2A2, 0x1B1E04D, 0x29FF649, 0x05270B7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2BAA9EA, 0x097ED98, 0x0B7194A, 0x067981F, 0x24D4CE1, 0x1A4B17D, 0x1FA062F, 0x06C4525,
+            0x265C798, 0x0D5551B, 0x1CAA3CC, 0x004FFBA, 0x22027BC, 0x1CD1C35, 0x1B8905E, 0x0D1AE8B,
+            0x2FAC452, 0x1F1BF11, 0x2B9D9BC, 0x148B2D5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x15BAAD5, 0x145A20E, 0x30A2EA2, 0x089AD48, 0x100E3FA, 0x1942152, 0x219DA91, 0x0FD62EF,
+            0x00085D5, 0x06B3C41, 0x09B15C0, 0x16B5A0B, 0x3A2E5B4, 0x127573C, 0x0105A35, 0x0ED245D,
+            0x004EF32, 0x1F54265, 0x346D51B, 0x0D0714D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0A56FF5, 0x14CF524, 0x0239294, 0x03120FD, 0x2BDEE72, 0x18F3E99, 0x1F1F848, 0x03BF7A8,
+            0x2662BFF, 0x06E5945, 0x37E163D, 0x03C8516, 0x23C3D18, 0x129D647, 0x144FFC3, 0x12F84AC,
+            0x3EEA084, 0x0922163, 0x3444DEF, 0x023276A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0768F41, 0x16F37C4, 0x3EF8BEB, 0x08CF788, 0x31DEE65, 0x15E753D, 0x31E486E, 0x0516CEE,
+            0x2C6F4E2, 0x0240CBA, 0x1D01757, 0x05906C1, 0x3FD6CF5, 0x1796728, 0x26A392E, 0x03CE8ED,
+            0x2AE68F9, 0x0B76CED, 0x1C41A47, 0x02D6CC8, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1C3CBB5, 0x135706E, 0x3544C2A, 0x07787AC, 0x3BC5FFF, 0x1CF44B8, 0x344F32A, 0x13BED0C,
+            0x2A8E77A, 0x0854772, 0x22B2F53, 0x068854F, 0x28276BE, 0x1E9D59E, 0x343DA17, 0x1140844,
+            0x1820863, 0x02395A1, 0x016A783, 0x14D3440, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0A40996, 0x127320B, 0x1072B69, 0x0746AF3, 0x321C100, 0x08ADFAE, 0x1450AA4, 0x16C54AF,
+            0x2A3A383, 0x0E0960B, 0x0D95544, 0x1BEDA0E, 0x1DAED7D, 0x1671A8B, 0x31004B1, 0x043B18B,
+            0x2C3226F, 0x065BDAF, 0x250A900, 0x0FE8AA6, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3B0D650, 0x15FF7E0, 0x202E067, 0x10089A7, 0x305840A, 0x0890272, 0x375C143, 0x0046329,
+            0x07217D3, 0x117264D, 0x363DAF7, 0x151B396, 0x33DF811, 0x1C74DB7, 0x227E17E, 0x08C64BE,
+            0x2E080B8, 0x04CA2F2, 0x390A159, 0x11E7E64, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2458A65, 0x0DD7922, 0x0C75C43, 0x10D6360, 0x2CAF7D0, 0x02F2FA5, 0x3760601, 0x026667E,
+            0x190E28C, 0x0E9C925, 0x3F1F909, 0x142F479, 0x000EDDB, 0x1500C62, 0x0AF1D0D, 0x0A03404,
+            0x023DA3C, 0x11672BB, 0x20E1547, 0x0E5D1B7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0B08C15, 0x1CBF192, 0x304C26D, 0x06D20F4, 0x0399E83, 0x05F9438, 0x28BC7D1, 0x0D28913,
+            0x36FFF07, 0x1274DF9, 0x0744062, 0x1147372, 0x0A5818B, 0x10D5A55, 0x0A237A7, 0x0B89B91,
+            0x1BDEA8A, 0x1194D40, 0x0090A27, 0x0B22E75, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x08F1E51, 0x1296C18, 0x23104FC, 0x142F25C, 0x2C5241D, 0x0EF9396, 0x3DB543E, 0x001B3D0,
+            0x0A863D9, 0x093DE23, 0x39E7754, 0x1A7797B, 0x1EDA66E, 0x1550982, 0x09C32F7, 0x164D51C,
+            0x18276A6, 0x1124C37, 0x11ABC8D, 0x1859D2F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^26 * G */ {
+        {
+            0x00DCCBD, 0x0B1893C, 0x271C190, 0x1F1AD4D, 0x2C76321, 0x03BD585, 0x2A22A93, 0x059AFE8,
+            0x2EB70CC, 0x1D99442, 0x0C9C874, 0x002640B, 0x288DBB4, 0x15F7BA0, 0x26C8342, 0x1ADD314,
+            0x0EE1083, 0x1BB13AC, 0x32B5500, 0x1FF3431, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1BED912, 0x1601A04, 0x3687B76, 0x0B824C6, 0x18C4855, 0x1796A0E, 0x0DC997A, 0x1E5FB4D,
+            0x1DD81F9, 0x1BA499E, 0x3D14632, 0x0A5CFBA, 0x1377BFD, 0x05EF285, 0x27DC031, 0x1380EEC,
+            0x1110F16, 0x0907BDD, 0x1563FFA, 0x0A9E248, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x39416E8, 0x1F747A1, 0x0066E56, 0x00C3A91, 0x0208909, 0x1CDA6C2, 0x0B077C4, 0x1EDE11E,
+            0x3A39587, 0x05AFB3A, 0x375DD91, 0x141DFA0, 0x09B80A3, 0x15DA595, 0x351DD59, 0x109573B,
+            0x19D7E3F, 0x019C16B, 0x0320F4A, 0x0A2A462, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x148C145, 0x19DE355, 0x17DBDB9, 0x1DF36DA, 0x1B713E1, 0x08648E3, 0x3045D75, 0x0BD580F,
+            0x2F278E3, 0x1BB1CFF, 0x2F00045, 0x112F8D8, 0x2D2C638, 0x0233AFE, 0x0062A04, 0x16E83D4,
+            0x3E876E9, 0x03BFCEA, 0x04DCDDA, 0x0833F6D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x04FE7CC, 0x1F34F91, 0x1821513, 0x142742E, 0x3706EAC, 0x14BD0D5, 0x1A1A8B3, 0x078C1EB,
+            0x2D1BFDE, 0x11B4EC9, 0x359A344, 0x1699C9A, 0x3E7CFB9, 0x1A4D892, 0x17C56D0, 0x1340152,
+            0x0A0130D, 0x0136FC4, 0x19E9040, 0x0492BCF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2559DF6, 0x1D56E58, 0x07E82A0, 0x13E69AA, 0x36D5491, 0x016C826, 0x37A2AE3, 0x115983A,
+            0x0E1FD1F, 0x1DC8390, 0x07852A3, 0x052B0C6, 0x0E8C8B0, 0x04A5373, 0x3F87A3C, 0x1C44C1C,
+            0x3DEB3F4, 0x1839CA9, 0x04F0452, 0x0E3290E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x302A805, 0x1B772C7, 0x1F53DF4, 0x0C7BFF6, 0x06457D9, 0x17E07DC, 0x3277206, 0x1BA353F,
+            0x074CC66, 0x1840FC9, 0x2C5B323, 0x086CC3B, 0x29AAC1D, 0x05F310A, 0x369944F, 0x10242F1,
+            0x1CF8D46, 0x02B491D, 0x38A5B55, 0x05C2A93, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x12EDFCC, 0x1927497, 0x24A6CCA, 0x051F258, 0x0BD4F52, 0x1ACE1BD, 0x128ABAC, 0x1683EFF,
+            0x078CC37, 0x0A4839C, 0x1A2E234, 0x1A6119A, 0x22109B5, 0x15F1A6F, 0x3C5D9B3, 0x1BFAA66,
+            0x367750C, 0x0DCAAC2, 0x1C6EE23, 0x12E7D6B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x161D236, 0x0A5E165, 0x0285430, 0x0610327, 0x068972D, 0x01D6D98, 0x2099141, 0x17F0EBC,
+            0x1E3E5B8, 0x1C5D0DC, 0x36FC276, 0x06147ED, 0x2592674, 0x0B2C198, 0x228C8E6, 0x19047B4,
+            0x1476BE2, 0x04861E4, 0x2C4835F, 0x05EE4D8, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3BB116E, 0x016D4E3, 0x35CF8AD, 0x15F058E, 0x2074F30, 0x18757BB, 0x04B8A0B, 0x02C7C80,
+            0x0015BC6, 0x0E6E2ED, 0x2FC2FCD, 0x13F87E2, 0x12BEA3A, 0x1BBD025, 0x00D847A, 0x156AADC,
+            0x305A8DD, 0x1DA35D5, 0x1B69334, 0x1BE47A6, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x13C6107, 0x163DED9, 0x3FDB568, 0x0A663D1, 0x108D067, 0x1B94B1E, 0x232B455, 0x080533C,
+            0x05E6A9B, 0x1E3757D, 0x3B8C2E6, 0x121DA01, 0x1A4EE91, 0x0046149, 0x11E02D5, 0x0463783,
+            0x2BB73E5, 0x04496F8, 0x0D17DB8, 0x0FE0856, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3F500F1, 0x19E83DC, 0x1435198, 0x00FBAFF, 0x2571263, 0x0B6291B, 0x26E7A34, 0x1591989,
+            0x1B8E37C, 0x05BBBED, 0x1BCD2F0, 0x05780B1, 0x004F094, 0x05F9CD0, 0x3435596, 0x1294DCE,
+            0x0C761D1, 0x1304968, 0x27E966A, 0x1861CCC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1E2E0F2, 0x1A78A1C, 0x3D83EDB, 0x051B275, 0x0CE0098, 0x0853A9F, 0x3D8BA92, 0x1F03395,
+            0x2CA31BE, 0x0CB2429, 0x133F3A7, 0x09CFCE2, 0x3C51634, 0x0F93A6D, 0x10F00E7, 0x06A37A4,
+            0x2946FAA, 0x0CC0147, 0x1335E06, 0x0A39757, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x088CD33, 0x1B7E575, 0x2C04239, 0x0E87096, 0x18FD2F2, 0x016A29F, 0x24F02A9, 0x0B415AA,
+            0x3B59283, 0x1F28E46, 0x0E7434E, 0x0DBFDE9, 0x0ECBD78, 0x0ED4C7B, 0x089C0BE, 0x06E2CB2,
+            0x1EEE3E7, 0x1C8BC04, 0x333BC1D, 0x085B0C8, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0CEE859, 0x1A38BF8, 0x234D4EB, 0x12D1513, 0x2F9C41D, 0x1E721E2, 0x3CF5278, 0x0532A9B,
+            0x249DCEF, 0x1D12B8D, 0x1982647, 0x035B1D2, 0x36D17C4, 0x1666A9A, 0x04620E0, 0x0214096,
+            0x23B14C8, 0x085749A, 0x2123FDF, 0x12174DE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x19F806F, 0x1D8892A, 0x3F8E713, 0x04E4372, 0x027446D, 0x1B3C52E, 0x0C1B9AB, 0x1315906,
+            0x1AC0367, 0x00D7C30, 0x01F135E, 0x19DBEB7, 0x2900238, 0x007C1AB, 0x171A841, 0x08162B5,
+            0x2424175, 0x08747D3, 0x321824F, 0x1175992, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^25 * G */ {
+        {
+            0x202914F, 0x080841B, 0x2CCE011, 0x16916AE, 0x1727798, 0x00055C2, 0x2CA56A7, 0x0E34668,
+            0x36C6DFE, 0x08BF304, 0x2154A21, 0x10440D7, 0x00C3C49, 0x14F55FC, 0x1945929, 0x0CE1E1F,
+            0x11B62F3, 0x171CF6B, 0x252B6B5, 0x077ADDF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x24E2D4F, 0x1DF1A65, 0x36A3D90, 0x197E260, 0x1EC126E, 0x0E22A36, 0x037D702, 0x13F1BDF,
+            0x318112A, 0x1A9982C, 0x26868E5, 0x1FBFC8F, 0x24BC3C3, 0x1A5A1A6, 0x1EF3A7B, 0x08BDBF3,
+            0x0C46A7F, 0x1AB7F20, 0x024171A, 0x06CD3F9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x34AFDB3, 0x00F7D79, 0x0E45524, 0x00C3F36, 0x0966B71, 0x0742BF1, 0x1D3096B, 0x09E61E5,
+            0x0D2485B, 0x1204F1B, 0x07E81C8, 0x0B1E543, 0x00FE24D, 0x17D48AE, 0x2767626, 0x0E16250,
+            0x0032D39, 0x0F87116, 0x39E0B4C, 0x1A908B8, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1D520D4, 0x0FFF706, 0x32A9C26, 0x18677E8, 0x3136E3C, 0x0709C32, 0x1643100, 0x01E7214,
+            0x3B30AAD, 0x0442C65, 0x112F8A0, 0x1499371, 0x125E43B, 0x189C720, 0x28F1188, 0x06A7BCC,
+            0x01FDAE6, 0x1CA7042, 0x3A10413, 0x133AD29, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x390790B, 0x08B0893, 0x3804661, 0x0E46FDA, 0x3475BA5, 0x03E1B0D, 0x28F8C8B, 0x079EBA3,
+            0x197E458, 0x01CA4DA, 0x006D92A, 0x19890AB, 0x2860FF9, 0x04C74E3, 0x3564A36, 0x1B7D014,
+            0x0912E88, 0x118C109, 0x1D8646B, 0x17E3D3A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x33E4D0A, 0x0C8BBDC, 0x02509A8, 0x1CBC795, 0x0A3FFF0, 0x0B3DE61, 0x3639BB7, 0x1D46001,
+            0x3866932, 0x1F4863D, 0x0082152, 0x03308B2, 0x019085A, 0x00C5E9C, 0x216FD7E, 0x08A9978,
+            0x002AC46, 0x10EA4F4, 0x2B5D5C8, 0x1BA1226, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1C35016, 0x1EF07C3, 0x15A56DA, 0x104C722, 0x03CA041, 0x1EDBAFF, 0x2102DD2, 0x0B80084,
+            0x2542540, 0x0F062A6, 0x0F25E71, 0x03738B9, 0x0667276, 0x1050752, 0x1E605F8, 0x132945E,
+            0x3EC16E0, 0x18CB85C, 0x32E38F1, 0x0984A6D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x241043D, 0x06227AB, 0x23961E5, 0x07BF990, 0x39E3499, 0x1120E4B, 0x0051099, 0x0997193,
+            0x1264F72, 0x11CDE66, 0x389585F, 0x1F9A8C0, 0x171B597, 0x060E1D7, 0x1EAFC23, 0x1553C49,
+            0x00FF43C, 0x1AA1443, 0x211B499, 0x1B30DD3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2DA28F8, 0x111CCE0, 0x304DF75, 0x0F9D9E7, 0x26A4AEA, 0x01B12EA, 0x105C8E4, 0x131EE18,
+            0x2ED493A, 0x07D9EED, 0x3B64BD2, 0x0ACF506, 0x14BD221, 0x1E1357A, 0x2FFED21, 0x0E1E32E,
+            0x33EA03E, 0x04676AB, 0x2F6991A, 0x05FEE47, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x08363B9, 0x18624F8, 0x16DAD6E, 0x0348387, 0x1E4EC98, 0x1ADF522, 0x090E894, 0x19C1AE9,
+            0x31FB315, 0x07B5A3A, 0x3A49F1D, 0x149E069, 0x0D43813, 0x09C663F, 0x1694675, 0x0F29CDE,
+            0x18F0E62, 0x11CB7E2, 0x24790C0, 0x1017E95, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0CF0401, 0x0CD1389, 0x065D961, 0x091C283, 0x2A96773, 0x05DDDEC, 0x1D96191, 0x02A8BBF,
+            0x18689C9, 0x0558FA4, 0x11DDA7A, 0x17A2927, 0x1759B92, 0x1C26EC5, 0x2A88323, 0x062E7DC,
+            0x05F7D4D, 0x09326F9, 0x2B23E45, 0x003FABA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x22A7B07, 0x0A15E39, 0x0BF6151, 0x0B762AC, 0x2E70B08, 0x1A054E0, 0x1EE2BEA, 0x1985461,
+            0x164EEDF, 0x15EDBA0, 0x20E79B6, 0x0DC1616, 0x1E2CB00, 0x07D3CAB, 0x2F4A13D, 0x152631D,
+            0x032A349, 0x1E2382D, 0x2DE2D09, 0x06F9F94, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1F7D162, 0x12E2C06, 0x30B4B05, 0x1805286, 0x0A93E77, 0x017C68B, 0x03DD21F, 0x109BD56,
+            0x256F9C4, 0x174EFEB, 0x1CB791B, 0x0608541, 0x060CA2E, 0x13FFCCF, 0x178C76D, 0x1918F75,
+            0x05F805D, 0x17A86C1, 0x38B9B0D, 0x16EFC36, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1CC411B, 0x0329F0E, 0x36B2C8D, 0x1822A84, 0x3256482, 0x1010B3F, 0x05FA906, 0x1C5591E,
+            0x040ADB7, 0x059E5E3, 0x3DE5F08, 0x0919D8F, 0x048FD3E, 0x17C6B67, 0x2B66ABB, 0x04ACC00,
+            0x29C9F2F, 0x10A2636, 0x2F32048, 0x1DCABD8, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x057EFB2, 0x0884974, 0x043CDE2, 0x0D3BFAF, 0x384A4B9, 0x16D5E08, 0x16EB03E, 0x11576A5,
+            0x07CD1DB, 0x039E270, 0x31E53E6, 0x0679400, 0x3222A7B, 0x19F43DB, 0x26C3BDF, 0x00FBFA2,
+            0x217762E, 0x0C7C9AC, 0x22146D4, 0x1215E62, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1B7C6D5, 0x0609DBB, 0x2FF85DA, 0x0DC2C09, 0x18ADEFB, 0x158879C, 0x130CE27, 0x078297A,
+            0x0A0109B, 0x0040ECA, 0x3D4C1DA, 0x1C7AD04, 0x2A36F1F, 0x062C8E2, 0x13AC03C, 0x18135F5,
+            0x15B0898, 0x04ADCDB, 0x17DFD67, 0x18DF5E6, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^24 * G */ {
+        {
+            0x1860C1F, 0x05E63ED, 0x2BA5EB6, 0x1D1347E, 0x24B4692, 0x1D343C9, 0x0DD7EFF, 0x0CD809D,
+            0x3BEF9C0, 0x052F1EB, 0x23BF959, 0x19B122F, 0x06456B8, 0x08B7AC8, 0x3D346CA, 0x0692E7C,
+            0x350BFDA, 0x18725B5, 0x38A068F, 0x13BCAA9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x26A6390, 0x10590DD, 0x2E8A2D4, 0x1331863, 0x0A8967E, 0x041F2EA, 0x26640CD, 0x1311CB3,
+            0x0ADDE0A, 0x0B3CD88, 0x36F8F87, 0x1AE27D1, 0x13A8B9F, 0x0DD73CE, 0x1E5203E, 0x186B02D,
+            0x3A7165A, 0x1E1EEBB, 0x329ABD8, 0x0559AC2, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3AC1D5C, 0x1654A95, 0x0753A9D, 0x1898C5C, 0x1BCECE2, 0x19D3F73, 0x260CAEA, 0x091D660,
+            0x0FCE89C, 0x1ADA398, 0x2A562F9, 0x1302F86, 0x1C625DF, 0x12303B6, 0x3D4C4B9, 0x0CEFE11,
+            0x015D457, 0x1410050, 0x01050FC, 0x1350E67, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3CB7A81, 0x02D3A00, 0x243DBEA, 0x1554F55, 0x29490E9, 0x01DE76A, 0x061E84C, 0x07AE196,
+            0x23D5BF1, 0x129D2A1, 0x07C21BD, 0x0EDA5B7, 0x1311735, 0x1BD3827, 0x0DD0696, 0x013960A,
+            0x1C76694, 0x09140EF, 0x0369892, 0x1A6503C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x20CD303, 0x1F2755C, 0x1688F68, 0x07B78DA, 0x307B988, 0x16743BD, 0x1AD479F, 0x1D4F898,
+            0x25F3A9B, 0x15A5C00, 0x1DE6EA6, 0x0A1DD66, 0x2D25AB9, 0x0BF2DA1, 0x23DCF33, 0x16A0CA0,
+            0x0A56220, 0x195C02C, 0x0939306, 0x12735A7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0B08397, 0x040B81E, 0x0BECFF3, 0x0F87B6F, 0x02426A2, 0x07420E2, 0x2DC2F44, 0x05F3FBE,
+            0x356DD03, 0x0D84678, 0x1934BAD, 0x06887CD, 0x22FE6BF, 0x0AA5A64, 0x1B80CA0, 0x0D3087F,
+            0x1F27BDB, 0x1E83D8F, 0x23A0027, 0x0525CF2, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1AEC874, 0x0AA375C, 0x2F51207, 0x0B385DE, 0x1F36D5F, 0x1AB2719, 0x195411B, 0x0D18064,
+            0x38038B2, 0x15B63E3, 0x2B7AFA9, 0x1EF4E3A, 0x01D16D3, 0x0938B60, 0x0818C74, 0x077792F,
+            0x2D992D5, 0x0F7A46A, 0x27F74B0, 0x186D0EC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3463E39, 0x13F5898, 0x093176C, 0x031321D, 0x11F976F, 0x0B729D9, 0x3BDF698, 0x10986AD,
+            0x0BED9F5, 0x0B18B71, 0x2F9B678, 0x17FA568, 0x0009A1D, 0x029E7F7, 0x0E40383, 0x16E2E86,
+            0x0CDFA35, 0x1017D80, 0x339AB6C, 0x0E79023, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x134068E, 0x15691B7, 0x341A03F, 0x1CCD8F8, 0x237306F, 0x0788945, 0x0929708, 0x08821EB,
+            0x34EA983, 0x0E9CC9B, 0x06B8CF9, 0x009A95D, 0x125723C, 0x03BC30F, 0x307FD74, 0x1B9C50B,
+            0x25BEA47, 0x1F89ADB, 0x04D2046, 0x1DD36B1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x27874C3, 0x038C481, 0x0A422C3, 0x1F9A1E4, 0x0FB1D26, 0x1181FC4, 0x227B26E, 0x0C04103,
+            0x3269AB1, 0x1EBF0DB, 0x1AA9052, 0x0DA646B, 0x39A8E76, 0x10FEF93, 0x24968EA, 0x0193A4F,
+            0x0F3D408, 0x139A071, 0x35A6A54, 0x1F98503, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2BE42F6, 0x02E6920, 0x2901917, 0x15B8690, 0x1BC7278, 0x063A826, 0x2B6AF57, 0x1289DF7,
+            0x05AE0B2, 0x1272615, 0x0CD9E22, 0x1B30215, 0x12553B7, 0x18CCBD0, 0x0B2067D, 0x080FD3A,
+            0x3FFFC85, 0x09C0733, 0x2B1F339, 0x0776CFF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x01CEF10, 0x0D367FB, 0x08105D1, 0x038DB9B, 0x23900CE, 0x1A98F68, 0x1BD8F51, 0x14225EA,
+            0x26D998D, 0x15866BD, 0x0B00B88, 0x058A256, 0x0D4CADE, 0x1356D81, 0x2D04173, 0x083E0D3,
+            0x1242725, 0x0C74B8E, 0x1C98FE0, 0x08043DA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x00B9EFF, 0x042C2D1, 0x2E99CCC, 0x0298056, 0x0E5C6C3, 0x17B4750, 0x0D6CA2A, 0x1CF3E40,
+            0x29F0A02, 0x0E7133E, 0x25C510F, 0x1C467B0, 0x1EC89A8, 0x03FBA90, 0x169E1A7, 0x07DD12F,
+            0x0E7D4F3, 0x1E8D8B6, 0x1C93532, 0x0D8FC0E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2ACB68F, 0x103BCDB, 0x38CE276, 0x05BBBAA, 0x1459204, 0x0972181, 0x05A4814, 0x1C404CB,
+            0x0BC3EF1, 0x109960C, 0x1A92AF4, 0x0FEE092, 0x378AFE9, 0x195C537, 0x308CE5C, 0x0797BD5,
+            0x30EBF6E, 0x110F5EC, 0x040932B, 0x13AD884, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x17CC1AA, 0x055C059, 0x0197827, 0x10FB810, 0x03A7279, 0x15DFBCB, 0x1412B8B, 0x0DA6262,
+            0x31AC69D, 0x1781139, 0x25A7267, 0x0132CC1, 0x0C968B9, 0x04AE4E2, 0x353C260, 0x1B8E90B,
+            0x21F9379, 0x1954D8F, 0x168E732, 0x19E6DE5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x095072B, 0x1E13DB3, 0x03B9A07, 0x051FC9F, 0x0BD192A, 0x1F00C2A, 0x2273156, 0x0016DA9,
+            0x358285A, 0x161E53C, 0x08898C2, 0x10D9B79, 0x0836DFC, 0x00D17B4, 0x2593F14, 0x152893F,
+            0x106809A, 0x0E18ED3, 0x0278E93, 0x1AB4B52, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^23 * G */ {
+        {
+            0x2BD4CFE, 0x05FE49F, 0x1FDE137, 0x12A8D1D, 0x004F100, 0x005140C, 0x328944C, 0x04F530B,
+            0x03F50BF, 0x1DF0AAA, 0x0823769, 0x17231AE, 0x00FA5EC, 0x0FEFD5B, 0x0A78DFA, 0x1805842,
+            0x18E6E04, 0x13CB9FB, 0x0D18EB1, 0x1463A90, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x29D15A4, 0x11F15BB, 0x0FB3AC3, 0x14E8B81, 0x3DDE83D, 0x046D4F9, 0x14B7A27, 0x1818C01,
+            0x23913A4, 0x035DD88, 0x12AB74D, 0x0B9047F, 0x2714B5D, 0x1F550AD, 0x2ED7F92, 0x18A5E0A,
+            0x2E1F190, 0x13E4656, 0x24AFA9C, 0x117F5D6, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x271994B, 0x1FCE146, 0x0EB9DDD, 0x09ABD43, 0x2558F3C, 0x020182A, 0x0647E5C, 0x0513F86,
+            0x17FFEC5, 0x0C5BBAC, 0x0D8EAC5, 0x03DAF02, 0x1394CEC, 0x1EF94D7, 0x0A91D28, 0x19B5380,
+            0x30418B3, 0x12D5516, 0x1AF73EE, 0x072ACB7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0FE93C7, 0x0577398, 0x12F5B58, 0x01BF104, 0x2C50151, 0x109277A, 0x351D6C6, 0x0A73F71,
+            0x3E7901C, 0x0771E1A, 0x384BD7B, 0x18207EC, 0x10D8CB7, 0x00D7FB6, 0x3EAF27A, 0x085235D,
+            0x1A29E29, 0x14F7C93, 0x3AE4523, 0x18B6EE7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x148FF10, 0x1045BAA, 0x3C2F7AF, 0x05218A5, 0x11328F5, 0x07452E9, 0x13CE1FE, 0x06F396F,
+            0x2911F4E, 0x19A2CDC, 0x1F63789, 0x1563E8D, 0x12390A9, 0x04B5480, 0x3B66283, 0x034A90F,
+            0x3A3A80E, 0x1EFF6AA, 0x2D56E60, 0x1B5403B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2CE664A, 0x14F976E, 0x28ABE03, 0x1DD5AE8, 0x2EF8B52, 0x04AE8D9, 0x258A444, 0x0FA9293,
+            0x282447D, 0x1975267, 0x033AED7, 0x057A51E, 0x0686286, 0x1311CC7, 0x0B8A9F1, 0x1545228,
+            0x1BC5356, 0x0D326CE, 0x2B01B86, 0x13EB658, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x08DB4D6, 0x1CE98B4, 0x2DD7250, 0x1EE9B32, 0x2568CE8, 0x0FD6546, 0x246EC13, 0x0377193,
+            0x24808B8, 0x12FAF35, 0x1CB1D83, 0x0B59B3B, 0x31CC8A2, 0x10AC626, 0x3FBEDA0, 0x00CC33F,
+            0x0744285, 0x191686E, 0x237CAB5, 0x0B3DD49, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x36EA6B2, 0x1559099, 0x3BB9007, 0x1F004D2, 0x011EE72, 0x0573578, 0x27BE0F9, 0x027A6E2,
+            0x30E998A, 0x1D9DAAF, 0x3FDC756, 0x0B352DD, 0x373AC68, 0x13A5FAD, 0x2FF3173, 0x110CA39,
+            0x01C7263, 0x1D8EDB2, 0x2003C85, 0x1568539, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0565DEB, 0x0B845C5, 0x26E9A0C, 0x0CAB516, 0x07723EF, 0x0010744, 0x2B10C9F, 0x1918EB8,
+            0x3E44944, 0x15EF1EF, 0x0DAE5AF, 0x0D368E3, 0x0C4279D, 0x01292C1, 0x26CC2C8, 0x1D7CB51,
+            0x00294B3, 0x1D90E05, 0x22CC5FC, 0x1089A59, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1CFFB51, 0x0C4A80D, 0x02326B4, 0x0D62391, 0x2A7A47D, 0x001CA51, 0x2DA1E5F, 0x05A3D68,
+            0x35A1FA9, 0x0A8BBBD, 0x2635B25, 0x0C28ABC, 0x07D42E2, 0x010B39E, 0x2842520, 0x162B5A7,
+            0x0500C92, 0x1A80917, 0x053B380, 0x15DDE3C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x09759C2, 0x00175BE, 0x158428A, 0x1E09075, 0x16DA5B4, 0x15423BD, 0x2723343, 0x0B1A0FA,
+            0x0A7C276, 0x12C5E81, 0x220B5D2, 0x01709DB, 0x104DCAB, 0x14BD7D7, 0x2D35E13, 0x17FD7DD,
+            0x3DC933E, 0x0E6D3A6, 0x0BB40F9, 0x0D69F38, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x12212E9, 0x14CCDCD, 0x2970C41, 0x168795B, 0x3605375, 0x0915B49, 0x2978CFE, 0x122293E,
+            0x39CB6C5, 0x1E4B23F, 0x1EFEEDA, 0x165D121, 0x1EA1312, 0x1FE60FF, 0x39F3291, 0x095D55F,
+            0x00AC7D7, 0x0B35B1F, 0x105A338, 0x082922A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3457C13, 0x0D15100, 0x1D33CE9, 0x138E571, 0x0C11C5D, 0x0F1A041, 0x0418CA2, 0x0ECB221,
+            0x16BCCA8, 0x1636881, 0x10FC61F, 0x178987C, 0x1ADFD58, 0x07C6FC6, 0x175DDEE, 0x149091F,
+            0x305C81C, 0x03073FC, 0x2FA4732, 0x0E06322, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x038E617, 0x017134C, 0x1C11C5D, 0x14D945F, 0x1D1AFC7, 0x16E077E, 0x17BF9F3, 0x161DF63,
+            0x2B7DCE5, 0x1BFB032, 0x1D3C500, 0x0D069D7, 0x201C4D8, 0x0027774, 0x1C9ED25, 0x086B189,
+            0x0010B99, 0x109231F, 0x28880C8, 0x0C3165D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1B47EF0, 0x0982EDC, 0x090C304, 0x14D30C2, 0x0D9A259, 0x04B8D12, 0x29B0C08, 0x0E8B6BE,
+            0x1E412B1, 0x0462C83, 0x39AA46D, 0x1F02AA1, 0x00F80B6, 0x01DC032, 0x284A9A0, 0x0EAE2B4,
+            0x3C3DB29, 0x0FE6579, 0x3E5B998, 0x045472D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x15F29AF, 0x0C7EA2C, 0x0F0E9FF, 0x17540AA, 0x0939B5B, 0x03D9FEC, 0x0713AF5, 0x1321A99,
+            0x2F6ECFF, 0x0AC21B0, 0x241298B, 0x0C62163, 0x1D598D0, 0x11BEF92, 0x0A02856, 0x1ADFB60,
+            0x0810367, 0x0B57601, 0x01E3453, 0x17F69A5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^22 * G */ {
+        {
+            0x28BAEC6, 0x1CFB698, 0x03A45DF, 0x04F20E9, 0x02948BD, 0x14D20F1, 0x3EC8AF0, 0x1ACFC56,
+            0x11ADBE2, 0x06195E0, 0x1848BBE, 0x0655662, 0x389E8A2, 0x151864C, 0x3C4592E, 0x0E62894,
+            0x0D5A154, 0x04EC693, 0x0C7E07F, 0x045C241, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x19CD734, 0x12E6DF4, 0x3EF1CA0, 0x0D1189C, 0x2DE3BC7, 0x1CBE44F, 0x078A877, 0x17FEA17,
+            0x13F0C01, 0x163D999, 0x3C9C8AD, 0x04F4221, 0x17419E9, 0x00AE5F3, 0x196429E, 0x1DB911D,
+            0x17E885B, 0x1DC1CE1, 0x296398F, 0x01F4F9F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2484DAA, 0x0B03DAD, 0x3AB007D, 0x10D210E, 0x3CB6C33, 0x1685FEE, 0x271F0E2, 0x16DCA79,
+            0x1466FAB, 0x0D26454, 0x2E4C14B, 0x15F82B6, 0x3BE1BE2, 0x07FD104, 0x3464038, 0x11D3515,
+            0x2E877EE, 0x1276304, 0x2937903, 0x027702A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3270560, 0x01EE3D1, 0x32E2162, 0x1783595, 0x283DF40, 0x0B75EB4, 0x39C4446, 0x190D9B2,
+            0x0BBC367, 0x0E85179, 0x34106A6, 0x00C93E8, 0x15E9D7E, 0x1B613B2, 0x36ADC07, 0x18905FE,
+            0x3D1746D, 0x1EB963F, 0x3999B50, 0x07AEE87, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x06AEA3F, 0x1D00DCF, 0x35FA0CE, 0x1767B17, 0x12F167E, 0x03AFA91, 0x3666E6E, 0x018426C,
+            0x3293AF2, 0x0BD9624, 0x3F958FE, 0x0E8A13E, 0x099141E, 0x0F60F82, 0x2D1E86F, 0x052ECDB,
+            0x3B54490, 0x0417B7A, 0x0C221C9, 0x0E11598, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2860273, 0x0BD59A6, 0x31263EC, 0x1320B0E, 0x168460D, 0x0AB9EBB, 0x1BDB709, 0x19B21E1,
+            0x1A031DE, 0x1B28EDA, 0x26C05AB, 0x15ECAE2, 0x36838F5, 0x1AAD585, 0x1EB69CA, 0x1137136,
+            0x0BCB74A, 0x17FDACA, 0x296526D, 0x0312CCE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x29ADCB2, 0x0E9EB07, 0x21B73B3, 0x1D4AE08, 0x2487D06, 0x020154B, 0x01AF39E, 0x1CA1B83,
+            0x06623EA, 0x08B2CA7, 0x374C0B5, 0x061B436, 0x0A4F2F3, 0x071A4D4, 0x02B5B45, 0x0B78B96,
+            0x33CBE0B, 0x1BE3490, 0x29D638D, 0x1997F86, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x395A68D, 0x11316D3, 0x2141803, 0x0AB6F11, 0x3B8CA90, 0x0BB6691, 0x1BE195A, 0x04F9F74,
+            0x15AF4D2, 0x061CB75, 0x0244344, 0x118988E, 0x3B6F8D3, 0x0F361E1, 0x389E03E, 0x1CD3B6E,
+            0x31C9C1C, 0x1D51F43, 0x1E9D4ED, 0x178D952, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2CCB5BD, 0x156620E, 0x263DD33, 0x036580B, 0x265081F, 0x12D2C20, 0x1717F2B, 0x0D2B3DE,
+            0x28594E4, 0x092B8AC, 0x11B9559, 0x11D1EE7, 0x1C35505, 0x01ABC4F, 0x19DC37B, 0x1DD8EF9,
+            0x32B735D, 0x04D420A, 0x2EBEF63, 0x1CDE3AD, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x25B8D97, 0x05BF9B1, 0x151F1B6, 0x18715E5, 0x3AA65B3, 0x0D997B6, 0x0BCD8B6, 0x0F4E195,
+            0x36711C4, 0x0D197DB, 0x385E1C3, 0x074472A, 0x06BD7E7, 0x1414B1F, 0x2E19D3B, 0x1E7CA97,
+            0x2C2B11C, 0x19D8373, 0x1F02C3B, 0x1A02C89, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1AF77C7, 0x0CC5A4F, 0x121C4AA, 0x1898522, 0x1F52E76, 0x1FC7EF5, 0x0F52FB8, 0x095B928,
+            0x02799B9, 0x0524616, 0x3DC5C07, 0x1262323, 0x007FE0B, 0x1C851DE, 0x257A997, 0x067F8D3,
+            0x149DB14, 0x0436254, 0x38713C6, 0x144E527, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0FE5F52, 0x1E2BA60, 0x1B0DD77, 0x0B2A5CF, 0x3F58A16, 0x1A9DC8B, 0x222635F, 0x1703BAE,
+            0x25A9653, 0x17E695E, 0x30FFBCE, 0x124D5F0, 0x080FD8F, 0x02E1D60, 0x1BAABA8, 0x07B6935,
+            0x27A9AA4, 0x17532AC, 0x3CD85E5, 0x0741786, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x260EF03, 0x1219742, 0x2E87191, 0x0D3A333, 0x09CFB98, 0x0CFF75C, 0x12ECC3B, 0x053E658,
+            0x218C98A, 0x1E47232, 0x2254AD7, 0x07B5B09, 0x2F98E56, 0x1E721BC, 0x0423D96, 0x1EC0953,
+            0x23AB053, 0x1876266, 0x3AC8472, 0x187C0F4, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x208806C, 0x0E703A4, 0x2EC2EB7, 0x0D06E3E, 0x3E6EAB7, 0x1F8DE25, 0x124E109, 0x037EAB0,
+            0x01DFC8B, 0x07B50F2, 0x3BD6C9F, 0x07ECF4B, 0x248AB57, 0x0205F19, 0x0867BDD, 0x07C0672,
+            0x1FCBE21, 0x13F42B3, 0x287DC07, 0x101769F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x158DC3E, 0x0160E65, 0x0E172FF, 0x1B06C5D, 0x1F0BE7C, 0x0E0BA4C, 0x16112DB, 0x1F61B49,
+            0x10A66EF, 0x0BF65CC, 0x2A02530, 0x021C286, 0x135D01D, 0x171EC87, 0x3134210, 0x1C22638,
+            0x3C51EF7, 0x1582185, 0x2042C56, 0x1E3EB15, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1EC1153, 0x180D801, 0x0B06F8C, 0x0A8E76E, 0x0232141, 0x1A9ECE7, 0x16575E9, 0x0FAB58C,
+            0x3B340CA, 0x10F3830, 0x2E0CE89, 0x08EEB0F, 0x3869D67, 0x0224225, 0x366AACE, 0x0BED6A8,
+            0x104F4ED, 0x0DE8586, 0x2FB5E46, 0x059910C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^21 * G */ {
+        {
+            0x21F1846, 0x1CB3591, 0x3EF3538, 0x049CF6E, 0x1888F0E, 0x11DFF22, 0x3BFE9F3, 0x07A8876,
+            0x35D56CF, 0x1D7248A, 0x2428F80, 0x00ACEF9, 0x27E4A92, 0x1568BB3, 0x2333EDB, 0x1DCE749,
+            0x20D221C, 0x0DE1B28, 0x3853A58, 0x046BF96, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0049EE5, 0x0D2193C, 0x1F77326, 0x121E569, 0x005873E, 0x0D958CC, 0x0947288, 0x0E6682F,
+            0x2F9FB1F, 0x19E4420, 0x114515F, 0x1D61141, 0x1A927DE, 0x149E692, 0x3AF53EB, 0x0607D4A,
+            0x30BD222, 0x0547AE5, 0x37D6D54, 0x0209FF5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0E2664B, 0x164DB47, 0x2C3DB5C, 0x0ADB054, 0x281DC9D, 0x141C9BD, 0x3137649, 0x14CAF1B,
+            0x2E24D6D, 0x0D284A9, 0x3157E61, 0x1B0E6EC, 0x1F02026, 0x1C921A8, 0x3D445FA, 0x1E7DD9D,
+            0x2B5AFD2, 0x1BC4D63, 0x1F1FCE7, 0x023933D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x14C38DE, 0x1385409, 0x2771E98, 0x1A54B26, 0x1531D30, 0x0700D3D, 0x3F0D6F4, 0x0100CF5,
+            0x3455B72, 0x1892189, 0x05ED98A, 0x10EFCF6, 0x2D6C407, 0x01D1831, 0x1F0C2C8, 0x124DF84,
+            0x1D82AEB, 0x1FB0724, 0x02922A6, 0x115B5C4, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1202B6F, 0x19DB57F, 0x16B2C4D, 0x032CE41, 0x0289310, 0x0EF55B2, 0x1AD3C54, 0x1782A47,
+            0x31205FB, 0x1CBA92B, 0x2FFFD87, 0x0FFBBB9, 0x2A753FD, 0x0129A1F, 0x364C3B0, 0x1735730,
+            0x32E3CE8, 0x1AC00EE, 0x0E083DE, 0x10831D9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x24A3A4D, 0x072C08C, 0x2D08CAF, 0x1318B27, 0x3B71554, 0x133ACEC, 0x24703EC, 0x1F6E7AC,
+            0x39C772A, 0x06C8E1F, 0x2CD4584, 0x01360AD, 0x0D91F58, 0x0E87349, 0x3117393, 0x16EC457,
+            0x32B29B1, 0x0AA8487, 0x1CBF48E, 0x19B9E30, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1C5B797, 0x0BD5898, 0x0232086, 0x0187F07, 0x1F84AE1, 0x08DBC94, 0x26E49DA, 0x0158EB3,
+            0x2A0C3C0, 0x1ADFC46, 0x359E301, 0x1737921, 0x2BF1FD5, 0x0294AE1, 0x1952131, 0x0AB1C09,
+            0x1D2487C, 0x148AEC4, 0x23277BC, 0x17C9D62, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x019830C, 0x0342B28, 0x14130D7, 0x1EB5180, 0x01BB4D3, 0x051BC8E, 0x154FA41, 0x1178982,
+            0x046AEDD, 0x17F8C2F, 0x0FFD56D, 0x054533F, 0x386EB2A, 0x10743C7, 0x08327B5, 0x0A63DC4,
+            0x32D705D, 0x06E1B96, 0x234CD59, 0x0DFD7AA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x33AA366, 0x0B0AC8D, 0x3F64DF4, 0x1FDEE08, 0x18B16A3, 0x15AA895, 0x2FF1FB3, 0x11FB08D,
+            0x1071C74, 0x09F589D, 0x3FA9BFE, 0x03BB355, 0x1700673, 0x1EBBD08, 0x28C1B8A, 0x1559A8F,
+            0x26F5C9B, 0x13D3E49, 0x27217FC, 0x1F3D5E7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1892A5D, 0x1C47B34, 0x0CB0C84, 0x0251066, 0x05ECC66, 0x0688DE7, 0x37DE561, 0x15F7183,
+            0x22E4265, 0x0A92578, 0x0D71428, 0x00BC737, 0x0D96A3B, 0x1217F64, 0x372F7D4, 0x105956F,
+            0x2EDF440, 0x01BE6AA, 0x0D37BC9, 0x0546C67, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3D82CFC, 0x066537B, 0x3485112, 0x1C27CD2, 0x2719417, 0x1C52639, 0x0945070, 0x10F23CE,
+            0x29DE58D, 0x1319DD9, 0x1CB310C, 0x0FA1B12, 0x1F674BB, 0x1AAAE1E, 0x0C5B81B, 0x1739E8D,
+            0x2769841, 0x1977CE2, 0x2AF59F3, 0x0FEDDA6, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2B4E3FB, 0x1B39B88, 0x0A72DBF, 0x0352465, 0x32D1F8D, 0x068260C, 0x0A5993F, 0x0A41451,
+            0x3CBD2EB, 0x1F1D308, 0x200943F, 0x069289D, 0x29D671C, 0x00178D3, 0x375D81A, 0x0C46660,
+            0x1E13255, 0x1370DA1, 0x3C6FB5E, 0x1C3BC07, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1F2D66B, 0x108EEFE, 0x2B685A0, 0x033000C, 0x03FE29D, 0x1128F4F, 0x18646AA, 0x16DE302,
+            0x0A07A79, 0x0BAC661, 0x22FA830, 0x1421B2D, 0x0F9B4CD, 0x1900155, 0x2726D26, 0x067A1D9,
+            0x160C153, 0x0DA91D5, 0x028EB19, 0x1651B1A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2AD9CB9, 0x1B3D68C, 0x2430B93, 0x10A6E57, 0x0BE6C83, 0x11DC8F6, 0x0C87108, 0x1931FC2,
+            0x17485BE, 0x00D4A81, 0x1C4B019, 0x1196DE9, 0x342D5DD, 0x0C821D0, 0x1467643, 0x1426CDE,
+            0x2451533, 0x17425F6, 0x0DCD79B, 0x1ED68E2, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x21FE1E0, 0x09547E4, 0x34ACB05, 0x1C86AD5, 0x0FF2511, 0x07B9026, 0x25ADEC7, 0x189A347,
+            0x11B08F1, 0x0D2086A, 0x2DEC02C, 0x01C9BDB, 0x12BDAFF, 0x13ECB12, 0x1FF61BE, 0x0CC77C2,
+            0x2F1196B, 0x187A922, 0x32626AD, 0x0E1E08D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1E50D23, 0x11A5A75, 0x0B6B9D9, 0x1AEF481, 0x1AAC6C4, 0x13E3F3D, 0x0698632, 0x0242CD6,
+            0x0AA7F3F, 0x0104D07, 0x0E11E02, 0x02561BC, 0x2EE8185, 0x05592C3, 0x0810B88, 0x04A8668,
+            0x0D61E0B, 0x10AB230, 0x3854512, 0x17CAC3E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^20 * G */ {
+        {
+            0x09309F8, 0x1669BA0, 0x27E2124, 0x18C7869, 0x21A96BE, 0x1816DB1, 0x06F5798, 0x1E35423,
+            0x24CCAAE, 0x17492E7, 0x38B460A, 0x1759F50, 0x2FF557A, 0x1A99D68, 0x28878F6, 0x1C5D817,
+            0x0ED68BB, 0x09DAF87, 0x0EC8C83, 0x1D6E15B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x377FAB4, 0x1B608B4, 0x0E1AE15, 0x0E7EBCF, 0x05048D4, 0x0C5F55D, 0x3CAD416, 0x1CBE284,
+            0x3151DCA, 0x0725816, 0x0631FC8, 0x1FEB7C9, 0x091DF2E, 0x1145FC4, 0x02C967C, 0x026BDF5,
+            0x0629591, 0x1F06E50, 0x18D6955, 0x17BEDDE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0125E8D, 0x1BE9DBA, 0x0D37372, 0x091611C, 0x39ED937, 0x0BC242D, 0x2DCCE48, 0x11AD171,
+            0x10CF67E, 0x1303381, 0x1CA6264, 0x0AA3B0B, 0x168372D, 0x1A63737, 0x09DEB2C, 0x0DB311C,
+            0x3FCA29A, 0x1D987D1, 0x2CF12E6, 0x1537E25, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x226DF7F, 0x19C8DE3, 0x256172E, 0x0252864, 0x1CEDB43, 0x0853D9D, 0x336851E, 0x1FCF4BD,
+            0x20D662C, 0x0D1C7E1, 0x0F1AE70, 0x12F0B5F, 0x36116FF, 0x179C9F4, 0x29D4B8A, 0x08ABAFF,
+            0x170CF70, 0x0B6D690, 0x208E552, 0x078AE34, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3E3D54B, 0x105D2C3, 0x21F6309, 0x0AA2843, 0x243EE79, 0x011B84A, 0x203D249, 0x1222D8D,
+            0x237B524, 0x101E05B, 0x346B4A9, 0x1F2F72C, 0x184DBFF, 0x1B5F395, 0x29C9433, 0x0C9CCD4,
+            0x0E57417, 0x09A4C1D, 0x3A50739, 0x14B7BDC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x31881B9, 0x1506FB6, 0x29052A9, 0x032BFF2, 0x291CCF8, 0x096123F, 0x1918853, 0x1B0F656,
+            0x25B4704, 0x02C1401, 0x3420A1F, 0x0657724, 0x08E9162, 0x13CE59B, 0x2D03CED, 0x00E437E,
+            0x3B758B4, 0x1C23F53, 0x0817E7E, 0x0E1A120, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1FD3BC5, 0x1C77754, 0x00F7FC9, 0x0C4937D, 0x393880D, 0x10BAB74, 0x19FE2A6, 0x1D91309,
+            0x197E500, 0x1771A32, 0x3C3C466, 0x16B2F56, 0x2D294AE, 0x048B86D, 0x14598B6, 0x03B9ADB,
+            0x24EDE5B, 0x103CFAF, 0x1B2E2E3, 0x126A4AB, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x18CCD7D, 0x05A2A15, 0x2C8DC40, 0x152B0C5, 0x18E470B, 0x1D9DEBB, 0x04AD7B8, 0x0FEC155,
+            0x36DD761, 0x1AE6D7A, 0x36A2140, 0x0CDE997, 0x12B261F, 0x002056E, 0x2F8DD5B, 0x183E6F8,
+            0x2090766, 0x14B374A, 0x3C012A8, 0x0898C66, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0012133, 0x043C8AF, 0x2CD097D, 0x123B0BD, 0x3276477, 0x19AD053, 0x1BB51C3, 0x0142297,
+            0x2A05857, 0x04EF6F8, 0x0ABB1E2, 0x16BCE8D, 0x006C6E6, 0x0585DD6, 0x30FCCC6, 0x0ABBD1A,
+            0x2B63379, 0x0A43A3A, 0x1209A0E, 0x1693788, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1808088, 0x0D6F33E, 0x14EB3AF, 0x136D904, 0x0AA2691, 0x07B5466, 0x2A33D08, 0x1E54FE7,
+            0x2D5D28E, 0x0A23382, 0x2F58CBB, 0x04E1DE1, 0x07A8E56, 0x1E2BC11, 0x1201194, 0x1860030,
+            0x18D81BC, 0x130E683, 0x3D202DA, 0x0A07FCC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0A0752E, 0x1B272B9, 0x2E81BB9, 0x13EE92E, 0x29E90D9, 0x161C7A4, 0x319AB06, 0x1E66415,
+            0x26AF23A, 0x08B4B82, 0x2FB5E6B, 0x0B4B0D8, 0x3102736, 0x1538C9D, 0x1E14663, 0x0423C20,
+            0x10B1A14, 0x0F4B55A, 0x17179B1, 0x05F34AD, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3C7AFF8, 0x196C7F7, 0x33A661B, 0x1BF6158, 0x0142254, 0x1A24675, 0x1ADAAC8, 0x1726F14,
+            0x3DF01D5, 0x0957BA5, 0x3859ADE, 0x0FE0567, 0x37E2845, 0x1B02DA5, 0x2558558, 0x091B9A0,
+            0x140F1F0, 0x15DA197, 0x1042DD7, 0x1DDDC2B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x12DCCD4, 0x00ACD60, 0x129536A, 0x14D457C, 0x262519D, 0x188378C, 0x1D4ABF2, 0x1D3C1C4,
+            0x2099FAB, 0x0CDC509, 0x315D70F, 0x1ED3FBA, 0x21C00FC, 0x1B0E317, 0x25DD46F, 0x119A71A,
+            0x13F934A, 0x1510AEA, 0x3A38205, 0x1F6F3C9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3183331, 0x1090351, 0x1793CDD, 0x13FCFCD, 0x2CC9F0C, 0x1A8EF0F, 0x3A0365D, 0x1B0DDCA,
+            0x1836417, 0x003A32B, 0x022A651, 0x0C4D7F2, 0x2151B25, 0x1613BBA, 0x1F80654, 0x1775977,
+            0x08F6BFC, 0x01045F4, 0x19A5D39, 0x181DCA5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1C04963, 0x18B5B24, 0x097FA61, 0x19DC275, 0x27BC98C, 0x055FF6B, 0x17460F2, 0x1351378,
+            0x225E2D4, 0x16AEC25, 0x20E006F, 0x16BC077, 0x01463A5, 0x1F9FD9A, 0x146ED6D, 0x0572191,
+            0x08E83CC, 0x1D32F2A, 0x3344CC2, 0x15A1F74, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x37614D3, 0x1C45FA3, 0x12C1582, 0x0B147B2, 0x1D57F36, 0x046FCA0, 0x247733B, 0x1A46F91,
+            0x30B502D, 0x0189777, 0x39A1FBE, 0x0E46FC0, 0x32833D1, 0x0E28678, 0x280CD77, 0x0D3A3FD,
+            0x27E9F3C, 0x0095FA0, 0x32F36D8, 0x1781D28, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^19 * G */ {
+        {
+            0x190FE42, 0x1FF77C3, 0x3F4B2F0, 0x00F0593, 0x23ECA3C, 0x04C396D, 0x106AF1B, 0x0F13B10,
+            0x1DEFD74, 0x03E2F97, 0x204B6FA, 0x0B47CF4, 0x0B2EC75, 0x1AE3668, 0x25E9E3E, 0x159062D,
+            0x0EBD6F2, 0x031145B, 0x019DAEE, 0x047BC8D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2A874E1, 0x0E1101B, 0x2915824, 0x14258C6, 0x3FCAE26, 0x0FB0BCA, 0x203AD3C, 0x11E429A,
+            0x275217A, 0x16AA85C, 0x165D56A, 0x04951F8, 0x102E961, 0x1F3921D, 0x2A65871, 0x03228E9,
+            0x236F8F9, 0x13B2123, 0x33317F1, 0x0BF520E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1A5E25C, 0x18D5E2D, 0x1C3B1CB, 0x1B78D52, 0x2866D8B, 0x11F61A7, 0x2518AFB, 0x14B0C37,
+            0x212149C, 0x0EBADF6, 0x3A73527, 0x1123B24, 0x1FE10E2, 0x1DE6263, 0x13DD72F, 0x0B0A6E3,
+            0x27A3D21, 0x006B968, 0x27618BD, 0x0669779, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x13C33AB, 0x01E4F95, 0x043ECC2, 0x064A8F0, 0x04E5BD7, 0x09EC14E, 0x045FFA0, 0x16C19D3,
+            0x37E4111, 0x17CDDC5, 0x0D66373, 0x0ACFDAD, 0x0D62C66, 0x1B8CA4F, 0x2FC5592, 0x06328D9,
+            0x21D0830, 0x02C0A1B, 0x130FE15, 0x0AB01D9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x374F130, 0x024A301, 0x0300F9F, 0x02E1BAD, 0x27BD5FA, 0x0114122, 0x1D2547F, 0x04F1427,
+            0x2F4AB36, 0x1353798, 0x18A4235, 0x0757C29, 0x330A25C, 0x1BC168B, 0x3FBD1C8, 0x0D1417F,
+            0x32E0DC7, 0x11A9F10, 0x08CEA32, 0x1E608F1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2463109, 0x1881528, 0x3D46C24, 0x0BBAB2C, 0x30D755A, 0x1D5616F, 0x38B7080, 0x0FC928B,
+            0x05B7D1B, 0x074EA29, 0x3119459, 0x1F26EE0, 0x2A5927B, 0x0BEB82A, 0x2BF35AC, 0x08B004F,
+            0x1A0A717, 0x01843C5, 0x21224B4, 0x1B85AFE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x09CF362, 0x1AA59E2, 0x0CC004A, 0x028D6A9, 0x34AA27A, 0x004EDD1, 0x26C44A4, 0x0E8E3BA,
+            0x17C08A4, 0x0B18795, 0x147A96F, 0x1457E21, 0x05304A5, 0x08CDF32, 0x27063ED, 0x0830874,
+            0x34E6FA2, 0x0D2FBF8, 0x3AACA60, 0x0F54A9F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x19AFF24, 0x180AD23, 0x002A10E, 0x0CACD8D, 0x2535E0C, 0x0467C8C, 0x2438D82, 0x047E4B8,
+            0x0F4C460, 0x1874C5D, 0x28366CD, 0x12E8B5F, 0x10A9755, 0x19E5160, 0x34B7225, 0x08C160B,
+            0x380BEA7, 0x0F6A0C6, 0x0FE2D8E, 0x197B767, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2BBC83D, 0x1CD9D87, 0x398C656, 0x1766A44, 0x3416878, 0x1E3F9C8, 0x2F2D327, 0x0DDFD76,
+            0x0B773A9, 0x12BFFC5, 0x0932EC5, 0x08BD05C, 0x22AB904, 0x000793F, 0x3A3A848, 0x029CC6C,
+            0x0C01C37, 0x0B2BF62, 0x0625C25, 0x1D6D1F1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x227A036, 0x1184646, 0x0E8DCC0, 0x0960C03, 0x3F34E54, 0x168EB2C, 0x3A91D3D, 0x09F4532,
+            0x32DB673, 0x164BA9A, 0x06C608B, 0x0839426, 0x311A1E8, 0x1698B54, 0x3631ADC, 0x1BFBD95,
+            0x2B1670E, 0x118AA82, 0x30BC463, 0x16504BF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3BF34F7, 0x0B53847, 0x35CA8D9, 0x1683C05, 0x38FC20C, 0x1B27A60, 0x1371F6C, 0x07B934E,
+            0x1AEF5D7, 0x0D4CA46, 0x32C0059, 0x1761C33, 0x17AB6DA, 0x03A9252, 0x381B554, 0x1EEA66B,
+            0x11DE0E8, 0x0E7102F, 0x1BB2656, 0x153F75C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3CF2586, 0x03C7741, 0x1A93560, 0x124510C, 0x1FA07A0, 0x0A9C880, 0x3BC7B40, 0x0541BBE,
+            0x201F365, 0x1F6E017, 0x3671F1D, 0x04354D5, 0x242A1D0, 0x1D3FAE3, 0x01607F2, 0x07251EA,
+            0x0C6E66F, 0x1C602F5, 0x228B942, 0x1C18D32, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3D62107, 0x1101241, 0x27DF3FD, 0x1D672C9, 0x1AC8BF0, 0x1894A9E, 0x06F1DE5, 0x0E8D832,
+            0x2B60C3F, 0x01B1AE5, 0x3A66189, 0x0888121, 0x197F6F7, 0x1517CD7, 0x0787DE6, 0x0F6235C,
+            0x306ECED, 0x1EB3579, 0x25DB029, 0x0723FC3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2F68F46, 0x1061A7A, 0x3032C1B, 0x0B883C3, 0x2EFE29A, 0x06D981E, 0x0286BD8, 0x0E8AB6A,
+            0x1B39B7C, 0x063103E, 0x3CBF468, 0x1B82B82, 0x20A9FE9, 0x03CDE4B, 0x0377A9C, 0x0CB27E2,
+            0x19C7DB2, 0x0C7F5DD, 0x2C764BA, 0x0170E3F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1A363C6, 0x0063250, 0x2BFA5A4, 0x1AE78C7, 0x2FE5273, 0x1B12CCC, 0x038007A, 0x1F2157B,
+            0x0E5CA52, 0x0D24500, 0x30DEBE8, 0x12DF41E, 0x007834C, 0x1C6434B, 0x304CD9F, 0x1748EFB,
+            0x1204017, 0x16A4CCC, 0x0BA80F2, 0x1A70B90, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1C5AD7B, 0x095DBAA, 0x05478A2, 0x0EE1BF3, 0x11C64B3, 0x1269D0B, 0x3924D51, 0x18D8A21,
+            0x30EEDBE, 0x19D585F, 0x06E9868, 0x0E4391B, 0x2CF7EED, 0x0399F94, 0x0641756, 0x0EA9425,
+            0x1F8FAEF, 0x0DAB0F2, 0x09424BF, 0x19DC662, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^18 * G */ {
+        {
+            0x3A38ED2, 0x1F94200, 0x23A9FF6, 0x1C4419D, 0x26CCB51, 0x0632046, 0x3124A75, 0x169FC7C,
+            0x0947D59, 0x1700B28, 0x1E550E9, 0x1D733A4, 0x38672A8, 0x1378110, 0x1F7F016, 0x14384A3,
+            0x03D8559, 0x0BD7718, 0x3BDED5B, 0x17E8619, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2AEB9B7, 0x0E6E67C, 0x0199298, 0x151DAE2, 0x14803F9, 0x029C14D, 0x27C3A8C, 0x164DE67,
+            0x06A1B9A, 0x1EB0A82, 0x14BCADD, 0x148060E, 0x3CAEBFC, 0x0ADBD5F, 0x368C9DE, 0x1AABA8F,
+            0x10EFA2C, 0x0CF731B, 0x2F22BC2, 0x19B566D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x26C7796, 0x12E6EA8, 0x2EF086C, 0x07FC2CF, 0x3619B84, 0x1242D07, 0x3CC6D98, 0x1864910,
+            0x3F78EDB, 0x17F275C, 0x32D3140, 0x011CCC2, 0x23DC534, 0x1DCB9B1, 0x18089D0, 0x1A9314E,
+            0x1330157, 0x0490159, 0x3AFB925, 0x13A304C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0C01B5A, 0x1DDACA6, 0x13A8167, 0x0E94990, 0x2F0CC62, 0x0D90798, 0x27A9C0B, 0x1852773,
+            0x1B563BC, 0x149A2D3, 0x1FDC869, 0x0F0E4A7, 0x2E2FF04, 0x183B315, 0x172607B, 0x06B29D1,
+            0x1110324, 0x00405A5, 0x18BB624, 0x02BFB1E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1104D03, 0x09E7915, 0x0A82646, 0x07A9A33, 0x3D79CA5, 0x11E59BE, 0x003AC4F, 0x0D4565A,
+            0x3CCBBBC, 0x14D9A60, 0x3C3DF7C, 0x051CBEF, 0x32A7823, 0x03FCD8C, 0x0A9C8D7, 0x0A853A6,
+            0x1641CC6, 0x181DDAE, 0x3C7E243, 0x0870A2D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1C54FA7, 0x0878865, 0x286B49E, 0x1D487BF, 0x145BCD7, 0x07EA545, 0x14A4D8E, 0x1458B50,
+            0x06E00D3, 0x11C0F7C, 0x21FD68D, 0x19C78B3, 0x194127E, 0x0DB15E7, 0x0984FF0, 0x128E74E,
+            0x1C66E88, 0x01AFBAD, 0x27BDC9E, 0x030BEC3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1D4E186, 0x02451B6, 0x11A29D3, 0x05BE13C, 0x0D9AAE2, 0x13CA1B0, 0x047C3CA, 0x1486F08,
+            0x1889445, 0x0A0D1CF, 0x31B8870, 0x02B84A8, 0x2D4EDBD, 0x041C4B5, 0x05D2914, 0x0BE5A93,
+            0x149C77A, 0x0D298E7, 0x187E750, 0x05685D4, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3F10CA8, 0x0F6588A, 0x01642C1, 0x06F4C94, 0x096E503, 0x0E28872, 0x22CDE6B, 0x115A035,
+            0x2FB6A37, 0x1012CCE, 0x021F180, 0x04820EF, 0x0749256, 0x056653F, 0x1B5AF93, 0x07C8888,
+            0x3CDA141, 0x1334C36, 0x3E22321, 0x0DD7EC3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2F1D1DB, 0x05DABAF, 0x0F981B6, 0x0A05F6C, 0x013CB0C, 0x0986FBE, 0x21DC441, 0x1B545C1,
+            0x08C9B83, 0x0FB85FA, 0x2889B2A, 0x1530BEB, 0x3B312FC, 0x01930F3, 0x1784A40, 0x0130DC5,
+            0x379BDBF, 0x17EF5D2, 0x1168DF7, 0x18B658E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2BFF919, 0x076BED1, 0x24948C3, 0x114A8D4, 0x02BB731, 0x03A4A84, 0x3FC6786, 0x0AB7A62,
+            0x0AD0A22, 0x1553B09, 0x1E808BE, 0x04F8A62, 0x14A684D, 0x136C201, 0x3DE4A53, 0x05008CD,
+            0x295F3AD, 0x1C57990, 0x0C9D021, 0x0980B24, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x35380AA, 0x0354F30, 0x13A864D, 0x1961B15, 0x07B534B, 0x1BC7850, 0x01498DC, 0x1DD877F,
+            0x1C216D3, 0x05A4B61, 0x31E6F09, 0x0EF130C, 0x39CE121, 0x0A167AE, 0x03B9A2B, 0x024E34E,
+            0x2387E9E, 0x0743A19, 0x1299823, 0x1BA73DF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x17CEEF2, 0x1936782, 0x2F9E06D, 0x1A658A7, 0x300C660, 0x002F21A, 0x2D50286, 0x0029B2D,
+            0x0518C94, 0x1DC529A, 0x039B63B, 0x12A1833, 0x04F568A, 0x1B64363, 0x0ACAA8E, 0x1F0ACCD,
+            0x1902378, 0x0EA66D0, 0x32BFDC5, 0x0935FBE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x17D7E44, 0x0F2B410, 0x1B6E76A, 0x07EBA1D, 0x21BDAEF, 0x0220C37, 0x1163C84, 0x034F077,
+            0x3155384, 0x1106057, 0x30CC448, 0x0E02969, 0x374EBE7, 0x19D1D6F, 0x16D33AD, 0x0FC7F2C,
+            0x2F38F91, 0x0C4EF26, 0x12977D7, 0x0E3C576, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x18C1472, 0x0B38B61, 0x01DF248, 0x0FFE884, 0x1871A08, 0x05D3E84, 0x042294B, 0x126E89C,
+            0x30F59D6, 0x0B61F61, 0x11510FD, 0x13F7034, 0x2AB4492, 0x1C46337, 0x0FCA5CD, 0x199A0DF,
+            0x15C5114, 0x08358D4, 0x316515E, 0x12135F1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0E07232, 0x0B55ABB, 0x35C1C11, 0x05E4FB9, 0x2C5F6DC, 0x18DEECB, 0x2FDB0E7, 0x09C916A,
+            0x3FF8A2C, 0x086FCC8, 0x1D9CAE1, 0x1D98924, 0x3BF0D6F, 0x124C784, 0x05EDF5C, 0x13DBD2B,
+            0x059A02F, 0x07615B3, 0x2754A97, 0x1F2191C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1663D64, 0x08B6CDF, 0x23F81BB, 0x15FD1FC, 0x096DC38, 0x009A4EE, 0x0E9E97B, 0x0495837,
+            0x12658E5, 0x0F18462, 0x275622C, 0x1F56E92, 0x1B61363, 0x1783F47, 0x3344B1C, 0x022C4BC,
+            0x1EB58F8, 0x1EEA464, 0x0A8AC59, 0x189DD20, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^17 * G */ {
+        {
+            0x17C1EFC, 0x09BCD6F, 0x0EA7774, 0x1739983, 0x17DFF1E, 0x12007CB, 0x154E6FC, 0x0C9A3D9,
+            0x03FFFD7, 0x1D23108, 0x1CA07BD, 0x1168FF4, 0x238ED9E, 0x092CACA, 0x3DDF733, 0x16DB5AB,
+            0x0B02A57, 0x0D42A87, 0x0EEDD63, 0x011923F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x339B596, 0x042E276, 0x1194D9A, 0x08FF057, 0x39806D8, 0x0FB34EC, 0x16C1465, 0x1DCFA98,
+            0x2F9D6B8, 0x05E568F, 0x20ADAE5, 0x1E924E5, 0x0CB45A5, 0x0AD6FC0, 0x0AAAC94, 0x0CEBE1B,
+            0x38CE592, 0x0D77C38, 0x2932277, 0x1BCB5A8, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x30AAF36, 0x007027F, 0x0B42D14, 0x15756D7, 0x2E2373D, 0x0D312F5, 0x1F7B0BD, 0x1091656,
+            0x22FB185, 0x18C8B70, 0x11E8D67, 0x0BB368F, 0x1F44BA9, 0x1F7A887, 0x162A8EF, 0x0EB0367,
+            0x0CABC51, 0x0158286, 0x2A59723, 0x1DB979B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1E7553D, 0x0CEF812, 0x385EB1E, 0x135114D, 0x002B9FA, 0x0B26DAD, 0x22A4106, 0x18BCCDD,
+            0x24CD042, 0x09B210A, 0x33852AC, 0x0A2C201, 0x3F2B48F, 0x16281A9, 0x2F35915, 0x1DF150B,
+            0x2B03492, 0x0D6E614, 0x2789FB4, 0x1C77F1B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x23FA3D8, 0x1958F8B, 0x0B2ACDE, 0x1FE99D0, 0x3FFABA5, 0x1334620, 0x3AE24FD, 0x09EB2ED,
+            0x2C85FC6, 0x1DE0BCF, 0x0CE1778, 0x0CCF080, 0x0558794, 0x1DFFCF8, 0x089CB4E, 0x04FCF99,
+            0x164AEB7, 0x1673AFE, 0x1891A29, 0x089D659, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0F66D07, 0x0100542, 0x1B0E73C, 0x1DDFD09, 0x23AE7E6, 0x1234070, 0x0205501, 0x1B0C699,
+            0x14F08D0, 0x09AE39C, 0x24F2D7A, 0x1863543, 0x13F30E3, 0x1B1E953, 0x2C0594D, 0x1E0E006,
+            0x277373D, 0x065CC33, 0x0A6B2BE, 0x1C41201, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x10B3194, 0x03059BE, 0x0A6F88D, 0x05C92C7, 0x04775E1, 0x04DB117, 0x173A0F9, 0x0BE09D0,
+            0x27A36E7, 0x0C59E3E, 0x0CFB48A, 0x1660D26, 0x187B121, 0x124AB0A, 0x0BC5093, 0x050C225,
+            0x11520B2, 0x0D7BB7A, 0x3AD3E7E, 0x0513FF6, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x319D0EB, 0x1FC917F, 0x3F843D8, 0x0A2D8DB, 0x1AD4CF8, 0x1A84756, 0x1D11B34, 0x17CCDAD,
+            0x1FF89D6, 0x0B28730, 0x28CC039, 0x1140EAF, 0x38EF41F, 0x15709E8, 0x301BDC1, 0x0F40778,
+            0x02D61AA, 0x1886670, 0x39138F8, 0x116975C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x266632E, 0x1152CF0, 0x130869A, 0x14D673E, 0x2E7BA09, 0x0E42700, 0x39E0380, 0x1F2A87D,
+            0x20EE4F9, 0x0FDCFA5, 0x16C38F9, 0x16F638E, 0x24D75AA, 0x1DE970D, 0x09C750E, 0x0CFA118,
+            0x213E2A4, 0x047269B, 0x2254CFA, 0x0D8643E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2CA89BC, 0x098E1BC, 0x2A136D8, 0x0CD1428, 0x369C7FE, 0x11C94C3, 0x3F7AE99, 0x015CFE1,
+            0x010C0C8, 0x00CE9D2, 0x380D838, 0x0CF7F78, 0x14C6157, 0x1DAEE1A, 0x2E91B41, 0x05269B7,
+            0x171687F, 0x1364891, 0x1196DD5, 0x050A55B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x13AE12F, 0x184A119, 0x37B8EB2, 0x1C267BC, 0x1F7055F, 0x02C6DC9, 0x00CBF51, 0x0EA7713,
+            0x068A21D, 0x1DEE2B2, 0x3458187, 0x0559AEC, 0x1493F98, 0x0AA5A47, 0x18EDF88, 0x17FD05F,
+            0x0871F7B, 0x198064E, 0x297EEE0, 0x0E3D4B1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x382B82B, 0x19E248C, 0x0E8BB72, 0x10708D2, 0x16579EF, 0x1C6E9F8, 0x37B48D1, 0x070C863,
+            0x0769595, 0x0CCF2DE, 0x0AB778E, 0x0FB7B39, 0x00D5E50, 0x09167E6, 0x19792F4, 0x1A6815B,
+            0x3109414, 0x02FAEDE, 0x01A0622, 0x04301F3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2CF8090, 0x14D646F, 0x0D08901, 0x05BCDCC, 0x2087509, 0x00BB306, 0x31552A6, 0x109729B,
+            0x0577362, 0x1111C5A, 0x03AEA07, 0x0E66CD1, 0x3B5C9ED, 0x1259F55, 0x0F314DC, 0x10C9241,
+            0x17DD277, 0x13F2F21, 0x2D70F13, 0x09A8D5C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3CA1D27, 0x11591EC, 0x39832E6, 0x01C6B65, 0x39205E2, 0x1F154AC, 0x17E7E15, 0x1EF7396,
+            0x1D9A327, 0x0B94B0D, 0x0B9CF7D, 0x00F2C24, 0x3905F25, 0x0E61138, 0x07AF7B9, 0x1DBAF22,
+            0x393677D, 0x1D96DF4, 0x3EF36A5, 0x1489F31, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2A1C079, 0x0726D9C, 0x1DFBF44, 0x1D612A3, 0x0F36001, 0x1C0A8E9, 0x0B4A18E, 0x149F440,
+            0x023270D, 0x184DE85, 0x3C6E0BE, 0x18EFE03, 0x12E3E9F, 0x0FB54EE, 0x1BCA3F7, 0x107B7B0,
+            0x3B432D5, 0x12FFB3C, 0x38FE4F6, 0x1E05E03, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2035897, 0x192B22D, 0x2AA1AC7, 0x0D53C2B, 0x03CD4A2, 0x14EF584, 0x08D167E, 0x1B0B8D4,
+            0x33654B7, 0x1B385CC, 0x2F6E3CD, 0x08B2D1F, 0x1E812CA, 0x1D77DC9, 0x21F4363, 0x1219642,
+            0x2D8F5FB, 0x08A9BA1, 0x3877D7F, 0x1A4E681, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^16 * G */ {
+        {
+            0x1DA33FF, 0x1A11F2B, 0x2E62349, 0x098FB42, 0x35ABD68, 0x1737764, 0x2432E90, 0x0A2C878,
+            0x333EDCB, 0x1603897, 0x00A95B7, 0x1160D7A, 0x3DFFEE5, 0x0875FBD, 0x17D3BF6, 0x0FF6ACB,
+            0x03F0417, 0x11D4D76, 0x0310B98, 0x01603C2, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x22314A7, 0x0BAEEBE, 0x11B68DA, 0x0F71234, 0x0B0E138, 0x187CAEF, 0x1E6867E, 0x19FBEC1,
+            0x00AB325, 0x0E453E6, 0x3DF267D, 0x14747FC, 0x091C987, 0x14D79DB, 0x2F22FF8, 0x14B0B62,
+            0x06F638D, 0x022F78B, 0x076CF73, 0x1244D04, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2874590, 0x04421D4, 0x0886F04, 0x028E2FF, 0x29C4414, 0x0A4A783, 0x0272257, 0x0CDC55C,
+            0x3C0EAD4, 0x00FFC51, 0x35F41ED, 0x1BE8F64, 0x3C2F715, 0x0DAB3B7, 0x011FCF8, 0x0626D0B,
+            0x0F36BD5, 0x0C199AC, 0x3FF65C8, 0x1E3693C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x18DB4C7, 0x08B5CA0, 0x0FCD834, 0x13332ED, 0x1AC0799, 0x01549E4, 0x2917E0D, 0x05544B7,
+            0x10AA448, 0x0C77C4F, 0x3B49ECA, 0x144E013, 0x05A5832, 0x176A805, 0x18DB702, 0x0A59211,
+            0x3EB607E, 0x14800D3, 0x0ACEF61, 0x191AEB4, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x150EBE7, 0x16DE353, 0x0B67665, 0x06B3299, 0x1CD5C5D, 0x1934C9A, 0x195DB60, 0x13EA9DD,
+            0x1B43FEC, 0x00C525D, 0x15E46D2, 0x0344B11, 0x10F08B6, 0x16347CD, 0x3DE308B, 0x01CADFC,
+            0x1EF1B31, 0x176D9DB, 0x33F06D3, 0x089F530, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2D7A336, 0x0A51456, 0x385F79F, 0x16A8402, 0x1B700E5, 0x022FFB1, 0x28FFF68, 0x1F3223B,
+            0x3AA6465, 0x1E72727, 0x1E80B07, 0x1542030, 0x22D7343, 0x0127AC2, 0x21426A1, 0x140A7ED,
+            0x301FD9A, 0x1C4BAFC, 0x2592EA1, 0x0491D70, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x021F081, 0x02B530F, 0x36AD7CD, 0x031EA1B, 0x1723122, 0x1646CEA, 0x1D5BF41, 0x0DE7FCF,
+            0x34A5307, 0x0A74FEC, 0x2C1350C, 0x1D15E28, 0x2B24877, 0x0993ED6, 0x1151D7D, 0x1BF1831,
+            0x2BFFF75, 0x09560F6, 0x08E7E81, 0x0DA47E7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2CD38D0, 0x156ABCC, 0x0368AAE, 0x1E4C6F2, 0x2997358, 0x17EFBFE, 0x3AEB2E1, 0x0172535,
+            0x01E1148, 0x010842C, 0x193EB51, 0x11B0220, 0x3807D97, 0x08DDBB0, 0x24C3651, 0x11A5CE4,
+            0x13375BB, 0x0FEC06F, 0x2FBF87B, 0x1D11C50, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x17AE5FF, 0x16A917F, 0x185464D, 0x01077BA, 0x06A7426, 0x128DD3B, 0x37BE599, 0x1F37A3F,
+            0x36D7A32, 0x047703A, 0x037CCDE, 0x05B5AEA, 0x39D18B2, 0x07D16B4, 0x0ADD5AD, 0x15ECB20,
+            0x1F7CEAA, 0x1CDC1F0, 0x35AAB19, 0x0A64263, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2173ECD, 0x0481336, 0x048359D, 0x1648207, 0x12D9A79, 0x0708704, 0x3F41F81, 0x18B4C98,
+            0x0BEB790, 0x0EAFFE5, 0x286418E, 0x0D03552, 0x012A88D, 0x11682E4, 0x157D2A7, 0x05D45E4,
+            0x3A858F1, 0x1CFD7B9, 0x14F7418, 0x01BD4FB, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x20ABD68, 0x1434348, 0x1A59792, 0x1A90E34, 0x2AAB7D4, 0x13CC56E, 0x29221B9, 0x0B96E29,
+            0x19A5094, 0x1DE7F01, 0x1069C61, 0x127FF93, 0x395D66E, 0x06BD1A5, 0x2059D04, 0x18401B5,
+            0x38C3237, 0x14DA474, 0x1DD41A4, 0x0EC1B4A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1A6AAB4, 0x14C7AFE, 0x16BDF52, 0x196E18E, 0x03C338A, 0x1A88F04, 0x39E8942, 0x17D8355,
+            0x2A880F8, 0x1F1FA6C, 0x32624E7, 0x15195DB, 0x3929A51, 0x1982191, 0x04170FE, 0x04F868B,
+            0x0EB5C0A, 0x05F3804, 0x06E3069, 0x19B5B85, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3000168, 0x03D3352, 0x123AF59, 0x00A129A, 0x071A4EB, 0x06AD53D, 0x06C1D8B, 0x15853AB,
+            0x23D9E3D, 0x1684DE6, 0x1063559, 0x1473553, 0x339095E, 0x05E3C93, 0x0D42E1E, 0x1E2B588,
+            0x19DB683, 0x0EF8D05, 0x388E027, 0x0D6A64B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2F2E947, 0x09CDB94, 0x25FDF6A, 0x19402E9, 0x2249DFF, 0x1DFD8C6, 0x150E080, 0x0435682,
+            0x24E149B, 0x0C3F4E0, 0x238D8C0, 0x152D77A, 0x3F9DBB8, 0x17E7C97, 0x0F0611F, 0x0EDEEC4,
+            0x3F2A91D, 0x15185C9, 0x3F3D2BC, 0x0098A95, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0A051C4, 0x03BB3DD, 0x028C830, 0x0CEB64E, 0x3996CBA, 0x1F20408, 0x051BC58, 0x17BB853,
+            0x2FD34AA, 0x0BE1166, 0x3CCE95E, 0x0F21DD2, 0x1D8449D, 0x1168B39, 0x2E44EE6, 0x14F5482,
+            0x3F21374, 0x0305CE6, 0x092D652, 0x1F1513D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0BAEA3E, 0x1287658, 0x3B350E5, 0x1C3412E, 0x368D490, 0x12A7067, 0x28B44A8, 0x08C7B5C,
+            0x09029F1, 0x1CE01A3, 0x316CB61, 0x12FBA89, 0x277EF98, 0x077D5DD, 0x292B69D, 0x10A9F82,
+            0x38BA61C, 0x1B1D258, 0x2E0E9C6, 0x0B9D784, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^15 * G */ {
+        {
+            0x1B31368, 0x1DE15C3, 0x14782B1, 0x03D551D, 0x049E61D, 0x153F4EC, 0x372D9F4, 0x0BA0FE2,
+            0x3AA9CA5, 0x1D33E5F, 0x3FC9220, 0x1419A65, 0x3C69106, 0x0391474, 0x36721C0, 0x1841168,
+            0x2E8795D, 0x0C579EE, 0x3F59EC8, 0x0ABCFE7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x074F779, 0x1398865, 0x0657052, 0x11C8A13, 0x06593C1, 0x14103F3, 0x2DDAC24, 0x159D07A,
+            0x0A47D97, 0x15C7AC9, 0x3801C9B, 0x14B6B9C, 0x114B10D, 0x07D149B, 0x3750ADC, 0x0CA53CF,
+            0x1A4DE19, 0x1ED7F28, 0x3939690, 0x0DF00D6, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x13FA05E, 0x164D21D, 0x2B71443, 0x04BDEBF, 0x3BC4A92, 0x0A31772, 0x26D798A, 0x0181EFD,
+            0x2707905, 0x09661C0, 0x317F93E, 0x1492B68, 0x014E05C, 0x0AF1E4B, 0x11C1E80, 0x080D08C,
+            0x3248FDB, 0x18B8727, 0x1C182AC, 0x15A2879, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3145345, 0x1F46A3C, 0x3C04722, 0x1BB1862, 0x20DAB2B, 0x0387329, 0x2770746, 0x07766FF,
+            0x1A3AF15, 0x113C46A, 0x1DA2C2D, 0x12AE77B, 0x2D08CDB, 0x14D2403, 0x04972A7, 0x0858B99,
+            0x39076D1, 0x0CE8F56, 0x25B839B, 0x1AA45C9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2A75567, 0x179292C, 0x095DD14, 0x1AF264E, 0x22B4955, 0x01082C6, 0x2A314D1, 0x05323CA,
+            0x2CF6B7A, 0x07F853A, 0x38906B5, 0x0FC698D, 0x0D308D3, 0x0905EB1, 0x3328B6C, 0x1323FF9,
+            0x06529D4, 0x054973D, 0x1F266C1, 0x13CEA28, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3938236, 0x1A0EDFF, 0x08669E7, 0x0D285F2, 0x38A4D3E, 0x17B7DF3, 0x0F6AD78, 0x096CEAE,
+            0x2E2AB33, 0x0F5F539, 0x32CDE84, 0x11D1881, 0x14B2FD0, 0x0D5F17C, 0x261A001, 0x0CD33E6,
+            0x312C204, 0x02617D9, 0x1126FEC, 0x1680EE4, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2315BFB, 0x03CE1B9, 0x17223CA, 0x0C36CA6, 0x094E5DF, 0x12C4CB2, 0x21DAB0C, 0x0C3FE76,
+            0x2DDB406, 0x03FAB9A, 0x25E3A86, 0x063802F, 0x0B380E5, 0x1722443, 0x2DAE977, 0x15972D8,
+            0x027FB2D, 0x0CD59DA, 0x2BF8CC8, 0x149082D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2396884, 0x1D41BD2, 0x09CF81A, 0x0BD93FC, 0x1217132, 0x135CDB3, 0x006E56D, 0x12227D0,
+            0x36271F6, 0x0A553A1, 0x2EB4812, 0x0C7876A, 0x0D2701C, 0x10F5700, 0x316C94F, 0x01309C3,
+            0x03A1D97, 0x11A4AD2, 0x0605C83, 0x1B6352E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3C4D77A, 0x196632E, 0x374B90B, 0x186B469, 0x36A77B7, 0x10731E7, 0x1D3CB4D, 0x0331BFB,
+            0x06D25CB, 0x1BCE296, 0x07C13C4, 0x14BCF19, 0x3FCA98A, 0x0A92246, 0x1BB150F, 0x1A467F6,
+            0x099D57F, 0x0D43FBA, 0x0562BF6, 0x17E5DD9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x239223C, 0x0D3016E, 0x023BE83, 0x1392E8D, 0x2BEA398, 0x03ED952, 0x15EE86C, 0x1BF8D1A,
+            0x1E95A0E, 0x0889D83, 0x22548E3, 0x07D992B, 0x11850BF, 0x1944570, 0x2F14916, 0x181DB55,
+            0x0D14560, 0x098DBFE, 0x23F50E9, 0x12FD77A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2861721, 0x008814F, 0x2B13BB6, 0x129C605, 0x32AD12E, 0x130B5DC, 0x2203D33, 0x0A53140,
+            0x0356A69, 0x16DCDF1, 0x3A36221, 0x10B0282, 0x088372D, 0x0B08051, 0x1E2A413, 0x1E3D88D,
+            0x1C75D83, 0x10ECC36, 0x3DC2DEA, 0x01102EE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x253C0A0, 0x06D0483, 0x381D520, 0x036CAEE, 0x10648A7, 0x065AB34, 0x0F4B942, 0x153E755,
+            0x056EA6A, 0x1BE0019, 0x0AC055F, 0x01C0ACA, 0x122D1FB, 0x0E2F841, 0x24E2677, 0x0694C81,
+            0x261F63E, 0x1D2495A, 0x06A3F3E, 0x13F74E3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3EB2B4D, 0x0BCF936, 0x14A625C, 0x1E1C614, 0x279F3E5, 0x09915BB, 0x0962C27, 0x09C5F94,
+            0x14417EC, 0x1790DA7, 0x2529043, 0x1C98F9E, 0x0F5F50F, 0x0D8CB2D, 0x0B12351, 0x1F95B75,
+            0x33D9912, 0x15C353E, 0x1A729A6, 0x1183F72, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1C050CC, 0x0464F0E, 0x34C1646, 0x0CAFEF9, 0x0B6F6E5, 0x187115E, 0x3C3833B, 0x03D9EA7,
+            0x1E3C051, 0x14A395E, 0x12C6BAD, 0x12D69C0, 0x2074557, 0x18C5DBA, 0x3A6A39A, 0x0099E6F,
+            0x045EA4F, 0x1F98A8F, 0x0F009F1, 0x181F74A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x112E5DB, 0x0592E0F, 0x337953D, 0x0CBC27C, 0x0A340C7, 0x0B0F1C1, 0x3FB8030, 0x11BD7F0,
+            0x0F5B039, 0x15CE575, 0x0F4F111, 0x183C1C5, 0x2406ECF, 0x1CE4FA7, 0x32FF1FF, 0x0D2348F,
+            0x27252F6, 0x1A7117F, 0x2FAB8D3, 0x1BBD38E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3CA1FB9, 0x0E43073, 0x2B3B2FF, 0x06547CD, 0x0A70D02, 0x18BBC42, 0x2E372B4, 0x152B68F,
+            0x27F7441, 0x07655A2, 0x3119951, 0x064896A, 0x24A998A, 0x1D8F080, 0x0B4F386, 0x146C794,
+            0x17321CE, 0x1E4F1CB, 0x0A5DC7A, 0x0CE56DD, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^14 * G */ {
+        {
+            0x098C20A, 0x03D8BB1, 0x0C82C85, 0x0B46BEE, 0x03DDCC8, 0x0DD9564, 0x30D4FE1, 0x0373EBB,
+            0x2C080CD, 0x0A98F3C, 0x2BFB934, 0x0E104E7, 0x3022B2C, 0x1CB648D, 0x29FDD17, 0x05C9132,
+            0x399EFD1, 0x12E0A57, 0x10342FC, 0x083C6B2, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x24DE58D, 0x10BB26A, 0x04E4B4F, 0x03DF8A0, 0x0F36C64, 0x1EF5974, 0x1B7502E, 0x081C40B,
+            0x3CF67C2, 0x1DB4785, 0x1920FE1, 0x0960BBB, 0x33F6B43, 0x0109097, 0x0149E74, 0x1EB7716,
+            0x0D34239, 0x00E2FFC, 0x263BAA8, 0x101446F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3D556EC, 0x1B41344, 0x0CA0231, 0x16CB3F0, 0x25C3E3E, 0x1822689, 0x07D9574, 0x11C696B,
+            0x1D808DD, 0x11530F4, 0x085D445, 0x10ECFD4, 0x1DEC621, 0x19164F4, 0x3CFE9E7, 0x0590D2F,
+            0x2BD60FA, 0x05C72A7, 0x390CCD0, 0x19FD03E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3F61E3C, 0x0B3FD1D, 0x3127867, 0x0A0308A, 0x22BD505, 0x08D9FE3, 0x351B545, 0x1731A8B,
+            0x01C1E0F, 0x1E640C2, 0x060D803, 0x0D908EF, 0x38AAA41, 0x0ACB5DE, 0x28BC708, 0x0948564,
+            0x0884411, 0x069B5B0, 0x39F9209, 0x0560B65, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x302F270, 0x1639061, 0x204EB11, 0x1E440AB, 0x09C7225, 0x0617B1F, 0x1BB08AE, 0x193AF7B,
+            0x33D37B6, 0x17F71EF, 0x01F6361, 0x1E5884B, 0x1BCBB2E, 0x0EE2E39, 0x0E85070, 0x1B4E7B6,
+            0x0CD808B, 0x1161895, 0x1A67CCA, 0x08CAE54, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3AB6C30, 0x1FD5435, 0x2E8C5A6, 0x1A82994, 0x1FFFFC8, 0x03152C8, 0x3184A77, 0x0923DF1,
+            0x3F52B30, 0x1D8F6A8, 0x2388DBB, 0x0A8C2D0, 0x2F08BE9, 0x07815F3, 0x355E38A, 0x123D92A,
+            0x0117D92, 0x1881788, 0x21F8CF4, 0x05A8F93, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2DA8CEA, 0x0A59698, 0x0F112FF, 0x008AAB5, 0x078E3F7, 0x1526D01, 0x2FF176E, 0x1359B5A,
+            0x3637E16, 0x057F178, 0x2FC2405, 0x04340BE, 0x0E72E62, 0x17173DE, 0x1C9F25E, 0x06584A6,
+            0x26AFFDE, 0x1759F31, 0x3FE9363, 0x1A4D1A3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0ADC016, 0x06D7E41, 0x30A1FD0, 0x0D1780E, 0x2AD35E5, 0x1FC55E7, 0x06640C6, 0x10B08BD,
+            0x0E82F9B, 0x19DC3B6, 0x2E48CF9, 0x1323915, 0x206E37A, 0x05BC797, 0x3462044, 0x1BE9198,
+            0x0CAC425, 0x0148EA8, 0x359D598, 0x15C42CE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1E6EB04, 0x11E3D56, 0x1D6CE03, 0x0F203AB, 0x070EF5E, 0x012B0D9, 0x1EBA006, 0x0AD35C5,
+            0x22694F3, 0x099CED7, 0x2BC44B7, 0x1DD185C, 0x0DE3D58, 0x0E0A477, 0x160BDCE, 0x08AB2D9,
+            0x30AF012, 0x1390177, 0x3E23804, 0x0EB3597, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0BF1614, 0x1916D2C, 0x12F61BF, 0x1195F55, 0x1A4FA8C, 0x03AAF5B, 0x14BB7C8, 0x0123ABB,
+            0x087599E, 0x09B850F, 0x1D62AE2, 0x084609A, 0x2E9F0F3, 0x047F3EB, 0x2A72DB7, 0x1B97A57,
+            0x26B4444, 0x001ACB3, 0x1092AB8, 0x184BF06, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2B0B4B9, 0x1F1C54D, 0x39B1F4D, 0x18F52F3, 0x0461236, 0x010F560, 0x3CD4B2B, 0x0B91D85,
+            0x3E7F6C2, 0x05EE707, 0x2C7190B, 0x14CCF0B, 0x0788EF7, 0x0828901, 0x1AAAFAE, 0x069C442,
+            0x3950A15, 0x1C66C54, 0x20EDF93, 0x0DA5F11, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0D311F1, 0x09F324E, 0x39A3E05, 0x05D01BA, 0x319D8E9, 0x0CD8198, 0x1690111, 0x09ED021,
+            0x35667D4, 0x12C4D10, 0x3B690B0, 0x093730C, 0x3658D5D, 0x09A3268, 0x3B1625A, 0x0435278,
+            0x10AE09B, 0x09CAF53, 0x38A8E6A, 0x17DE752, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x356A492, 0x02BDB03, 0x0E730C2, 0x10EF79B, 0x24F65B0, 0x004C2DB, 0x04E5781, 0x18EBE88,
+            0x0D4ECF0, 0x14E4B00, 0x38FE520, 0x067661A, 0x0444BAA, 0x0C80917, 0x21463DF, 0x1C27217,
+            0x2FF4DCC, 0x0992C01, 0x27DDF4C, 0x0C318E8, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3CB5E32, 0x1FEC27D, 0x09ED77D, 0x1617E15, 0x32E1031, 0x15DFB0E, 0x3A40560, 0x0A9B825,
+            0x33EBA31, 0x1A8457D, 0x1426C08, 0x148346F, 0x34E9B13, 0x057EEBD, 0x0432E0D, 0x156EC10,
+            0x14031DD, 0x05986BD, 0x067FBAD, 0x17A6CF3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1FF628E, 0x1C62486, 0x3C5D265, 0x0CFA32E, 0x1624D72, 0x07F68EA, 0x1D6E30F, 0x0CDED2C,
+            0x029CB5E, 0x08D7C18, 0x14D404D, 0x0E04936, 0x3B999AA, 0x07CEAEC, 0x35182F2, 0x0B1A9C5,
+            0x1F59628, 0x13326CD, 0x06EEEC9, 0x0D2FC18, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x139C1AD, 0x1191F41, 0x239CFAA, 0x17A2B48, 0x02FE987, 0x09DBD84, 0x1F8E730, 0x097A25C,
+            0x3A4B7ED, 0x09BEB85, 0x08AC31E, 0x15F03B5, 0x290B82E, 0x088C987, 0x3290B51, 0x112396B,
+            0x3716772, 0x1734F50, 0x3637430, 0x0081DA7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^13 * G */ {
+        {
+            0x2B5242D, 0x0DC115B, 0x0E6C605, 0x0C54EDF, 0x32D6165, 0x0E9658A, 0x13141EC, 0x1F946D8,
+            0x30A8246, 0x1160089, 0x1F06D10, 0x099836A, 0x003B5EA, 0x0E76EF3, 0x138F3E8, 0x0D22BE9,
+            0x30B476F, 0x06B5E59, 0x08F4D96, 0x041AFA7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0C4E6A6, 0x0D26E40, 0x0D147F5, 0x0A9004D, 0x25D6898, 0x1D86AD0, 0x29302A7, 0x131279E,
+            0x1A49F5B, 0x18D751A, 0x1E7CF19, 0x0559CD6, 0x2B76884, 0x187F8A6, 0x1617E16, 0x086AE68,
+            0x3526E5D, 0x0447C54, 0x33380B1, 0x07063CA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x17A1673, 0x0858311, 0x3548270, 0x1A4E20E, 0x24557F9, 0x1E0A142, 0x1E8BB5F, 0x18D180F,
+            0x127A104, 0x1B5C837, 0x2DFA0E9, 0x1CF755F, 0x3F65D6C, 0x0006F0C, 0x1DD4B50, 0x19B28A8,
+            0x1E4F43F, 0x1BC4C47, 0x00C5F9F, 0x068AECC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0A740BF, 0x0ACAB2D, 0x37E257F, 0x0BB1C58, 0x2771254, 0x0C0E284, 0x111C3D4, 0x18D0F19,
+            0x086DFEE, 0x19A73C5, 0x165CE17, 0x13E0F13, 0x2183D8B, 0x029789F, 0x312A6BA, 0x028E288,
+            0x2EF4BBE, 0x19B2F04, 0x066C30D, 0x092E246, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x08AD9FA, 0x0632365, 0x320D8EA, 0x00F6FEA, 0x01AACEF, 0x0884A0B, 0x19E8240, 0x06C6892,
+            0x2361442, 0x1EBD53E, 0x0B217C2, 0x1B10352, 0x27E2AB6, 0x1887658, 0x2D67FA4, 0x0B9E891,
+            0x2A90FC1, 0x109C823, 0x1C2E7ED, 0x017EDDC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1DE7E17, 0x050EFA5, 0x1C04D33, 0x095A181, 0x1E8160C, 0x00810A4, 0x0BFD836, 0x0BC820A,
+            0x3775BA3, 0x127F997, 0x200A7BA, 0x0B9EFFB, 0x0CF17C9, 0x1C08CCE, 0x1691608, 0x044C13D,
+            0x0BC2684, 0x044F2CE, 0x28371BE, 0x0D7225F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x27B9910, 0x0BD8B29, 0x0EBB60C, 0x010D95D, 0x0DE6B5C, 0x1793BBA, 0x1FC4BD4, 0x013E962,
+            0x1A85837, 0x0E61CBB, 0x3DF05FB, 0x0A6BEF7, 0x2031BCD, 0x10C53CD, 0x0E276AB, 0x0B711D4,
+            0x23DB555, 0x0AA0797, 0x0D855D1, 0x1997D7D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3EAA379, 0x08DF66D, 0x11CD99B, 0x17C1CB9, 0x022468E, 0x149CCFB, 0x16AC6A2, 0x1049A29,
+            0x1F570BF, 0x039175F, 0x164C6B1, 0x0F4DF95, 0x300801D, 0x06D8034, 0x3796E0F, 0x0F599DD,
+            0x2F50344, 0x0C9BC73, 0x171BBF7, 0x0CA376C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1EDC6C9, 0x0D5A2A9, 0x34BC342, 0x0006C19, 0x33C264B, 0x06D575A, 0x2EDE23A, 0x1467E64,
+            0x1C89B5E, 0x0BCE21F, 0x2338CD1, 0x117AD1F, 0x31D3C34, 0x1A6955D, 0x2711E8C, 0x0030237,
+            0x0D7CEEA, 0x148A605, 0x17139AB, 0x104FDB3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0CBA180, 0x12644FF, 0x3EF40AA, 0x1092717, 0x0374560, 0x19D0002, 0x2105991, 0x11E75C1,
+            0x3ECEB9C, 0x0797E45, 0x086570D, 0x07C5470, 0x16A790E, 0x19E5B8F, 0x0CEC313, 0x15773AE,
+            0x2AB9722, 0x04D556A, 0x134E470, 0x1FF4217, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x23B9B36, 0x1959E64, 0x2B22068, 0x1F93F5B, 0x14659BF, 0x079A396, 0x0603594, 0x0C6AF6A,
+            0x06C0B33, 0x0B14999, 0x3ACF752, 0x17EE4E7, 0x33A0EDC, 0x132F76F, 0x0302478, 0x02A0DB1,
+            0x1D57BF2, 0x1DC2A7F, 0x22F8B1C, 0x10588FD, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x031A95B, 0x1418B73, 0x37DCA60, 0x0BCEAA9, 0x1975766, 0x1068F36, 0x07C5069, 0x139E44F,
+            0x14ED4A6, 0x0B64DEB, 0x2465664, 0x0F55B55, 0x330AB8B, 0x1EA4267, 0x253D5B0, 0x021FC51,
+            0x0878E22, 0x13EBFBE, 0x00E50F5, 0x0FBEDFA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x203A1CD, 0x0BBF8F2, 0x194410C, 0x06B8559, 0x1A0317B, 0x04E28B3, 0x34AA4E3, 0x1A80B00,
+            0x0ECAE7F, 0x1E533DA, 0x20E89CA, 0x19301CD, 0x2A79921, 0x18C1102, 0x1022D86, 0x18AEDEA,
+            0x1AAD04C, 0x0F998BF, 0x3A9E3F4, 0x1E51183, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2EB9AB2, 0x0FA2BBA, 0x33F0730, 0x062C04B, 0x15D1A6B, 0x1632453, 0x3F9212C, 0x0846837,
+            0x21D8A4C, 0x099C994, 0x1BB03A7, 0x0348051, 0x3B42840, 0x08B6120, 0x2EF5AC0, 0x0ECF6D0,
+            0x04E604D, 0x1F1E54B, 0x3FD9FF6, 0x0D2475A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x17DE099, 0x1E64A40, 0x2977F1C, 0x0487929, 0x27E4B3D, 0x01913BA, 0x2EDF3C3, 0x183462A,
+            0x2C30132, 0x130A8C0, 0x2500A6F, 0x1D659F0, 0x24FD091, 0x1059680, 0x3470414, 0x0501CD5,
+            0x1264F48, 0x00E43F0, 0x3D37694, 0x0C3414A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x38A4AFC, 0x0E4855F, 0x0E5CCA7, 0x05295C8, 0x2DCF8D2, 0x0497D85, 0x07D270B, 0x13DE0B7,
+            0x1066D78, 0x0C158A2, 0x3CACF61, 0x1547DB4, 0x2770C09, 0x0EE59BE, 0x1E30229, 0x1633B37,
+            0x37F2C95, 0x1C65AE2, 0x30CFD4D, 0x161A518, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^12 * G */ {
+        {
+            0x39D3855, 0x1B89086, 0x346E162, 0x04B8B0E, 0x0C15F5C, 0x0F167D3, 0x16E361C, 0x01DED7D,
+            0x0038B1E, 0x161B526, 0x06AFE79, 0x08A219D, 0x2208F48, 0x0F51CBF, 0x1B5457E, 0x01D2C7B,
+            0x367C587, 0x0702018, 0x15DDCC9, 0x1E3452A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1E6DFD6, 0x09208C3, 0x0EF26DD, 0x1BE3C59, 0x278AC39, 0x1E93A38, 0x20CDE57, 0x081552C,
+            0x216B8F9, 0x13B2264, 0x109A391, 0x08027F6, 0x06A337D, 0x179FDE4, 0x054EB26, 0x101BF9D,
+            0x3EA70CC, 0x0F9822A, 0x354EE0C, 0x1EFDCB3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x38CAA68, 0x041A103, 0x38C8071, 0x1FA8A6D, 0x32B8DD3, 0x1D85953, 0x19514AC, 0x1FEEE41,
+            0x3A03015, 0x19C2F5C, 0x29220F7, 0x1FE6F29, 0x33E76F2, 0x042633C, 0x30AA1D7, 0x053F079,
+            0x221248E, 0x11521DC, 0x2B205A3, 0x060BE06, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x045FE2F, 0x16DDA1F, 0x1905394, 0x1D348C4, 0x3354935, 0x0D46E68, 0x135141C, 0x0A8EFF3,
+            0x05C0DCC, 0x00A2935, 0x29B6FC8, 0x11AA16E, 0x3F08025, 0x075BDF9, 0x1F77933, 0x0E3BFD3,
+            0x12228AE, 0x0ADE1E1, 0x1978223, 0x0EE563F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1C1A1D2, 0x1DB5486, 0x26305F2, 0x0E5A33C, 0x2677067, 0x1D0180E, 0x2D33C0A, 0x0247645,
+            0x21A1D3B, 0x14E1BB4, 0x0010BFB, 0x1CC1BD6, 0x0961E13, 0x0D430AB, 0x3D565E3, 0x1509EE1,
+            0x1348951, 0x174D095, 0x02879E8, 0x1749CF5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2955998, 0x037D3CB, 0x0763721, 0x1117CC1, 0x2A3D9E7, 0x0B3397F, 0x1B48A49, 0x17D3565,
+            0x189792F, 0x04F6EA8, 0x0676FD6, 0x040167C, 0x2D9EE04, 0x069E772, 0x1470F21, 0x189F2C8,
+            0x17E40BC, 0x1DC9821, 0x1156026, 0x12BBDBA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x052B928, 0x058DE53, 0x30C8730, 0x0F60CAD, 0x2F599C5, 0x140B906, 0x2E6D2D5, 0x1D58762,
+            0x06F4EC8, 0x19EA2AB, 0x10ABBD1, 0x0DBAC00, 0x03A01E8, 0x0B18F94, 0x3C8262E, 0x19A37D8,
+            0x0F04BC8, 0x1BBBE72, 0x1FFFA9A, 0x02970EC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1D63E33, 0x0A0FF8C, 0x127F0C2, 0x040EF9D, 0x351CC21, 0x1869047, 0x10E0706, 0x1C25CFB,
+            0x27788D5, 0x06A3089, 0x3146A18, 0x0D82D99, 0x08F3196, 0x04495C1, 0x27DDB60, 0x1EFAC3A,
+            0x03A8713, 0x175B8AC, 0x0148F08, 0x053EEAE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0355CE0, 0x1A1C1FB, 0x3F694D3, 0x18CCC49, 0x0B3C7CC, 0x0AE8500, 0x0DB8CA7, 0x035712D,
+            0x2FC5325, 0x1ECD59C, 0x31B0F36, 0x05080D4, 0x24D28A1, 0x17A157C, 0x02BD896, 0x1B0B9DD,
+            0x1A7B8BE, 0x01DB81F, 0x174F5B9, 0x0B00BCE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0EFA9A4, 0x0E9B4F0, 0x3F2D9BE, 0x0D3FAC7, 0x10CFC1E, 0x14A6364, 0x29BFDA5, 0x077B11D,
+            0x1165D14, 0x18B90F9, 0x0E86776, 0x1BC19AD, 0x10DE58C, 0x18B2133, 0x06B74AC, 0x01684DE,
+            0x0EF952A, 0x00D2681, 0x33EF608, 0x157FE59, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2591697, 0x1373BE4, 0x2C6396E, 0x0FE06FA, 0x3290F7D, 0x13C7246, 0x126F577, 0x19882A7,
+            0x336DE3E, 0x0EE0BE4, 0x194EEC3, 0x19F04B3, 0x3CF8989, 0x094A856, 0x022B818, 0x14AA27B,
+            0x31AC287, 0x18DA065, 0x076AC35, 0x0A8453C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2B2FD56, 0x1883367, 0x181729F, 0x0A999D5, 0x090B612, 0x1B60AA5, 0x1738780, 0x1FEBABF,
+            0x06D6CB3, 0x1B9A05F, 0x0A5F89E, 0x140D970, 0x131DB28, 0x0043384, 0x15DE022, 0x1E782AC,
+            0x23A46D0, 0x1EFBA77, 0x1169A2C, 0x0006FC0, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x395B16D, 0x0B39477, 0x3CD85EC, 0x11D0A5C, 0x0B28B6D, 0x0B0F843, 0x2E14DAF, 0x14ABE2C,
+            0x2FA8C81, 0x0AEB509, 0x1E44278, 0x04CDC0A, 0x352E941, 0x1BEEE1C, 0x348B697, 0x11ECB93,
+            0x072093F, 0x002CF16, 0x3491AAF, 0x1996C58, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2AF88E6, 0x1BF0743, 0x1A6F153, 0x16C8A6D, 0x08A40A9, 0x0C80BE9, 0x2CD9426, 0x1AECCE6,
+            0x3A2CDC3, 0x0D2C164, 0x3B6B978, 0x0C09926, 0x22B83B4, 0x0C32E2D, 0x13BE579, 0x1FB643C,
+            0x00B77C5, 0x1575BD9, 0x3479691, 0x0F0E8D7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3F9CF0A, 0x05E490D, 0x268F95A, 0x1DB873F, 0x2B33A46, 0x06ADAB2, 0x3191618, 0x07F056C,
+            0x070AEB4, 0x06C86EE, 0x0C0D568, 0x18E6B8B, 0x31CFF80, 0x12398E4, 0x166CB4C, 0x151BD35,
+            0x3D3B95F, 0x1551077, 0x3E0A281, 0x1E9C6B5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3E788F2, 0x1151A75, 0x2399650, 0x06B1037, 0x3277274, 0x1048383, 0x0A03A3B, 0x0B507C8,
+            0x1859664, 0x16D1A2F, 0x28F41E8, 0x1B1A0F6, 0x1BC32BD, 0x04C17E7, 0x19CE5C2, 0x1C2B6AA,
+            0x0FF0BD1, 0x1F907F0, 0x24583E5, 0x07C6543, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^11 * G */ {
+        {
+            0x2E5BC2B, 0x1061081, 0x3C63684, 0x1D2A722, 0x2A7EE3A, 0x1A99541, 0x10FA81A, 0x172A28F,
+            0x14358FA, 0x17B170F, 0x076DE47, 0x1CDF0D5, 0x08106CC, 0x1FE1638, 0x24C7902, 0x006A7D6,
+            0x09CFFB0, 0x026DA47, 0x1861C97, 0x0734E33, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2CBDE20, 0x0582AA8, 0x198D1F6, 0x12767BB, 0x223B756, 0x081FC23, 0x0315555, 0x1E6D684,
+            0x365466F, 0x13FDAC6, 0x3457FBB, 0x0F3DA1D, 0x3C05558, 0x0C8A0BE, 0x0FC1E8D, 0x0DCAD3C,
+            0x094A26C, 0x09C7E1D, 0x3D4B6F0, 0x0F3E79D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1B43379, 0x0F08F79, 0x39A7B68, 0x02F69E1, 0x26F9F43, 0x016E0EC, 0x30DCC7D, 0x1A444ED,
+            0x3C9D996, 0x1E9889F, 0x0D68AC8, 0x1ADDCA7, 0x1235FDC, 0x0039184, 0x358992B, 0x0206FE5,
+            0x1FBF225, 0x13DD9CD, 0x17172CD, 0x1ED9C54, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3EFA9E6, 0x0F1DC07, 0x0FAEEB4, 0x1CF106C, 0x07CDEB5, 0x03BE243, 0x02E0755, 0x091194E,
+            0x3EA66C9, 0x11E1DD1, 0x179FC84, 0x03CD519, 0x12F946C, 0x1379614, 0x240A6C9, 0x1CF1B33,
+            0x0B2E45B, 0x0314D4E, 0x29DDCD1, 0x134DE5D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2032C64, 0x13467E7, 0x21D4DB2, 0x1410C20, 0x1F04CD7, 0x051C8F8, 0x3C6FF0A, 0x0E291E9,
+            0x3C5B6EA, 0x1E46A80, 0x26514CC, 0x08B45AA, 0x22C63F2, 0x0194AA7, 0x3E80E1D, 0x0AD1BE8,
+            0x089B116, 0x1F738A1, 0x072B312, 0x1F1FBA2, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x118A283, 0x1DD5A06, 0x297B57B, 0x06F80EE, 0x282D688, 0x047E02F, 0x31F14CC, 0x00678E8,
+            0x0E120E5, 0x0214F44, 0x0F92ABD, 0x034AE2C, 0x17C0A24, 0x19D8907, 0x3F4B1C2, 0x11C9399,
+            0x2261381, 0x14A98CC, 0x244E6BB, 0x038EA59, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2FE89CC, 0x1E58E88, 0x182AF30, 0x09C9FDE, 0x2667794, 0x0586C56, 0x0F5D22B, 0x1745FC6,
+            0x365AED8, 0x0F4AFDA, 0x1833C54, 0x00FA54A, 0x097AAFC, 0x0084D88, 0x0C769B3, 0x1E366FA,
+            0x2BB7C4C, 0x09A8466, 0x3516C18, 0x07364C2, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2265F63, 0x0129CE2, 0x0F4D974, 0x0B93AC6, 0x1141BCA, 0x1FDD5C3, 0x334B9BD, 0x1189195,
+            0x0F92BF2, 0x003B37D, 0x1A70FBE, 0x07E1D80, 0x2DBC2C4, 0x041B1B1, 0x3F65AEA, 0x02E1894,
+            0x36A721B, 0x0DA22BD, 0x1B6B241, 0x17185F9, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1DB93C0, 0x1FA9716, 0x23768D7, 0x06782DA, 0x21B0571, 0x0A3CC99, 0x2F8C353, 0x04EBD2E,
+            0x00C7550, 0x02D9C25, 0x37AE586, 0x1C26B2C, 0x07801F2, 0x199CBEB, 0x3F7BE0E, 0x0347AB7,
+            0x2C7AB2D, 0x1D3B713, 0x021D093, 0x019FD99, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2989B65, 0x187AF0F, 0x15AE7E4, 0x03C4769, 0x2ABF802, 0x1C9521D, 0x088704F, 0x1963596,
+            0x082BAF7, 0x071B8D6, 0x3C0BBD3, 0x06D1F69, 0x0D7F8A7, 0x00E2381, 0x04EFB5F, 0x19D76DA,
+            0x17D6AEE, 0x141999F, 0x05F0B15, 0x04A4BEC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3A186F7, 0x0222B83, 0x3359806, 0x07181A5, 0x1D3CD3C, 0x0BC004C, 0x189852F, 0x1FF1A35,
+            0x34B75BA, 0x01A870E, 0x32199CB, 0x06579C0, 0x24F057B, 0x0343AB7, 0x24EC167, 0x142B6C7,
+            0x008337D, 0x1F0CC23, 0x3EEF827, 0x0117EA7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3DE7B72, 0x1899F0D, 0x2198D48, 0x1570698, 0x1C35147, 0x1E3A4F7, 0x3C7A8D0, 0x13AEB85,
+            0x26FBC19, 0x189D584, 0x1784CD7, 0x0D13303, 0x1FF39BF, 0x1D154F4, 0x02F36DA, 0x0BB4EF8,
+            0x2A58CE7, 0x1E25D9A, 0x386CED9, 0x080DC44, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2B82D73, 0x024F72F, 0x3292367, 0x1B4EDA9, 0x344FD6E, 0x11BD550, 0x2607874, 0x10FB40B,
+            0x229487F, 0x1AE0DD7, 0x0F76D04, 0x1FC1829, 0x3F947AF, 0x09BFDBE, 0x11306ED, 0x1E30326,
+            0x33CFD03, 0x0C29A2B, 0x0F35D04, 0x01152D8, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2EA3C47, 0x1E931FC, 0x19393CE, 0x069CD05, 0x3D9837A, 0x13A8B4E, 0x085E019, 0x0FFC008,
+            0x23EC549, 0x0D48736, 0x157DF21, 0x0588D5C, 0x1EB3CFF, 0x111A743, 0x01AF8A9, 0x109EE6E,
+            0x0BB9437, 0x09CF138, 0x04B3472, 0x07DF1B0, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x01F361E, 0x124A14D, 0x3A52465, 0x0239361, 0x11D059F, 0x00BB7C5, 0x35D0675, 0x1A591F0,
+            0x2E7E379, 0x072771B, 0x3997D34, 0x1D507FB, 0x21C619F, 0x0C21D72, 0x16E9278, 0x01585BB,
+            0x19EECB0, 0x18BAD0C, 0x08422BA, 0x0840B65, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3B60EB8, 0x1D517C0, 0x05948B6, 0x0B73B8D, 0x112C823, 0x0EC2FCC, 0x360E3B4, 0x0AE60E8,
+            0x19F398F, 0x190A0E2, 0x2E7A78E, 0x0CEE5B5, 0x3850DEA, 0x09EA6AF, 0x1155428, 0x0A6236F,
+            0x38BB262, 0x081C83C, 0x18F3F29, 0x0212C9D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^10 * G */ {
+        {
+            0x194C7A1, 0x090DF20, 0x0E61A39, 0x1FCC4A0, 0x14B04B3, 0x0A96787, 0x1F43612, 0x1BD6676,
+            0x39EF0F0, 0x1EBA805, 0x24A5A67, 0x0BAB5D5, 0x2F080D6, 0x1CF6228, 0x33F9881, 0x04BF6A4,
+            0x1C17C66, 0x02B37C9, 0x06EED75, 0x1B7E461, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1042548, 0x1AF7A6C, 0x3ABC960, 0x19C5AEB, 0x1D5AAD6, 0x175D61A, 0x33A08DC, 0x01F5DC2,
+            0x3D2F62C, 0x11B410F, 0x1C968EC, 0x0CFC8C7, 0x30527FD, 0x0AC041E, 0x3296DA8, 0x03ADE53,
+            0x0BAD071, 0x05FDF9C, 0x3BE08CC, 0x06DCD78, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x274E0AC, 0x0C32E69, 0x39EF963, 0x0838DB3, 0x1D3B444, 0x06C8924, 0x38DF6BE, 0x04EF372,
+            0x190A12A, 0x037E46D, 0x29733FF, 0x1A72601, 0x219F7F7, 0x1F25D33, 0x0CE0F0D, 0x1183B4F,
+            0x2F7C924, 0x012A3C3, 0x30CC3C9, 0x1FE2EE7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x325BCAC, 0x1AA9EAB, 0x39E4318, 0x12CE6B2, 0x0B1138C, 0x000FB1E, 0x1404706, 0x1687049,
+            0x161E4F0, 0x104A82E, 0x13147F2, 0x0E2E702, 0x2067D0A, 0x084267C, 0x03604E2, 0x07BB2A6,
+            0x15ED95A, 0x016F946, 0x0830752, 0x1D6EB62, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3E71623, 0x1EDDABD, 0x2FB0651, 0x08F29FB, 0x270EB0A, 0x020D6F8, 0x049BD95, 0x081B680,
+            0x33BFE78, 0x1A9A854, 0x3CC14A4, 0x0C92025, 0x01C1C2D, 0x01A1AB6, 0x1E28937, 0x07D7A28,
+            0x364520A, 0x1269ADE, 0x1B52B3B, 0x1BD70B6, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1108950, 0x1E9F0CE, 0x095C35C, 0x198FA50, 0x17AF75A, 0x0C1C88C, 0x1C9073D, 0x0E8FE93,
+            0x12E98ED, 0x02FFCA1, 0x0613CF1, 0x103F385, 0x2AB60FC, 0x0697F06, 0x12E3C4B, 0x0787B13,
+            0x1EC444A, 0x1D80C5B, 0x2068BC3, 0x032CFFB, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0CB0BB3, 0x14E3B69, 0x20F787F, 0x0E38055, 0x27335F2, 0x126218F, 0x1C31C59, 0x04FB970,
+            0x33C4D21, 0x0D2739A, 0x12A1BE5, 0x11B730C, 0x1F2CE4E, 0x02EFBF5, 0x3472947, 0x0901FB9,
+            0x06F0AA4, 0x1EEE3E5, 0x2B4B965, 0x075F754, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3AC0E76, 0x1D809AF, 0x112B78D, 0x1FD9120, 0x207AA2B, 0x144ADE9, 0x0B1EB6C, 0x128A675,
+            0x0CFF300, 0x029F7AB, 0x2C5FE85, 0x03BF934, 0x3A7C2F2, 0x0D95323, 0x0316005, 0x16D5987,
+            0x390FBF7, 0x115C549, 0x1F1DDD0, 0x044BA8B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x306955E, 0x0C21BCC, 0x0598DA5, 0x1F25D4A, 0x3593B8C, 0x1AACE26, 0x0BE75D0, 0x02E3B75,
+            0x1DB67B8, 0x1013C52, 0x2CE7912, 0x1CF3A26, 0x007735E, 0x1E422B7, 0x3DD40D4, 0x0048630,
+            0x3E8586A, 0x133086A, 0x1759CF2, 0x05A35CE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1ED4503, 0x15867EF, 0x37277E7, 0x0BD641F, 0x20AFE18, 0x153657C, 0x0E8D449, 0x03093C5,
+            0x0C92AE6, 0x0DEC1B6, 0x0180FE3, 0x00D62FC, 0x15DE9D7, 0x033F77C, 0x16ABDD2, 0x0DAEFCE,
+            0x3144394, 0x1B442EC, 0x28C7F4D, 0x023FF46, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3D57203, 0x003DC80, 0x04D993E, 0x0BA5AEC, 0x1CBD05A, 0x14142C1, 0x0AA7E78, 0x0461515,
+            0x0616C82, 0x0D060E3, 0x2E3479A, 0x0F31912, 0x1090D54, 0x0B7861A, 0x0BFC77D, 0x0093211,
+            0x191E3DB, 0x19AC995, 0x02AF733, 0x0751253, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x308DCC8, 0x0F2898B, 0x3F612FC, 0x1465807, 0x0A7EF22, 0x0CC00B2, 0x0D6A361, 0x10B68FA,
+            0x31A4E68, 0x05FC4D4, 0x184EF0C, 0x0623B42, 0x0741DEC, 0x034B8B7, 0x0571B76, 0x03DE044,
+            0x27091DE, 0x1D950C9, 0x1635BCE, 0x0F825EB, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3CEB470, 0x04EA79D, 0x33AD704, 0x08EA501, 0x083DB65, 0x17E94C1, 0x2FA2920, 0x13B09DA,
+            0x01BEFAE, 0x1813204, 0x12D96E4, 0x0257E26, 0x03D4D41, 0x060585E, 0x18399C2, 0x097D587,
+            0x236E727, 0x1DD0DD0, 0x08988CC, 0x026A144, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x158225F, 0x0071E42, 0x07D28F4, 0x1819372, 0x2624975, 0x04817AD, 0x1C8FB1A, 0x090FE9A,
+            0x2E2BB98, 0x11734B6, 0x3041313, 0x0136011, 0x1D1CC3B, 0x012DE0E, 0x1E16760, 0x10DCE50,
+            0x1B7B335, 0x064223F, 0x1B031C0, 0x121B5C3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x216C22C, 0x098235D, 0x14D62E7, 0x06ABAF5, 0x1FAA13F, 0x1C40895, 0x3E3B1B3, 0x0544627,
+            0x2626A21, 0x0F1A91D, 0x129D9E5, 0x0C61392, 0x20E2E61, 0x0838E68, 0x0C45645, 0x0B8D616,
+            0x1AE67F0, 0x1251B75, 0x317A3BA, 0x0F359B8, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3D9439F, 0x1A9FD93, 0x297C157, 0x03444BB, 0x11D8EE9, 0x04B7949, 0x30A8A53, 0x0CBFAC6,
+            0x31B0729, 0x03607CA, 0x25610C4, 0x116007F, 0x21B6393, 0x1B4EB6B, 0x2BD726A, 0x008409F,
+            0x03378A3, 0x0F04705, 0x1A42F45, 0x19F886C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^9 * G */ {
+        {
+            0x2B46662, 0x105ED4A, 0x265BB90, 0x01974C7, 0x14CA07F, 0x0894549, 0x121CA78, 0x153F847,
+            0x0F3299E, 0x00ACF7D, 0x32D6B46, 0x1E69B78, 0x3776F04, 0x12930E7, 0x11C9802, 0x023DA20,
+            0x28FE330, 0x0EE035A, 0x200E8F3, 0x0BF2584, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x204AB5F, 0x0B765FA, 0x0E9229F, 0x01BAAE5, 0x237F0A4, 0x010FDB3, 0x39BFAF0, 0x0C0B9B5,
+            0x092CC15, 0x1022EC4, 0x228FD48, 0x1F43CB8, 0x264381C, 0x1071BDE, 0x116C8ED, 0x1D27695,
+            0x169DCF0, 0x1EB4B9F, 0x2A4C618, 0x0E17D3E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2601968, 0x11140CA, 0x06DAE91, 0x0F0419F, 0x2BE336F, 0x12A5ED7, 0x0296F5A, 0x17F95B1,
+            0x336BB7B, 0x01266D8, 0x361DB37, 0x06359FB, 0x32E5A12, 0x115EAC2, 0x33D9E42, 0x191E113,
+            0x24BA29C, 0x15F979C, 0x195AB0A, 0x1DA764C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0527B64, 0x19F68F5, 0x2A7B378, 0x12B755D, 0x1D2C4E9, 0x15A7A96, 0x076D66B, 0x0F50AEA,
+            0x2781D87, 0x0A50916, 0x2046455, 0x1DA9BEC, 0x166D43F, 0x1BAECB9, 0x2C83146, 0x05CD033,
+            0x0B73136, 0x099C1BB, 0x31F8824, 0x00B9DBD, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x22EF79C, 0x0CF0678, 0x27E4D43, 0x0C212EE, 0x3115B5E, 0x0A816E3, 0x18E9F40, 0x006FC18,
+            0x0A80364, 0x0A1AA3A, 0x3553C75, 0x19CDB65, 0x3DF1C7B, 0x11DD90D, 0x2BD7116, 0x11E2138,
+            0x03FC11B, 0x0A588AE, 0x32F4769, 0x090F4D7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1BAFD84, 0x182EF0D, 0x3F247F3, 0x082B00A, 0x0004D5A, 0x116B439, 0x27B7832, 0x1881790,
+            0x1B81737, 0x1F5A035, 0x20D8EBA, 0x0F44B63, 0x1C6023E, 0x0AA6530, 0x0A477A7, 0x16537DD,
+            0x0F68847, 0x06CE6B5, 0x31B657E, 0x1D922CB, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0514C62, 0x1F6F27B, 0x3ACBA5E, 0x0412CB3, 0x16D8B4E, 0x0D2A614, 0x29CD96A, 0x135D3CE,
+            0x1BC6E0F, 0x04EC6AE, 0x067ACED, 0x11EC828, 0x3733360, 0x19AD2E7, 0x2613E0F, 0x0A7EAE4,
+            0x21A7E9D, 0x124EF96, 0x3EE32D6, 0x099C831, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x05BF836, 0x177616B, 0x329FFB6, 0x0C40BBC, 0x30F83C0, 0x059CD93, 0x03ECD5C, 0x192052A,
+            0x221BC6A, 0x09EA8D1, 0x12F61F7, 0x039A63F, 0x1B8FA62, 0x01C4B1D, 0x3E81684, 0x00DAE7F,
+            0x2E932C3, 0x11CBB0E, 0x1345845, 0x02C9ABE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x34D421B, 0x1D7DD96, 0x2C33083, 0x014A930, 0x134B109, 0x0590687, 0x3BE1D4A, 0x1700247,
+            0x01FA99C, 0x1E8D7C3, 0x1938EBC, 0x10F880E, 0x0550A4C, 0x1D0D06E, 0x3BBF68E, 0x15C1CCB,
+            0x0418CC1, 0x0D9F647, 0x26B91B1, 0x09A9956, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x02748BE, 0x13ED0C2, 0x009924D, 0x1851546, 0x2FDF485, 0x1B58E56, 0x3A6540E, 0x06A6921,
+            0x04BC553, 0x191E9F0, 0x0091B53, 0x1E46659, 0x30BFA64, 0x1F02DE0, 0x334ABD9, 0x17CE73E,
+            0x1836F48, 0x1C7BB8C, 0x36235F0, 0x0089022, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x101FF5D, 0x07718B4, 0x024FAE3, 0x1AEE073, 0x37B39EB, 0x05BF03C, 0x05F7850, 0x130E174,
+            0x1682AA5, 0x10B8263, 0x0802095, 0x0339B1B, 0x32806F9, 0x1E97DA6, 0x1D21F52, 0x0EE58DD,
+            0x21D38A7, 0x1FC9F47, 0x03C23BD, 0x1F3BA06, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x03E6218, 0x079E117, 0x3222264, 0x0303828, 0x0093F29, 0x081E933, 0x3278B5E, 0x1A51B41,
+            0x172C5A9, 0x154388B, 0x0EA190D, 0x024BA2F, 0x16F0718, 0x0E16ED4, 0x2B91FBE, 0x1A535D5,
+            0x16189A6, 0x0386BD4, 0x14085CF, 0x15509E8, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2E9BEE5, 0x165D38F, 0x26AD934, 0x141860A, 0x3F25717, 0x0C1A9E9, 0x110F6C8, 0x04959AF,
+            0x0773A67, 0x18879E3, 0x36225B3, 0x05BC1DE, 0x268D3ED, 0x12A35BD, 0x10B01F5, 0x0F7E159,
+            0x1F89979, 0x0B63DDB, 0x3E6926C, 0x03E2594, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2638C23, 0x0F269B3, 0x1050BF9, 0x1BDD74A, 0x3120A7E, 0x195B8A3, 0x34AFAE3, 0x1A2CCE3,
+            0x23E363F, 0x1C47454, 0x26D66F1, 0x1239240, 0x1BB48E8, 0x1640682, 0x11227F0, 0x117CC68,
+            0x2B6C77A, 0x0B2C199, 0x282B6B2, 0x0560096, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2FEE479, 0x0D82DBF, 0x2CBC478, 0x0ED3E75, 0x3FD36FE, 0x09AEBA5, 0x296BC89, 0x0B0852F,
+            0x0D38EF6, 0x190AFBC, 0x2EEA9BB, 0x0B0293A, 0x063E826, 0x1BD5E15, 0x08169D2, 0x0892304,
+            0x3C2574C, 0x107577B, 0x0517D35, 0x16AB3F0, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x355CFDB, 0x1F33D7F, 0x201A101, 0x105669E, 0x24B94C8, 0x19D50E0, 0x173F704, 0x07E0284,
+            0x3D61777, 0x13905C5, 0x3DAB2F5, 0x1CBE066, 0x2C015D6, 0x0F63D9F, 0x190E0A1, 0x01DFAF7,
+            0x0480FAB, 0x1D2DAD2, 0x3AD7D7A, 0x14DFCA5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^8 * G */ {
+        {
+            0x00D9B02, 0x0960975, 0x1CD5B99, 0x0DAF819, 0x26D0762, 0x1C1A910, 0x02522AC, 0x1A6FD45,
+            0x26CE386, 0x171C383, 0x3EBF251, 0x195588D, 0x17D4739, 0x1C1A1E5, 0x38BC512, 0x1F7E796,
+            0x0775D37, 0x1251693, 0x32417E6, 0x08C32E3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x112F52B, 0x1A0C9FE, 0x155BAFF, 0x18484FE, 0x2FDC029, 0x12B23FF, 0x03D2D54, 0x1138CEC,
+            0x3BAA3A2, 0x1B334F7, 0x1D92A9E, 0x1BAC3B6, 0x0743699, 0x0516820, 0x15CC81F, 0x1FC28A3,
+            0x062238F, 0x1F1E065, 0x042DAA3, 0x1633620, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0155EE3, 0x1C39A52, 0x0E4C7CC, 0x0238987, 0x1BBE034, 0x162D608, 0x0DA6FD4, 0x0258E97,
+            0x1796F3B, 0x0AF24E1, 0x1B6B529, 0x15F7D29, 0x3424C32, 0x04AB8EC, 0x25879D2, 0x00B9824,
+            0x1AE2D71, 0x1EEFFC5, 0x2201DFF, 0x03ACDC1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x01BD8D0, 0x181FC95, 0x23A3C5D, 0x0916FE0, 0x103CFA2, 0x0491415, 0x26EBC5A, 0x06BA615,
+            0x386C5DE, 0x0964A5E, 0x2720F50, 0x097942D, 0x3F5B65E, 0x07AFA4C, 0x0AB0036, 0x14AEF0C,
+            0x0901833, 0x0395904, 0x0E5AC90, 0x154252D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x172C301, 0x13BC759, 0x1294CC3, 0x0164210, 0x1D1F3C2, 0x0D9F725, 0x0C20D61, 0x09FE2FC,
+            0x2822180, 0x1CC2453, 0x003F096, 0x00EEFF9, 0x0B50380, 0x169881F, 0x0AF8659, 0x0DC2227,
+            0x07871CC, 0x0C81DA0, 0x01DE519, 0x04D0229, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0FFD199, 0x0F0BE06, 0x01B7054, 0x0BC86B2, 0x0048041, 0x019E4E3, 0x1828497, 0x0F91788,
+            0x236C0A9, 0x1659185, 0x0BE0B8B, 0x1FA3F97, 0x178A307, 0x042822C, 0x123C5B6, 0x1F9CD4F,
+            0x0784F9C, 0x0D1E322, 0x177F3BC, 0x1BB1E7D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1BBF586, 0x00633C6, 0x38E043C, 0x1762806, 0x39CD94C, 0x1905A9F, 0x3C81A37, 0x1FEE1D2,
+            0x3B30866, 0x1202A5E, 0x03DB898, 0x10BFED7, 0x26FCBD9, 0x13CCDAA, 0x39D5033, 0x1615143,
+            0x3E7A3D5, 0x1CFCCAB, 0x0C11D88, 0x199498E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x277886E, 0x03C3A77, 0x27E17C4, 0x1E97575, 0x145936B, 0x01C3563, 0x15DD519, 0x03836B7,
+            0x05FB74A, 0x18F751C, 0x0F945F4, 0x0D5CCB3, 0x119D54E, 0x079DB14, 0x1AB9615, 0x1CDA2B3,
+            0x1D0E7B3, 0x0CFACF6, 0x25AEC72, 0x1A87500, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x27110FB, 0x150EE37, 0x2772FEC, 0x05360CB, 0x3AF263C, 0x1D42617, 0x1C52468, 0x08672A3,
+            0x3F979EC, 0x0F9B801, 0x1172118, 0x0BC4F75, 0x0B9D4A8, 0x1BF9825, 0x39497D2, 0x10E6C8D,
+            0x064E6D7, 0x0FBC10E, 0x0265734, 0x0984A98, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0E09866, 0x1569566, 0x37FCDB8, 0x0D120C2, 0x142D410, 0x12C8DC0, 0x1798116, 0x1D4AFEF,
+            0x1C2017A, 0x0BCBB1F, 0x36ADEC7, 0x1EEC37E, 0x3F18234, 0x1880A67, 0x29533CD, 0x0BD8E08,
+            0x3EDF0A0, 0x017661C, 0x281628F, 0x0391280, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1A11541, 0x168F50C, 0x11F5BD5, 0x1868B6E, 0x2972920, 0x0AC1F0A, 0x1CECCA9, 0x1818D29,
+            0x1D5FE1B, 0x0A5F837, 0x1335761, 0x0CD52F5, 0x3E1E6F7, 0x0E95E78, 0x01A7A68, 0x15AE2DA,
+            0x0FD456D, 0x10B19ED, 0x3917E95, 0x1FFFF50, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x15662F9, 0x1A65586, 0x0A1173A, 0x0AB8DF3, 0x3C7FF2C, 0x04A10F3, 0x3EC66D8, 0x1FB0599,
+            0x0D85087, 0x1789A88, 0x1B9EC01, 0x01CAA8F, 0x31693C6, 0x022815A, 0x20EFD50, 0x0BA84DC,
+            0x27CD4E9, 0x04DE9E3, 0x209F5D4, 0x0AF600B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1FDB7B1, 0x06FDEC6, 0x13591C0, 0x19554C4, 0x174FE8A, 0x1BC27FA, 0x217D5E9, 0x1DFC5EB,
+            0x08411C8, 0x02AEB74, 0x0C51309, 0x0581F20, 0x3172591, 0x1295D32, 0x0A50DB9, 0x02C8C9D,
+            0x0C44975, 0x12B09C7, 0x363B006, 0x0E23357, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0BC4BEE, 0x1BBE6C8, 0x094B46E, 0x02554B3, 0x2E04505, 0x1E2CA2A, 0x1468242, 0x08E2934,
+            0x2A613E0, 0x1102D1D, 0x269242B, 0x0600C3B, 0x303CA6E, 0x17C8FCB, 0x1388466, 0x19A60B0,
+            0x1C64192, 0x17136F3, 0x1D17BD5, 0x10130FE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x18EDF4E, 0x0FAC318, 0x07EDF21, 0x0C73B6D, 0x28D862F, 0x0AE5425, 0x25FA195, 0x0172394,
+            0x0A668D1, 0x1285C09, 0x18B22B3, 0x017E274, 0x01833E1, 0x074EA71, 0x2126F31, 0x0CEBB38,
+            0x39871B3, 0x01B3DB7, 0x018D460, 0x05FE924, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3BC0B2A, 0x1716069, 0x0C81403, 0x151A261, 0x3CA63F1, 0x11056A1, 0x1304792, 0x1CB4009,
+            0x26A3CB5, 0x06F8CCF, 0x245E142, 0x078E99B, 0x0B8F4CE, 0x13F94A4, 0x0ABB778, 0x09C7762,
+            0x2595FC9, 0x1288677, 0x0C94A59, 0x0F731A5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^7 * G */ {
+        {
+            0x0E47B7B, 0x0C87FD2, 0x160A786, 0x019F3A7, 0x3C3F362, 0x179C3B9, 0x36ED65C, 0x1006195,
+            0x3D738B2, 0x02CDFC0, 0x25D0986, 0x09BBC0A, 0x3AB6C66, 0x08D7564, 0x23CBFC8, 0x03D5DAC,
+            0x37508B9, 0x0DF0D9B, 0x1DC01A8, 0x16BEEB1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x076BF5A, 0x0E1C5DD, 0x097D27F, 0x14284A5, 0x33076C1, 0x08D2C79, 0x2A7448A, 0x1E8D8B1,
+            0x1994916, 0x0F86776, 0x01B9727, 0x1CA9478, 0x2EE2732, 0x1BAA8C5, 0x045C98D, 0x1A148C1,
+            0x30C6458, 0x0967131, 0x23217F8, 0x111840E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x19BA885, 0x1C2C7BC, 0x184F513, 0x0BC1701, 0x2EB98BB, 0x11082B8, 0x396F894, 0x0A6F5DF,
+            0x33526C7, 0x1F025F9, 0x3F26F21, 0x19FE58C, 0x2880FB4, 0x0CDAE5C, 0x20E4574, 0x186773D,
+            0x23CF4AC, 0x01DD46D, 0x109FBC5, 0x0EF07EC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2F61F86, 0x174879D, 0x091624C, 0x01B8603, 0x30C4ADA, 0x1C4330B, 0x141A2E6, 0x022D09D,
+            0x1C227A9, 0x0DC490F, 0x32F3004, 0x03FCFCB, 0x048FCCF, 0x039843E, 0x0C5E3D8, 0x181787C,
+            0x095B19D, 0x01E1713, 0x372EAEC, 0x04AB4DE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x376C2D3, 0x0BF6701, 0x127A2A5, 0x0711E09, 0x020DB01, 0x0D0A498, 0x25DF1EB, 0x1C8B681,
+            0x10AE933, 0x0BB1F9B, 0x1F74FC8, 0x0E06AAF, 0x2665384, 0x1FD50C4, 0x39B1EA4, 0x0ACC43B,
+            0x3F153E9, 0x1DEB415, 0x2F3A09B, 0x09A3DAF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2C01B9B, 0x0D5CF1F, 0x0FE7046, 0x16C1CDF, 0x1965C2A, 0x02FA0A9, 0x3DA8F23, 0x14C9E85,
+            0x25B3266, 0x1A22EE4, 0x11ECB6C, 0x085EF87, 0x28DF568, 0x1FED9F0, 0x3469A6B, 0x1FE7CC3,
+            0x1FA7B37, 0x007E3D0, 0x2C5CE30, 0x00B0EF3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x31EBBE6, 0x0B2C0FD, 0x23A5BB3, 0x00681E8, 0x33ADD79, 0x0802AAF, 0x210607A, 0x0651239,
+            0x36FCE1E, 0x1A59349, 0x39D27E8, 0x18E0CBA, 0x1579A71, 0x05C752D, 0x05223D6, 0x1BEEEA4,
+            0x1A74C46, 0x134380D, 0x0339C5F, 0x0DC4FFB, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x198148E, 0x1CD0DF9, 0x0EFCD52, 0x191A1DB, 0x09B3465, 0x0733721, 0x348C885, 0x0C4A5ED,
+            0x2D4655E, 0x1F62ABA, 0x06D5705, 0x0E5AC12, 0x11477CC, 0x0E9344C, 0x27C8797, 0x087610E,
+            0x04F3A19, 0x1E6FC67, 0x20AF33F, 0x0BE7B9A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1C593E0, 0x1AB0FC5, 0x01CDE02, 0x0AF10BC, 0x098873F, 0x055DE6C, 0x2A1F609, 0x136164E,
+            0x15CAA96, 0x105B5C4, 0x3D3D4DE, 0x075806D, 0x1405295, 0x095DA6A, 0x2F81033, 0x064EFAB,
+            0x1720A96, 0x08E3884, 0x0BB9F58, 0x1A3C2DC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x396B3FA, 0x0A72014, 0x35E2CB0, 0x1F0A929, 0x00EBCA6, 0x081E864, 0x09874C4, 0x1A9D81C,
+            0x15445D1, 0x09E911C, 0x0635425, 0x05ABAD5, 0x06D30C5, 0x02BFDCD, 0x167E219, 0x0DE8875,
+            0x14A1127, 0x0D57558, 0x084B5C6, 0x02D854B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x36E7D16, 0x0E4B68D, 0x2823CF6, 0x157A753, 0x027B860, 0x021A4C6, 0x1748895, 0x122EF7A,
+            0x2B32182, 0x1931646, 0x000AED3, 0x09AFF66, 0x2178CF6, 0x0C25D87, 0x0596FDA, 0x0B65A9D,
+            0x30817D7, 0x0C559FE, 0x37AC588, 0x1791B56, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1695D61, 0x052D4C6, 0x392FD06, 0x1AE5E56, 0x2C3430D, 0x1C8CF75, 0x140A62D, 0x1EF3C09,
+            0x1DFFED1, 0x1D841F8, 0x1146487, 0x05BF518, 0x36964AB, 0x0983857, 0x38C4FDB, 0x068CCB2,
+            0x088796F, 0x0E05F4A, 0x219AB9C, 0x1504B5D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x13A4836, 0x1286C9B, 0x071FB00, 0x04D4491, 0x235EAEF, 0x1A1E44F, 0x23BAAF5, 0x1CE0E58,
+            0x3E2CD76, 0x192234A, 0x0C9FCB4, 0x0FFAAA5, 0x0ABFDF3, 0x0E21C16, 0x1810E1B, 0x19140DA,
+            0x378DB44, 0x060AEA4, 0x3B5539A, 0x16EECB7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x20F2904, 0x006C9E1, 0x21CC482, 0x059C78E, 0x31F3CF0, 0x155BF3E, 0x1A5C452, 0x0FA8335,
+            0x0ADEE8F, 0x06F97C4, 0x33CF2F8, 0x033A3B2, 0x01A0DB1, 0x02801BD, 0x2295A84, 0x1796DD3,
+            0x2B0DBE7, 0x1F4894C, 0x3DD0ADB, 0x1EE947F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0CC6D96, 0x1DFF678, 0x30BF7C3, 0x006BDA4, 0x3B5C30B, 0x049504E, 0x2433EB4, 0x10C9DF7,
+            0x001699F, 0x0A1AA54, 0x0000201, 0x072BDD9, 0x260D8C2, 0x1A075A1, 0x0699556, 0x03F28F9,
+            0x0F58690, 0x061DB30, 0x0FDF835, 0x0DB4A3E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x150BC20, 0x07D6CF1, 0x3C96E59, 0x0EBAC15, 0x3D35D79, 0x1700B56, 0x319628A, 0x1A9C3BF,
+            0x01B1FA8, 0x0195B71, 0x0FE0140, 0x0C815EB, 0x3975ADF, 0x06D4031, 0x17D404E, 0x0F0B55F,
+            0x246F3FE, 0x190E313, 0x03966FC, 0x01B3063, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^6 * G */ {
+        {
+            0x3F15E9F, 0x08AE441, 0x028F3B7, 0x15BA5BA, 0x0917206, 0x1528E53, 0x086FC87, 0x0433F30,
+            0x0E48E18, 0x0A2079B, 0x0FCC4DE, 0x0FBC770, 0x132693F, 0x0A52773, 0x3401F81, 0x0AD9A6A,
+            0x158C9AB, 0x0B94B29, 0x3D219C8, 0x10ED0A7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x13D7B1B, 0x1506460, 0x00C57B5, 0x1841B3A, 0x1A92ED2, 0x0348154, 0x2F4EFE0, 0x06385C9,
+            0x1D0CB5A, 0x1FFF195, 0x30D4D50, 0x1737E9B, 0x2BC3BE4, 0x1270804, 0x0769EF0, 0x1983363,
+            0x2F035AA, 0x08FB788, 0x3AC5FD8, 0x1B91F07, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2AC0001, 0x179EDF7, 0x2884538, 0x0690E6A, 0x0E49E4C, 0x125D18A, 0x3299C84, 0x1D1B2B8,
+            0x3B34E5F, 0x1AE6DEC, 0x088DB71, 0x128BB6A, 0x0ACE36C, 0x086231B, 0x2C395CC, 0x1B16537,
+            0x0A4380C, 0x11AEE13, 0x23B5395, 0x0BF5575, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x062C627, 0x04C372B, 0x38CEDF1, 0x1BD53D2, 0x21813FF, 0x1E7B235, 0x3F04716, 0x1375E09,
+            0x299FD12, 0x0631630, 0x2E86E6C, 0x0C8B99E, 0x1D397D1, 0x09EAC24, 0x044431D, 0x1FEBA7D,
+            0x2F2E89F, 0x08F2F65, 0x1768E6D, 0x18E1F17, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x01DFB97, 0x148D292, 0x3CB1D30, 0x064E71C, 0x0F99D11, 0x0FC2A89, 0x26E1894, 0x090989D,
+            0x15014AA, 0x06E18E2, 0x3DA3FA9, 0x04AD025, 0x07EF5EE, 0x0328E5F, 0x3048964, 0x17D7136,
+            0x11B8A4D, 0x0FDF528, 0x0ECFB20, 0x0EA2642, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1A48EBA, 0x132EEEB, 0x0C55DD7, 0x0E2E7A0, 0x37D8F33, 0x1919F69, 0x3968B6A, 0x096824B,
+            0x031ADD1, 0x1FFD7E5, 0x04F959C, 0x145B866, 0x29A8C7D, 0x01E8D7B, 0x1B0122A, 0x1D4DEA9,
+            0x020E536, 0x05D7519, 0x2EEE84F, 0x11A84DF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x311B010, 0x032686D, 0x386CD5E, 0x145399B, 0x1A2B522, 0x1ED31A5, 0x0348BDB, 0x0C1FF18,
+            0x1118BA8, 0x00C31AF, 0x1D6DF65, 0x1E5F1A0, 0x3E63D3F, 0x0F2B58F, 0x17D6D1B, 0x0D88033,
+            0x3D914B0, 0x028FB30, 0x0761AFE, 0x12DEA25, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2C1D3F8, 0x19900A9, 0x3B1105F, 0x070EE96, 0x007217D, 0x0DDC064, 0x32974DC, 0x0EFD703,
+            0x266C152, 0x16F32DA, 0x35F0C43, 0x0D368C8, 0x0C775FE, 0x0433C75, 0x2B0C4BA, 0x17797FC,
+            0x2955716, 0x1735B1E, 0x2157A5D, 0x136F0E0, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2200CAB, 0x09AC906, 0x2866C1F, 0x022451B, 0x101FFB3, 0x19F57B5, 0x2060639, 0x0817250,
+            0x3380C2C, 0x0F380FC, 0x3B9A6BA, 0x1FDC617, 0x21D9EEC, 0x16D635F, 0x12D74D6, 0x17B6549,
+            0x1D68792, 0x0AAB738, 0x2A7A710, 0x14545AB, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2D77966, 0x0872D62, 0x3FF07F2, 0x0192A28, 0x1A8F102, 0x136E4AE, 0x164A547, 0x0028C9D,
+            0x11A4AEC, 0x1364DC7, 0x1DC055F, 0x1B7DF78, 0x1B158D5, 0x16B4FCC, 0x19D3B70, 0x0525163,
+            0x201AB68, 0x1B30FE8, 0x0E0F756, 0x0A20AF0, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0B31B75, 0x06F6903, 0x385611B, 0x023E973, 0x1322750, 0x12EA9C0, 0x07EE4FD, 0x12E3E98,
+            0x18ACCDB, 0x1B10611, 0x260D1B1, 0x12B5B55, 0x114EA27, 0x1EBE4D3, 0x1189944, 0x1A84C82,
+            0x03C1BCE, 0x164118A, 0x2E8750E, 0x037F817, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2A5F4B6, 0x085CD11, 0x31891CA, 0x044E7FF, 0x14A2CC5, 0x0B5B137, 0x0B7F567, 0x096F8EE,
+            0x1213095, 0x089BD0D, 0x00956D1, 0x0D1434C, 0x2A6E44F, 0x1A1C3FD, 0x108286D, 0x1F35DEB,
+            0x311FE13, 0x1C8CB08, 0x17AD611, 0x0143A31, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2A27940, 0x1BB21AD, 0x39A76A4, 0x18A1099, 0x2F62098, 0x0E3B4F2, 0x1D9C0BF, 0x1D9D1EA,
+            0x0AF40B5, 0x0B940A5, 0x19C0A17, 0x017E4B6, 0x02211EE, 0x12F3D33, 0x2A5596F, 0x1CFC2BE,
+            0x1CF818E, 0x1231B7F, 0x3631396, 0x00A9757, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1D3BB76, 0x0092CBE, 0x3F243FE, 0x01F79F2, 0x236C0D9, 0x1ECD59F, 0x0DC31AB, 0x04F2019,
+            0x33E522D, 0x09B3DBB, 0x1600EF4, 0x095DFBC, 0x173B7A6, 0x1B93970, 0x1269CC6, 0x09BEA6C,
+            0x30E68F0, 0x1B56881, 0x2E74BAE, 0x1883FBA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1E158B9, 0x18E7C20, 0x28916E8, 0x0F6B519, 0x25C7C22, 0x052D2AE, 0x184461E, 0x17D17E7,
+            0x15F38F4, 0x15F3BF4, 0x353ACD2, 0x0CDD600, 0x0B090C4, 0x1765DB9, 0x2D3F3DC, 0x14BD12E,
+            0x0929888, 0x0718933, 0x122782F, 0x06C5FDE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2301FCF, 0x05C9EC1, 0x055596A, 0x0CFAB36, 0x01DDA8F, 0x007D2A5, 0x09DAFDC, 0x09BE0C7,
+            0x2B267C6, 0x12D4BA0, 0x197C6D7, 0x1E971A5, 0x31977F7, 0x1A7F0E3, 0x111B723, 0x061B95A,
+            0x1E72E3E, 0x1949D5E, 0x0B9B895, 0x07FDA2D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^5 * G */ {
+        {
+            0x085569D, 0x1F3DC4C, 0x23E09AA, 0x0DE0B73, 0x12326E6, 0x06F9626, 0x1AF3F35, 0x1C3F3D8,
+            0x0D947BA, 0x01C98EF, 0x0DD1622, 0x037A1E3, 0x27FBF08, 0x1D6B25A, 0x3331539, 0x18EA9FC,
+            0x24EECDD, 0x176986D, 0x0622832, 0x0319F55, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2D4EA0B, 0x091E07E, 0x21A058B, 0x0D7F1E6, 0x00EB17D, 0x12B233F, 0x2741C87, 0x09E3304,
+            0x051CA79, 0x14C3D00, 0x0F17C48, 0x165CB74, 0x15A1FBF, 0x0095BEC, 0x0BF7C71, 0x0E2BD10,
+            0x187F3A8, 0x1E29329, 0x07D9D7C, 0x141120E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x09A8046, 0x06F5B6C, 0x3554889, 0x04BCE54, 0x063C99E, 0x1AAD1B7, 0x36AD0E3, 0x0761D1E,
+            0x320699A, 0x0364B24, 0x041D1F6, 0x135F28F, 0x2898ABA, 0x1E33C17, 0x3BE3D5E, 0x0A74C82,
+            0x30CFFD0, 0x1E04F04, 0x3046AFE, 0x035B3C7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x151443A, 0x11355F2, 0x2BC93C1, 0x0E8D717, 0x2526942, 0x0CD5791, 0x1E72BDF, 0x02FD877,
+            0x2438038, 0x1DF1597, 0x0BC8ACB, 0x0D5F7D3, 0x28BA782, 0x086FA1D, 0x35402FF, 0x0779B5A,
+            0x39A438E, 0x0F35337, 0x2C3BB8B, 0x06D8D04, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x33266BF, 0x0A9F3BD, 0x3A4BD50, 0x111C77C, 0x2B489A6, 0x12A5499, 0x22823DC, 0x18F6294,
+            0x1CB65E1, 0x020D6D3, 0x377DF80, 0x0E3C31E, 0x16713C4, 0x0FA9B7A, 0x119ECA8, 0x0293099,
+            0x2B638D5, 0x001FE8C, 0x37536E5, 0x1CEF495, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1153BF0, 0x1E2F6B5, 0x12C1A23, 0x1F0A994, 0x3BAC8CC, 0x04A3110, 0x0F7E5DB, 0x02DEB88,
+            0x1F4ED50, 0x1DD751E, 0x23A96DA, 0x10E0A46, 0x250019F, 0x1E32A93, 0x2B01849, 0x0636D3D,
+            0x3B68C93, 0x0856664, 0x171FE5A, 0x0431E4C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0F0488D, 0x1527E75, 0x1AFF63F, 0x1620466, 0x1E03BF4, 0x1DF299B, 0x1E102F2, 0x18E496A,
+            0x176A124, 0x1533FE4, 0x3EA61D4, 0x026F5F7, 0x2D47059, 0x08A024B, 0x3EDFAE1, 0x18EFF3C,
+            0x0E5469F, 0x1D5905E, 0x2C7C8D2, 0x1DA8D65, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x095B89D, 0x1FCF794, 0x2F7967E, 0x0E847EB, 0x24C44D1, 0x11550E2, 0x2CA6115, 0x0F91600,
+            0x1302105, 0x0C24C15, 0x05D2CCA, 0x19F8295, 0x156BA8F, 0x0351A68, 0x11F006B, 0x0F21A3D,
+            0x07C1EAD, 0x100D8BA, 0x169F029, 0x00FC7A6, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1A2DA21, 0x022A93A, 0x0AEF0F6, 0x1EFE68E, 0x0430174, 0x1EA9A3F, 0x3BC564E, 0x153CBA8,
+            0x16E89EC, 0x0492AB5, 0x2EE038C, 0x182F710, 0x2AF09B2, 0x1EF0803, 0x130C815, 0x00F7587,
+            0x340E5A9, 0x0195715, 0x1918592, 0x1D06C2D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2838909, 0x0D931CA, 0x3A61FBB, 0x0184E1E, 0x09EB1AE, 0x195D1A6, 0x11E1709, 0x118CBC5,
+            0x00AB4F3, 0x0EF64FC, 0x04E38D2, 0x10680BD, 0x1670813, 0x141FDCF, 0x1961B75, 0x1CFE16F,
+            0x2AE4A97, 0x05F5A3A, 0x148F6B7, 0x0B3127A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x128AD9B, 0x1236B59, 0x3D107BE, 0x1DD2DFB, 0x0003C07, 0x07A34D2, 0x1D09C29, 0x1B08208,
+            0x228D67E, 0x1852FF3, 0x26A8D01, 0x00F9284, 0x32A4FD1, 0x1462CB0, 0x372D0CD, 0x01D4299,
+            0x3692182, 0x04E49A9, 0x2128BE0, 0x0C506D7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0929813, 0x0BF6B84, 0x29AC12E, 0x1F91CBF, 0x39E7E40, 0x144D059, 0x2395EB3, 0x1EA2370,
+            0x1CB0BA3, 0x0A7B631, 0x3F3C7F2, 0x095DDD9, 0x1F8FA05, 0x0C03E04, 0x2FFAC79, 0x113557F,
+            0x197A9D0, 0x1586D0A, 0x3842713, 0x18A4C83, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x24629F4, 0x1E1F354, 0x15C7842, 0x08E51E3, 0x1079EC2, 0x0DCCFBE, 0x1181EB6, 0x0C94968,
+            0x3A78915, 0x1470A71, 0x2E08437, 0x0BF5732, 0x09BF3B7, 0x01E0461, 0x2C0D8DC, 0x0EA5C8C,
+            0x1B13693, 0x00E7992, 0x0EED951, 0x1D117EB, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3BEFF85, 0x05CC364, 0x31448AA, 0x023DEAF, 0x3734DCF, 0x14E02A8, 0x27D9B16, 0x1138507,
+            0x0B60B7A, 0x025E525, 0x30B5559, 0x16DC890, 0x2AA6BAB, 0x0DC2AE5, 0x0C3FCC8, 0x02A5AD4,
+            0x0075569, 0x03DBDDC, 0x1BFA3DF, 0x1315654, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3ED6664, 0x0293CF9, 0x130C04C, 0x129611B, 0x220BDDE, 0x0EE2569, 0x2F650D9, 0x1E45C8A,
+            0x307D6F0, 0x18A964C, 0x25AC51B, 0x161A5F9, 0x357190F, 0x1BF9323, 0x0B27951, 0x049D36D,
+            0x3BA7FE3, 0x0306E91, 0x0E65952, 0x15C9362, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x248FCB3, 0x0179F58, 0x3CB6D90, 0x027543C, 0x10C180D, 0x0B6244F, 0x38AE213, 0x16F7A0E,
+            0x2D0F3CA, 0x01C5AA2, 0x358D2BB, 0x06F9658, 0x322D8C5, 0x14AADA1, 0x3EE4768, 0x0570F1F,
+            0x2A74E90, 0x1EA3A90, 0x292B1CF, 0x09568CE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^4 * G */ {
+        {
+            0x30BBA58, 0x124A73F, 0x0B8B036, 0x19B4B38, 0x11CB3AE, 0x05820AB, 0x2ADD423, 0x08D5B25,
+            0x1CC1B6B, 0x0ED6CC2, 0x29F7829, 0x1732D69, 0x2E59FC5, 0x1B8C9F8, 0x2372395, 0x0F4380E,
+            0x3D6E520, 0x0F49362, 0x39EB4BD, 0x10331FA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x24365BD, 0x1C2A053, 0x085DBCA, 0x1D83254, 0x2F69BD4, 0x0D030BB, 0x17CD94D, 0x1E492E6,
+            0x0F6FA77, 0x0338F29, 0x035845F, 0x03EEC88, 0x1E46E8D, 0x0368866, 0x1D2EF42, 0x1D3BE20,
+            0x16FC3D2, 0x04D8371, 0x355848A, 0x01FDB05, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3F36BD6, 0x184C743, 0x185B681, 0x0BC6D09, 0x2849135, 0x0747701, 0x2F15858, 0x0D8EC66,
+            0x07E44B5, 0x1803145, 0x0D6E989, 0x17FE81D, 0x3D30BBB, 0x14AEEBE, 0x071AB18, 0x1C568F1,
+            0x377DD80, 0x1B8355E, 0x024C6EF, 0x1D9924E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x07C4FEF, 0x12F9095, 0x1A177C3, 0x19506C0, 0x1453AB1, 0x16B3273, 0x155AD0A, 0x0A44CB8,
+            0x060D217, 0x0485099, 0x11A1027, 0x1B4E0D2, 0x1EFDF0D, 0x0B4515B, 0x062FA61, 0x08074DE,
+            0x20896ED, 0x0123BDD, 0x350EDA2, 0x0997481, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0059398, 0x081664E, 0x159C737, 0x00638C0, 0x1D6F14D, 0x0E58987, 0x0C040B0, 0x11C0C4E,
+            0x33A1349, 0x0645312, 0x1FA1A03, 0x005AC69, 0x11ABD7C, 0x0AF40ED, 0x0AE240C, 0x0E07F87,
+            0x1BDA868, 0x1369AC9, 0x13ADD8C, 0x0FF346C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3F8A003, 0x085D6BC, 0x150F7A1, 0x0AAFF08, 0x3DF478D, 0x136BE37, 0x3C5BD25, 0x0026BBA,
+            0x3041C7E, 0x009AAE8, 0x2C92C02, 0x19A1177, 0x3656F0F, 0x1465C40, 0x26393DF, 0x0968D4D,
+            0x203BF42, 0x188ACE5, 0x3F117F9, 0x1A58C8F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2B45F88, 0x0B78192, 0x31F507F, 0x00E9925, 0x2A048A1, 0x0030BD9, 0x1FCD247, 0x04F420F,
+            0x19BD87C, 0x06E9659, 0x0F9EAEB, 0x0C8D41C, 0x267E20B, 0x177234A, 0x341F669, 0x1194810,
+            0x3674CA9, 0x0974AF4, 0x3A89673, 0x11AF4E8, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x346DDC0, 0x1B07068, 0x08F0777, 0x07F864C, 0x0D8DCE8, 0x18D8111, 0x0BE816B, 0x0B23A65,
+            0x0802D08, 0x112EB4F, 0x013C6C5, 0x1744C58, 0x2CE38DE, 0x1D8C154, 0x147F174, 0x1B9B879,
+            0x185FCE4, 0x1D1C422, 0x2CC6BD7, 0x1D15CBE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2246E3D, 0x063C1B5, 0x2D8D07D, 0x066A92E, 0x35E85D9, 0x06ACEE8, 0x1A5AA4B, 0x1E89907,
+            0x0382D73, 0x051A76E, 0x0C449C4, 0x09400DC, 0x097A75F, 0x0D10727, 0x0F13938, 0x010527D,
+            0x0D9DFFE, 0x158F01E, 0x29BE6EC, 0x1711DFE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x37AD21D, 0x0E2361A, 0x1CAE488, 0x02685C6, 0x121071C, 0x1512F7B, 0x30F8BA6, 0x070E73B,
+            0x3BFB1D7, 0x117B5D7, 0x047E1F9, 0x0B9C7A8, 0x300047F, 0x0F3464F, 0x1795FE2, 0x0AB9B52,
+            0x32F1870, 0x098229E, 0x0B26235, 0x07F4AE5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x38DAA8E, 0x1150637, 0x39CB2D0, 0x0C1E218, 0x1B70762, 0x191C7E5, 0x2AD4AB9, 0x1CA43DA,
+            0x022F67F, 0x155822F, 0x3DAABE5, 0x11921DA, 0x2BD712D, 0x0DF17B0, 0x2958B3C, 0x0473D58,
+            0x0ED681B, 0x0637082, 0x37296EA, 0x01A4DE5, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3402484, 0x091091D, 0x2201CBD, 0x0F82DD4, 0x3D6876E, 0x012FDDF, 0x1A17C22, 0x1F646F8,
+            0x2B5C524, 0x188E665, 0x078ABFE, 0x0DC71DD, 0x0A3C523, 0x128496E, 0x0C89FB5, 0x1166147,
+            0x34FAC02, 0x0FF08B3, 0x21D9FC8, 0x0526AE2, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x12982B9, 0x0E999B1, 0x13B935F, 0x124645D, 0x3BC9A65, 0x17049D3, 0x23F5E8D, 0x0203BB2,
+            0x0636AFA, 0x0400CD6, 0x36E9FA4, 0x16D1596, 0x3CC1C26, 0x0741BD7, 0x2FB61C3, 0x0D1E7BC,
+            0x328AE65, 0x06EFDA8, 0x0B1C316, 0x1DD647D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2EA29DF, 0x0C6E3B7, 0x395B40A, 0x0401CF2, 0x3A55298, 0x16693A8, 0x02FD49E, 0x1F78EB5,
+            0x16B645E, 0x1953AC8, 0x32CD843, 0x090DFC6, 0x011CF45, 0x1AAC467, 0x34891F0, 0x03E77B8,
+            0x3DE8A6C, 0x12C698A, 0x0038F94, 0x016374B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x16AC702, 0x05571E4, 0x3AC65AC, 0x0F9D6AE, 0x2C0C4DE, 0x0776DE0, 0x09E6FDF, 0x01BE53F,
+            0x39CB9CB, 0x1FC008B, 0x0E5FCBD, 0x08D5AAF, 0x257FC0F, 0x1FE5BF1, 0x3305831, 0x034A463,
+            0x3A6DD06, 0x149CD02, 0x117CB00, 0x11F85D1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0ED349F, 0x0143D6A, 0x29BB200, 0x0EC19A9, 0x1A1692D, 0x0CBCCF1, 0x2F21816, 0x1995A34,
+            0x0C6A741, 0x0DB030D, 0x0A76C89, 0x08E3954, 0x0B0DDE6, 0x0806657, 0x3E5E47D, 0x1AE5153,
+            0x3DD6CBC, 0x1FE390A, 0x3401807, 0x1DF85A3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^3 * G */ {
+        {
+            0x3912195, 0x04B46DC, 0x2E1B0D8, 0x0BD0002, 0x1F6A573, 0x087DD8E, 0x006BD81, 0x142ACBC,
+            0x34DA75C, 0x0DDFCE1, 0x24EDA5B, 0x018AEA6, 0x2A7F6C1, 0x06CD848, 0x25228EE, 0x1BADC8F,
+            0x3B99069, 0x0A9606F, 0x16CCEEF, 0x0A2F49A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x150628E, 0x10D535E, 0x312C5BB, 0x1E3D9A1, 0x204B393, 0x177AB38, 0x23A7814, 0x1179563,
+            0x3B7D242, 0x1CA596C, 0x36869BA, 0x0097E1D, 0x2079EBB, 0x1EFEC90, 0x323D014, 0x1228659,
+            0x30DB2CB, 0x0AED6D5, 0x1DFD005, 0x0AB8960, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3791D5F, 0x039DBC1, 0x06A492C, 0x0A2B629, 0x2353DB0, 0x1993091, 0x20FF3B7, 0x0753481,
+            0x39D6919, 0x058D23E, 0x3405EF8, 0x1DEBEA8, 0x179355C, 0x1631109, 0x3DA3D05, 0x1035B50,
+            0x1001988, 0x1A9561D, 0x17847FA, 0x19F4AC3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3F4C9CF, 0x0DABE0E, 0x291ED35, 0x0A0EBB5, 0x25FB2FA, 0x010B633, 0x10A54AB, 0x14BC96A,
+            0x307E420, 0x09E8F85, 0x33FF15A, 0x0DCC9B2, 0x00D556C, 0x1F7193D, 0x1559E25, 0x0E89CCC,
+            0x0A60BDE, 0x0D791D4, 0x3F573AB, 0x0830A38, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0B90E69, 0x04B19F8, 0x10B5815, 0x05CD1C4, 0x21A26BA, 0x0A3225C, 0x346D4DB, 0x1BCB93D,
+            0x0CDB69B, 0x0E78931, 0x39B06AD, 0x13531E8, 0x173CA1A, 0x0A09657, 0x1F7D433, 0x01DB0D9,
+            0x30492BB, 0x1008725, 0x3993863, 0x180A521, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x02CB75B, 0x0694ACE, 0x297DDA8, 0x02D47A8, 0x18F4326, 0x04EAD9D, 0x2CBC070, 0x03B8026,
+            0x2385910, 0x1E7A679, 0x1920C42, 0x145C51E, 0x0915884, 0x1A20063, 0x09A4BF5, 0x0FB8990,
+            0x226938F, 0x03DF9A5, 0x2D46CBB, 0x08E1355, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x132721E, 0x0AE9894, 0x1C408DB, 0x04F3E9F, 0x28B598A, 0x016ABC2, 0x123C553, 0x18519CE,
+            0x2732E8D, 0x0CD90D3, 0x0C1A3F9, 0x1F937F9, 0x05F5F2C, 0x05C565C, 0x2F96F6C, 0x13BB2EC,
+            0x2BEC828, 0x15D97C0, 0x3433773, 0x08634E3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x238609B, 0x1A71F3F, 0x35BAD4A, 0x14FB52A, 0x23674D5, 0x0304105, 0x0E26A5A, 0x0C6AE05,
+            0x16B00BC, 0x0525F0F, 0x3C2827B, 0x0EA9A5E, 0x2E195E0, 0x1473092, 0x1922F2F, 0x122A208,
+            0x318648D, 0x08BCAFC, 0x227F37B, 0x1FE861E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x24B949D, 0x1E7A03D, 0x2B0D5E7, 0x1941649, 0x2D39200, 0x173A668, 0x2BD5795, 0x009847A,
+            0x3000F9F, 0x050E2DD, 0x3C4F2A1, 0x117AFB5, 0x248D44B, 0x1B986CF, 0x0FF2740, 0x1B219D3,
+            0x129543F, 0x19826CF, 0x0C6D31C, 0x1C283BD, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3F7D928, 0x0E0C1DF, 0x3793B57, 0x0A68354, 0x0946743, 0x0BB2BBE, 0x3413519, 0x07638CE,
+            0x13E7104, 0x1665871, 0x17980FE, 0x01E1DCA, 0x2C64520, 0x11CE10A, 0x02C65CD, 0x1801B4A,
+            0x1CEC04F, 0x008ED48, 0x1CD739D, 0x09E5ACE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3B7357D, 0x1164886, 0x3EAF39E, 0x0A12860, 0x0B2784A, 0x0B241CD, 0x0DEE23B, 0x16E9F1E,
+            0x2B29289, 0x1F1CA5E, 0x39DFFFB, 0x01252BF, 0x292FA5D, 0x1384939, 0x0A96EE9, 0x0E4545B,
+            0x2FD6C03, 0x18F6E4C, 0x1E0928E, 0x05DCE74, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x37D131E, 0x0B6F339, 0x122C019, 0x06ED70B, 0x3C4C53A, 0x0137837, 0x178C85B, 0x1F9C10C,
+            0x1C21168, 0x0153468, 0x15831EE, 0x014F5B5, 0x2E32E0B, 0x1AF5A21, 0x165E0E5, 0x1A7D280,
+            0x1C23B52, 0x1781A40, 0x26D1DCC, 0x1E8488D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x22C09FE, 0x15A0181, 0x1DC3506, 0x18CA193, 0x31A8EF6, 0x1EC961A, 0x1319446, 0x0B60BDF,
+            0x3F6280F, 0x1927601, 0x1E5531E, 0x0FE63FC, 0x1526CC5, 0x0BFF647, 0x1CDDBD2, 0x00C54D9,
+            0x104AA92, 0x157F88D, 0x2D628FD, 0x0B66A3F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x18E5735, 0x0C84F3B, 0x0331AAD, 0x1162A56, 0x3B906EF, 0x01B6E2D, 0x0BE0255, 0x09D9E71,
+            0x166EE77, 0x0FB405C, 0x1470AD5, 0x166F7C5, 0x2D80E9F, 0x11A7470, 0x22BBD00, 0x03BD8EA,
+            0x17900BE, 0x04E01B1, 0x3D78E26, 0x16A2013, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2641F59, 0x1BB9006, 0x3F3FB1F, 0x0775A67, 0x003696D, 0x0D2DD75, 0x0EE2C5D, 0x06CDBB3,
+            0x27E907E, 0x0B24FED, 0x010CF74, 0x161F39B, 0x3D2E731, 0x051C74D, 0x0DE17A8, 0x1F2B29C,
+            0x2A9A920, 0x036323C, 0x1B8B78A, 0x0EEF690, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1953FE6, 0x140F532, 0x2CA582C, 0x04E5B57, 0x22D20C2, 0x09652A8, 0x1FCE57A, 0x0BDCC90,
+            0x34EA1B9, 0x054863B, 0x20034C0, 0x1A6150A, 0x1751EF5, 0x1A7E9B8, 0x1D57C0A, 0x1DAD97C,
+            0x36B6DA6, 0x1498025, 0x0D6BA23, 0x1813F35, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^2 * G */ {
+        {
+            0x0F43ACF, 0x10F44B4, 0x360B4A2, 0x1EB842A, 0x28309D0, 0x0D10ECC, 0x3B7F304, 0x1E20EC4,
+            0x0CDE252, 0x0FFA7F5, 0x162F009, 0x08221C7, 0x2363559, 0x158999E, 0x2E391E9, 0x0E2F2CF,
+            0x021E9FA, 0x11C7758, 0x11DB30F, 0x047C3AE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x05139FD, 0x124D91C, 0x2D011CF, 0x10EDF2F, 0x0041E01, 0x0F4D34F, 0x2298C16, 0x0F334BD,
+            0x354EBC9, 0x1EBBE28, 0x2479121, 0x01A6DCB, 0x0DE6963, 0x1FFD7E5, 0x1F93364, 0x143EB5B,
+            0x1AF5A40, 0x0A7DEDC, 0x35BC4FD, 0x148F645, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x31CB4AE, 0x11541D5, 0x0965008, 0x03089DB, 0x088AEAB, 0x0975A99, 0x29DD589, 0x1A1B719,
+            0x225F5AF, 0x11283E6, 0x39A9A61, 0x0FDEC41, 0x05DE2F8, 0x1136A9A, 0x1EA67B8, 0x0EFC716,
+            0x18F2A1D, 0x1CC606B, 0x3588A9B, 0x0B5C37D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x14B1A12, 0x1ADD148, 0x27F38A1, 0x1050682, 0x2BC4BA7, 0x13D7C54, 0x2D67C0F, 0x01FFD40,
+            0x16EA571, 0x028D5B2, 0x3A8ADA7, 0x1361CCB, 0x1CDF4B0, 0x12F095F, 0x0863DAD, 0x1434CA5,
+            0x0176299, 0x0044FA4, 0x1261A1C, 0x0AEA0D0, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1C9CEE2, 0x0483476, 0x09C1ECD, 0x116D535, 0x0E375EF, 0x11C3835, 0x25685CB, 0x0DD44F5,
+            0x2BBB020, 0x134CF52, 0x119BA9C, 0x13992A7, 0x33CB556, 0x04BB7B8, 0x368502C, 0x11A9652,
+            0x37C7662, 0x158C99D, 0x088D557, 0x1F6DD43, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1DE88EC, 0x0CB208F, 0x076C748, 0x1DB891E, 0x3D0A77B, 0x179CE33, 0x3A8D7BE, 0x074EC79,
+            0x02B74B8, 0x0BFD6FF, 0x374C0DA, 0x1297FAF, 0x2B2BC37, 0x0DAA83D, 0x2C04C74, 0x0215D44,
+            0x33F6206, 0x098FAFA, 0x176B371, 0x0E82833, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0FF238F, 0x1F95D55, 0x30C985D, 0x0CAD3B1, 0x223FB86, 0x07D5CA6, 0x03EBBCB, 0x0953641,
+            0x273E91D, 0x1B4170C, 0x35769B0, 0x1D84DC6, 0x2B2C017, 0x0D06E22, 0x35FB99C, 0x0F441C1,
+            0x20A67C1, 0x1BF0FD2, 0x1C3909E, 0x131201F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x018D59D, 0x0BA0B4A, 0x218B0DD, 0x0947A50, 0x350FFFF, 0x1098EE0, 0x25ACB1A, 0x0EFCD53,
+            0x1F3B3DD, 0x049C307, 0x25111BC, 0x1295C4B, 0x3A02246, 0x1F7F9F5, 0x2EA0724, 0x04F61DF,
+            0x16EA69F, 0x01BBC09, 0x3C9E956, 0x1C26A2F, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2090A58, 0x0AA3C1F, 0x3CBDE73, 0x10B1077, 0x388DE46, 0x10F9A1E, 0x3C77A71, 0x09429F4,
+            0x20D751E, 0x06B69C7, 0x17E4846, 0x0C31E37, 0x2625970, 0x12BE88F, 0x379A6DD, 0x1F05082,
+            0x08DF804, 0x03114C6, 0x2B4EF74, 0x1FC9DFD, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x26B704A, 0x1CA853F, 0x1B7721F, 0x15F0387, 0x3CD46A2, 0x1A5F29C, 0x28DABCE, 0x0B7A41E,
+            0x1B1746F, 0x0BC95EB, 0x0DD66E7, 0x1268848, 0x037BB61, 0x1FC28F1, 0x2566DDD, 0x1DFC439,
+            0x2268CF5, 0x17F6564, 0x20967F7, 0x074745B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x051F207, 0x16274B9, 0x2DD93B8, 0x126748A, 0x0CC56E6, 0x07B6D47, 0x0281ED8, 0x04AA3D7,
+            0x22AEF5A, 0x033D8D2, 0x23BB0B3, 0x1FA5DE0, 0x3B2A3EA, 0x1370919, 0x16D435D, 0x169DC7A,
+            0x2047E8B, 0x1B4CA8F, 0x244AFA4, 0x1C97DB7, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0CEB88B, 0x19D224A, 0x1D1DC07, 0x1720B06, 0x1119495, 0x08280B4, 0x2063C74, 0x01D17C2,
+            0x1114474, 0x0867640, 0x12F035F, 0x17A6041, 0x0103F96, 0x1D501CA, 0x2713A40, 0x1032072,
+            0x1749027, 0x134E41B, 0x36AD244, 0x1DE9A29, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x05294A0, 0x0D53016, 0x1606E71, 0x0DF0E66, 0x3E48BFA, 0x049FC03, 0x15A3D5A, 0x083F0AF,
+            0x04467C6, 0x0EE511A, 0x27EBD9E, 0x1365BCF, 0x11E365C, 0x15E74AE, 0x3D97293, 0x1F8E75B,
+            0x0F740AA, 0x1038CB3, 0x201E2DD, 0x17A3740, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x33EE47D, 0x02DDFE4, 0x19D5092, 0x03FD135, 0x3E893C7, 0x1E932C8, 0x1B776AB, 0x1B826E2,
+            0x3705F88, 0x1B1828F, 0x0DCF907, 0x1FDBA7F, 0x2F129B0, 0x18826C7, 0x09543B7, 0x0666516,
+            0x2FA99FF, 0x09477DA, 0x38D166F, 0x1AD46C4, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x173CBF4, 0x0CB8EA9, 0x1865EC3, 0x0A38148, 0x067C58A, 0x149F8C2, 0x27D4EE0, 0x15F2CAF,
+            0x1F4EE37, 0x077562C, 0x2AC4384, 0x109CF7D, 0x11A308C, 0x1B11BCF, 0x190C9FB, 0x175D981,
+            0x238172B, 0x032F6A8, 0x25CBCFA, 0x102E069, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2A296D6, 0x049A335, 0x30A1CE1, 0x18B38DF, 0x25CDF9D, 0x07B15D9, 0x0E592E5, 0x1EBE340,
+            0x2D3435D, 0x16DE5BF, 0x2C4E9E5, 0x09D27C4, 0x2435621, 0x02DBC5F, 0x1CDE56D, 0x1B293C7,
+            0x36F0EFF, 0x10BCFB8, 0x01BF9CC, 0x0DBE369, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^1 * G */ {
+        {
+            0x2D03927, 0x03BB92A, 0x2943A4A, 0x08A7E83, 0x31FCBD0, 0x1553C2F, 0x21F1973, 0x0471763,
+            0x393D356, 0x12272DA, 0x3EA29B5, 0x0195EA5, 0x0EB0BFD, 0x074D205, 0x0A79E9D, 0x1138A95,
+            0x3D142BA, 0x00DA462, 0x03541EB, 0x0AD9A60, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x02ACCFF, 0x1F63102, 0x280CD36, 0x029A9F7, 0x3A8C90E, 0x06FC222, 0x0F85495, 0x147F0BD,
+            0x08FD793, 0x0B1296B, 0x3581372, 0x1559E24, 0x12B58E9, 0x0C66558, 0x195A2CB, 0x0E0D7DF,
+            0x03A8487, 0x0DAB5AB, 0x32E0F0A, 0x028512A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x396BF1E, 0x0AD7536, 0x1E44004, 0x0B24EE7, 0x3AC7CEA, 0x06C3B08, 0x174D424, 0x16AFB27,
+            0x3ECB64A, 0x00A878A, 0x31D9093, 0x1C6CDD7, 0x176DF6B, 0x0DACBA9, 0x1492A51, 0x0883F42,
+            0x22909C4, 0x1EA84F5, 0x257DE6D, 0x0070379, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x026DA50, 0x0293605, 0x2E11F83, 0x06841F3, 0x1720D80, 0x027EA5B, 0x0C3A23D, 0x11311DB,
+            0x0C7A2C5, 0x1ABBDB2, 0x0A9A059, 0x08B1606, 0x39C22DF, 0x060BBAD, 0x1B254D4, 0x0E791D2,
+            0x2F11DEF, 0x036886C, 0x115B67F, 0x02E8BDC, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3C667A1, 0x1387703, 0x28CB56E, 0x00D3B27, 0x337C25E, 0x133E8BE, 0x3CF0678, 0x0690873,
+            0x153EB3C, 0x0B41EB5, 0x29D994B, 0x1214D7D, 0x30B2A7F, 0x0F954B8, 0x0A300B5, 0x02CECE3,
+            0x20AA80F, 0x0AFA061, 0x3EC7E3D, 0x03C57FE, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2C60DA8, 0x18FC3FE, 0x19EE6E7, 0x1D50789, 0x18AA110, 0x14AC46F, 0x0E0E856, 0x0A1B395,
+            0x1E6E637, 0x11E5EC7, 0x03633ED, 0x019A5A2, 0x0D748F3, 0x1997BB7, 0x002D1F7, 0x1287F48,
+            0x03A9023, 0x04425AD, 0x31D4E41, 0x19B8518, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3644B5C, 0x04DD62B, 0x17FC6A3, 0x19CA401, 0x32E16AA, 0x1D0BA58, 0x3F32C8B, 0x1F5CFC8,
+            0x275648A, 0x05700E4, 0x0C48820, 0x15FA05E, 0x14DB04C, 0x1642DC8, 0x0BAFF02, 0x15C7DA5,
+            0x093B404, 0x1D7E69C, 0x3106691, 0x19DD7CF, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0422AFD, 0x19D91C5, 0x38240C9, 0x1041C01, 0x016CCFB, 0x102402A, 0x2E4BA6B, 0x063F289,
+            0x3DD2BF2, 0x12F61EB, 0x2DF069B, 0x12861E6, 0x03FF09D, 0x071036D, 0x33EA573, 0x1E4910A,
+            0x07AAA7C, 0x0D75BAB, 0x2895FA4, 0x1686E35, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1A64946, 0x006A083, 0x236B58C, 0x05A0013, 0x27E6AEF, 0x058FCD9, 0x00895CB, 0x1965C2C,
+            0x004D4E3, 0x04515F9, 0x328D0C1, 0x03D793B, 0x23CF80E, 0x0D35C2F, 0x17B9CCF, 0x16F36EF,
+            0x05536AB, 0x0C6F93E, 0x127521B, 0x123D0EB, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x23ECE54, 0x132EB22, 0x14AB0C4, 0x0EBEFC0, 0x123E7CF, 0x11286C9, 0x2867540, 0x100CD37,
+            0x01A2DE6, 0x1A7938B, 0x2B46188, 0x1ECA4FD, 0x06E346F, 0x1A09C32, 0x154FA3F, 0x1375D47,
+            0x01650A5, 0x00E95EE, 0x3607FB8, 0x1650D3D, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x321704B, 0x1D1E816, 0x35CA6CA, 0x16C0088, 0x078D391, 0x18EDEEB, 0x10B19E2, 0x14592BB,
+            0x1AD4531, 0x0717EDB, 0x1070456, 0x1F5BE28, 0x0CE7F54, 0x0C491A2, 0x3513BD6, 0x07704FC,
+            0x208B92A, 0x0AE5CCA, 0x362CD35, 0x02676F1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3DA62E6, 0x1C209BD, 0x04B4D98, 0x13AEBDA, 0x2086307, 0x1296BD8, 0x308480F, 0x0D9801F,
+            0x3E729D3, 0x1AAFCEF, 0x3957DEC, 0x06ADA48, 0x0199AD1, 0x16DBF88, 0x339E6D8, 0x1E06AAD,
+            0x29D66BC, 0x190700F, 0x10DFED3, 0x07D63A2, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0F7690C, 0x1F62AFE, 0x181176D, 0x09348E9, 0x1264923, 0x1BD879E, 0x3ADA83F, 0x03EF9E7,
+            0x0AE3507, 0x0C420EB, 0x1C08558, 0x18DEA4B, 0x09D1027, 0x0401930, 0x150F86B, 0x1792320,
+            0x2691EC6, 0x1305764, 0x37D037F, 0x17A9DE3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x0E9935E, 0x0488ADA, 0x01DEBF7, 0x0B05D5E, 0x1ECCE90, 0x1909DF2, 0x30CFFD4, 0x187A0A6,
+            0x30800AD, 0x0DAAF28, 0x287E3EB, 0x170A34C, 0x0A3483C, 0x08BAB45, 0x3ED20EC, 0x03F5725,
+            0x2AC1C8C, 0x1320642, 0x2E7A110, 0x02DA558, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x04074B0, 0x1403803, 0x1F845F8, 0x11109BD, 0x0287D5E, 0x15A08EC, 0x262F07E, 0x13EAF29,
+            0x18B4DEE, 0x102D2F7, 0x23ABC50, 0x176E9B4, 0x2472542, 0x1ED5784, 0x17AEB80, 0x129AFDD,
+            0x353C439, 0x18377A1, 0x1122D19, 0x0CC6F49, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2D6029B, 0x017964A, 0x21E63EF, 0x0C84581, 0x046FA5B, 0x0A6A5AF, 0x3A9422C, 0x1787FF3,
+            0x2854D9C, 0x1ACB660, 0x1A6221E, 0x08BE256, 0x11EA303, 0x0995A50, 0x345DFD4, 0x1CBB942,
+            0x1C50FFF, 0x1E1279D, 0x005576E, 0x11E6EE1, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+    /* 32^0 * G */ {
+        {
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x36A2BB3, 0x06C33BD, 0x01129B9, 0x06583D7, 0x1147575, 0x11189BE,
+            0x25634B3, 0x11C359D, 0x1E07F34, 0x047C201, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x183FA9B, 0x1CDCAB7, 0x151142E, 0x03C47D0, 0x30FF450, 0x11DF2B2, 0x2842BD3, 0x14FB1E1,
+            0x3905BA6, 0x05524F1, 0x3C4998A, 0x0F1234A, 0x2C3687B, 0x1B2F1F9, 0x2E5621B, 0x0196FCB,
+            0x20C6C9F, 0x19857E8, 0x1DF1966, 0x04F9069, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x00426DF, 0x1E723F3, 0x06522C3, 0x135BA78, 0x329161F, 0x1ADD3C0, 0x148B0FC, 0x16E9E06,
+            0x24587E6, 0x174F032, 0x34F4563, 0x07D4F21, 0x0876E66, 0x08403D7, 0x01D57B4, 0x0DC313E,
+            0x396BE2D, 0x1B2CCFE, 0x1D53792, 0x09F88D4, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1B8BCCD, 0x14250C8, 0x106D5D8, 0x09CEA9E, 0x1DC2E2E, 0x0F351EB, 0x201E6F2, 0x11FA7D5,
+            0x3F0EFB6, 0x1885D1A, 0x39D68F1, 0x002C83C, 0x258EDD7, 0x11F9CA7, 0x150C1F9, 0x03D57D6,
+            0x22FEC74, 0x120616D, 0x1A8DDFF, 0x011413B, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x3F1ADF8, 0x0A14E28, 0x3F0413D, 0x01E3C08, 0x01A6EE3, 0x1174A3F, 0x3986BDD, 0x04DF145,
+            0x12B15A8, 0x05B602C, 0x3ED6318, 0x1F45FA0, 0x3875187, 0x08D065D, 0x0F929A0, 0x06A42C0,
+            0x2B47A9E, 0x03B9CE5, 0x1F7D897, 0x03FB458, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x037DADC, 0x0014F37, 0x1F9AD74, 0x1182DC4, 0x38CC499, 0x14DD765, 0x2B5C100, 0x1DD4C28,
+            0x399E646, 0x1154D9D, 0x007F6A8, 0x17EE784, 0x20DEB1C, 0x0DD3AD5, 0x1D75AEA, 0x1641468,
+            0x24C35FB, 0x17A994B, 0x0299098, 0x0D2C34C, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x08F3B3F, 0x11071B1, 0x26218A8, 0x1D80EFA, 0x31CFEF3, 0x01889C8, 0x1F8FDBC, 0x161D15D,
+            0x0043D79, 0x1F8CF61, 0x1C34B04, 0x0F8A5B9, 0x3C1EF0D, 0x17703CD, 0x1638ED1, 0x022446A,
+            0x3399735, 0x18EC177, 0x207A52A, 0x007D1F3, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x275F8FE, 0x0D99D02, 0x006E920, 0x041768A, 0x3BC74AF, 0x04E80EC, 0x13F6001, 0x14F8E33,
+            0x2D004C5, 0x0F6A469, 0x20C3505, 0x0C8784F, 0x1EE7910, 0x1E83C63, 0x2D79465, 0x1DD0D31,
+            0x0B48676, 0x11283CA, 0x3E5969C, 0x155F893, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1891AF1, 0x0ED9D2D, 0x14BAB5C, 0x135BA98, 0x380BBDD, 0x05B45E4, 0x1E4AB80, 0x0535785,
+            0x0316809, 0x17A2626, 0x2C635B7, 0x1855F47, 0x2A92CDD, 0x1755FC8, 0x3807890, 0x03ECA17,
+            0x08E0C5A, 0x0B8514C, 0x35EB46C, 0x128A321, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x02209AB, 0x1C85F91, 0x0E80418, 0x18FC7F7, 0x09C0119, 0x1CE6166, 0x3C64678, 0x06BE2D4,
+            0x277745E, 0x19CEEC0, 0x2F11808, 0x08E8F8E, 0x2C33574, 0x00C3D24, 0x0D3E847, 0x0560D95,
+            0x18BCE95, 0x17C99C1, 0x20CAA18, 0x103FF18, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x17B48D7, 0x12A6773, 0x30A7A7B, 0x03BAFF4, 0x3AC370D, 0x189E4F9, 0x2D0377B, 0x1FF5F84,
+            0x222364E, 0x095F031, 0x3417818, 0x1DCD7FC, 0x3B1746C, 0x00D7468, 0x270205F, 0x0A2585E,
+            0x383B23D, 0x0A24981, 0x20A8B36, 0x1E48ACA, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2189E0C, 0x0182BFE, 0x16CF821, 0x04861D7, 0x3EE0D09, 0x132A27A, 0x265C44C, 0x1DDF3FE,
+            0x08EBC06, 0x1139BBF, 0x0E27EB9, 0x15915AF, 0x37B36E1, 0x063D2D4, 0x0F2DE35, 0x1173DC3,
+            0x1D37F73, 0x0CBECED, 0x3D7294F, 0x07BF503, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x01512FC, 0x0BFCE2F, 0x3B9AFED, 0x1452280, 0x3558A05, 0x13BB75B, 0x1A1A0ED, 0x032E068,
+            0x3D6624F, 0x16E9D22, 0x391105B, 0x11080F8, 0x28445C0, 0x007DE6E, 0x151BFA6, 0x0955DF1,
+            0x2EB1E9D, 0x19D5EAF, 0x01646A5, 0x122018E, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x1E9995C, 0x06D16E3, 0x1272F7F, 0x152967C, 0x3DCCEFE, 0x0E0FFA2, 0x136470D, 0x0F92080,
+            0x2C52355, 0x1303724, 0x2A94DA6, 0x0F6CF0A, 0x0C29596, 0x06A2910, 0x3B53B6B, 0x130EE94,
+            0x1B6C308, 0x1ED06D4, 0x0981F2F, 0x1542261, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x2E3E052, 0x0359F4D, 0x0D9E4CB, 0x1F95498, 0x2F7EF08, 0x119CB53, 0x0303B7F, 0x086D01D,
+            0x0F335C4, 0x1BAA33C, 0x3413001, 0x0C20B69, 0x20D5FD1, 0x19362B4, 0x3DE934F, 0x1EF7241,
+            0x3D726EC, 0x193B81A, 0x27BDA9B, 0x1FEA903, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        },
+        {
+            0x13C3988, 0x1BBB179, 0x02B4CA2, 0x1C9D471, 0x20E9BA7, 0x13CC73E, 0x0A49538, 0x16E3243,
+            0x27B417E, 0x0D31354, 0x3E5665C, 0x0C009CB, 0x1499E4E, 0x1EF654E, 0x2AC7122, 0x049096D,
+            0x19C4F02, 0x1E28FC1, 0x24AC942, 0x00202A4, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+            0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+        }
+    },
+};
+
+__attribute__((aligned(32)))
+const ge_opt base_table_top = {
+    0x27846F6, 0x12F029C, 0x24BF6EF, 0x161C4DF, 0x0FB8843, 0x0730D14, 0x10C3E31, 0x1C70A82,
+    0x09FC8E2, 0x17BCE63, 0x15F80E6, 0x13FE9B4, 0x36E6D72, 0x0F6925F, 0x004F29B, 0x182428E,
+    0x326F22E, 0x023105C, 0x173F2A6, 0x18ADA6A, 0x0000001, 0x0000000, 0x0000000, 0x0000000,
+    0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000, 0x0000000,
+};
@@ -0,0 +1,23 @@
+#ifndef CURVE13318_BASE_TABLE_H_
+#define CURVE13318_BASE_TABLE_H_
+
+#define base_table crypto_scalarmult_curve13318_avx2_base_table
+#define base_table_top crypto_scalarmult_curve13318_avx2_base_table_top
+
+#include "ge.h"
+
+/*
+Fixed-base comb table for the base point G
+
+`base_table[i][j]` contains the affine point (j + 1) * 32^(50 - i) * G, such
+that every signed 5-bit window of the scalar selects its own table row. This
+removes all doublings from the fixed-base scalar multiplication.
+*/
+extern const ge_opt base_table[51][16];
+
+/*
+The point 32^51 * G, which is added for the zeroth window
+*/
+extern const ge_opt base_table_top;
+
+#endif // CURVE13318_BASE_TABLE_H_
@@ -0,0 +1,149 @@
+; Benchmarks for the point operations and a single ladder step
+;
+; Every benchmark operates on the zeroed points in `bench_q` and `bench_table`.
+; Because all the code is constant-time, the values of these points do not
+; influence the measurements.
+
+%include "bench.asm"
+%include "../ge_add.mac.asm"
+%include "../ge_double.mac.asm"
+%include "../select.mac.asm"
+
+section .rodata
+
+_bench1_name: db `ge_add\0`
+_bench2_name: db `ge_double\0`
+_bench3_name: db `select\0`
+_bench4_name: db `ladderstep\0`
+
+align 8, db 0
+_bench_fns_arr: dq bench_ge_add, bench_ge_double, bench_select, bench_ladderstep
+_bench_names_arr: dq _bench1_name, _bench2_name, _bench3_name, _bench4_name
+_bench_fns: dq _bench_fns_arr
+_bench_names: dq _bench_names_arr
+_bench_fns_n: dd 4
+
+section .bss
+align 32
+bench_q: resb 128
+bench_table: resb 16*128
+scratch_space: resb 7*10*32
+
+section .text
+
+bench_ge_add:
+    bench_prologue
+    lea rdi, [rel bench_q]
+    lea rsi, [rel bench_table]
+    lea r14, [rel scratch_space]
+    ge_add rdi, rsi, rdi, r14
+    bench_epilogue
+    ret
+
+section .rodata
+ge_add_consts
+fe10x4_mul_consts
+fe10x4_carry_consts
+
+section .text
+
+bench_ge_double:
+    bench_prologue
+    lea rdi, [rel bench_q]
+    lea r14, [rel scratch_space]
+    ge_double rdi, rdi, r14
+    bench_epilogue
+    ret
+
+section .rodata
+ge_double_consts
+fe10x4_square_consts
+fe10x4_carry_consts
+
+section .text
+
+bench_select:
+    bench_prologue
+    lea rdi, [rel bench_q]
+    lea rdx, [rel bench_table]
+    mov r8, 5
+    select r8, rdx
+    vmovdqa yword [rdi + 0*32], ymm0
+    vmovdqa yword [rdi + 1*32], ymm1
+    vmovdqa yword [rdi + 2*32], ymm2
+    vmovdqa yword [rdi + 3*32], ymm3
+    bench_epilogue
+    ret
+
+section .rodata
+select_consts
+
+section .text
+
+bench_ladderstep:
+    ; One iteration of the loop in `crypto_scalarmult_curve13318_avx2_ladder`
+    %xdefine tmp        r14 + 6*10*32
+
+    bench_prologue
+    lea rdi, [rel bench_q]
+    lea rdx, [rel bench_table]
+    lea r14, [rel scratch_space]
+
+    mov rbx, 5
+.double:
+    ge_double rdi, rdi, r14
+    sub rbx, 1
+    jnz .double
+
+    ; compute_idx for the window 0b10110 (negative)
+    mov r10, 0x16
+    mov rax, r10
+    shr r10, 4
+    and r10, 1
+    lea r11, [r10 - 1]
+    neg r10
+    lea r9, [rax - 1]
+    and r9, r11
+    not rax
+    and rax, r10
+    mov r8, rax
+    or r8, r9
+    and r8, 0x1F
+
+    select r8, rdx
+
+    vmovdqa yword [tmp + 0*32], ymm0
+    vmovq xmm15, r10
+    vpbroadcastq ymm15, xmm15
+    vpcmpeqd ymm14, ymm14, ymm14
+    vpxor ymm14, ymm14, ymm15
+    vmovdqa ymm13, yword [rel .const_4P_at_Y + 0*32]
+    vpsubd ymm13, ymm13, ymm1
+    vpand ymm13, ymm13, ymm15
+    vpand ymm12, ymm1, ymm14
+    vpor ymm13, ymm13, ymm12
+    vpblendd ymm1, ymm1, ymm13, 0b11111100
+    vmovdqa yword [tmp + 1*32], ymm1
+    vmovdqa ymm13, yword [rel .const_4P_at_Y + 1*32]
+    vpsubd ymm13, ymm13, ymm2
+    vpand ymm13, ymm13, ymm15
+    vpand ymm12, ymm2, ymm14
+    vpor ymm13, ymm13, ymm12
+    vpblendd ymm2, ymm2, ymm13, 0b00001111
+    vmovdqa yword [tmp + 2*32], ymm2
+    vmovdqa yword [tmp + 3*32], ymm3
+
+    ge_add rdi, tmp, rdi, r14
+    bench_epilogue
+    ret
+
+section .rodata
+ge_add_consts
+fe10x4_mul_consts
+fe10x4_carry_consts
+select_consts
+
+align 32, db 0
+.const_4P_at_Y:
+dd 0x0000000, 0x0000000, 0xFFFFFB4, 0x7FFFFFC, 0xFFFFFFC, 0x7FFFFFC, 0xFFFFFFC, 0x7FFFFFC
+dd 0xFFFFFFC, 0x7FFFFFC, 0xFFFFFFC, 0x7FFFFFC, 0x0000000, 0x0000000, 0x0000000, 0x0000000
@@ -1,13 +1,23 @@
+#define _GNU_SOURCE
 #include <assert.h>
+#include <cpuid.h>
+#include <linux/perf_event.h>
 #include <stdint.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
+#include <sys/ioctl.h>
+#include <sys/syscall.h>
+#include <unistd.h>
 
 #if !defined(ITERATIONS)
 # define ITERATIONS 1000000
 #endif
 
+#if !defined(COUNTER_ITERATIONS)
+# define COUNTER_ITERATIONS 100000
+#endif
+
 // Noop function for calculating base measurement
 uint64_t _bench_blank(void);
 
@@ -20,6 +30,33 @@ char** _bench_names;
 // Amount of benchmarks
 unsigned int _bench_fns_n;
 
+// Hardware performance counters that are collected around every benchmark
+typedef struct {
+    const char *name;
+    uint32_t type;
+    uint64_t config;
+    int intel_only;
+} counter_spec;
+
+static const counter_spec counter_specs[] = {
+    // CPU_CLK_UNHALTED.THREAD_P
+    {"unhalted", PERF_TYPE_HARDWARE, PERF_COUNT_HW_CPU_CYCLES, 0},
+    // UOPS_RETIRED.ALL
+    {"uops", PERF_TYPE_RAW, 0x01C2, 1},
+    // UOPS_EXECUTED_PORT.PORT_0 and UOPS_EXECUTED_PORT.PORT_5 (Haswell and
+    // later), these are the ports of the vector multiplier and the shuffle unit
+    {"p0", PERF_TYPE_RAW, 0x01A1, 1},
+    {"p5", PERF_TYPE_RAW, 0x20A1, 1},
+    {"l1d-miss", PERF_TYPE_HW_CACHE, PERF_COUNT_HW_CACHE_L1D |
+                                     (PERF_COUNT_HW_CACHE_OP_READ << 8) |
+                                     (PERF_COUNT_HW_CACHE_RESULT_MISS << 16), 0},
+};
+
+#define COUNTERS (sizeof(counter_specs) / sizeof(counter_specs[0]))
+
+// File descriptors of the counters, -1 if a counter is not available
+static int counter_fds[COUNTERS];
+
 
 int compare_uint64_ts(const void *ptrx, const void *ptry) {
     const uint64_t x = *(const uint64_t*)ptrx;
@@ -42,6 +79,63 @@ uint64_t measure_fn( uint64_t(*fn)(void) ) {
     return median;
 }
 
+static int is_intel(void) {
+    unsigned int eax, ebx, ecx, edx;
+    if (!__get_cpuid(0, &eax, &ebx, &ecx, &edx)) return 0;
+    // "GenuineIntel"
+    return ebx == 0x756E6547 && edx == 0x49656E69 && ecx == 0x6C65746E;
+}
+
+// Open all the counters that this CPU supports, returns the amount of
+// counters that could be opened
+static unsigned int open_counters(void) {
+    const int intel = is_intel();
+    unsigned int opened = 0;
+
+    for (size_t i = 0; i < COUNTERS; i++) {
+        struct perf_event_attr attr;
+
+        counter_fds[i] = -1;
+        if (counter_specs[i].intel_only && !intel) continue;
+
+        memset(&attr, 0, sizeof(attr));
+        attr.size = sizeof(attr);
+        attr.type = counter_specs[i].type;
+        attr.config = counter_specs[i].config;
+        attr.disabled = 1;
+        attr.exclude_kernel = 1;
+        attr.exclude_hv = 1;
+        attr.read_format = PERF_FORMAT_TOTAL_TIME_ENABLED | PERF_FORMAT_TOTAL_TIME_RUNNING;
+        counter_fds[i] = syscall(SYS_perf_event_open, &attr, 0, -1, -1, 0);
+        if (counter_fds[i] >= 0) opened++;
+    }
+    return opened;
+}
+
+// Run `fn` for COUNTER_ITERATIONS times, and store the average count of every
+// counter in `values`
+static void measure_counters(uint64_t(*fn)(void), double values[COUNTERS]) {
+    for (size_t i = 0; i < COUNTERS; i++) {
+        if (counter_fds[i] < 0) continue;
+        ioctl(counter_fds[i], PERF_EVENT_IOC_RESET, 0);
+        ioctl(counter_fds[i], PERF_EVENT_IOC_ENABLE, 0);
+    }
+    for (size_t i = 0; i < COUNTER_ITERATIONS; i++) {
+        fn();
+    }
+    for (size_t i = 0; i < COUNTERS; i++) {
+        // {value, time_enabled, time_running}
+        uint64_t buf[3];
+
+        values[i] = 0;
+        if (counter_fds[i] < 0) continue;
+        ioctl(counter_fds[i], PERF_EVENT_IOC_DISABLE, 0);
+        if (read(counter_fds[i], buf, sizeof(buf)) != sizeof(buf) || buf[2] == 0) continue;
+        // Scale the count if the counter was multiplexed with other events
+        values[i] = (double)buf[0] * ((double)buf[1] / (double)buf[2]) / COUNTER_ITERATIONS;
+    }
+}
+
 static int get_max_strlen(char **strs, const unsigned int n) {
     int max_length = 0;
     for (size_t i = 0; i < n; i++) {
@@ -52,8 +146,16 @@ static int get_max_strlen(char **strs, const unsigned int n) {
 }
 
 int main(void) {
+    double blank_counts[COUNTERS], counts[COUNTERS];
     const uint64_t blank = measure_fn(_bench_blank);
     const int max_name_length = get_max_strlen(_bench_names, _bench_fns_n);
+    const unsigned int counters = open_counters();
+
+    if (counters == 0) {
+        printf("hardware performance counters are not available "
+               "(see /proc/sys/kernel/perf_event_paranoid)\n");
+    }
+    measure_counters(_bench_blank, blank_counts);
 
     // Measure benchmark
     printf("running %d benchmarks\n\n", _bench_fns_n);
@@ -64,8 +166,20 @@ int main(void) {
         printf("%s", _bench_names[i]);
         for (size_t j = 0; j < max_name_length - strlen(name); j++) printf(" ");
         printf(" ... bench: ");
-        printf("% 10ld cycles/op\n", measure_fn(fn) - blank);
+        printf("% 10ld cycles/op", measure_fn(fn) - blank);
+        if (counters != 0) {
+            measure_counters(fn, counts);
+            printf(" |");
+            for (size_t j = 0; j < COUNTERS; j++) {
+                if (counter_fds[j] < 0) continue;
+                printf(" %s %8.1f", counter_specs[j].name, counts[j] - blank_counts[j]);
+            }
+        }
+        printf("\n");
     }
     printf("\n");
+    for (size_t i = 0; i < COUNTERS; i++) {
+        if (counter_fds[i] >= 0) close(counter_fds[i]);
+    }
     return 0;
 }
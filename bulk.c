@@ -0,0 +1,237 @@
+// Multiply a stream of (scalar, point) records on a pool of worker threads
+//
+// Usage: bulk [--threads N] [--batch N] [INPUT [OUTPUT]]
+//
+// Every input record is a 32-byte scalar followed by a 64-byte point. For every
+// input record we write a 64-byte output point followed by a status byte, which
+// is 0 if the input point was valid and 1 if it was not (the output point is
+// then all zeros). INPUT and OUTPUT default to stdin and stdout, "-" selects
+// them explicitly. An input that is a regular file is memory mapped instead of
+// read. Only one batch of records is buffered at a time, so the memory use does
+// not depend on the size of the input. The throughput is reported on stderr.
+//
+//   --threads     Amount of threads, including the main thread (default: one
+//                 per online CPU)
+//   --batch       Amount of records per batch (default 4096)
+
+#define _DEFAULT_SOURCE
+
+#include "scalarmult.h"
+#include <errno.h>
+#include <fcntl.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <time.h>
+#include <unistd.h>
+
+#define IN_RECORD_BYTES 96
+#define OUT_RECORD_BYTES 65
+#define DEFAULT_BATCH 4096
+
+#define STATUS_OK 0
+#define STATUS_INVALID_POINT 1
+
+typedef struct {
+    int fd;
+    uint8_t *map;       // NULL if the input is not memory mapped
+    size_t size;        // Size of the mapping
+    size_t offset;      // Amount of bytes of the mapping that were consumed
+    size_t released;    // Amount of bytes of the mapping that were given back
+    long page_size;
+} input;
+
+static int input_open(input *in, const char *path)
+{
+    struct stat st;
+    off_t pos, start;
+
+    memset(in, 0, sizeof(*in));
+    in->fd = path == NULL ? STDIN_FILENO : open(path, O_RDONLY);
+    if (in->fd < 0) return -1;
+    in->page_size = sysconf(_SC_PAGESIZE);
+
+    // A redirected stdin may already have been read from, so the input starts
+    // at the current position. The mapping has to start at a page boundary.
+    pos = lseek(in->fd, 0, SEEK_CUR);
+    if (pos >= 0 && fstat(in->fd, &st) == 0 && S_ISREG(st.st_mode) && st.st_size > pos) {
+        start = pos - pos % in->page_size;
+        void *map = mmap(NULL, (size_t)(st.st_size - start), PROT_READ, MAP_PRIVATE, in->fd, start);
+        if (map != MAP_FAILED) {
+            madvise(map, (size_t)(st.st_size - start), MADV_SEQUENTIAL);
+            in->map = map;
+            in->size = (size_t)(st.st_size - start);
+            in->offset = (size_t)(pos - start);
+        }
+    }
+    return 0;
+}
+
+static void input_close(input *in)
+{
+    if (in->map != NULL) munmap(in->map, in->size);
+    if (in->fd != STDIN_FILENO) close(in->fd);
+}
+
+/*
+Return a pointer to the next `*len` bytes of the input, where `*len` is at most
+`max` and only less than `max` at the end of the input. `buf` (`max` bytes) is
+used if the input is not memory mapped. Returns NULL on a read error.
+*/
+static const uint8_t *input_next(input *in, uint8_t *buf, size_t max, size_t *len)
+{
+    if (in->map != NULL) {
+        // Give the pages of the previous batch back, so that the resident set
+        // stays bounded for inputs that are larger than the memory
+        size_t release = in->offset - in->offset % (size_t)in->page_size;
+        if (release > in->released) {
+            madvise(&in->map[in->released], release - in->released, MADV_DONTNEED);
+            in->released = release;
+        }
+        *len = in->size - in->offset < max ? in->size - in->offset : max;
+        in->offset += *len;
+        return &in->map[in->offset - *len];
+    }
+
+    *len = 0;
+    while (*len < max) {
+        ssize_t ret = read(in->fd, &buf[*len], max - *len);
+        if (ret < 0 && errno == EINTR) continue;
+        if (ret < 0) return NULL;
+        if (ret == 0) break;
+        *len += (size_t)ret;
+    }
+    return buf;
+}
+
+static int write_all(int fd, const uint8_t *buf, size_t len)
+{
+    while (len > 0) {
+        ssize_t ret = write(fd, buf, len);
+        if (ret < 0 && errno == EINTR) continue;
+        if (ret < 0) return -1;
+        buf += ret;
+        len -= (size_t)ret;
+    }
+    return 0;
+}
+
+static double now(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+
+int main(int argc, char *argv[])
+{
+    const char *paths[2] = {NULL, NULL};
+    unsigned int npaths = 0, threads = 0;
+    size_t batch = DEFAULT_BATCH, records = 0, invalid = 0;
+    uint8_t *buf, *keys, *points, *products, *bitmap, *out;
+    scalarmult_pool *pool;
+    input in;
+    int out_fd, ret = 1;
+    double start, elapsed;
+
+    for (int i = 1; i < argc; i++) {
+        if (i + 1 < argc && strcmp(argv[i], "--threads") == 0) {
+            threads = (unsigned int)strtoul(argv[++i], NULL, 10);
+        } else if (i + 1 < argc && strcmp(argv[i], "--batch") == 0) {
+            batch = strtoul(argv[++i], NULL, 10);
+        } else if ((argv[i][0] != '-' || strcmp(argv[i], "-") == 0) && npaths < 2) {
+            paths[npaths++] = strcmp(argv[i], "-") == 0 ? NULL : argv[i];
+        } else {
+            batch = 0;
+            break;
+        }
+    }
+    if (batch == 0) {
+        fprintf(stderr, "usage: %s [--threads N] [--batch N] [INPUT [OUTPUT]]\n", argv[0]);
+        return 2;
+    }
+    const char *in_path = paths[0], *out_path = paths[1];
+
+    if (input_open(&in, in_path) != 0) {
+        perror(in_path);
+        return 1;
+    }
+    out_fd = out_path == NULL ? STDOUT_FILENO : open(out_path, O_WRONLY | O_CREAT | O_TRUNC, 0644);
+    if (out_fd < 0) {
+        perror(out_path);
+        input_close(&in);
+        return 1;
+    }
+
+    pool = crypto_scalarmult_pool_new(threads);
+    buf = in.map == NULL ? malloc(batch * IN_RECORD_BYTES) : NULL;
+    keys = malloc(batch * 32);
+    points = malloc(batch * 64);
+    products = malloc(batch * 64);
+    bitmap = malloc((batch + 7) / 8);
+    out = malloc(batch * OUT_RECORD_BYTES);
+    if (pool == NULL || (in.map == NULL && buf == NULL) || keys == NULL || points == NULL
+            || products == NULL || bitmap == NULL || out == NULL) {
+        fprintf(stderr, "%s: out of memory\n", argv[0]);
+        goto cleanup;
+    }
+
+    start = now();
+    for (;;) {
+        size_t len, n;
+        const uint8_t *records_in = input_next(&in, buf, batch * IN_RECORD_BYTES, &len);
+
+        if (records_in == NULL) {
+            perror(in_path);
+            goto cleanup;
+        }
+        n = len / IN_RECORD_BYTES;
+        if (len == 0) break;
+
+        for (size_t i = 0; i < n; i++) {
+            memcpy(&keys[32*i], &records_in[IN_RECORD_BYTES*i], 32);
+            memcpy(&points[64*i], &records_in[IN_RECORD_BYTES*i + 32], 64);
+        }
+        if (crypto_scalarmult_pool_batch(pool, products, keys, points, n) == 0) {
+            memset(bitmap, 0xFF, (n + 7) / 8);
+        } else {
+            // Only look up which points were invalid if there are any
+            crypto_scalarmult_validate_batch(bitmap, points, n);
+        }
+        for (size_t i = 0; i < n; i++) {
+            const int valid = (bitmap[i / 8] >> (i % 8)) & 1;
+            memcpy(&out[OUT_RECORD_BYTES*i], &products[64*i], 64);
+            out[OUT_RECORD_BYTES*i + 64] = valid ? STATUS_OK : STATUS_INVALID_POINT;
+            invalid += !valid;
+        }
+        if (write_all(out_fd, out, n * OUT_RECORD_BYTES) != 0) {
+            perror(out_path);
+            goto cleanup;
+        }
+        records += n;
+        if (len % IN_RECORD_BYTES != 0) {
+            fprintf(stderr, "%s: input ends with a partial record\n", argv[0]);
+            goto cleanup;
+        }
+    }
+    elapsed = now() - start;
+
+    fprintf(stderr, "%zu records (%zu invalid) in %.3f s with %u threads: %.0f records/s\n",
+            records, invalid, elapsed, crypto_scalarmult_pool_threads(pool),
+            elapsed > 0 ? (double)records / elapsed : 0);
+    ret = 0;
+
+cleanup:
+    free(out);
+    free(bitmap);
+    free(products);
+    free(points);
+    free(keys);
+    free(buf);
+    crypto_scalarmult_pool_free(pool);
+    if (out_fd != STDOUT_FILENO) close(out_fd);
+    input_close(&in);
+    return ret;
+}
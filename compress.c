@@ -0,0 +1,44 @@
+/*
+Conversion between the 64-byte and the compressed 33-byte point encodings
+*/
+
+#include "ge.h"
+#include "scalarmult.h"
+
+void crypto_scalarmult_compress(uint8_t *out, const uint8_t *in)
+{
+    uint8_t nonzero = 0;
+
+    for (unsigned int i = 0; i < 64; i++) nonzero |= in[i];
+    if (nonzero == 0) {
+        // The point at infinity
+        for (unsigned int i = 0; i < 33; i++) out[i] = 0;
+        return;
+    }
+    out[0] = 0x02 | (in[32] & 0x1);
+    for (unsigned int i = 0; i < 32; i++) out[1 + i] = in[i];
+}
+
+int crypto_scalarmult_decompress(uint8_t *out, const uint8_t *in)
+{
+    ge p;
+
+    int err = ge_frombytes_compressed(p, in);
+    if (err != 0) {
+        for (unsigned int i = 0; i < 64; i++) out[i] = 0;
+        return -1;
+    }
+    fe10_tobytes(&out[0], &p[0]);
+    fe10_tobytes(&out[32], &p[1]);
+    return 0;
+}
+
+int crypto_scalarmult_decompress_batch(uint8_t *out, const uint8_t *in, size_t n)
+{
+    int ret = 0;
+
+    for (size_t i = 0; i < n; i++) {
+        ret |= crypto_scalarmult_decompress(&out[64*i], &in[33*i]);
+    }
+    return ret;
+}
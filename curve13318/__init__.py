@@ -0,0 +1,705 @@
+# *-* encoding: utf-8 *-*
+"""
+Python bindings for libcurve13318
+
+The bindings use CFFI in ABI mode, so they only need a compiled
+`libcurve13318.so` (see the Makefile). The library is looked up at
+`$CURVE13318_LIBRARY`, then next to this package, and finally in the system's
+library path.
+
+All functions accept any object that supports the buffer protocol (bytes,
+bytearray, memoryview, NumPy uint8 arrays, ...). Inputs are never copied, and
+outputs are written directly into the `out` buffer if one is given. CFFI
+releases the GIL around every call into the library, so scalar multiplications
+in different threads run in parallel.
+"""
+
+import ctypes.util
+import os
+import threading
+
+from cffi import FFI
+
+__all__ = [
+    'COMPRESSEDBYTES', 'FIELDBYTES', 'POINTBYTES', 'PROJECTIVEBYTES', 'SCALARBYTES', 'SHAREDBYTES',
+    'SCHNORR_PUBLICKEYBYTES', 'SCHNORR_SECRETKEYBYTES', 'SCHNORR_SEEDBYTES', 'SCHNORR_SIGNATUREBYTES',
+    'Pool', 'Prepared', 'Table', 'backend', 'build_table', 'ecdh', 'force_backend', 'hash_to_curve', 'hash_to_curve_batch',
+    'map_to_curve', 'normalize', 'normalize_batch', 'profile_enable',
+    'profile_reset', 'profile_stats', 'scalar_add', 'scalar_invert', 'scalar_mul',
+    'scalar_reduce', 'scalarmult', 'scalarmult_base', 'scalarmult_batch',
+    'scalarmult_double', 'scalarmult_multi', 'scalarmult_projective', 'schnorr_keypair',
+    'schnorr_sign', 'schnorr_verify', 'schnorr_verify_batch', 'validate', 'validate_batch',
+]
+
+POINTBYTES = 64
+COMPRESSEDBYTES = 33
+PROJECTIVEBYTES = 96
+SCALARBYTES = 32
+SHAREDBYTES = 32
+FIELDBYTES = 32
+SCHNORR_SEEDBYTES = 32
+SCHNORR_PUBLICKEYBYTES = 33
+SCHNORR_SECRETKEYBYTES = SCHNORR_SEEDBYTES + SCHNORR_PUBLICKEYBYTES
+SCHNORR_SIGNATUREBYTES = SCHNORR_PUBLICKEYBYTES + 32
+
+# sizeof(scalarmult_prepared) and its required alignment
+_PREPARED_BYTES = 16 * 32 * 4
+_PREPARED_ALIGN = 32
+
+ffi = FFI()
+ffi.cdef("""
+int crypto_scalarmult_curve13318_avx2_scalarmult(
+    uint8_t *out, const uint8_t *k, const uint8_t *p);
+int crypto_scalarmult_curve13318_avx2_scalarmult_vartime(
+    uint8_t *out, const uint8_t *k, const uint8_t *p);
+int crypto_scalarmult_curve13318_avx2_scalarmult_ecdh(
+    uint8_t *out, const uint8_t *k, const uint8_t *p);
+int crypto_scalarmult_curve13318_avx2_scalarmult_ecdh_compressed(
+    uint8_t *out, const uint8_t *k, const uint8_t *p);
+int crypto_scalarmult_curve13318_avx2_scalarmult_hash_to_curve(
+    uint8_t *out, const uint8_t *msg, size_t msglen, const uint8_t *dst, size_t dstlen);
+int crypto_scalarmult_curve13318_avx2_scalarmult_hash_to_curve_batch(
+    uint8_t *out, const uint8_t *const *msgs, const size_t *msglens, size_t n,
+    const uint8_t *dst, size_t dstlen);
+void crypto_scalarmult_curve13318_avx2_scalarmult_map_to_curve(
+    uint8_t *out, const uint8_t *u);
+void crypto_scalarmult_curve13318_avx2_scalarmult_scalar_reduce(
+    uint8_t *out, const uint8_t *in);
+void crypto_scalarmult_curve13318_avx2_scalarmult_scalar_add(
+    uint8_t *out, const uint8_t *a, const uint8_t *b);
+void crypto_scalarmult_curve13318_avx2_scalarmult_scalar_mul(
+    uint8_t *out, const uint8_t *a, const uint8_t *b);
+void crypto_scalarmult_curve13318_avx2_scalarmult_scalar_invert(
+    uint8_t *out, const uint8_t *a);
+int crypto_scalarmult_curve13318_avx2_scalarmult_schnorr_keypair(
+    uint8_t *pk, uint8_t *sk, const uint8_t *seed);
+int crypto_scalarmult_curve13318_avx2_scalarmult_schnorr_sign(
+    uint8_t *sig, const uint8_t *msg, size_t msglen, const uint8_t *sk);
+int crypto_scalarmult_curve13318_avx2_scalarmult_schnorr_verify(
+    const uint8_t *sig, const uint8_t *msg, size_t msglen, const uint8_t *pk);
+int crypto_scalarmult_curve13318_avx2_scalarmult_schnorr_verify_batch(
+    const uint8_t *sigs, const uint8_t *const *msgs, const size_t *msglens,
+    const uint8_t *pks, size_t n);
+int crypto_scalarmult_curve13318_avx2_scalarmult_base(
+    uint8_t *out, const uint8_t *k);
+const char *crypto_scalarmult_curve13318_avx2_scalarmult_backend(void);
+int crypto_scalarmult_curve13318_avx2_scalarmult_force_backend(const char *name);
+typedef struct {
+    uint64_t calls;
+    uint64_t cycles[6];
+} scalarmult_profile;
+void crypto_scalarmult_curve13318_avx2_scalarmult_profile_enable(int enable);
+void crypto_scalarmult_curve13318_avx2_scalarmult_profile_get(scalarmult_profile *out);
+void crypto_scalarmult_curve13318_avx2_scalarmult_profile_reset(void);
+int crypto_scalarmult_curve13318_avx2_scalarmult_batch(
+    uint8_t *out, const uint8_t *k, const uint8_t *p, size_t n);
+int crypto_scalarmult_curve13318_avx2_scalarmult_projective(
+    uint8_t *out, const uint8_t *k, const uint8_t *p);
+int crypto_scalarmult_curve13318_avx2_scalarmult_double(
+    uint8_t *out, const uint8_t *k, const uint8_t *p, const uint8_t *l, const uint8_t *q);
+int crypto_scalarmult_curve13318_avx2_scalarmult_double_vartime(
+    uint8_t *out, const uint8_t *k, const uint8_t *p, const uint8_t *l, const uint8_t *q);
+int crypto_scalarmult_curve13318_avx2_scalarmult_multi(
+    uint8_t *out, const uint8_t *k, const uint8_t *p, size_t n);
+int crypto_scalarmult_curve13318_avx2_scalarmult_validate(const uint8_t *p);
+int crypto_scalarmult_curve13318_avx2_scalarmult_validate_batch(
+    uint8_t *bitmap, const uint8_t *p, size_t n);
+void crypto_scalarmult_curve13318_avx2_scalarmult_normalize(
+    uint8_t *out, const uint8_t *p);
+void crypto_scalarmult_curve13318_avx2_scalarmult_normalize_batch(
+    uint8_t *out, const uint8_t *p, size_t n);
+int crypto_scalarmult_curve13318_avx2_scalarmult_prepare(
+    void *pp, const uint8_t *p);
+int crypto_scalarmult_curve13318_avx2_scalarmult_prepared(
+    uint8_t *out, const uint8_t *k, const void *pp);
+typedef struct {
+    const void *entries;
+    size_t count;
+    void *map;
+    size_t map_size;
+} scalarmult_table;
+size_t crypto_scalarmult_curve13318_avx2_scalarmult_table_bytes(size_t n);
+int crypto_scalarmult_curve13318_avx2_scalarmult_table_build(
+    uint8_t *out, const uint8_t *p, size_t n);
+int crypto_scalarmult_curve13318_avx2_scalarmult_table_open(
+    scalarmult_table *t, const char *path);
+void crypto_scalarmult_curve13318_avx2_scalarmult_table_close(scalarmult_table *t);
+const void *crypto_scalarmult_curve13318_avx2_scalarmult_table_find(
+    const scalarmult_table *t, const uint8_t *p);
+void *crypto_scalarmult_curve13318_avx2_scalarmult_pool_new(unsigned int nthreads);
+void crypto_scalarmult_curve13318_avx2_scalarmult_pool_free(void *pool);
+unsigned int crypto_scalarmult_curve13318_avx2_scalarmult_pool_threads(const void *pool);
+int crypto_scalarmult_curve13318_avx2_scalarmult_pool_batch(
+    void *pool, uint8_t *out, const uint8_t *k, const uint8_t *p, size_t n);
+""")
+
+
+def _find_library():
+    path = os.getenv('CURVE13318_LIBRARY')
+    if path is not None:
+        return path
+    here = os.path.dirname(os.path.abspath(__file__))
+    for directory in (here, os.path.dirname(here)):
+        path = os.path.join(directory, 'libcurve13318.so')
+        if os.path.exists(path):
+            return path
+    path = ctypes.util.find_library('curve13318')
+    if path is None:
+        raise ImportError('could not find libcurve13318.so, set CURVE13318_LIBRARY')
+    return path
+
+
+lib = ffi.dlopen(_find_library())
+
+
+def _input(obj, size, name):
+    """Borrow a read-only pointer to the buffer `obj` without copying"""
+    buf = ffi.from_buffer(obj)
+    if len(buf) != size:
+        raise ValueError('{} must be {} bytes, not {}'.format(name, size, len(buf)))
+    return buf
+
+
+def _output(out, size):
+    """Borrow a writable pointer to `out`, or allocate a new bytearray"""
+    if out is None:
+        out = bytearray(size)
+    buf = ffi.from_buffer(out, require_writable=True)
+    if len(buf) != size:
+        raise ValueError('out must be {} bytes, not {}'.format(size, len(buf)))
+    return out, buf
+
+
+def _allocate_aligned(size, align):
+    """Allocate `size` bytes aligned to `align`, returns (owner, pointer)"""
+    owner = ffi.new('uint8_t[]', size + align - 1)
+    address = int(ffi.cast('uintptr_t', owner))
+    offset = -address % align
+    return owner, owner + offset
+
+
+def scalarmult(k, p, out=None, vartime=False):
+    """
+    Multiply the point `p` (64 bytes) by the scalar `k` (32 bytes)
+
+    The result (64 bytes) is written into `out`, or into a new bytearray if
+    `out` is None. Set `vartime` only if `k` is public. Raises ValueError if
+    `p` is not a valid point.
+    """
+    out, out_buf = _output(out, POINTBYTES)
+    k_buf = _input(k, SCALARBYTES, 'k')
+    p_buf = _input(p, POINTBYTES, 'p')
+    if vartime:
+        fn = lib.crypto_scalarmult_curve13318_avx2_scalarmult_vartime
+    else:
+        fn = lib.crypto_scalarmult_curve13318_avx2_scalarmult
+    if fn(out_buf, k_buf, p_buf) != 0:
+        raise ValueError('p is not a valid point')
+    return out
+
+
+def ecdh(k, p, out=None):
+    """
+    Compute the shared secret, i.e. the x-coordinate (32 bytes) of k * p
+
+    `k` is the secret scalar (32 bytes) and `p` is the peer's point, either
+    full (64 bytes) or compressed (33 bytes). Raises ValueError if `p` is not
+    a valid point or if the result is the point at infinity.
+    """
+    out, out_buf = _output(out, SHAREDBYTES)
+    k_buf = _input(k, SCALARBYTES, 'k')
+    p_buf = ffi.from_buffer(p)
+    if len(p_buf) == POINTBYTES:
+        fn = lib.crypto_scalarmult_curve13318_avx2_scalarmult_ecdh
+    elif len(p_buf) == COMPRESSEDBYTES:
+        fn = lib.crypto_scalarmult_curve13318_avx2_scalarmult_ecdh_compressed
+    else:
+        raise ValueError('p must be {} or {} bytes, not {}'.format(
+            POINTBYTES, COMPRESSEDBYTES, len(p_buf)))
+    if fn(out_buf, k_buf, p_buf) != 0:
+        raise ValueError('p is not a valid point, or k * p is the point at infinity')
+    return out
+
+
+def hash_to_curve(msg, dst, out=None):
+    """
+    Hash the message `msg` to a point (64 bytes) with the domain separation
+    tag `dst` (at most 255 bytes), following RFC 9380 with the suite
+    CURVE13318_XMD:SHA-256_SSWU_RO_
+    """
+    out, out_buf = _output(out, POINTBYTES)
+    msg_buf = ffi.from_buffer(msg)
+    dst_buf = ffi.from_buffer(dst)
+    if lib.crypto_scalarmult_curve13318_avx2_scalarmult_hash_to_curve(
+            out_buf, msg_buf, len(msg_buf), dst_buf, len(dst_buf)) != 0:
+        raise ValueError('dst must be at most 255 bytes, not {}'.format(len(dst_buf)))
+    return out
+
+
+def hash_to_curve_batch(msgs, dst, out=None):
+    """
+    Hash a sequence of n messages to the curve with the same domain separation
+    tag, sharing one inversion between many points. Returns the concatenated
+    points (64*n bytes).
+    """
+    msg_bufs = [ffi.from_buffer(msg) for msg in msgs]
+    n = len(msg_bufs)
+    out, out_buf = _output(out, POINTBYTES * n)
+    dst_buf = ffi.from_buffer(dst)
+    msg_ptrs = ffi.new('const uint8_t *[]', msg_bufs)
+    msg_lens = ffi.new('size_t[]', [len(buf) for buf in msg_bufs])
+    if lib.crypto_scalarmult_curve13318_avx2_scalarmult_hash_to_curve_batch(
+            out_buf, msg_ptrs, msg_lens, n, dst_buf, len(dst_buf)) != 0:
+        raise ValueError('dst must be at most 255 bytes, not {}'.format(len(dst_buf)))
+    return out
+
+
+def map_to_curve(u, out=None):
+    """
+    Map a field element `u` (32 bytes, little-endian) to a point with the
+    simplified SWU map. The output is not uniformly distributed, use
+    `hash_to_curve` to hash messages.
+    """
+    out, out_buf = _output(out, POINTBYTES)
+    u_buf = _input(u, FIELDBYTES, 'u')
+    lib.crypto_scalarmult_curve13318_avx2_scalarmult_map_to_curve(out_buf, u_buf)
+    return out
+
+
+def scalar_reduce(x, out=None):
+    """Reduce a 64-byte little-endian integer modulo the group order"""
+    out, out_buf = _output(out, SCALARBYTES)
+    x_buf = _input(x, 2 * SCALARBYTES, 'x')
+    lib.crypto_scalarmult_curve13318_avx2_scalarmult_scalar_reduce(out_buf, x_buf)
+    return out
+
+
+def scalar_add(a, b, out=None):
+    """Compute a + b modulo the group order (32 bytes each)"""
+    out, out_buf = _output(out, SCALARBYTES)
+    a_buf = _input(a, SCALARBYTES, 'a')
+    b_buf = _input(b, SCALARBYTES, 'b')
+    lib.crypto_scalarmult_curve13318_avx2_scalarmult_scalar_add(out_buf, a_buf, b_buf)
+    return out
+
+
+def scalar_mul(a, b, out=None):
+    """Compute a * b modulo the group order (32 bytes each)"""
+    out, out_buf = _output(out, SCALARBYTES)
+    a_buf = _input(a, SCALARBYTES, 'a')
+    b_buf = _input(b, SCALARBYTES, 'b')
+    lib.crypto_scalarmult_curve13318_avx2_scalarmult_scalar_mul(out_buf, a_buf, b_buf)
+    return out
+
+
+def scalar_invert(a, out=None):
+    """Compute 1 / a modulo the group order, the inverse of zero is zero"""
+    out, out_buf = _output(out, SCALARBYTES)
+    a_buf = _input(a, SCALARBYTES, 'a')
+    lib.crypto_scalarmult_curve13318_avx2_scalarmult_scalar_invert(out_buf, a_buf)
+    return out
+
+
+def schnorr_keypair(seed):
+    """
+    Derive a Schnorr key pair from a secret, uniformly random seed (32 bytes)
+
+    Returns (public key, secret key), with a 33-byte public key and a 65-byte
+    secret key.
+    """
+    seed_buf = _input(seed, SCHNORR_SEEDBYTES, 'seed')
+    pk, pk_buf = _output(None, SCHNORR_PUBLICKEYBYTES)
+    sk, sk_buf = _output(None, SCHNORR_SECRETKEYBYTES)
+    lib.crypto_scalarmult_curve13318_avx2_scalarmult_schnorr_keypair(pk_buf, sk_buf, seed_buf)
+    return pk, sk
+
+
+def schnorr_sign(msg, sk, out=None):
+    """Sign the message `msg` with the secret key `sk`, returns 65 bytes"""
+    out, out_buf = _output(out, SCHNORR_SIGNATUREBYTES)
+    msg_buf = ffi.from_buffer(msg)
+    sk_buf = _input(sk, SCHNORR_SECRETKEYBYTES, 'sk')
+    lib.crypto_scalarmult_curve13318_avx2_scalarmult_schnorr_sign(
+        out_buf, msg_buf, len(msg_buf), sk_buf)
+    return out
+
+
+def schnorr_verify(sig, msg, pk):
+    """Return True if `sig` is a valid signature of `msg` under the public key `pk`"""
+    sig_buf = _input(sig, SCHNORR_SIGNATUREBYTES, 'sig')
+    msg_buf = ffi.from_buffer(msg)
+    pk_buf = _input(pk, SCHNORR_PUBLICKEYBYTES, 'pk')
+    return lib.crypto_scalarmult_curve13318_avx2_scalarmult_schnorr_verify(
+        sig_buf, msg_buf, len(msg_buf), pk_buf) == 0
+
+
+def schnorr_verify_batch(sigs, msgs, pks):
+    """
+    Verify n signatures at once, returns True if all of them are valid
+
+    `sigs` holds the concatenated signatures (65*n bytes), `msgs` is a
+    sequence of n messages and `pks` holds the concatenated public keys (33*n
+    bytes). If the result is False, use `schnorr_verify` to find the invalid
+    signatures.
+    """
+    msg_bufs = [ffi.from_buffer(msg) for msg in msgs]
+    n = len(msg_bufs)
+    sigs_buf = _input(sigs, SCHNORR_SIGNATUREBYTES * n, 'sigs')
+    pks_buf = _input(pks, SCHNORR_PUBLICKEYBYTES * n, 'pks')
+    msg_ptrs = ffi.new('const uint8_t *[]', msg_bufs)
+    msg_lens = ffi.new('size_t[]', [len(buf) for buf in msg_bufs])
+    return lib.crypto_scalarmult_curve13318_avx2_scalarmult_schnorr_verify_batch(
+        sigs_buf, msg_ptrs, msg_lens, pks_buf, n) == 0
+
+
+def scalarmult_base(k, out=None):
+    """Multiply the base point by the scalar `k` (32 bytes)"""
+    out, out_buf = _output(out, POINTBYTES)
+    k_buf = _input(k, SCALARBYTES, 'k')
+    lib.crypto_scalarmult_curve13318_avx2_scalarmult_base(out_buf, k_buf)
+    return out
+
+
+def scalarmult_projective(k, p, out=None):
+    """
+    Like `scalarmult`, but return the projective result (96 bytes: X, Y and Z)
+
+    This skips the field inversion. Use `normalize` or `normalize_batch` to
+    convert the result to the 64-byte encoding.
+    """
+    out, out_buf = _output(out, PROJECTIVEBYTES)
+    k_buf = _input(k, SCALARBYTES, 'k')
+    p_buf = _input(p, POINTBYTES, 'p')
+    if lib.crypto_scalarmult_curve13318_avx2_scalarmult_projective(out_buf, k_buf, p_buf) != 0:
+        raise ValueError('p is not a valid point')
+    return out
+
+
+def scalarmult_double(k, p, l, q, out=None, vartime=False):
+    """
+    Compute k*P + l*Q (64 bytes) with one shared chain of doublings
+
+    Set `vartime` only if `k` and `l` are public (e.g. for signature
+    verification). Raises ValueError if `p` or `q` is not a valid point.
+    """
+    out, out_buf = _output(out, POINTBYTES)
+    k_buf = _input(k, SCALARBYTES, 'k')
+    p_buf = _input(p, POINTBYTES, 'p')
+    l_buf = _input(l, SCALARBYTES, 'l')
+    q_buf = _input(q, POINTBYTES, 'q')
+    if vartime:
+        fn = lib.crypto_scalarmult_curve13318_avx2_scalarmult_double_vartime
+    else:
+        fn = lib.crypto_scalarmult_curve13318_avx2_scalarmult_double
+    if fn(out_buf, k_buf, p_buf, l_buf, q_buf) != 0:
+        raise ValueError('p or q is not a valid point')
+    return out
+
+
+def scalarmult_multi(k, p, out=None):
+    """
+    Compute the sum of k[i] * p[i] (64 bytes) over n points
+
+    `k` holds the concatenated scalars (32*n bytes) and `p` the concatenated
+    points (64*n bytes). This function is *not* constant time, so only use it
+    with public scalars. Raises ValueError if any of the points is invalid.
+    """
+    k_len = len(ffi.from_buffer(k))
+    if k_len % SCALARBYTES != 0:
+        raise ValueError('length of k must be a multiple of {}'.format(SCALARBYTES))
+    n = k_len // SCALARBYTES
+    out, out_buf = _output(out, POINTBYTES)
+    k_buf = _input(k, SCALARBYTES * n, 'k')
+    p_buf = _input(p, POINTBYTES * n, 'p')
+    if lib.crypto_scalarmult_curve13318_avx2_scalarmult_multi(out_buf, k_buf, p_buf, n) != 0:
+        raise ValueError('p contains an invalid point')
+    return out
+
+
+def backend():
+    """Return the name of the backend that `scalarmult` and `scalarmult_base` use"""
+    return ffi.string(lib.crypto_scalarmult_curve13318_avx2_scalarmult_backend()).decode()
+
+
+def force_backend(name=None):
+    """
+    Use the backend `name` ('avx2', 'fe51', 'fe51_affine' or 'portable') for
+    `scalarmult` and `scalarmult_base`, or go back to the fastest supported one
+    if `name` is None
+
+    This is meant for benchmarking. It may be called while other threads use
+    the library; calls that already started finish on the previous backend.
+    """
+    c_name = ffi.NULL if name is None else name.encode()
+    if lib.crypto_scalarmult_curve13318_avx2_scalarmult_force_backend(c_name) != 0:
+        raise ValueError('backend {!r} is not supported'.format(name))
+
+
+# The phases of `scalarmult_profile`, in the order of their enum values
+_PROFILE_PHASES = ('frombytes', 'into_opt', 'precompute', 'windows', 'ladder', 'tobytes')
+
+
+def profile_enable(enable=True):
+    """
+    Enable (or disable) per-phase cycle profiling of the avx2 backend
+
+    The setting applies to all threads, but every thread keeps its own counts.
+    """
+    lib.crypto_scalarmult_curve13318_avx2_scalarmult_profile_enable(int(bool(enable)))
+
+
+def profile_stats():
+    """
+    Return the profile of the calling thread as a dict
+
+    The dict maps 'calls' to the amount of profiled scalar multiplications, and
+    the name of every phase to the amount of cycles spent in it.
+    """
+    c_profile = ffi.new('scalarmult_profile *')
+    lib.crypto_scalarmult_curve13318_avx2_scalarmult_profile_get(c_profile)
+    stats = {'calls': c_profile.calls}
+    for i, name in enumerate(_PROFILE_PHASES):
+        stats[name] = c_profile.cycles[i]
+    return stats
+
+
+def profile_reset():
+    """Reset the profile of the calling thread"""
+    lib.crypto_scalarmult_curve13318_avx2_scalarmult_profile_reset()
+
+
+def validate(p):
+    """Return True if `p` (64 bytes) is a valid point"""
+    p_buf = _input(p, POINTBYTES, 'p')
+    return lib.crypto_scalarmult_curve13318_avx2_scalarmult_validate(p_buf) == 0
+
+
+def validate_batch(p):
+    """
+    Validate n concatenated points (64*n bytes), returns a list of n bools
+    """
+    p_len = len(ffi.from_buffer(p))
+    if p_len % POINTBYTES != 0:
+        raise ValueError('length of p must be a multiple of {}'.format(POINTBYTES))
+    n = p_len // POINTBYTES
+    p_buf = _input(p, POINTBYTES * n, 'p')
+    bitmap = ffi.new('uint8_t[]', (n + 7) // 8)
+    lib.crypto_scalarmult_curve13318_avx2_scalarmult_validate_batch(bitmap, p_buf, n)
+    return [bool((bitmap[i // 8] >> (i % 8)) & 1) for i in range(n)]
+
+
+def normalize(p, out=None):
+    """Convert a projective point (96 bytes) to the 64-byte encoding"""
+    out, out_buf = _output(out, POINTBYTES)
+    p_buf = _input(p, PROJECTIVEBYTES, 'p')
+    lib.crypto_scalarmult_curve13318_avx2_scalarmult_normalize(out_buf, p_buf)
+    return out
+
+
+def normalize_batch(p, out=None):
+    """
+    Convert n concatenated projective points (96*n bytes) to the 64-byte
+    encoding, sharing one inversion between many points
+    """
+    p_len = len(ffi.from_buffer(p))
+    if p_len % PROJECTIVEBYTES != 0:
+        raise ValueError('length of p must be a multiple of {}'.format(PROJECTIVEBYTES))
+    n = p_len // PROJECTIVEBYTES
+    out, out_buf = _output(out, POINTBYTES * n)
+    p_buf = _input(p, PROJECTIVEBYTES * n, 'p')
+    lib.crypto_scalarmult_curve13318_avx2_scalarmult_normalize_batch(out_buf, p_buf, n)
+    return out
+
+
+def _batch_buffers(k, p, out):
+    """Check the lengths of a batch, returns (n, out, k_buf, p_buf, out_buf)"""
+    k_len = len(ffi.from_buffer(k))
+    if k_len % SCALARBYTES != 0:
+        raise ValueError('length of k must be a multiple of {}'.format(SCALARBYTES))
+    n = k_len // SCALARBYTES
+    out, out_buf = _output(out, POINTBYTES * n)
+    k_buf = _input(k, SCALARBYTES * n, 'k')
+    p_buf = _input(p, POINTBYTES * n, 'p')
+    return n, out, k_buf, p_buf, out_buf
+
+
+def scalarmult_batch(k, p, out=None):
+    """
+    Multiply n points by n scalars in a single call
+
+    `k` holds the concatenated scalars (32*n bytes) and `p` the concatenated
+    points (64*n bytes). The results (64*n bytes) are written into `out`, or
+    into a new bytearray if `out` is None. Raises ValueError if any of the
+    points is invalid.
+    """
+    n, out, k_buf, p_buf, out_buf = _batch_buffers(k, p, out)
+    if lib.crypto_scalarmult_curve13318_avx2_scalarmult_batch(out_buf, k_buf, p_buf, n) != 0:
+        raise ValueError('p contains an invalid point')
+    return out
+
+
+class Pool(object):
+    """
+    A pool of native worker threads for large batches
+
+    `threads` is the amount of threads that work on a batch, including the
+    calling thread; 0 means one thread per online CPU. The pool can also be
+    used as a context manager, which closes it on exit. It may be shared
+    between threads; `close` waits until the batches that already started have
+    finished.
+    """
+
+    def __init__(self, threads=0):
+        # The native pool processes one batch at a time anyway, so holding the
+        # lock during a batch does not cost any parallelism
+        self._lock = threading.Lock()
+        self._pool = lib.crypto_scalarmult_curve13318_avx2_scalarmult_pool_new(threads)
+        if self._pool == ffi.NULL:
+            raise MemoryError('could not start the worker threads')
+
+    @property
+    def threads(self):
+        with self._lock:
+            if self._pool is None:
+                raise ValueError('pool is closed')
+            return lib.crypto_scalarmult_curve13318_avx2_scalarmult_pool_threads(self._pool)
+
+    def scalarmult_batch(self, k, p, out=None):
+        """Same as the module-level `scalarmult_batch`, but multi-threaded"""
+        n, out, k_buf, p_buf, out_buf = _batch_buffers(k, p, out)
+        with self._lock:
+            if self._pool is None:
+                raise ValueError('pool is closed')
+            ret = lib.crypto_scalarmult_curve13318_avx2_scalarmult_pool_batch(
+                self._pool, out_buf, k_buf, p_buf, n)
+        if ret != 0:
+            raise ValueError('p contains an invalid point')
+        return out
+
+    def close(self):
+        with self._lock:
+            if self._pool is not None:
+                lib.crypto_scalarmult_curve13318_avx2_scalarmult_pool_free(self._pool)
+                self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+
+class Prepared(object):
+    """
+    A validated point together with its precomputed lookup table
+
+    Use this for long-lived points that are multiplied by many scalars. The
+    validation and table precomputation are only done once, in the constructor,
+    which raises ValueError if `p` is not a valid point, and RuntimeError if the
+    CPU does not support AVX2.
+    """
+
+    def __init__(self, p):
+        p_buf = _input(p, POINTBYTES, 'p')
+        self._owner, self._handle = _allocate_aligned(_PREPARED_BYTES, _PREPARED_ALIGN)
+        if lib.crypto_scalarmult_curve13318_avx2_scalarmult_prepare(self._handle, p_buf) != 0:
+            if lib.crypto_scalarmult_curve13318_avx2_scalarmult_validate(p_buf) == 0:
+                raise RuntimeError('prepared points need a CPU with AVX2')
+            raise ValueError('p is not a valid point')
+
+    def scalarmult(self, k, out=None):
+        """Multiply the prepared point by the scalar `k` (32 bytes)"""
+        out, out_buf = _output(out, POINTBYTES)
+        k_buf = _input(k, SCALARBYTES, 'k')
+        lib.crypto_scalarmult_curve13318_avx2_scalarmult_prepared(out_buf, k_buf, self._handle)
+        return out
+
+
+def build_table(p, out=None):
+    """
+    Build a table file for n concatenated points (64*n bytes)
+
+    Returns the file contents, which can be written to disk and loaded with
+    `Table`. Raises ValueError if any of the points is invalid, and
+    RuntimeError if the CPU does not support AVX2.
+    """
+    p_len = len(ffi.from_buffer(p))
+    if p_len % POINTBYTES != 0:
+        raise ValueError('length of p must be a multiple of {}'.format(POINTBYTES))
+    n = p_len // POINTBYTES
+    out, out_buf = _output(out, lib.crypto_scalarmult_curve13318_avx2_scalarmult_table_bytes(n))
+    p_buf = _input(p, POINTBYTES * n, 'p')
+    if lib.crypto_scalarmult_curve13318_avx2_scalarmult_table_build(out_buf, p_buf, n) != 0:
+        bitmap = ffi.new('uint8_t[]', (n + 7) // 8)
+        if lib.crypto_scalarmult_curve13318_avx2_scalarmult_validate_batch(bitmap, p_buf, n) == 0:
+            raise RuntimeError('prepared points need a CPU with AVX2')
+        raise ValueError('p contains an invalid point')
+    return out
+
+
+class Table(object):
+    """
+    A memory-mapped table file of prepared points, see `build_table`
+
+    The file is mapped read-only and shared, and its entries are used in place,
+    so opening it is a lot cheaper than preparing the points again. Raises
+    ValueError if the file can not be mapped or is not a valid table file. The
+    table can also be used as a context manager, which closes it on exit.
+
+    Table files must be trusted like code: their points and lookup tables are
+    not checked against the curve, and the checksum only catches accidental
+    corruption. A tampered entry can make `scalarmult` leak bits of the secret
+    scalar, so only open files that nobody untrusted can write to.
+    """
+
+    def __init__(self, path):
+        self._table = ffi.new('scalarmult_table *')
+        c_path = os.fsencode(path)
+        if lib.crypto_scalarmult_curve13318_avx2_scalarmult_table_open(self._table, c_path) != 0:
+            self._table = None
+            raise ValueError('{!r} is not a valid table file'.format(path))
+
+    def _find(self, p):
+        if self._table is None:
+            raise ValueError('table is closed')
+        p_buf = _input(p, POINTBYTES, 'p')
+        return lib.crypto_scalarmult_curve13318_avx2_scalarmult_table_find(self._table, p_buf)
+
+    def __len__(self):
+        return 0 if self._table is None else self._table.count
+
+    def __contains__(self, p):
+        return self._find(p) != ffi.NULL
+
+    def scalarmult(self, k, p, out=None):
+        """
+        Multiply the point `p` from the table by the scalar `k` (32 bytes),
+        skipping its validation and table precomputation. Raises KeyError if
+        `p` is not in the table, and RuntimeError if the CPU does not support
+        AVX2.
+        """
+        entry = self._find(p)
+        if entry == ffi.NULL:
+            raise KeyError('p is not in the table')
+        out, out_buf = _output(out, POINTBYTES)
+        k_buf = _input(k, SCALARBYTES, 'k')
+        if lib.crypto_scalarmult_curve13318_avx2_scalarmult_prepared(out_buf, k_buf, entry) != 0:
+            raise RuntimeError('prepared points need a CPU with AVX2')
+        return out
+
+    def close(self):
+        if self._table is not None:
+            lib.crypto_scalarmult_curve13318_avx2_scalarmult_table_close(self._table)
+            self._table = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __del__(self):
+        self.close()
@@ -0,0 +1,152 @@
+/*
+Runtime selection of the scalar multiplication backend
+
+When the library is loaded, we pick the first backend in `backends` that is
+supported by the CPU. The environment variable CURVE13318_BACKEND, or a call
+to `crypto_scalarmult_force_backend`, overrides this choice. The selected
+backend is read and written atomically, so it may be changed while other
+threads are computing; calls that already started finish on the old backend.
+
+This file is compiled for baseline x86-64, because it has to run on CPUs that
+do not support AVX2. It also tells the other entry points whether they can
+use AVX2, see `backend_has_avx2`.
+*/
+
+#include "backend.h"
+#include "scalarmult.h"
+#include <cpuid.h>
+#include <stddef.h>
+#include <stdlib.h>
+#include <string.h>
+
+typedef struct {
+    const char *name;
+    int (*supported)(void);
+    int (*scalarmult)(uint8_t *out, const uint8_t *key, const uint8_t *in);
+    int (*scalarmult_base)(uint8_t *out, const uint8_t *key);
+} backend;
+
+// The base point G, see `crypto_scalarmult_base`
+static const uint8_t base_point[64] = {
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    179, 43, 106, 247, 206, 176, 201, 77, 137, 224, 122, 176, 76, 93, 29, 69,
+    190, 137, 17, 103, 105, 172, 236, 172, 225, 72, 243, 7, 94, 128, 240, 17
+};
+
+static int cpu_has_avx2(void)
+{
+    unsigned int eax, ebx, ecx, edx;
+    uint32_t xcr0, xcr0_hi;
+
+    if (!__get_cpuid(1, &eax, &ebx, &ecx, &edx)) return 0;
+    if (!(ecx & bit_OSXSAVE) || !(ecx & bit_AVX)) return 0;
+
+    // The OS must also save the YMM registers on a context switch
+    __asm__ __volatile__ ("xgetbv" : "=a"(xcr0), "=d"(xcr0_hi) : "c"(0));
+    if ((xcr0 & 0x6) != 0x6) return 0;
+
+    if (__get_cpuid_max(0, NULL) < 7) return 0;
+    __cpuid_count(7, 0, eax, ebx, ecx, edx);
+    return (ebx & bit_AVX2) != 0;
+}
+
+// Result of `cpu_has_avx2`, or -1 if it has not been computed yet
+static int has_avx2 = -1;
+
+int backend_has_avx2(void)
+{
+    int ret = __atomic_load_n(&has_avx2, __ATOMIC_RELAXED);
+
+    // Other constructors may run before ours, so compute it on first use
+    if (ret < 0) {
+        ret = cpu_has_avx2();
+        __atomic_store_n(&has_avx2, ret, __ATOMIC_RELAXED);
+    }
+    return ret;
+}
+
+static int always_supported(void)
+{
+    return 1;
+}
+
+static int scalarmult_base_fe51(uint8_t *out, const uint8_t *key)
+{
+    return crypto_scalarmult_fe51(out, key, base_point);
+}
+
+static int scalarmult_base_fe51_affine(uint8_t *out, const uint8_t *key)
+{
+    return crypto_scalarmult_fe51_affine(out, key, base_point);
+}
+
+static int scalarmult_base_portable(uint8_t *out, const uint8_t *key)
+{
+    return crypto_scalarmult_portable(out, key, base_point);
+}
+
+// All backends, fastest first. The order is fixed instead of measured when the
+// library is loaded. The backends run the same algorithm, so their relative
+// speed only depends on the instruction set, and a measurement that is short
+// enough for a constructor (a few cold scalar multiplications) is noisier than
+// the differences between the fe51 variants (see `timeit`). With `timeit`,
+// "fe51_affine" takes about 4% fewer cycles than "fe51": its mixed additions
+// save more than its inversion costs. Both only need baseline x86-64 and are
+// about 10% faster than "portable", so "portable" is never selected
+// automatically; it is the plain C reference for testing.
+static const backend backends[] = {
+    {"avx2", backend_has_avx2, crypto_scalarmult_avx2, crypto_scalarmult_base_avx2},
+    {"fe51_affine", always_supported, crypto_scalarmult_fe51_affine, scalarmult_base_fe51_affine},
+    {"fe51", always_supported, crypto_scalarmult_fe51, scalarmult_base_fe51},
+    {"portable", always_supported, crypto_scalarmult_portable, scalarmult_base_portable},
+};
+
+#define BACKEND_COUNT (sizeof(backends) / sizeof(backends[0]))
+
+// Until the constructor has run, use the backend that runs everywhere. The
+// backends are constant, so relaxed atomics suffice.
+static const backend *current = &backends[BACKEND_COUNT - 1];
+
+static const backend *get_backend(void)
+{
+    return __atomic_load_n(&current, __ATOMIC_RELAXED);
+}
+
+int crypto_scalarmult_force_backend(const char *name)
+{
+    for (size_t i = 0; i < BACKEND_COUNT; i++) {
+        if (name != NULL && strcmp(name, backends[i].name) != 0) continue;
+        if (!backends[i].supported()) {
+            if (name != NULL) return -1;
+            continue;
+        }
+        __atomic_store_n(&current, &backends[i], __ATOMIC_RELAXED);
+        return 0;
+    }
+    return -1;
+}
+
+const char *crypto_scalarmult_backend(void)
+{
+    return get_backend()->name;
+}
+
+static void __attribute__((constructor)) select_backend(void)
+{
+    const char *name = getenv("CURVE13318_BACKEND");
+
+    if (name == NULL || crypto_scalarmult_force_backend(name) != 0) {
+        crypto_scalarmult_force_backend(NULL);
+    }
+}
+
+int crypto_scalarmult(uint8_t *out, const uint8_t *key, const uint8_t *in)
+{
+    return get_backend()->scalarmult(out, key, in);
+}
+
+int crypto_scalarmult_base(uint8_t *out, const uint8_t *key)
+{
+    return get_backend()->scalarmult_base(out, key);
+}
@@ -0,0 +1,87 @@
+/*
+Four field elements in radix 2^25.5, interleaved over four 64-bit lanes
+
+Limb `i` of lane `l` is stored in `v[4*i + l]`, which is the layout that is
+used by the AVX2 routines in fe10x4_*.asm. Every lane holds an independent
+field element.
+*/
+
+#ifndef CURVE13318_FE10X4_H_
+#define CURVE13318_FE10X4_H_
+
+#include "consts.h"
+#include <inttypes.h>
+
+#define fe10x4_mul_asm crypto_scalarmult_curve13318_avx2_fe10x4_mul_asm
+#define fe10x4_square_asm crypto_scalarmult_curve13318_avx2_fe10x4_square_asm
+#define fe10x4_carry crypto_scalarmult_curve13318_avx2_fe10x4_carry
+
+typedef struct {
+    uint64_t v[40];
+} __attribute__((aligned(32))) fe10x4;
+
+/*
+Multiply two vectors of field elements
+
+The limbs of the operands must be at most 2^27. The output is *not* carried.
+*/
+extern void fe10x4_mul_asm(fe10x4 *dest, const fe10x4 *op1, const fe10x4 *op2);
+
+/*
+Square a vector of field elements, same bounds as `fe10x4_mul_asm`
+*/
+extern void fe10x4_square_asm(fe10x4 *dest, const fe10x4 *element);
+
+/*
+Carry ripple a vector of field elements, s.t. all limbs are at most
+1.01 * 2^26
+*/
+extern void fe10x4_carry(fe10x4 *element);
+
+/*
+Add `lhs` and `rhs` into `z`
+*/
+static inline void fe10x4_add(fe10x4 *z, const fe10x4 *lhs, const fe10x4 *rhs) {
+    for (unsigned int i = 0; i < 40; i++) z->v[i] = lhs->v[i] + rhs->v[i];
+}
+
+/*
+Compute `lhs - rhs` into `z` by adding 4*p, and carry the result. The limbs of
+`rhs` must be smaller than those of 4*p, which holds for the sum of two
+carried elements.
+*/
+static inline void fe10x4_sub(fe10x4 *z, const fe10x4 *lhs, const fe10x4 *rhs) {
+    for (unsigned int i = 0; i < 10; i++) {
+        const uint64_t fourp = i == 0 ? _4P0 : (i % 2 == 0 ? _4PRestB26 : _4PRestB25);
+        for (unsigned int l = 0; l < 4; l++) {
+            z->v[4*i + l] = lhs->v[4*i + l] + fourp - rhs->v[4*i + l];
+        }
+    }
+    fe10x4_carry(z);
+}
+
+/*
+Multiply two carried vectors and carry the result
+*/
+static inline void fe10x4_mul(fe10x4 *z, const fe10x4 *lhs, const fe10x4 *rhs) {
+    fe10x4_mul_asm(z, lhs, rhs);
+    fe10x4_carry(z);
+}
+
+/*
+Square a carried vector and carry the result
+*/
+static inline void fe10x4_square(fe10x4 *z, const fe10x4 *element) {
+    fe10x4_square_asm(z, element);
+    fe10x4_carry(z);
+}
+
+/*
+Multiply a carried vector by 13318 and carry the result
+*/
+static inline void fe10x4_mul_b(fe10x4 *z, const fe10x4 *element) {
+    for (unsigned int i = 0; i < 40; i++) z->v[i] = element->v[i] * CURVE13318_B;
+    fe10x4_carry(z);
+}
+
+#endif // CURVE13318_FE10X4_H_
@@ -11,6 +11,13 @@
 #define fe51_mul crypto_scalarmult_curve13318_avx2_fe51_mul
 #define fe51_nsquare crypto_scalarmult_curve13318_avx2_fe51_nsquare
 #define fe51_invert crypto_scalarmult_curve13318_avx2_fe51_invert
+#define fe51_invert_safegcd crypto_scalarmult_curve13318_avx2_fe51_invert_safegcd
+#define fe51_frombytes crypto_scalarmult_curve13318_avx2_fe51_frombytes
+#define fe51_sqrt crypto_scalarmult_curve13318_avx2_fe51_sqrt
+#define fe51_sqrt_ratio crypto_scalarmult_curve13318_avx2_fe51_sqrt_ratio
+#define fe51_pack_portable crypto_scalarmult_curve13318_avx2_fe51_pack_portable
+#define fe51_mul_portable crypto_scalarmult_curve13318_avx2_fe51_mul_portable
+#define fe51_nsquare_portable crypto_scalarmult_curve13318_avx2_fe51_nsquare_portable
 
 typedef struct
 {
@@ -22,5 +29,87 @@ extern void fe51_pack(unsigned char *, const fe51 *);
 extern void fe51_mul(fe51 *, const fe51 *, const fe51 *);
 extern void fe51_nsquare(fe51 *, const fe51 *, int);
 extern void fe51_invert(fe51 *, const fe51 *);
+extern void fe51_frombytes(fe51 *, const unsigned char *);
+extern int fe51_sqrt(fe51 *, const fe51 *);
+
+/*
+Compute r = sqrt(u / v) if u / v is a square, and r = sqrt(2 * u / v)
+otherwise (2 is not a square modulo p). `v` must not be zero. Returns 0 if
+u / v is a square, -1 otherwise.
+*/
+extern int fe51_sqrt_ratio(fe51 *r, const fe51 *u, const fe51 *v);
+
+/*
+Constant-time inversion with Bernstein-Yang divsteps, computes the same result
+as `fe51_invert`. The output is fully reduced.
+*/
+extern void fe51_invert_safegcd(fe51 *, const fe51 *);
+
+/*
+The inversion that is used for converting points to affine coordinates. Build
+with `make INVERT=safegcd` to use `fe51_invert_safegcd` instead of the
+addition chain.
+*/
+#ifdef CURVE13318_INVERT_SAFEGCD
+# define fe51_invert_affine fe51_invert_safegcd
+#else
+# define fe51_invert_affine fe51_invert
+#endif
+
+/*
+Portable C versions of `fe51_pack`, `fe51_mul` and `fe51_nsquare`, which do
+not need any particular instruction set
+*/
+extern void fe51_pack_portable(unsigned char *, const fe51 *);
+extern void fe51_mul_portable(fe51 *, const fe51 *, const fe51 *);
+extern void fe51_nsquare_portable(fe51 *, const fe51 *, int);
+
+/*
+Add `lhs` and `rhs` into `z`
+*/
+static inline void fe51_add(fe51 *z, const fe51 *lhs, const fe51 *rhs)
+{
+  for (unsigned int i = 0; i < 5; i++) z->v[i] = lhs->v[i] + rhs->v[i];
+}
+
+/*
+Subtract `rhs` from `lhs` into `z`, by computing `lhs + 4*p - rhs`. The limbs
+of `rhs` must be less than 4*(2^51 - 19), which holds for the outputs of
+`fe51_mul` and `fe51_nsquare`.
+*/
+static inline void fe51_sub(fe51 *z, const fe51 *lhs, const fe51 *rhs)
+{
+  z->v[0] = lhs->v[0] + 0x1FFFFFFFFFFFB4 - rhs->v[0];
+  for (unsigned int i = 1; i < 5; i++) {
+    z->v[i] = lhs->v[i] + 0x1FFFFFFFFFFFFC - rhs->v[i];
+  }
+}
+
+/*
+Carry ripple `z`, s.t. all limbs are less than 2^51 + 2^18
+*/
+static inline void fe51_carry(fe51 *z)
+{
+  uint64_t carry;
+
+  for (unsigned int i = 0; i < 4; i++) {
+    carry = z->v[i] >> 51;
+    z->v[i] &= 0x7FFFFFFFFFFFF;
+    z->v[i + 1] += carry;
+  }
+  carry = z->v[4] >> 51;
+  z->v[4] &= 0x7FFFFFFFFFFFF;
+  z->v[0] += 19 * carry;
+}
+
+/*
+Replace `z` with `src` if `mask` is all ones, keep `z` if `mask` is zero
+*/
+static inline void fe51_cmov(fe51 *z, const fe51 *src, uint64_t mask)
+{
+  for (unsigned int i = 0; i < 5; i++) {
+    z->v[i] = (z->v[i] & ~mask) | (src->v[i] & mask);
+  }
+}
 
 #endif /* CURVE13318_FE51_H_ */
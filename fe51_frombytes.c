@@ -0,0 +1,35 @@
+/*
+Load a bytestring into a field element (fe51)
+
+Like `fe10_frombytes`, this function interprets all 256 bits of the input, so
+the result is the input modulo 2^255 - 19.
+*/
+
+#include "fe51.h"
+
+static uint64_t load_8(const unsigned char *in)
+{
+  uint64_t result = 0;
+  for (unsigned int i = 0; i < 8; i++) {
+    result |= ((uint64_t) in[i]) << (8*i);
+  }
+  return result;
+}
+
+void fe51_frombytes(fe51 *z, const unsigned char *s)
+{
+  const uint64_t mask = 0x7FFFFFFFFFFFF;
+  const uint64_t w0 = load_8(s);
+  const uint64_t w1 = load_8(s + 8);
+  const uint64_t w2 = load_8(s + 16);
+  const uint64_t w3 = load_8(s + 24);
+
+  z->v[0] = w0 & mask;
+  z->v[1] = ((w0 >> 51) | (w1 << 13)) & mask;
+  z->v[2] = ((w1 >> 38) | (w2 << 26)) & mask;
+  z->v[3] = ((w2 >> 25) | (w3 << 39)) & mask;
+  z->v[4] = (w3 >> 12) & mask;
+
+  // Reduce the 2^255 bit, because 2^255 = 19 (mod p)
+  z->v[0] += 19 * (w3 >> 63);
+}
@@ -0,0 +1,229 @@
+/*
+Constant-time inversion modulo 2^255 - 19 with Bernstein-Yang divsteps
+
+This file is adapted from the constant-time part of libsecp256k1's
+modinv64_impl.h ("safegcd"), specialized for p = 2^255 - 19. Elements are
+represented as five signed 62-bit limbs. Ten batches of 59 divsteps, i.e. 590
+divsteps, suffice for every 256-bit input. Like `fe51_invert`, the inverse of
+zero is zero.
+*/
+
+#include "fe51.h"
+
+__extension__ typedef __int128 int128_t;
+
+#define M62 (UINT64_MAX >> 2)
+
+typedef struct {
+    int64_t v[5];
+} signed62;
+
+// Transition matrix of 59 divsteps, scaled by 2^62
+typedef struct {
+    int64_t u, v, q, r;
+} trans2x2;
+
+// p = 2^255 - 19 = -19 + 128 * 2^(4*62)
+static const signed62 modulus = {{-19, 0, 0, 0, 128}};
+
+// p^-1 mod 2^62
+static const uint64_t modulus_inv62 = 0x39435e50d79435e5;
+
+/*
+Do 59 divsteps on the low 62 bits of `f0` and `g0`, starting with
+zeta = -(delta + 1/2); returns the new zeta and stores the transition matrix
+in `t`
+*/
+static int64_t divsteps_59(int64_t zeta, uint64_t f0, uint64_t g0, trans2x2 *t)
+{
+    // The matrix starts as the identity times 8, because 3 + 59 = 62
+    uint64_t u = 8, v = 0, q = 0, r = 8;
+    volatile uint64_t c1, c2;
+    uint64_t mask1, mask2, f = f0, g = g0, x, y, z;
+
+    for (unsigned int i = 3; i < 62; i++) {
+        // mask1 is all ones iff zeta < 0, mask2 is all ones iff g is odd
+        c1 = zeta >> 63;
+        mask1 = c1;
+        c2 = g & 1;
+        mask2 = -c2;
+        // Conditionally negate f, u and v, and add them to g, q and r
+        x = (f ^ mask1) - mask1;
+        y = (u ^ mask1) - mask1;
+        z = (v ^ mask1) - mask1;
+        g += x & mask2;
+        q += y & mask2;
+        r += z & mask2;
+        // If both conditions hold, zeta becomes -zeta - 2 and (g, q, r) is
+        // added to (f, u, v); otherwise zeta becomes zeta - 1
+        mask1 &= mask2;
+        zeta = (zeta ^ (int64_t)mask1) - 1;
+        f += g & mask1;
+        u += q & mask1;
+        v += r & mask1;
+        g >>= 1;
+        u <<= 1;
+        v <<= 1;
+    }
+    t->u = (int64_t)u;
+    t->v = (int64_t)v;
+    t->q = (int64_t)q;
+    t->r = (int64_t)r;
+    return zeta;
+}
+
+/*
+Compute (t * [d, e]) / 2^62 mod p, where multiples of p are added to make the
+division exact. `d` and `e` are kept in (-2p, p).
+*/
+static void update_de_62(signed62 *d, signed62 *e, const trans2x2 *t)
+{
+    const int64_t d0 = d->v[0], d1 = d->v[1], d2 = d->v[2], d3 = d->v[3], d4 = d->v[4];
+    const int64_t e0 = e->v[0], e1 = e->v[1], e2 = e->v[2], e3 = e->v[3], e4 = e->v[4];
+    const int64_t u = t->u, v = t->v, q = t->q, r = t->r;
+    int64_t md, me, sd, se;
+    int128_t cd, ce;
+
+    // Start md and me with the corrections for negative d and e
+    sd = d4 >> 63;
+    se = e4 >> 63;
+    md = (u & sd) + (v & se);
+    me = (q & sd) + (r & se);
+    cd = (int128_t)u * d0 + (int128_t)v * e0;
+    ce = (int128_t)q * d0 + (int128_t)r * e0;
+    // Choose md and me s.t. the bottom 62 bits of t*[d,e] + p*[md,me] are zero
+    md -= (int64_t)((modulus_inv62 * (uint64_t)cd + (uint64_t)md) & M62);
+    me -= (int64_t)((modulus_inv62 * (uint64_t)ce + (uint64_t)me) & M62);
+    cd += (int128_t)modulus.v[0] * md;
+    ce += (int128_t)modulus.v[0] * me;
+    cd >>= 62;
+    ce >>= 62;
+
+    // Limbs 1, 2 and 3 of p are zero
+    cd += (int128_t)u * d1 + (int128_t)v * e1;
+    ce += (int128_t)q * d1 + (int128_t)r * e1;
+    d->v[0] = (int64_t)((uint64_t)cd & M62); cd >>= 62;
+    e->v[0] = (int64_t)((uint64_t)ce & M62); ce >>= 62;
+    cd += (int128_t)u * d2 + (int128_t)v * e2;
+    ce += (int128_t)q * d2 + (int128_t)r * e2;
+    d->v[1] = (int64_t)((uint64_t)cd & M62); cd >>= 62;
+    e->v[1] = (int64_t)((uint64_t)ce & M62); ce >>= 62;
+    cd += (int128_t)u * d3 + (int128_t)v * e3;
+    ce += (int128_t)q * d3 + (int128_t)r * e3;
+    d->v[2] = (int64_t)((uint64_t)cd & M62); cd >>= 62;
+    e->v[2] = (int64_t)((uint64_t)ce & M62); ce >>= 62;
+    cd += (int128_t)u * d4 + (int128_t)v * e4;
+    ce += (int128_t)q * d4 + (int128_t)r * e4;
+    cd += (int128_t)modulus.v[4] * md;
+    ce += (int128_t)modulus.v[4] * me;
+    d->v[3] = (int64_t)((uint64_t)cd & M62); cd >>= 62;
+    e->v[3] = (int64_t)((uint64_t)ce & M62); ce >>= 62;
+    d->v[4] = (int64_t)cd;
+    e->v[4] = (int64_t)ce;
+}
+
+/*
+Compute (t * [f, g]) / 2^62, which is exact by construction of `t`
+*/
+static void update_fg_62(signed62 *f, signed62 *g, const trans2x2 *t)
+{
+    const int64_t f0 = f->v[0], f1 = f->v[1], f2 = f->v[2], f3 = f->v[3], f4 = f->v[4];
+    const int64_t g0 = g->v[0], g1 = g->v[1], g2 = g->v[2], g3 = g->v[3], g4 = g->v[4];
+    const int64_t u = t->u, v = t->v, q = t->q, r = t->r;
+    int128_t cf, cg;
+
+    cf = (int128_t)u * f0 + (int128_t)v * g0;
+    cg = (int128_t)q * f0 + (int128_t)r * g0;
+    cf >>= 62;
+    cg >>= 62;
+    cf += (int128_t)u * f1 + (int128_t)v * g1;
+    cg += (int128_t)q * f1 + (int128_t)r * g1;
+    f->v[0] = (int64_t)((uint64_t)cf & M62); cf >>= 62;
+    g->v[0] = (int64_t)((uint64_t)cg & M62); cg >>= 62;
+    cf += (int128_t)u * f2 + (int128_t)v * g2;
+    cg += (int128_t)q * f2 + (int128_t)r * g2;
+    f->v[1] = (int64_t)((uint64_t)cf & M62); cf >>= 62;
+    g->v[1] = (int64_t)((uint64_t)cg & M62); cg >>= 62;
+    cf += (int128_t)u * f3 + (int128_t)v * g3;
+    cg += (int128_t)q * f3 + (int128_t)r * g3;
+    f->v[2] = (int64_t)((uint64_t)cf & M62); cf >>= 62;
+    g->v[2] = (int64_t)((uint64_t)cg & M62); cg >>= 62;
+    cf += (int128_t)u * f4 + (int128_t)v * g4;
+    cg += (int128_t)q * f4 + (int128_t)r * g4;
+    f->v[3] = (int64_t)((uint64_t)cf & M62); cf >>= 62;
+    g->v[3] = (int64_t)((uint64_t)cg & M62); cg >>= 62;
+    f->v[4] = (int64_t)cf;
+    g->v[4] = (int64_t)cg;
+}
+
+// Carry ripple `r` s.t. limbs 0 to 3 are in [0, 2^62)
+static void carry_62(int64_t r[5])
+{
+    for (unsigned int i = 0; i < 4; i++) {
+        r[i + 1] += r[i] >> 62;
+        r[i] &= (int64_t)M62;
+    }
+}
+
+/*
+Map `r` from (-2p, p) to [0, p), negating it if `sign` is negative
+*/
+static void normalize_62(signed62 *r, int64_t sign)
+{
+    int64_t cond_add, cond_negate;
+
+    // Bring r into (-p, p)
+    cond_add = r->v[4] >> 63;
+    for (unsigned int i = 0; i < 5; i++) r->v[i] += modulus.v[i] & cond_add;
+    cond_negate = sign >> 63;
+    for (unsigned int i = 0; i < 5; i++) r->v[i] = (r->v[i] ^ cond_negate) - cond_negate;
+    carry_62(r->v);
+
+    // Bring r into [0, p)
+    cond_add = r->v[4] >> 63;
+    for (unsigned int i = 0; i < 5; i++) r->v[i] += modulus.v[i] & cond_add;
+    carry_62(r->v);
+}
+
+void fe51_invert_safegcd(fe51 *r, const fe51 *x)
+{
+    uint8_t s[32];
+    uint64_t w[4];
+    signed62 d = {{0, 0, 0, 0, 0}};
+    signed62 e = {{1, 0, 0, 0, 0}};
+    signed62 f = modulus;
+    signed62 g;
+    int64_t zeta = -1;
+
+    // Load the canonical encoding of x into signed 62-bit limbs
+    fe51_pack(s, x);
+    for (unsigned int i = 0; i < 4; i++) {
+        w[i] = 0;
+        for (unsigned int j = 0; j < 8; j++) w[i] |= (uint64_t)s[8*i + j] << (8*j);
+    }
+    g.v[0] = (int64_t)(w[0] & M62);
+    g.v[1] = (int64_t)(((w[0] >> 62) | (w[1] << 2)) & M62);
+    g.v[2] = (int64_t)(((w[1] >> 60) | (w[2] << 4)) & M62);
+    g.v[3] = (int64_t)(((w[2] >> 58) | (w[3] << 6)) & M62);
+    g.v[4] = (int64_t)(w[3] >> 56);
+
+    for (unsigned int i = 0; i < 10; i++) {
+        trans2x2 t;
+        zeta = divsteps_59(zeta, (uint64_t)f.v[0], (uint64_t)g.v[0], &t);
+        update_de_62(&d, &e, &t);
+        update_fg_62(&f, &g, &t);
+    }
+
+    // Now g = 0 and f = +-1 (unless x = 0), so d = +-1/x
+    normalize_62(&d, f.v[4]);
+
+    w[0] = (uint64_t)d.v[0] | ((uint64_t)d.v[1] << 62);
+    w[1] = ((uint64_t)d.v[1] >> 2) | ((uint64_t)d.v[2] << 60);
+    w[2] = ((uint64_t)d.v[2] >> 4) | ((uint64_t)d.v[3] << 58);
+    w[3] = ((uint64_t)d.v[3] >> 6) | ((uint64_t)d.v[4] << 56);
+    r->v[0] = w[0] & 0x7FFFFFFFFFFFF;
+    r->v[1] = ((w[0] >> 51) | (w[1] << 13)) & 0x7FFFFFFFFFFFF;
+    r->v[2] = ((w[1] >> 38) | (w[2] << 26)) & 0x7FFFFFFFFFFFF;
+    r->v[3] = ((w[2] >> 25) | (w[3] << 39)) & 0x7FFFFFFFFFFFF;
+    r->v[4] = w[3] >> 12;
+}
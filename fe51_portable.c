@@ -0,0 +1,77 @@
+/*
+Portable versions of the fe51 routines
+
+These functions compute the same results as the amd64-51 routines in
+fe51_*.S, but are written in C with 128-bit products. The limbs of the inputs
+must be less than 2^54. The outputs of `fe51_mul_portable` and
+`fe51_nsquare_portable` are carried.
+*/
+
+#include "fe51.h"
+
+__extension__ typedef unsigned __int128 uint128_t;
+
+#define MASK51 0x7FFFFFFFFFFFF
+
+void fe51_mul_portable(fe51 *r, const fe51 *x, const fe51 *y)
+{
+  const uint64_t *a = x->v, *b = y->v;
+  const uint64_t b1_19 = 19 * b[1], b2_19 = 19 * b[2];
+  const uint64_t b3_19 = 19 * b[3], b4_19 = 19 * b[4];
+  uint128_t t0, t1, t2, t3, t4;
+
+  t0 = (uint128_t)a[0] * b[0] + (uint128_t)a[1] * b4_19 + (uint128_t)a[2] * b3_19
+     + (uint128_t)a[3] * b2_19 + (uint128_t)a[4] * b1_19;
+  t1 = (uint128_t)a[0] * b[1] + (uint128_t)a[1] * b[0] + (uint128_t)a[2] * b4_19
+     + (uint128_t)a[3] * b3_19 + (uint128_t)a[4] * b2_19;
+  t2 = (uint128_t)a[0] * b[2] + (uint128_t)a[1] * b[1] + (uint128_t)a[2] * b[0]
+     + (uint128_t)a[3] * b4_19 + (uint128_t)a[4] * b3_19;
+  t3 = (uint128_t)a[0] * b[3] + (uint128_t)a[1] * b[2] + (uint128_t)a[2] * b[1]
+     + (uint128_t)a[3] * b[0] + (uint128_t)a[4] * b4_19;
+  t4 = (uint128_t)a[0] * b[4] + (uint128_t)a[1] * b[3] + (uint128_t)a[2] * b[2]
+     + (uint128_t)a[3] * b[1] + (uint128_t)a[4] * b[0];
+
+  t1 += t0 >> 51;
+  t2 += t1 >> 51;
+  t3 += t2 >> 51;
+  t4 += t3 >> 51;
+  t0 = ((uint64_t)t0 & MASK51) + 19 * (t4 >> 51);
+  r->v[1] = ((uint64_t)t1 & MASK51) + (uint64_t)(t0 >> 51);
+  r->v[0] = (uint64_t)t0 & MASK51;
+  r->v[2] = (uint64_t)t2 & MASK51;
+  r->v[3] = (uint64_t)t3 & MASK51;
+  r->v[4] = (uint64_t)t4 & MASK51;
+}
+
+void fe51_nsquare_portable(fe51 *r, const fe51 *x, int n)
+{
+  fe51_mul_portable(r, x, x);
+  for (int i = 1; i < n; i++) fe51_mul_portable(r, r, r);
+}
+
+void fe51_pack_portable(unsigned char *out, const fe51 *x)
+{
+  fe51 t = *x;
+  uint64_t q;
+
+  // Afterwards, t < 2^255 + 19 < 2*p
+  fe51_carry(&t);
+  fe51_carry(&t);
+
+  // q = 1 iff t >= p, then compute t - q*p = t + 19*q - q*2^255
+  q = (t.v[0] + 19) >> 51;
+  for (unsigned int i = 1; i < 5; i++) q = (t.v[i] + q) >> 51;
+  t.v[0] += 19 * q;
+  for (unsigned int i = 0; i < 4; i++) {
+    t.v[i + 1] += t.v[i] >> 51;
+    t.v[i] &= MASK51;
+  }
+  t.v[4] &= MASK51;
+
+  for (unsigned int i = 0; i < 32; i++) {
+    const unsigned int bit = 8 * i, limb = bit / 51, shift = bit % 51;
+    uint64_t byte = t.v[limb] >> shift;
+    if (shift > 43 && limb < 4) byte |= t.v[limb + 1] << (51 - shift);
+    out[i] = (unsigned char)byte;
+  }
+}
@@ -0,0 +1,146 @@
+/*
+Constant-time square roots modulo p = 2^255 - 19
+
+Because p = 5 (mod 8), a candidate root of `a` is r = a^((p + 3) / 8). If
+r^2 = a, then r is a root. If r^2 = -a, then r * sqrt(-1) is a root. Otherwise,
+`a` is not a square. The exponent (p + 3) / 8 = 2^252 - 2 is computed with the
+same addition chain as `fe51_invert`.
+
+`fe51_sqrt_ratio` uses the same fix-up for the quotient of two elements, but it
+additionally handles the non-square case for the simplified SWU map.
+*/
+
+#include "fe51.h"
+
+#define fe51_square(x, y) fe51_nsquare(x, y, 1)
+
+static const fe51 sqrtm1 = {{
+  0x61B274A0EA0B0, 0x0D5A5FC8F189D, 0x7EF5E9CBD0C60, 0x78595A6804C9E, 0x2B8324804FC1D
+}};
+
+static const fe51 one = {{1, 0, 0, 0, 0}};
+
+// (1 - sqrt(-1))^2 = 2 / sqrt(-1) and (1 + sqrt(-1))^2 = -2 / sqrt(-1)
+static const fe51 one_minus_sqrtm1 = {{
+  0x1E4D8B5F15F3E, 0x72A5A0370E762, 0x010A16342F39F, 0x07A6A597FB361, 0x547CDB7FB03E2
+}};
+static const fe51 one_plus_sqrtm1 = {{
+  0x61B274A0EA0B1, 0x0D5A5FC8F189D, 0x7EF5E9CBD0C60, 0x78595A6804C9E, 0x2B8324804FC1D
+}};
+
+// Return 0xFFFF... if `a` and `b` are equal modulo p, 0 otherwise
+static uint64_t fe51_equal_mask(const fe51 *a, const fe51 *b)
+{
+  unsigned char sa[32], sb[32];
+  uint64_t diff = 0;
+  fe51_pack(sa, a);
+  fe51_pack(sb, b);
+  for (unsigned int i = 0; i < 32; i++) diff |= sa[i] ^ sb[i];
+  return -((diff - 1) >> 63);
+}
+
+// Compute r = a^(2^252 - 4), with the same addition chain as `fe51_invert`
+static void fe51_pow2252m4(fe51 *r, const fe51 *a)
+{
+  fe51 z2;
+  fe51 z9;
+  fe51 z11;
+  fe51 z2_5_0;
+  fe51 z2_10_0;
+  fe51 z2_20_0;
+  fe51 z2_50_0;
+  fe51 z2_100_0;
+  fe51 t;
+
+  /* 2 */ fe51_square(&z2,a);
+  /* 4 */ fe51_square(&t,&z2);
+  /* 8 */ fe51_square(&t,&t);
+  /* 9 */ fe51_mul(&z9,&t,a);
+  /* 11 */ fe51_mul(&z11,&z9,&z2);
+  /* 22 */ fe51_square(&t,&z11);
+  /* 2^5 - 2^0 = 31 */ fe51_mul(&z2_5_0,&t,&z9);
+
+  /* 2^10 - 2^5 */ fe51_nsquare(&t,&z2_5_0, 5);
+  /* 2^10 - 2^0 */ fe51_mul(&z2_10_0,&t,&z2_5_0);
+
+  /* 2^20 - 2^10 */ fe51_nsquare(&t,&z2_10_0, 10);
+  /* 2^20 - 2^0 */ fe51_mul(&z2_20_0,&t,&z2_10_0);
+
+  /* 2^40 - 2^20 */ fe51_nsquare(&t,&z2_20_0, 20);
+  /* 2^40 - 2^0 */ fe51_mul(&t,&t,&z2_20_0);
+
+  /* 2^50 - 2^10 */ fe51_nsquare(&t,&t,10);
+  /* 2^50 - 2^0 */ fe51_mul(&z2_50_0,&t,&z2_10_0);
+
+  /* 2^100 - 2^50 */ fe51_nsquare(&t,&z2_50_0, 50);
+  /* 2^100 - 2^0 */ fe51_mul(&z2_100_0,&t,&z2_50_0);
+
+  /* 2^200 - 2^100 */ fe51_nsquare(&t,&z2_100_0, 100);
+  /* 2^200 - 2^0 */ fe51_mul(&t,&t,&z2_100_0);
+
+  /* 2^250 - 2^50 */ fe51_nsquare(&t,&t, 50);
+  /* 2^250 - 2^0 */ fe51_mul(&t,&t,&z2_50_0);
+
+  /* 2^252 - 2^2 */ fe51_nsquare(r,&t,2);
+}
+
+int fe51_sqrt(fe51 *r, const fe51 *a)
+{
+  fe51 t;
+  fe51 check;
+  const fe51 zero = {{0}};
+  uint64_t is_root, is_neg_root;
+
+  /* 2^252 - 4 */ fe51_pow2252m4(&t, a);
+  /* 2^252 - 2 */ fe51_square(&check, a);
+  fe51_mul(r, &t, &check);
+
+  // Fix up the candidate root
+  fe51_square(&check, r);
+  is_root = fe51_equal_mask(&check, a);
+  fe51_add(&t, &check, a);
+  is_neg_root = fe51_equal_mask(&t, &zero);
+  fe51_mul(&t, r, &sqrtm1);
+  fe51_cmov(r, &t, is_neg_root);
+
+  return (int)((is_root | is_neg_root) & 1) - 1;
+}
+
+int fe51_sqrt_ratio(fe51 *r, const fe51 *u, const fe51 *v)
+{
+  fe51 v3, uv7, t, check, factor, neg_u;
+  const fe51 zero = {{0}};
+  uint64_t is_root, is_neg_root, is_i_root, is_neg_i_root;
+
+  // r = u * v^3 * (u * v^7)^((p - 5) / 8), so that v * r^2 = u * chi, where
+  // chi = (u / v)^((p - 1) / 4) is one of 1, -1, sqrt(-1) and -sqrt(-1)
+  fe51_square(&t, v);
+  fe51_mul(&v3, &t, v);
+  fe51_square(&t, &v3);
+  fe51_mul(&t, &t, v);
+  fe51_mul(&uv7, &t, u);
+  /* 2^252 - 4 */ fe51_pow2252m4(&t, &uv7);
+  /* 2^252 - 3 */ fe51_mul(&t, &t, &uv7);
+  fe51_mul(&t, &t, &v3);
+  fe51_mul(r, &t, u);
+
+  fe51_square(&t, r);
+  fe51_mul(&check, &t, v);
+  fe51_sub(&neg_u, &zero, u);
+  fe51_carry(&neg_u);
+  is_root = fe51_equal_mask(&check, u);
+  is_neg_root = fe51_equal_mask(&check, &neg_u);
+  fe51_mul(&t, u, &sqrtm1);
+  is_i_root = fe51_equal_mask(&check, &t);
+  fe51_mul(&t, &neg_u, &sqrtm1);
+  is_neg_i_root = fe51_equal_mask(&check, &t);
+
+  // Multiply r by a square root of 1, -1, 2 / sqrt(-1) or -2 / sqrt(-1)
+  factor = one;
+  fe51_cmov(&factor, &sqrtm1, is_neg_root);
+  fe51_cmov(&factor, &one_minus_sqrtm1, is_i_root);
+  fe51_cmov(&factor, &one_plus_sqrtm1, is_neg_i_root);
+  fe51_mul(r, r, &factor);
+
+  return (int)((is_root | is_neg_root) & 1) - 1;
+}
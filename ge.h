@@ -14,10 +14,19 @@ point on E is represented by its projective coordinates, i.e. (X : Y : Z).
 typedef fe10 ge[3];
 typedef uint32_t ge_opt[32];
 
+// Amount of points that share a single inversion in the batched routines
+#define GE_BATCH_SIZE 64
+
 #define ge_zero crypto_scalarmult_curve13318_avx2_ge_zero
 #define ge_copy crypto_scalarmult_curve13318_avx2_ge_copy
+#define ge_affine_point_on_curve crypto_scalarmult_curve13318_avx2_ge_affine_point_on_curve
 #define ge_frombytes crypto_scalarmult_curve13318_avx2_ge_frombytes
+#define ge_frombytes_compressed crypto_scalarmult_curve13318_avx2_ge_frombytes_compressed
+#define ge_frombytes_projective crypto_scalarmult_curve13318_avx2_ge_frombytes_projective
 #define ge_tobytes crypto_scalarmult_curve13318_avx2_ge_tobytes
+#define ge_tobytes_x crypto_scalarmult_curve13318_avx2_ge_tobytes_x
+#define ge_tobytes_projective crypto_scalarmult_curve13318_avx2_ge_tobytes_projective
+#define ge_tobytes_batch crypto_scalarmult_curve13318_avx2_ge_tobytes_batch
 #define ge_double crypto_scalarmult_curve13318_avx2_ge_double
 #define ge_add crypto_scalarmult_curve13318_avx2_ge_add
 #define ge_double_asm crypto_scalarmult_curve13318_avx2_ge_double_asm
@@ -54,6 +63,46 @@ Returns:
 */
 int ge_frombytes(ge point, const uint8_t *bytes);
 
+/*
+Check if an encoded affine point (x, y) satisfies the curve equation
+
+Uses the fe51 arithmetic. Like `ge_frombytes`, both coordinates are reduced
+modulo p.
+
+Arguments:
+  - bytes   Input bytes (64 bytes)
+Returns:
+  1 if the point is on the curve, 0 otherwise
+*/
+int ge_affine_point_on_curve(const uint8_t *bytes);
+
+/*
+Decompress a 33-byte encoding into a point on the curve
+
+The encoding is a prefix byte (0x02 if y is even, 0x03 if y is odd), followed
+by the 32-byte x-coordinate. The y-coordinate is recovered with a constant-time
+square root, so the resulting point is always on the curve.
+
+Arguments:
+  - point   Output point
+  - bytes   Input bytes (33 bytes)
+Returns:
+  0 on succes, nonzero on failure
+*/
+int ge_frombytes_compressed(ge point, const uint8_t *bytes);
+
+/*
+Load a point from its projective byte representation (X, Y and Z, 32 bytes
+each, see `ge_tobytes_projective`)
+
+The point is *not* validated.
+
+Arguments:
+  - point   Output point
+  - bytes   Input bytes (96 bytes)
+*/
+void ge_frombytes_projective(ge point, const uint8_t *bytes);
+
 /*
 Convert a projective point on the curve to its byte representation
 
@@ -65,6 +114,44 @@ Returns:
 */
 void ge_tobytes(uint8_t *bytes, ge point);
 
+/*
+Store only the affine x-coordinate of a point, as 32 little-endian bytes
+
+This skips the multiplication and the encoding of y in `ge_tobytes`.
+
+Arguments:
+  - bytes   Output bytes (32 bytes)
+  - point   Input point
+Returns:
+  0 on success, -1 if `point` is the point at infinity (`bytes` is then zero)
+*/
+int ge_tobytes_x(uint8_t *bytes, ge point);
+
+/*
+Store a projective point without converting it to affine coordinates
+
+The output consists of the X, Y and Z coordinates, each reduced modulo p and
+stored as 32 little-endian bytes. This skips the inversion in `ge_tobytes`.
+
+Arguments:
+  - bytes   Output bytes (96 bytes)
+  - point   Input point
+*/
+void ge_tobytes_projective(uint8_t *bytes, ge point);
+
+/*
+Convert `n` projective points to their byte representations
+
+Every group of GE_BATCH_SIZE points shares a single inversion (Montgomery's
+trick). Points at infinity are encoded as (0, 0), just like `ge_tobytes`.
+
+Arguments:
+  - bytes   Output bytes (64*n bytes)
+  - points  Input points
+  - n       Amount of points
+*/
+void ge_tobytes_batch(uint8_t *bytes, ge *points, size_t n);
+
 /*
 Add two `point_1` and `point_2` into `out`.
 */
@@ -1,32 +1,37 @@
+#include "fe51.h"
 #include "ge.h"
-#include <stdbool.h>
 
-static bool ge_affine_point_on_curve(ge p)
+// Compute the right-hand side of the curve equation, x^3 - 3*x + 13318
+static void curve_rhs(fe51 *rhs, const fe51 *x)
 {
-    // TODO(dsprenkels) Use fe51 arithmetic here
+    fe51 x2, x3, t;
 
+    fe51_nsquare(&x2, x, 1);
+    fe51_mul(&x3, &x2, x);
+    fe51_add(&t, x, x);
+    fe51_add(&t, &t, x);
+    fe51_sub(rhs, &x3, &t);
+    rhs->v[0] += CURVE13318_B;
+}
+
+int ge_affine_point_on_curve(const uint8_t *s)
+{
     // Use the general curve equation to check if this point is on the curve
     // y^2 = x^3 - 3*x + 13318
-    uint64_t nonzero = 0;
-    fe10 lhs, rhs, t0;
-    fe10_square(&lhs, &p[1]);   // y^2
-    fe10_square(&t0, &p[0]);    // x^2
-    fe10_mul(&rhs, &t0, &p[0]); // x^3
-    fe10_zero(&t0);             // 0
-    fe10_add2p(&t0);            // 0
-    fe10_sub(&t0, &t0, &p[0]);  // -x
-    fe10_add(&rhs, &rhs, &t0);  // x^3 - x
-    fe10_add(&rhs, &rhs, &t0);  // x^3 - 2*x
-    fe10_add(&rhs, &rhs, &t0);  // x^3 - 3*x
-    fe10_add_b(&rhs);           // x^3 - 3*x + 13318
-    fe10_carry(&rhs);
-    fe10_add2p(&lhs);           // Still y^2
-    fe10_sub(&lhs, &lhs, &rhs); // (==0) or (!=0) mod p
-    fe10_carry(&lhs);
-    fe10_reduce(&lhs);          // 0 or !0
-
-    for (unsigned int i = 0; i < 10; i++) nonzero |= lhs.v[i];
-    return nonzero == 0;
+    fe51 x, y, lhs, rhs;
+    uint8_t lhs_bytes[32], rhs_bytes[32];
+    uint8_t diff = 0;
+
+    fe51_frombytes(&x, &s[0]);
+    fe51_frombytes(&y, &s[32]);
+    fe51_nsquare(&lhs, &y, 1);
+    curve_rhs(&rhs, &x);
+
+    // fe51_pack fully reduces its input, so we can compare the bytes
+    fe51_pack(lhs_bytes, &lhs);
+    fe51_pack(rhs_bytes, &rhs);
+    for (unsigned int i = 0; i < 32; i++) diff |= lhs_bytes[i] ^ rhs_bytes[i];
+    return diff == 0;
 }
 
 int ge_frombytes(ge p, const uint8_t *s)
@@ -39,6 +44,47 @@ int ge_frombytes(ge p, const uint8_t *s)
     for (unsigned int i = 1; i < 10; i++) p[2].v[i] = 0;
 
     // Check if this point is valid
-    if (!ge_affine_point_on_curve(p)) return -1;
+    if (!ge_affine_point_on_curve(s)) return -1;
     return 0;
 }
+
+void ge_frombytes_projective(ge p, const uint8_t *s)
+{
+    fe10_frombytes(&p[0], &s[ 0]);
+    fe10_frombytes(&p[1], &s[32]);
+    fe10_frombytes(&p[2], &s[64]);
+}
+
+int ge_frombytes_compressed(ge p, const uint8_t *s)
+{
+    fe51 x, rhs, y, y_neg;
+    const fe51 zero = {{0}};
+    uint8_t y_bytes[32];
+    uint64_t flip;
+    uint8_t prefix_ok, sign;
+    int err;
+
+    // Prefix must be 0x02 (even y) or 0x03 (odd y)
+    prefix_ok = (s[0] | 1) == 0x03;
+    sign = s[0] & 0x1;
+
+    // y^2 = x^3 - 3*x + 13318
+    fe51_frombytes(&x, &s[1]);
+    curve_rhs(&rhs, &x);
+    err = fe51_sqrt(&y, &rhs);
+
+    // Choose the root with the requested parity
+    fe51_pack(y_bytes, &y);
+    flip = -(uint64_t)((y_bytes[0] & 0x1) ^ sign);
+    fe51_sub(&y_neg, &zero, &y);
+    fe51_cmov(&y, &y_neg, flip);
+    fe51_pack(y_bytes, &y);
+
+    fe10_frombytes(&p[0], &s[1]);
+    fe10_frombytes(&p[1], y_bytes);
+    fe10_one(&p[2]);
+
+    // There is no point with y = 0 on the curve, so we do not have to reject
+    // the non-canonical encoding of y = -0.
+    return (err | (prefix_ok - 1)) ? -1 : 0;
+}
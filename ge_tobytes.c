@@ -1,34 +1,118 @@
 #include "fe51.h"
 #include "ge.h"
 
+// Convert a radix 2^25.5 element into radix 2^51
+static void fe10_into_fe51(fe51 *dest, const fe10 *src)
+{
+    for (size_t i = 0; i < 5; i++) {
+        dest->v[i] = src->v[2*i];
+        dest->v[i] += src->v[2*i + 1] << 26;
+    }
+}
+
+// Return 0xFFFF... if `z` is zero modulo p, 0 otherwise
+static uint64_t fe51_zero_mask(const fe51 *z)
+{
+    uint8_t s[32];
+    uint64_t nonzero = 0;
+    fe51_pack(s, z);
+    for (size_t i = 0; i < 32; i++) nonzero |= s[i];
+    return -((nonzero - 1) >> 63);
+}
+
 void ge_tobytes(uint8_t *s, ge p)
 {
     /*
     This function actually deals with the point at infinity, encoded as (0, 0).
     Namely, if `z` (`p[2]`) is zero, because of the implementation of
-    `fe10_invert`, `z_inverse` will also be 0. And so, the coordinates that are
-    encoded into `s` are 0.
+    `fe51_invert_affine`, `z_inverse` will also be 0. And so, the coordinates
+    that are encoded into `s` are 0.
     */
     fe51 x_projective, y_projective, z_projective, z_inverse, x_affine, y_affine;
 
-    for (size_t i = 0; i < 5; i++) {
-        x_projective.v[i] = p[0].v[2*i];
-        x_projective.v[i] += p[0].v[2*i + 1] << 26;
-    }
-    for (size_t i = 0; i < 5; i++) {
-        y_projective.v[i] = p[1].v[2*i];
-        y_projective.v[i] += p[1].v[2*i + 1] << 26;
-    }
-    for (size_t i = 0; i < 5; i++) {
-        z_projective.v[i] = p[2].v[2*i];
-        z_projective.v[i] += p[2].v[2*i + 1] << 26;
-    }
+    fe10_into_fe51(&x_projective, &p[0]);
+    fe10_into_fe51(&y_projective, &p[1]);
+    fe10_into_fe51(&z_projective, &p[2]);
 
     // Convert to affine coordinates
-    fe51_invert(&z_inverse, &z_projective);
+    fe51_invert_affine(&z_inverse, &z_projective);
     fe51_mul(&x_affine, &x_projective, &z_inverse);
     fe51_mul(&y_affine, &y_projective, &z_inverse);
 
     fe51_pack(&s[ 0], &x_affine);
     fe51_pack(&s[32], &y_affine);
 }
+
+int ge_tobytes_x(uint8_t *s, ge p)
+{
+    fe51 x_projective, z_projective, z_inverse, x_affine;
+
+    fe10_into_fe51(&x_projective, &p[0]);
+    fe10_into_fe51(&z_projective, &p[2]);
+
+    fe51_invert_affine(&z_inverse, &z_projective);
+    fe51_mul(&x_affine, &x_projective, &z_inverse);
+    fe51_pack(s, &x_affine);
+
+    // G has x = 0 as well, so the point at infinity must be detected by its Z
+    return -(int)(fe51_zero_mask(&z_projective) & 1);
+}
+
+void ge_tobytes_projective(uint8_t *s, ge p)
+{
+    fe51 t;
+
+    for (size_t i = 0; i < 3; i++) {
+        fe10_into_fe51(&t, &p[i]);
+        fe51_pack(&s[32*i], &t);
+    }
+}
+
+static void ge_tobytes_batch_chunk(uint8_t *s, ge *p, size_t n)
+{
+    /*
+    Montgomery's trick: invert the product of all the `z` coordinates and
+    peel off the individual inverses. A point at infinity would zero the whole
+    product, so its `z` is replaced by 1 and its inverse is cleared afterwards,
+    which yields the same (0, 0) encoding as `ge_tobytes`.
+    */
+    fe51 z[GE_BATCH_SIZE], acc[GE_BATCH_SIZE];
+    uint64_t zero_mask[GE_BATCH_SIZE];
+    fe51 inv, z_inverse, x_projective, y_projective, x_affine, y_affine;
+
+    for (size_t i = 0; i < n; i++) {
+        fe10_into_fe51(&z[i], &p[i][2]);
+        zero_mask[i] = fe51_zero_mask(&z[i]);
+        for (size_t j = 0; j < 5; j++) z[i].v[j] &= ~zero_mask[i];
+        z[i].v[0] |= 1 & zero_mask[i];
+    }
+
+    acc[0] = z[0];
+    for (size_t i = 1; i < n; i++) fe51_mul(&acc[i], &acc[i - 1], &z[i]);
+    fe51_invert_affine(&inv, &acc[n - 1]);
+
+    for (size_t i = n; i-- > 0;) {
+        if (i > 0) {
+            fe51_mul(&z_inverse, &inv, &acc[i - 1]);
+            fe51_mul(&inv, &inv, &z[i]);
+        } else {
+            z_inverse = inv;
+        }
+        for (size_t j = 0; j < 5; j++) z_inverse.v[j] &= ~zero_mask[i];
+
+        fe10_into_fe51(&x_projective, &p[i][0]);
+        fe10_into_fe51(&y_projective, &p[i][1]);
+        fe51_mul(&x_affine, &x_projective, &z_inverse);
+        fe51_mul(&y_affine, &y_projective, &z_inverse);
+        fe51_pack(&s[64*i +  0], &x_affine);
+        fe51_pack(&s[64*i + 32], &y_affine);
+    }
+}
+
+void ge_tobytes_batch(uint8_t *s, ge *p, size_t n)
+{
+    for (size_t i = 0; i < n; i += GE_BATCH_SIZE) {
+        const size_t chunk = n - i < GE_BATCH_SIZE ? n - i : GE_BATCH_SIZE;
+        ge_tobytes_batch_chunk(&s[64*i], &p[i], chunk);
+    }
+}
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# *-* encoding: utf-8 *-*
+"""
+Generate the fixed-base comb table that is used by `crypto_scalarmult_base`.
+
+For every one of the 51 signed 5-bit windows `i` (most significant window
+first) the table contains the 16 points `j * 32^(50 - i) * G` for `j` in
+[1, 16]. An extra point `32^51 * G` takes care of the zeroth window. All
+points are stored as affine points (Z = 1) in the `ge_opt` layout.
+
+This script does not depend on Sage. Usage:
+
+    python3 gen_base_table.py > base_table.c
+"""
+
+P = 2**255 - 19
+B = 13318
+
+# Base point G = (0, sqrt(13318))
+G = (0, 0x11f0805e07f348e1acecac69671189be451d5d4cb07ae0894dc9b0cef76a2bb3)
+
+
+def inverse(a):
+    return pow(a, P - 2, P)
+
+
+def point_add(p1, p2):
+    """Add two affine points, `None` encodes the point at infinity"""
+    if p1 is None:
+        return p2
+    if p2 is None:
+        return p1
+    (x1, y1), (x2, y2) = p1, p2
+    if x1 == x2:
+        if (y1 + y2) % P == 0:
+            return None
+        slope = (3 * x1 * x1 - 3) * inverse(2 * y1) % P
+    else:
+        slope = (y2 - y1) * inverse(x2 - x1) % P
+    x3 = (slope * slope - x1 - x2) % P
+    y3 = (slope * (x1 - x3) - y1) % P
+    return (x3, y3)
+
+
+def point_double(p):
+    return point_add(p, p)
+
+
+def encode_ge_opt(point):
+    """Encode an affine point as 32 radix-2^25.5 limbs (X, Y, Z, padding)"""
+    x, y = point
+    limbs = []
+    for value in (x, y, 1):
+        shift = 0
+        for i in range(10):
+            mask_width = 26 if i % 2 == 0 else 25
+            limbs.append((value >> shift) & (2**mask_width - 1))
+            shift += mask_width
+    return limbs + [0, 0]
+
+
+def format_ge_opt(point, indent):
+    limbs = ['0x{:07X}'.format(limb) for limb in encode_ge_opt(point)]
+    lines = []
+    for i in range(0, 32, 8):
+        lines.append(indent + '    ' + ', '.join(limbs[i:i+8]) + ',')
+    return indent + '{\n' + '\n'.join(lines) + '\n' + indent + '}'
+
+
+def main():
+    print('/*')
+    print('Precomputed comb table for fixed-base scalar multiplication')
+    print('')
+    print('This file is generated by gen_base_table.py. Do not edit.')
+    print('*/')
+    print('')
+    print('#include "base_table.h"')
+    print('')
+
+    # windows[i] = 32^(50 - i) * G
+    windows = [G]
+    for _ in range(51):
+        point = windows[-1]
+        for _ in range(5):
+            point = point_double(point)
+        windows.append(point)
+    top = windows[51]
+    windows = list(reversed(windows[:51]))
+
+    print('__attribute__((aligned(32)))')
+    print('const ge_opt base_table[51][16] = {')
+    for i, base in enumerate(windows):
+        print('    /* 32^{} * G */ {{'.format(50 - i))
+        multiple = base
+        entries = []
+        for j in range(16):
+            entries.append(format_ge_opt(multiple, ' ' * 8))
+            multiple = point_add(multiple, base)
+        print(',\n'.join(entries))
+        print('    },')
+    print('};')
+    print('')
+    print('__attribute__((aligned(32)))')
+    print('const ge_opt base_table_top = {')
+    print(format_ge_opt(top, '')[2:-2])
+    print('};')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# *-* encoding: utf-8 *-*
+"""
+Generate a binary known-answer-test corpus for `kat` (see kat.c).
+
+The expected values are computed with plain Python integers, so this script
+does not depend on Sage. The corpus only has to be generated once; `kat`
+memory-maps it and replays all vectors against the library in bulk. Usage:
+
+    python3 gen_kat.py [--seed SEED] [--scale SCALE] kat.bin
+
+All integers in the corpus are little-endian. The file starts with the magic
+bytes "C13318KT", a uint32 version and a uint32 amount of sections. Every
+section starts with a uint32 type, a uint32 record size and a uint64 amount
+of records, followed by the records:
+
+    type  name             record
+    1     fe51_mul         a (32), b (32), a * b (32)
+    2     fe10_mul         a (32), b (32), a * b (32)
+    3     fe51_invert      a (32), 1 / a (32)
+    4     fe51_sqrt        a (32), 1 if a is a square else 0 (1)
+    5     ge_add           p (64), q (64), p + q (64)
+    6     ge_double        p (64), 2 * p (64)
+    7     validate         p (64), 1 if p is on the curve else 0 (1)
+    8     scalarmult       k (32), p (64), k * p (64), 1 if p is valid else 0 (1)
+    9     scalarmult_base  k (32), k * G (64)
+
+Field elements in the inputs are not necessarily reduced, the outputs are
+fully reduced. The point at infinity is encoded as (0, 0), just like the
+library does.
+"""
+
+import argparse
+import random
+import struct
+
+P = 2**255 - 19
+N = 0x80000000000000000000000000000000f4f654f83deb8d16eb7d12dc4dc2cbe3
+A = -3
+B = 13318
+
+# Base point G = (0, sqrt(13318))
+G = (0, 0x11f0805e07f348e1acecac69671189be451d5d4cb07ae0894dc9b0cef76a2bb3)
+
+MAGIC = b'C13318KT'
+VERSION = 1
+
+# (type, name, record size, default amount of records)
+SECTIONS = [
+    (1, 'fe51_mul', 96, 500000),
+    (2, 'fe10_mul', 96, 500000),
+    (3, 'fe51_invert', 64, 20000),
+    (4, 'fe51_sqrt', 33, 20000),
+    (5, 'ge_add', 192, 50000),
+    (6, 'ge_double', 128, 50000),
+    (7, 'validate', 65, 200000),
+    (8, 'scalarmult', 161, 2000),
+    (9, 'scalarmult_base', 96, 2000),
+]
+
+# Field elements that tend to trigger carry and reduction bugs
+EDGE_FIELD = [0, 1, 2, 19, P - 1, P, P + 1, P + 18, 2**255 - 1, 2**256 - 1,
+              2**51 - 1, 2**51, 2**102 - 1, 2**255 - 20, 2**256 - 38]
+
+# Scalars that tend to trigger bugs in the windowing and recoding
+EDGE_SCALAR = [0, 1, 2, 15, 16, 17, 31, 32, N - 1, N, N + 1, 2**255 - 1,
+               2**256 - 1, 2**255, 2**250 - 1]
+
+
+def inverse(a):
+    """Invert `a` modulo P, the inverse of 0 is 0 (like `fe51_invert`)"""
+    a %= P
+    return pow(a, -1, P) if a != 0 else 0
+
+
+def sqrt(a):
+    """Return a square root of `a` modulo P, or None"""
+    a %= P
+    r = pow(a, (P + 3) // 8, P)
+    if r * r % P != a:
+        r = r * pow(2, (P - 1) // 4, P) % P
+    return r if r * r % P == a else None
+
+
+def on_curve(point):
+    x, y = point
+    return (y * y - x**3 - A * x - B) % P == 0
+
+
+def point_add(p1, p2):
+    """Add two affine points, `None` encodes the point at infinity"""
+    if p1 is None:
+        return p2
+    if p2 is None:
+        return p1
+    (x1, y1), (x2, y2) = p1, p2
+    if x1 == x2:
+        if (y1 + y2) % P == 0:
+            return None
+        slope = (3 * x1 * x1 + A) * inverse(2 * y1) % P
+    else:
+        slope = (y2 - y1) * inverse(x2 - x1) % P
+    x3 = (slope * slope - x1 - x2) % P
+    y3 = (slope * (x1 - x3) - y1) % P
+    return (x3, y3)
+
+
+def jacobian_double(p):
+    """Double a point in Jacobian coordinates, with a = -3"""
+    x, y, z = p
+    if z == 0 or y == 0:
+        return (1, 1, 0)
+    delta = z * z % P
+    gamma = y * y % P
+    beta = x * gamma % P
+    alpha = 3 * (x - delta) * (x + delta) % P
+    x3 = (alpha * alpha - 8 * beta) % P
+    z3 = ((y + z)**2 - gamma - delta) % P
+    y3 = (alpha * (4 * beta - x3) - 8 * gamma * gamma) % P
+    return (x3, y3, z3)
+
+
+def jacobian_add(p1, p2):
+    """Add two points in Jacobian coordinates"""
+    x1, y1, z1 = p1
+    x2, y2, z2 = p2
+    if z1 == 0:
+        return p2
+    if z2 == 0:
+        return p1
+    z1z1 = z1 * z1 % P
+    z2z2 = z2 * z2 % P
+    u1 = x1 * z2z2 % P
+    u2 = x2 * z1z1 % P
+    s1 = y1 * z2 * z2z2 % P
+    s2 = y2 * z1 * z1z1 % P
+    if u1 == u2:
+        return jacobian_double(p1) if s1 == s2 else (1, 1, 0)
+    h = u2 - u1
+    r = s2 - s1
+    hh = h * h % P
+    hhh = h * hh % P
+    v = u1 * hh % P
+    x3 = (r * r - hhh - 2 * v) % P
+    y3 = (r * (v - x3) - s1 * hhh) % P
+    z3 = h * z1 * z2 % P
+    return (x3, y3, z3)
+
+
+def scalarmult(k, point):
+    """Compute k * point like the library does, i.e. ignoring bit 255 of k"""
+    k %= 2**255
+    base = (point[0], point[1], 1)
+    acc = (1, 1, 0)
+    for bit in bin(k)[2:]:
+        acc = jacobian_double(acc)
+        if bit == '1':
+            acc = jacobian_add(acc, base)
+    x, y, z = acc
+    if z == 0:
+        return None
+    z_inv = inverse(z)
+    return (x * z_inv * z_inv % P, y * z_inv**3 % P)
+
+
+def encode_fe(a):
+    return (a % 2**256).to_bytes(32, 'little')
+
+
+def encode_point(point):
+    if point is None:
+        return bytes(64)
+    return encode_fe(point[0] % P) + encode_fe(point[1] % P)
+
+
+class Generator(object):
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        # Random points are generated with a random walk, because square
+        # roots are a lot slower than additions
+        self.walk = self.random_point()
+        self.step = self.random_point()
+
+    def random_point(self):
+        while True:
+            x = self.rng.randrange(P)
+            y = sqrt(x**3 + A * x + B)
+            if y is not None:
+                return (x, y)
+
+    def field(self):
+        """A random (unreduced) 256-bit input, or an edge case"""
+        if self.rng.random() < 1 / 16:
+            return self.rng.choice(EDGE_FIELD)
+        return self.rng.getrandbits(256)
+
+    def scalar(self):
+        if self.rng.random() < 1 / 16:
+            return self.rng.choice(EDGE_SCALAR)
+        return self.rng.getrandbits(256)
+
+    def point(self):
+        """A random valid point"""
+        self.walk = point_add(self.walk, self.step)
+        x, y = self.walk
+        return (x, y if self.rng.getrandbits(1) else P - y)
+
+    def maybe_invalid_point(self):
+        """
+        Return (encoding, point), where `point` is None if the encoding is not
+        a valid point
+        """
+        kind = self.rng.randrange(8)
+        if kind == 0:
+            # Not on the curve
+            x, y = self.point()
+            return encode_fe(x) + encode_fe(y + 1), None
+        if kind == 1:
+            # Random bytes are almost never on the curve
+            encoding = self.rng.getrandbits(512).to_bytes(64, 'little')
+            x = int.from_bytes(encoding[:32], 'little') % P
+            y = int.from_bytes(encoding[32:], 'little') % P
+            return encoding, (x, y) if on_curve((x, y)) else None
+        if kind == 2:
+            # The encoding of the point at infinity is invalid input
+            return bytes(64), None
+        if kind == 3:
+            # Non-canonical, but valid, encodings are reduced modulo p
+            x, y = self.point()
+            if x + P < 2**256:
+                x += P
+            if y + P < 2**256:
+                y += P
+            return encode_fe(x) + encode_fe(y), (x % P, y % P)
+        if kind == 4:
+            return encode_point(G), G
+        point = self.point()
+        return encode_point(point), point
+
+    def fe51_mul(self):
+        a, b = self.field(), self.field()
+        return encode_fe(a) + encode_fe(b) + encode_fe(a * b % P)
+
+    fe10_mul = fe51_mul
+
+    def fe51_invert(self):
+        a = self.field()
+        return encode_fe(a) + encode_fe(inverse(a % P))
+
+    def fe51_sqrt(self):
+        if self.rng.random() < 1 / 16:
+            a = self.rng.choice(EDGE_FIELD)
+            return encode_fe(a) + bytes([sqrt(a) is not None])
+        # 2 is not a square modulo p, so 2 * a^2 is not a square for a != 0
+        a = self.rng.getrandbits(256)
+        if self.rng.getrandbits(1):
+            return encode_fe(a * a % P) + b'\x01'
+        return encode_fe(2 * a * a % P) + bytes([a % P == 0])
+
+    def ge_add(self):
+        p = self.point()
+        kind = self.rng.randrange(8)
+        if kind == 0:
+            q = p
+        elif kind == 1:
+            q = (p[0], P - p[1])
+        else:
+            q = self.point()
+        return encode_point(p) + encode_point(q) + encode_point(point_add(p, q))
+
+    def ge_double(self):
+        p = self.point()
+        return encode_point(p) + encode_point(point_add(p, p))
+
+    def validate(self):
+        encoding, point = self.maybe_invalid_point()
+        return encoding + bytes([point is not None])
+
+    def scalarmult(self):
+        k = self.scalar()
+        encoding, point = self.maybe_invalid_point()
+        if point is None:
+            return encode_fe(k) + encoding + bytes(64) + b'\x00'
+        return encode_fe(k) + encoding + encode_point(scalarmult(k, point)) + b'\x01'
+
+    def scalarmult_base(self):
+        k = self.scalar()
+        return encode_fe(k) + encode_point(scalarmult(k, G))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('output', help='path of the corpus file')
+    parser.add_argument('--seed', type=int, default=13318)
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='multiply the amount of vectors per section')
+    args = parser.parse_args()
+
+    generator = Generator(args.seed)
+    with open(args.output, 'wb') as f:
+        f.write(MAGIC + struct.pack('<II', VERSION, len(SECTIONS)))
+        for kind, name, record_size, count in SECTIONS:
+            count = max(1, int(count * args.scale))
+            make_record = getattr(generator, name)
+            f.write(struct.pack('<IIQ', kind, record_size, count))
+            for start in range(0, count, 4096):
+                records = [make_record() for _ in range(min(4096, count - start))]
+                assert all(len(record) == record_size for record in records)
+                f.write(b''.join(records))
+
+
+if __name__ == '__main__':
+    main()
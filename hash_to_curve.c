@@ -0,0 +1,191 @@
+/*
+Hashing to the curve (RFC 9380) with the simplified SWU map
+
+We implement the suite CURVE13318_XMD:SHA-256_SSWU_RO_: `expand_message_xmd`
+with SHA-256 stretches the message into two field elements, each of them is
+mapped to the curve with the simplified SWU map and the result is the sum of
+both points. The cofactor of the curve is 1, so there is no cofactor clearing.
+
+For this curve, Z = 2 is the constant that is selected by the `find_z_sswu`
+procedure of RFC 9380. The map is the straight-line version of the RFC, where
+the square root of g(x1) or Z * g(x1) is computed by `fe51_sqrt_ratio` with a
+single exponentiation. We do not divide by the denominator of x, but we output
+a projective point, so that the inversions can be shared between many points
+by `ge_tobytes_batch`.
+*/
+
+#include "fe51.h"
+#include "ge.h"
+#include "scalarmult.h"
+#include "sha256.h"
+
+// Length of the output of hash_to_field per field element, ceil((255 + 128) / 8)
+#define HASH_TO_FIELD_BYTES 48
+// Length of the output of `expand_message_xmd` for two field elements
+#define EXPAND_BYTES (2 * HASH_TO_FIELD_BYTES)
+
+static const fe51 zero = {{0}};
+static const fe51 one = {{1, 0, 0, 0, 0}};
+static const fe51 curve_b = {{13318, 0, 0, 0, 0}};
+// 2^256 = 38 (mod p)
+static const fe51 two_256 = {{38, 0, 0, 0, 0}};
+// A * Z = -6
+static const fe51 a_times_z = {{
+    0x7FFFFFFFFFFE7, 0x7FFFFFFFFFFFF, 0x7FFFFFFFFFFFF, 0x7FFFFFFFFFFFF, 0x7FFFFFFFFFFFF
+}};
+
+#define fe51_square(x, y) fe51_nsquare(x, y, 1)
+
+// Return 0xFFFF... if `z` is zero modulo p, 0 otherwise
+static uint64_t fe51_zero_mask(const fe51 *z)
+{
+    uint8_t s[32];
+    uint64_t nonzero = 0;
+    fe51_pack(s, z);
+    for (size_t i = 0; i < 32; i++) nonzero |= s[i];
+    return -((nonzero - 1) >> 63);
+}
+
+// Return the parity of the fully reduced `z` (sgn0 in RFC 9380)
+static uint8_t fe51_sgn0(const fe51 *z)
+{
+    uint8_t s[32];
+    fe51_pack(s, z);
+    return s[0] & 1;
+}
+
+// Compute 3 * z and carry the result
+static void fe51_mul3(fe51 *r, const fe51 *z)
+{
+    fe51 t;
+    fe51_add(&t, z, z);
+    fe51_add(r, &t, z);
+    fe51_carry(r);
+}
+
+// Reduce a big-endian integer of HASH_TO_FIELD_BYTES bytes modulo p
+static void fe51_from_hash(fe51 *r, const uint8_t *s)
+{
+    uint8_t lo[32], hi[32] = {0};
+    fe51 t;
+
+    // Split the integer into lo + 2^256 * hi, both little-endian
+    for (size_t i = 0; i < 32; i++) lo[i] = s[HASH_TO_FIELD_BYTES - 1 - i];
+    for (size_t i = 0; i < HASH_TO_FIELD_BYTES - 32; i++) hi[i] = s[HASH_TO_FIELD_BYTES - 33 - i];
+    fe51_frombytes(r, lo);
+    fe51_frombytes(&t, hi);
+    fe51_mul(&t, &t, &two_256);
+    fe51_add(r, r, &t);
+    fe51_carry(r);
+}
+
+/*
+The simplified SWU map, which writes the projective point (X : Y : Z) to
+`s` (96 bytes)
+*/
+static void map_to_curve(uint8_t *s, const fe51 *u)
+{
+    fe51 tv1, tv2, tv3, tv4, tv5, tv6, x, y, y1, y_neg;
+    uint64_t is_square, flip;
+
+    fe51_square(&tv1, u);
+    fe51_add(&tv1, &tv1, &tv1);
+    fe51_carry(&tv1);
+    fe51_square(&tv2, &tv1);
+    fe51_add(&tv2, &tv2, &tv1);
+    fe51_carry(&tv2);
+    fe51_add(&tv3, &tv2, &one);
+    fe51_mul(&tv3, &tv3, &curve_b);
+    // tv4 = A * -tv2, or A * Z if tv2 = 0
+    fe51_mul3(&tv4, &tv2);
+    fe51_cmov(&tv4, &a_times_z, fe51_zero_mask(&tv2));
+
+    // x1 = tv3 / tv4 and g(x1) = tv2 / tv6
+    fe51_square(&tv2, &tv3);
+    fe51_square(&tv6, &tv4);
+    fe51_mul3(&tv5, &tv6);
+    fe51_sub(&tv2, &tv2, &tv5);
+    fe51_carry(&tv2);
+    fe51_mul(&tv2, &tv2, &tv3);
+    fe51_mul(&tv6, &tv6, &tv4);
+    fe51_mul(&tv5, &tv6, &curve_b);
+    fe51_add(&tv2, &tv2, &tv5);
+    fe51_carry(&tv2);
+
+    // If g(x1) is not a square, then g(x2) is, with x2 = Z * u^2 * x1
+    is_square = -(uint64_t)(fe51_sqrt_ratio(&y1, &tv2, &tv6) + 1);
+    fe51_mul(&x, &tv1, &tv3);
+    fe51_mul(&y, &tv1, u);
+    fe51_mul(&y, &y, &y1);
+    fe51_cmov(&x, &tv3, is_square);
+    fe51_cmov(&y, &y1, is_square);
+
+    // The sign of y must equal the sign of u
+    flip = -(uint64_t)(fe51_sgn0(u) ^ fe51_sgn0(&y));
+    fe51_sub(&y_neg, &zero, &y);
+    fe51_carry(&y_neg);
+    fe51_cmov(&y, &y_neg, flip);
+
+    // (x_num / tv4, y) = (x_num : y * tv4 : tv4)
+    fe51_mul(&y, &y, &tv4);
+    fe51_pack(&s[ 0], &x);
+    fe51_pack(&s[32], &y);
+    fe51_pack(&s[64], &tv4);
+}
+
+// Hash a message into a projective point
+static void hash_to_curve_projective(ge p, const uint8_t *msg, size_t msglen,
+                                     const uint8_t *dst, size_t dstlen)
+{
+    uint8_t uniform[EXPAND_BYTES], s[96];
+    fe51 u;
+    ge q0, q1;
+
+    expand_message_xmd(uniform, sizeof(uniform), &msg, &msglen, 1, dst, dstlen);
+
+    fe51_from_hash(&u, &uniform[0]);
+    map_to_curve(s, &u);
+    ge_frombytes_projective(q0, s);
+
+    fe51_from_hash(&u, &uniform[HASH_TO_FIELD_BYTES]);
+    map_to_curve(s, &u);
+    ge_frombytes_projective(q1, s);
+
+    ge_add(p, q0, q1);
+}
+
+int crypto_scalarmult_hash_to_curve(uint8_t *out, const uint8_t *msg, size_t msglen,
+                                    const uint8_t *dst, size_t dstlen)
+{
+    return crypto_scalarmult_hash_to_curve_batch(out, &msg, &msglen, 1, dst, dstlen);
+}
+
+int crypto_scalarmult_hash_to_curve_batch(uint8_t *out, const uint8_t *const *msgs,
+                                          const size_t *msglens, size_t n,
+                                          const uint8_t *dst, size_t dstlen)
+{
+    ge p[GE_BATCH_SIZE];
+
+    if (dstlen > EXPAND_DST_MAX_BYTES) return -1;
+
+    for (size_t i = 0; i < n; i += GE_BATCH_SIZE) {
+        const size_t chunk = n - i < GE_BATCH_SIZE ? n - i : GE_BATCH_SIZE;
+        for (size_t j = 0; j < chunk; j++) {
+            hash_to_curve_projective(p[j], msgs[i + j], msglens[i + j], dst, dstlen);
+        }
+        ge_tobytes_batch(&out[64*i], p, chunk);
+    }
+    return 0;
+}
+
+void crypto_scalarmult_map_to_curve(uint8_t *out, const uint8_t *in)
+{
+    uint8_t s[96];
+    fe51 u;
+    ge p;
+
+    fe51_frombytes(&u, in);
+    map_to_curve(s, &u);
+    ge_frombytes_projective(p, s);
+    ge_tobytes(out, p);
+}
@@ -0,0 +1,363 @@
+// Replay a known-answer-test corpus that was written by gen_kat.py
+//
+// Usage: kat [--backend NAME] FILE
+//
+// The corpus is memory mapped and every section is checked against the library
+// in one go. For every section we print the amount of vectors, the amount of
+// failures and the time it took. The exit status is 1 if any vector failed.
+//
+//   --backend     Force the scalar multiplication backend (see
+//                 `crypto_scalarmult_force_backend`)
+
+#define _DEFAULT_SOURCE
+
+#include "fe10.h"
+#include "fe51.h"
+#include "ge.h"
+#include "scalarmult.h"
+#include <fcntl.h>
+#include <inttypes.h>
+#include <stdio.h>
+#include <string.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <time.h>
+#include <unistd.h>
+
+#define KAT_VERSION 1
+#define HEADER_BYTES 16
+#define SECTION_HEADER_BYTES 16
+
+// Amount of failures that are printed per section
+#define MAX_REPORTED 5
+// Amount of scalar multiplications per call to `crypto_scalarmult_batch`
+#define SCALARMULT_BATCH 256
+
+typedef size_t (*replay_fn)(const uint8_t *records, size_t n);
+
+typedef struct {
+    uint32_t type;
+    const char *name;
+    uint32_t record_bytes;
+    replay_fn replay;
+} section_kind;
+
+static const char *current_section;
+static size_t reported;
+
+// Report a failed vector, returns 1 for counting
+static size_t fail(size_t index)
+{
+    if (reported++ < MAX_REPORTED) {
+        fprintf(stderr, "%s: vector %zu failed\n", current_section, index);
+    }
+    return 1;
+}
+
+static size_t replay_fe51_mul(const uint8_t *r, size_t n)
+{
+    size_t failures = 0;
+    fe51 a, b, c;
+    uint8_t out[32];
+
+    for (size_t i = 0; i < n; i++, r += 96) {
+        fe51_frombytes(&a, &r[0]);
+        fe51_frombytes(&b, &r[32]);
+        fe51_mul(&c, &a, &b);
+        fe51_pack(out, &c);
+        if (memcmp(out, &r[64], 32) != 0) failures += fail(i);
+    }
+    return failures;
+}
+
+static size_t replay_fe10_mul(const uint8_t *r, size_t n)
+{
+    size_t failures = 0;
+    fe10 a, b, c;
+    uint8_t out[32];
+
+    for (size_t i = 0; i < n; i++, r += 96) {
+        fe10_frombytes(&a, &r[0]);
+        fe10_frombytes(&b, &r[32]);
+        fe10_mul(&c, &a, &b);
+        fe10_tobytes(out, &c);
+        if (memcmp(out, &r[64], 32) != 0) failures += fail(i);
+    }
+    return failures;
+}
+
+static size_t replay_fe51_invert(const uint8_t *r, size_t n)
+{
+    size_t failures = 0;
+    fe51 a, c;
+    uint8_t out[32], out_safegcd[32];
+
+    for (size_t i = 0; i < n; i++, r += 64) {
+        fe51_frombytes(&a, &r[0]);
+        fe51_invert(&c, &a);
+        fe51_pack(out, &c);
+        fe51_invert_safegcd(&c, &a);
+        fe51_pack(out_safegcd, &c);
+        if (memcmp(out, &r[32], 32) != 0 || memcmp(out_safegcd, &r[32], 32) != 0) {
+            failures += fail(i);
+        }
+    }
+    return failures;
+}
+
+static size_t replay_fe51_sqrt(const uint8_t *r, size_t n)
+{
+    size_t failures = 0;
+    fe51 a, root, square;
+    uint8_t a_bytes[32], square_bytes[32];
+
+    for (size_t i = 0; i < n; i++, r += 33) {
+        fe51_frombytes(&a, &r[0]);
+        const int is_square = fe51_sqrt(&root, &a) == 0;
+        if (is_square != r[32]) {
+            failures += fail(i);
+            continue;
+        }
+        if (!is_square) continue;
+        fe51_nsquare(&square, &root, 1);
+        fe51_pack(square_bytes, &square);
+        fe51_pack(a_bytes, &a);
+        if (memcmp(square_bytes, a_bytes, 32) != 0) failures += fail(i);
+    }
+    return failures;
+}
+
+static size_t replay_ge_add(const uint8_t *r, size_t n)
+{
+    size_t failures = 0;
+    ge p, q, sum;
+    uint8_t out[64];
+
+    for (size_t i = 0; i < n; i++, r += 192) {
+        if (ge_frombytes(p, &r[0]) != 0 || ge_frombytes(q, &r[64]) != 0) {
+            failures += fail(i);
+            continue;
+        }
+        ge_add(sum, p, q);
+        ge_tobytes(out, sum);
+        if (memcmp(out, &r[128], 64) != 0) failures += fail(i);
+    }
+    return failures;
+}
+
+static size_t replay_ge_double(const uint8_t *r, size_t n)
+{
+    size_t failures = 0;
+    ge p, doubled;
+    uint8_t out[64];
+
+    for (size_t i = 0; i < n; i++, r += 128) {
+        if (ge_frombytes(p, &r[0]) != 0) {
+            failures += fail(i);
+            continue;
+        }
+        ge_double(doubled, p);
+        ge_tobytes(out, doubled);
+        if (memcmp(out, &r[64], 64) != 0) failures += fail(i);
+    }
+    return failures;
+}
+
+static size_t replay_validate(const uint8_t *r, size_t n)
+{
+    size_t failures = 0;
+    uint8_t points[64*SCALARMULT_BATCH], bitmap[SCALARMULT_BATCH / 8];
+
+    for (size_t start = 0; start < n; start += SCALARMULT_BATCH) {
+        const size_t len = n - start < SCALARMULT_BATCH ? n - start : SCALARMULT_BATCH;
+        for (size_t i = 0; i < len; i++) memcpy(&points[64*i], &r[65*(start + i)], 64);
+        crypto_scalarmult_validate_batch(bitmap, points, len);
+        for (size_t i = 0; i < len; i++) {
+            const int valid = (bitmap[i / 8] >> (i % 8)) & 1;
+            if (valid != r[65*(start + i) + 64]) failures += fail(start + i);
+        }
+    }
+    return failures;
+}
+
+static size_t replay_scalarmult(const uint8_t *r, size_t n)
+{
+    size_t failures = 0;
+    uint8_t keys[32*SCALARMULT_BATCH], points[64*SCALARMULT_BATCH], out[64*SCALARMULT_BATCH];
+
+    for (size_t start = 0; start < n; start += SCALARMULT_BATCH) {
+        const size_t len = n - start < SCALARMULT_BATCH ? n - start : SCALARMULT_BATCH;
+        int all_valid = 1;
+
+        // Replay the single scalar multiplications
+        for (size_t i = 0; i < len; i++) {
+            const uint8_t *record = &r[161*(start + i)];
+            // The output of `crypto_scalarmult` is unspecified for invalid points
+            const int ret = crypto_scalarmult(&out[64*i], &record[0], &record[32]);
+            if (ret != (record[160] ? 0 : -1)
+                    || (record[160] && memcmp(&out[64*i], &record[96], 64) != 0)) {
+                failures += fail(start + i);
+            }
+            memcpy(&keys[32*i], &record[0], 32);
+            memcpy(&points[64*i], &record[32], 64);
+            all_valid &= record[160];
+        }
+
+        // And the same vectors as one batch
+        const int ret = crypto_scalarmult_batch(out, keys, points, len);
+        for (size_t i = 0; i < len; i++) {
+            if (memcmp(&out[64*i], &r[161*(start + i) + 96], 64) != 0) failures += fail(start + i);
+        }
+        if (ret != (all_valid ? 0 : -1)) failures += fail(start);
+    }
+    return failures;
+}
+
+static size_t replay_scalarmult_base(const uint8_t *r, size_t n)
+{
+    size_t failures = 0;
+    uint8_t out[64];
+
+    for (size_t i = 0; i < n; i++, r += 96) {
+        if (crypto_scalarmult_base(out, &r[0]) != 0 || memcmp(out, &r[32], 64) != 0) {
+            failures += fail(i);
+        }
+    }
+    return failures;
+}
+
+static const section_kind kinds[] = {
+    {1, "fe51_mul", 96, replay_fe51_mul},
+    {2, "fe10_mul", 96, replay_fe10_mul},
+    {3, "fe51_invert", 64, replay_fe51_invert},
+    {4, "fe51_sqrt", 33, replay_fe51_sqrt},
+    {5, "ge_add", 192, replay_ge_add},
+    {6, "ge_double", 128, replay_ge_double},
+    {7, "validate", 65, replay_validate},
+    {8, "scalarmult", 161, replay_scalarmult},
+    {9, "scalarmult_base", 96, replay_scalarmult_base},
+};
+
+static uint32_t load_32(const uint8_t *s)
+{
+    uint32_t result = 0;
+    for (unsigned int i = 0; i < 4; i++) result |= (uint32_t)s[i] << (8*i);
+    return result;
+}
+
+static uint64_t load_64(const uint8_t *s)
+{
+    return load_32(s) | ((uint64_t)load_32(&s[4]) << 32);
+}
+
+static double now(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+
+// Replay all sections of a mapped corpus, returns the amount of failures
+static size_t replay(const uint8_t *corpus, size_t size)
+{
+    size_t offset = HEADER_BYTES, total = 0, failures = 0;
+    const uint32_t nsections = load_32(&corpus[12]);
+    const double start = now();
+
+    printf("%-16s %10s %10s %10s\n", "section", "vectors", "failures", "seconds");
+    for (uint32_t s = 0; s < nsections; s++) {
+        const section_kind *kind = NULL;
+
+        if (size - offset < SECTION_HEADER_BYTES) {
+            fprintf(stderr, "truncated section header\n");
+            return failures + 1;
+        }
+        const uint32_t type = load_32(&corpus[offset]);
+        const uint32_t record_bytes = load_32(&corpus[offset + 4]);
+        const uint64_t count = load_64(&corpus[offset + 8]);
+        offset += SECTION_HEADER_BYTES;
+        if (record_bytes == 0 || count > (size - offset) / record_bytes) {
+            fprintf(stderr, "truncated section of type %" PRIu32 "\n", type);
+            return failures + 1;
+        }
+
+        for (size_t i = 0; i < sizeof(kinds) / sizeof(kinds[0]); i++) {
+            if (kinds[i].type == type) kind = &kinds[i];
+        }
+        if (kind == NULL) {
+            // Newer corpora may have sections that we do not know yet
+            fprintf(stderr, "skipping section of unknown type %" PRIu32 "\n", type);
+        } else if (kind->record_bytes != record_bytes) {
+            fprintf(stderr, "%s: records are %" PRIu32 " bytes instead of %" PRIu32 "\n",
+                    kind->name, record_bytes, kind->record_bytes);
+            failures++;
+        } else {
+            const double section_start = now();
+            current_section = kind->name;
+            reported = 0;
+            const size_t section_failures = kind->replay(&corpus[offset], count);
+            printf("%-16s %10" PRIu64 " %10zu %10.3f\n", kind->name, count, section_failures,
+                   now() - section_start);
+            failures += section_failures;
+            total += count;
+        }
+        offset += count * record_bytes;
+    }
+    printf("%-16s %10zu %10zu %10.3f\n", "total", total, failures, now() - start);
+    return failures;
+}
+
+int main(int argc, char *argv[])
+{
+    const char *path = NULL;
+    struct stat st;
+    size_t failures;
+    void *corpus;
+    int fd;
+
+    for (int i = 1; i < argc; i++) {
+        if (i + 1 < argc && strcmp(argv[i], "--backend") == 0) {
+            if (crypto_scalarmult_force_backend(argv[++i]) != 0) {
+                fprintf(stderr, "unknown or unsupported backend: %s\n", argv[i]);
+                return 2;
+            }
+        } else if (path == NULL && argv[i][0] != '-') {
+            path = argv[i];
+        } else {
+            path = NULL;
+            break;
+        }
+    }
+    if (path == NULL) {
+        fprintf(stderr, "usage: %s [--backend NAME] FILE\n", argv[0]);
+        return 2;
+    }
+
+    fd = open(path, O_RDONLY);
+    if (fd < 0 || fstat(fd, &st) != 0) {
+        perror(path);
+        return 1;
+    }
+    if ((size_t)st.st_size < HEADER_BYTES) {
+        fprintf(stderr, "%s: not a KAT corpus\n", path);
+        close(fd);
+        return 1;
+    }
+    corpus = mmap(NULL, (size_t)st.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+    close(fd);
+    if (corpus == MAP_FAILED) {
+        perror(path);
+        return 1;
+    }
+    madvise(corpus, (size_t)st.st_size, MADV_SEQUENTIAL);
+
+    if (memcmp(corpus, "C13318KT", 8) != 0 || load_32((const uint8_t *)corpus + 8) != KAT_VERSION) {
+        fprintf(stderr, "%s: not a KAT corpus of version %d\n", path, KAT_VERSION);
+        munmap(corpus, (size_t)st.st_size);
+        return 1;
+    }
+    printf("backend: %s\n", crypto_scalarmult_backend());
+    failures = replay(corpus, (size_t)st.st_size);
+    munmap(corpus, (size_t)st.st_size);
+    return failures == 0 ? 0 : 1;
+}
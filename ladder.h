@@ -23,8 +23,19 @@ Arguments:
   - q           Output ge element, should be initialized to 𝒪 or P, depending
                 on the zeroth window.
   - windows     51 uint8_t windows
-  - p           Lookup table
+  - p           Lookup table (16 entries)
 */
-void crypto_scalarmult_curve13318_avx2_ladder(ge_opt q, uint8_t windows[51], ge_opt ptable[16]);
+void crypto_scalarmult_curve13318_avx2_ladder(ge_opt q, uint8_t windows[51], const ge_opt *ptable);
+
+/*
+Constant-time lookup in a lookup table, i.e. the `select` macro that is used by
+the ladder
+
+Arguments:
+  - dest        Output ge element (32-byte aligned)
+  - idx         Index in the table, or 0x1F for the neutral element
+  - ptable      Lookup table (16 entries, 32-byte aligned)
+*/
+void crypto_scalarmult_curve13318_avx2_select(ge_opt dest, uint64_t idx, const ge_opt *ptable);
 
 #endif // CURVE13318_LADDER_H_
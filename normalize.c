@@ -0,0 +1,27 @@
+/*
+Conversion of projective scalarmult outputs to the affine 64-byte encoding
+*/
+
+#include "ge.h"
+#include "scalarmult.h"
+
+void crypto_scalarmult_normalize(uint8_t *out, const uint8_t *in)
+{
+    ge p;
+
+    ge_frombytes_projective(p, in);
+    ge_tobytes(out, p);
+}
+
+void crypto_scalarmult_normalize_batch(uint8_t *out, const uint8_t *in, size_t n)
+{
+    ge p[GE_BATCH_SIZE];
+
+    for (size_t i = 0; i < n; i += GE_BATCH_SIZE) {
+        const size_t chunk = n - i < GE_BATCH_SIZE ? n - i : GE_BATCH_SIZE;
+        for (size_t j = 0; j < chunk; j++) {
+            ge_frombytes_projective(p[j], &in[96*(i + j)]);
+        }
+        ge_tobytes_batch(&out[64*i], p, chunk);
+    }
+}
@@ -0,0 +1,25 @@
+/*
+Per-phase cycle profiling of the avx2 scalar multiplication
+*/
+
+#include "profile.h"
+#include <string.h>
+
+int profile_enabled = 0;
+
+__thread scalarmult_profile profile_current;
+
+void crypto_scalarmult_profile_enable(int enable)
+{
+    __atomic_store_n(&profile_enabled, enable != 0, __ATOMIC_RELAXED);
+}
+
+void crypto_scalarmult_profile_get(scalarmult_profile *out)
+{
+    memcpy(out, &profile_current, sizeof(scalarmult_profile));
+}
+
+void crypto_scalarmult_profile_reset(void)
+{
+    memset(&profile_current, 0, sizeof(scalarmult_profile));
+}
@@ -0,0 +1,39 @@
+#ifndef CURVE13318_PROFILE_H_
+#define CURVE13318_PROFILE_H_
+
+#define profile_enabled crypto_scalarmult_curve13318_avx2_profile_enabled
+#define profile_current crypto_scalarmult_curve13318_avx2_profile_current
+
+#include "scalarmult.h"
+#include <inttypes.h>
+#include <x86intrin.h>
+
+// Nonzero if profiling is enabled, see `crypto_scalarmult_profile_enable`
+extern int profile_enabled;
+
+// Profile of the current thread
+extern __thread scalarmult_profile profile_current;
+
+/*
+Start timing a phase
+
+Returns:
+  The current time stamp counter, or 0 if profiling is disabled
+*/
+static inline uint64_t profile_start(void)
+{
+    if (__builtin_expect(!__atomic_load_n(&profile_enabled, __ATOMIC_RELAXED), 1)) return 0;
+    return __rdtsc();
+}
+
+/*
+Stop timing `phase`, which was started at `start` by `profile_start`
+*/
+static inline void profile_stop(unsigned int phase, uint64_t start)
+{
+    if (__builtin_expect(start == 0, 1)) return;
+    profile_current.cycles[phase] += __rdtsc() - start;
+    if (phase == SCALARMULT_PHASE_LADDER) profile_current.calls++;
+}
+
+#endif // CURVE13318_PROFILE_H_
@@ -0,0 +1,227 @@
+/*
+Arithmetic modulo the group order n
+
+Multiplications use Montgomery's method with R = 2^256 (the CIOS variant from
+Koç, Acar and Kaliski, "Analyzing and comparing Montgomery multiplication
+algorithms"). The only conditional operation is the final subtraction of n,
+which is done with masks. A product a * b is computed as
+mont(mont(a, b), R^2 mod n), so scalars never stay in the Montgomery domain
+outside of this file.
+*/
+
+#include "sc.h"
+#include "scalarmult.h"
+
+__extension__ typedef unsigned __int128 uint128_t;
+
+// The group order n
+static const uint64_t order[4] = {
+    0xeb7d12dc4dc2cbe3, 0xf4f654f83deb8d16, 0x0000000000000000, 0x8000000000000000
+};
+// n - 2, the exponent for inverting with Fermat's little theorem
+static const uint64_t order_minus_2[4] = {
+    0xeb7d12dc4dc2cbe1, 0xf4f654f83deb8d16, 0x0000000000000000, 0x8000000000000000
+};
+// -n^-1 mod 2^64
+static const uint64_t order_inv = 0x62ed854dc2232e35;
+// R^2 mod n
+static const sc r2 = {{
+    0x92b0f01ab16399ef, 0x64dd34afa710b4bb, 0xd39604ff319863e0, 0x2999fc027d4f7c05
+}};
+// R mod n, i.e. 1 in the Montgomery domain
+static const sc r1 = {{
+    0x1482ed23b23d341d, 0x0b09ab07c21472e9, 0xffffffffffffffff, 0x7fffffffffffffff
+}};
+
+static void load64(uint64_t *r, const uint8_t *s)
+{
+    *r = 0;
+    for (unsigned int i = 0; i < 8; i++) *r |= (uint64_t)s[i] << (8*i);
+}
+
+/*
+Reduce carry * 2^256 + a, which must be smaller than 2n, to the range [0, n)
+*/
+static void sc_reduce_once(sc *r, const uint64_t *a, uint64_t carry)
+{
+    uint64_t d[4], borrow = 0, mask;
+
+    for (unsigned int i = 0; i < 4; i++) {
+        const uint128_t t = (uint128_t)a[i] - order[i] - borrow;
+        d[i] = (uint64_t)t;
+        borrow = (uint64_t)(t >> 64) & 1;
+    }
+    // Subtract n if a >= n, i.e. if there is a carry or no borrow
+    mask = -(carry | (borrow ^ 1));
+    for (unsigned int i = 0; i < 4; i++) r->v[i] = (d[i] & mask) | (a[i] & ~mask);
+}
+
+/*
+Compute r = a * b / R (mod n), where a < R and b < n
+*/
+static void sc_montmul(sc *r, const sc *a, const sc *b)
+{
+    uint64_t t[6] = {0};
+
+    for (unsigned int i = 0; i < 4; i++) {
+        uint128_t c = 0;
+        uint64_t m;
+
+        // t += a * b[i]
+        for (unsigned int j = 0; j < 4; j++) {
+            c += (uint128_t)a->v[j] * b->v[i] + t[j];
+            t[j] = (uint64_t)c;
+            c >>= 64;
+        }
+        c += t[4];
+        t[4] = (uint64_t)c;
+        t[5] = (uint64_t)(c >> 64);
+
+        // t = (t + m * n) / 2^64, where m is chosen such that the division
+        // is exact
+        m = t[0] * order_inv;
+        c = (uint128_t)m * order[0] + t[0];
+        c >>= 64;
+        for (unsigned int j = 1; j < 4; j++) {
+            c += (uint128_t)m * order[j] + t[j];
+            t[j - 1] = (uint64_t)c;
+            c >>= 64;
+        }
+        c += t[4];
+        t[3] = (uint64_t)c;
+        t[4] = t[5] + (uint64_t)(c >> 64);
+    }
+    // The result is smaller than 2n
+    sc_reduce_once(r, t, t[4]);
+}
+
+void sc_frombytes(sc *r, const uint8_t *s)
+{
+    uint64_t a[4];
+
+    for (unsigned int i = 0; i < 4; i++) load64(&a[i], &s[8*i]);
+    // 2^256 < 2n
+    sc_reduce_once(r, a, 0);
+}
+
+int sc_frombytes_canonical(sc *r, const uint8_t *s)
+{
+    uint64_t a[4], borrow = 0;
+
+    for (unsigned int i = 0; i < 4; i++) {
+        load64(&a[i], &s[8*i]);
+        const uint128_t t = (uint128_t)a[i] - order[i] - borrow;
+        borrow = (uint64_t)(t >> 64) & 1;
+    }
+    sc_reduce_once(r, a, 0);
+    return borrow ? 0 : -1;
+}
+
+void sc_frombytes64(sc *r, const uint8_t *s)
+{
+    sc lo, hi;
+
+    // s = lo + R * hi, and mont(hi, R^2) = R * hi
+    sc_frombytes(&lo, &s[0]);
+    sc_frombytes(&hi, &s[32]);
+    sc_montmul(&hi, &hi, &r2);
+    sc_add(r, &lo, &hi);
+}
+
+void sc_tobytes(uint8_t *s, const sc *a)
+{
+    for (unsigned int i = 0; i < 4; i++) {
+        for (unsigned int j = 0; j < 8; j++) s[8*i + j] = (uint8_t)(a->v[i] >> (8*j));
+    }
+}
+
+void sc_add(sc *r, const sc *a, const sc *b)
+{
+    uint64_t t[4];
+    uint128_t c = 0;
+
+    for (unsigned int i = 0; i < 4; i++) {
+        c += (uint128_t)a->v[i] + b->v[i];
+        t[i] = (uint64_t)c;
+        c >>= 64;
+    }
+    sc_reduce_once(r, t, (uint64_t)c);
+}
+
+void sc_neg(sc *r, const sc *a)
+{
+    uint64_t t[4], borrow = 0;
+
+    // n - a is in (0, n], reduce it to map n to 0
+    for (unsigned int i = 0; i < 4; i++) {
+        const uint128_t d = (uint128_t)order[i] - a->v[i] - borrow;
+        t[i] = (uint64_t)d;
+        borrow = (uint64_t)(d >> 64) & 1;
+    }
+    sc_reduce_once(r, t, 0);
+}
+
+void sc_mul(sc *r, const sc *a, const sc *b)
+{
+    sc t;
+
+    sc_montmul(&t, a, b);
+    sc_montmul(r, &t, &r2);
+}
+
+void sc_invert(sc *r, const sc *a)
+{
+    static const sc one = {{1, 0, 0, 0}};
+    sc table[16], acc;
+
+    // table[i] = a^i in the Montgomery domain
+    table[0] = r1;
+    sc_montmul(&table[1], a, &r2);
+    for (unsigned int i = 2; i < 16; i++) sc_montmul(&table[i], &table[i - 1], &table[1]);
+
+    // a^(n - 2) with fixed 4-bit windows, the windows only depend on n
+    acc = r1;
+    for (int i = 63; i >= 0; i--) {
+        const unsigned int window = (order_minus_2[i / 16] >> (4 * (i % 16))) & 0xF;
+        for (unsigned int j = 0; j < 4; j++) sc_montmul(&acc, &acc, &acc);
+        if (window != 0) sc_montmul(&acc, &acc, &table[window]);
+    }
+    sc_montmul(r, &acc, &one);
+}
+
+void crypto_scalarmult_scalar_reduce(uint8_t *out, const uint8_t *in)
+{
+    sc r;
+
+    sc_frombytes64(&r, in);
+    sc_tobytes(out, &r);
+}
+
+void crypto_scalarmult_scalar_add(uint8_t *out, const uint8_t *a, const uint8_t *b)
+{
+    sc x, y;
+
+    sc_frombytes(&x, a);
+    sc_frombytes(&y, b);
+    sc_add(&x, &x, &y);
+    sc_tobytes(out, &x);
+}
+
+void crypto_scalarmult_scalar_mul(uint8_t *out, const uint8_t *a, const uint8_t *b)
+{
+    sc x, y;
+
+    sc_frombytes(&x, a);
+    sc_frombytes(&y, b);
+    sc_mul(&x, &x, &y);
+    sc_tobytes(out, &x);
+}
+
+void crypto_scalarmult_scalar_invert(uint8_t *out, const uint8_t *a)
+{
+    sc x;
+
+    sc_frombytes(&x, a);
+    sc_invert(&x, &x);
+    sc_tobytes(out, &x);
+}
@@ -0,0 +1,76 @@
+/*
+Arithmetic modulo the group order
+
+n = 2^255 + 0xf4f654f83deb8d16eb7d12dc4dc2cbe3 is larger than 2^255, so a
+reduced scalar needs all 256 bits. Scalars are represented as four 64-bit limbs
+(little-endian) and are always fully reduced. All functions run in constant
+time, apart from `sc_invert`, whose running time only depends on the (public)
+modulus.
+*/
+
+#ifndef CURVE13318_SC_H_
+#define CURVE13318_SC_H_
+
+#include <stdint.h>
+
+#define sc_frombytes crypto_scalarmult_curve13318_avx2_sc_frombytes
+#define sc_frombytes_canonical crypto_scalarmult_curve13318_avx2_sc_frombytes_canonical
+#define sc_frombytes64 crypto_scalarmult_curve13318_avx2_sc_frombytes64
+#define sc_tobytes crypto_scalarmult_curve13318_avx2_sc_tobytes
+#define sc_add crypto_scalarmult_curve13318_avx2_sc_add
+#define sc_neg crypto_scalarmult_curve13318_avx2_sc_neg
+#define sc_mul crypto_scalarmult_curve13318_avx2_sc_mul
+#define sc_invert crypto_scalarmult_curve13318_avx2_sc_invert
+
+typedef struct {
+    uint64_t v[4];
+} sc;
+
+/*
+Load a 256-bit little-endian integer and reduce it modulo n
+*/
+void sc_frombytes(sc *r, const uint8_t *s);
+
+/*
+Load a 256-bit little-endian integer that must already be reduced
+
+Returns:
+  0 on success, -1 if the integer is not smaller than n (`r` is then
+  reduced anyway)
+*/
+int sc_frombytes_canonical(sc *r, const uint8_t *s);
+
+/*
+Load a 512-bit little-endian integer and reduce it modulo n
+
+The bias of a uniformly random 512-bit input is negligible, so this is the
+function for deriving scalars from hashes.
+*/
+void sc_frombytes64(sc *r, const uint8_t *s);
+
+/*
+Store `a` as a 256-bit little-endian integer (32 bytes)
+*/
+void sc_tobytes(uint8_t *s, const sc *a);
+
+/*
+Compute r = a + b (mod n)
+*/
+void sc_add(sc *r, const sc *a, const sc *b);
+
+/*
+Compute r = -a (mod n)
+*/
+void sc_neg(sc *r, const sc *a);
+
+/*
+Compute r = a * b (mod n)
+*/
+void sc_mul(sc *r, const sc *a, const sc *b);
+
+/*
+Compute r = 1 / a (mod n), the inverse of zero is zero
+*/
+void sc_invert(sc *r, const sc *a);
+
+#endif // CURVE13318_SC_H_
@@ -2,12 +2,166 @@
 #define CURVE13318_SCALARMULT_H_
 
 #define crypto_scalarmult crypto_scalarmult_curve13318_avx2_scalarmult
+#define crypto_scalarmult_base crypto_scalarmult_curve13318_avx2_scalarmult_base
+#define crypto_scalarmult_backend crypto_scalarmult_curve13318_avx2_scalarmult_backend
+#define crypto_scalarmult_force_backend crypto_scalarmult_curve13318_avx2_scalarmult_force_backend
+#define crypto_scalarmult_batch crypto_scalarmult_curve13318_avx2_scalarmult_batch
+#define crypto_scalarmult_prepare crypto_scalarmult_curve13318_avx2_scalarmult_prepare
+#define crypto_scalarmult_prepared crypto_scalarmult_curve13318_avx2_scalarmult_prepared
+#define crypto_scalarmult_cache_init crypto_scalarmult_curve13318_avx2_scalarmult_cache_init
+#define crypto_scalarmult_cached crypto_scalarmult_curve13318_avx2_scalarmult_cached
+#define crypto_scalarmult_table_bytes crypto_scalarmult_curve13318_avx2_scalarmult_table_bytes
+#define crypto_scalarmult_table_build crypto_scalarmult_curve13318_avx2_scalarmult_table_build
+#define crypto_scalarmult_table_load crypto_scalarmult_curve13318_avx2_scalarmult_table_load
+#define crypto_scalarmult_table_open crypto_scalarmult_curve13318_avx2_scalarmult_table_open
+#define crypto_scalarmult_table_close crypto_scalarmult_curve13318_avx2_scalarmult_table_close
+#define crypto_scalarmult_table_find crypto_scalarmult_curve13318_avx2_scalarmult_table_find
+#define crypto_scalarmult_x4 crypto_scalarmult_curve13318_avx2_scalarmult_x4
+#define crypto_scalarmult_projective crypto_scalarmult_curve13318_avx2_scalarmult_projective
+#define crypto_scalarmult_base_projective crypto_scalarmult_curve13318_avx2_scalarmult_base_projective
+#define crypto_scalarmult_normalize crypto_scalarmult_curve13318_avx2_scalarmult_normalize
+#define crypto_scalarmult_normalize_batch crypto_scalarmult_curve13318_avx2_scalarmult_normalize_batch
+#define crypto_scalarmult_double crypto_scalarmult_curve13318_avx2_scalarmult_double
+#define crypto_scalarmult_double_projective crypto_scalarmult_curve13318_avx2_scalarmult_double_projective
+#define crypto_scalarmult_double_vartime crypto_scalarmult_curve13318_avx2_scalarmult_double_vartime
+#define crypto_scalarmult_double_projective_vartime crypto_scalarmult_curve13318_avx2_scalarmult_double_projective_vartime
+#define crypto_scalarmult_vartime crypto_scalarmult_curve13318_avx2_scalarmult_vartime
+#define crypto_scalarmult_projective_vartime crypto_scalarmult_curve13318_avx2_scalarmult_projective_vartime
+#define crypto_scalarmult_multi crypto_scalarmult_curve13318_avx2_scalarmult_multi
+#define crypto_scalarmult_multi_projective crypto_scalarmult_curve13318_avx2_scalarmult_multi_projective
+#define crypto_scalarmult_validate crypto_scalarmult_curve13318_avx2_scalarmult_validate
+#define crypto_scalarmult_validate_batch crypto_scalarmult_curve13318_avx2_scalarmult_validate_batch
+#define crypto_scalarmult_compress crypto_scalarmult_curve13318_avx2_scalarmult_compress
+#define crypto_scalarmult_decompress crypto_scalarmult_curve13318_avx2_scalarmult_decompress
+#define crypto_scalarmult_decompress_batch crypto_scalarmult_curve13318_avx2_scalarmult_decompress_batch
+#define crypto_scalarmult_compressed crypto_scalarmult_curve13318_avx2_scalarmult_compressed
+#define crypto_scalarmult_pool_new crypto_scalarmult_curve13318_avx2_scalarmult_pool_new
+#define crypto_scalarmult_pool_free crypto_scalarmult_curve13318_avx2_scalarmult_pool_free
+#define crypto_scalarmult_pool_threads crypto_scalarmult_curve13318_avx2_scalarmult_pool_threads
+#define crypto_scalarmult_pool_batch crypto_scalarmult_curve13318_avx2_scalarmult_pool_batch
+#define crypto_scalarmult_ecdh crypto_scalarmult_curve13318_avx2_scalarmult_ecdh
+#define crypto_scalarmult_ecdh_compressed crypto_scalarmult_curve13318_avx2_scalarmult_ecdh_compressed
+#define crypto_scalarmult_windowed crypto_scalarmult_curve13318_avx2_scalarmult_windowed
+#define crypto_scalarmult_hash_to_curve crypto_scalarmult_curve13318_avx2_scalarmult_hash_to_curve
+#define crypto_scalarmult_hash_to_curve_batch crypto_scalarmult_curve13318_avx2_scalarmult_hash_to_curve_batch
+#define crypto_scalarmult_map_to_curve crypto_scalarmult_curve13318_avx2_scalarmult_map_to_curve
+#define crypto_scalarmult_scalar_reduce crypto_scalarmult_curve13318_avx2_scalarmult_scalar_reduce
+#define crypto_scalarmult_scalar_add crypto_scalarmult_curve13318_avx2_scalarmult_scalar_add
+#define crypto_scalarmult_scalar_mul crypto_scalarmult_curve13318_avx2_scalarmult_scalar_mul
+#define crypto_scalarmult_scalar_invert crypto_scalarmult_curve13318_avx2_scalarmult_scalar_invert
+#define crypto_scalarmult_schnorr_keypair crypto_scalarmult_curve13318_avx2_scalarmult_schnorr_keypair
+#define crypto_scalarmult_schnorr_sign crypto_scalarmult_curve13318_avx2_scalarmult_schnorr_sign
+#define crypto_scalarmult_schnorr_verify crypto_scalarmult_curve13318_avx2_scalarmult_schnorr_verify
+#define crypto_scalarmult_schnorr_verify_batch crypto_scalarmult_curve13318_avx2_scalarmult_schnorr_verify_batch
+#define crypto_scalarmult_profile_enable crypto_scalarmult_curve13318_avx2_scalarmult_profile_enable
+#define crypto_scalarmult_profile_get crypto_scalarmult_curve13318_avx2_scalarmult_profile_get
+#define crypto_scalarmult_profile_reset crypto_scalarmult_curve13318_avx2_scalarmult_profile_reset
 
 #include <inttypes.h>
+#include <stddef.h>
+
+// Amount of points that are kept in a `scalarmult_cache`
+#define SCALARMULT_CACHE_SIZE 16
+
+// Sizes of the keys and signatures of `crypto_scalarmult_schnorr_*`
+#define SCHNORR_SEEDBYTES 32
+#define SCHNORR_PUBLICKEYBYTES 33
+#define SCHNORR_SECRETKEYBYTES (SCHNORR_SEEDBYTES + SCHNORR_PUBLICKEYBYTES)
+#define SCHNORR_SIGNATUREBYTES (SCHNORR_PUBLICKEYBYTES + 32)
+
+/*
+Opaque handle for a validated point and its precomputed lookup table
+
+Its contents are not part of the API. Create a handle with
+`crypto_scalarmult_prepare`; it stays valid for as long as the caller keeps it
+around.
+*/
+typedef struct {
+    uint32_t table[16][32];
+} __attribute__((aligned(32))) scalarmult_prepared;
+
+/*
+Bounded LRU cache of prepared points, keyed by their 64-byte encoding
+
+Initialize the cache with `crypto_scalarmult_cache_init`. A cache must not be
+used by multiple threads at the same time.
+*/
+typedef struct {
+    scalarmult_prepared entries[SCALARMULT_CACHE_SIZE];
+    uint8_t encodings[SCALARMULT_CACHE_SIZE][64];
+    uint64_t last_used[SCALARMULT_CACHE_SIZE];
+    uint64_t clock;
+    unsigned int count;
+} scalarmult_cache;
+
+// Version of the table file format, see `crypto_scalarmult_table_build`. The
+// files hold `scalarmult_prepared` as is, so the version must change whenever
+// its contents change.
+#define SCALARMULT_TABLE_VERSION 1
+// Size of the header of a table file
+#define SCALARMULT_TABLE_HEADER_BYTES 64
+
+/*
+Entry of a table file: a prepared point and its 64-byte encoding
+*/
+typedef struct {
+    scalarmult_prepared prepared;
+    uint8_t point[64];
+} scalarmult_table_entry;
+
+/*
+Handle for a loaded table file, see `crypto_scalarmult_table_open`
+
+The entries point directly into the loaded file, they are not copied.
+*/
+typedef struct {
+    const scalarmult_table_entry *entries;
+    size_t count;
+    void *map;          // NULL unless opened with `crypto_scalarmult_table_open`
+    size_t map_size;
+} scalarmult_table;
+
+/*
+Phases of a variable-base scalar multiplication, see `scalarmult_profile`
+*/
+enum {
+    SCALARMULT_PHASE_FROMBYTES,     // `ge_frombytes`, including validation
+    SCALARMULT_PHASE_INTO_OPT,      // `ge_into_ge_opt`
+    SCALARMULT_PHASE_PRECOMPUTE,    // computing the lookup table
+    SCALARMULT_PHASE_WINDOWS,       // computing the signed windows of k
+    SCALARMULT_PHASE_LADDER,        // the double-and-add ladder
+    SCALARMULT_PHASE_TOBYTES,       // `ge_tobytes`, including the inversion
+    SCALARMULT_PHASES
+};
+
+/*
+Per-thread cycle counts of the phases of the scalar multiplications that ran
+while profiling was enabled, see `crypto_scalarmult_profile_enable`
+
+`calls` is the amount of ladders that were run. Phases that a function does not
+need (e.g. validation in `crypto_scalarmult_prepared`) are not counted.
+*/
+typedef struct {
+    uint64_t calls;
+    uint64_t cycles[SCALARMULT_PHASES];
+} scalarmult_profile;
+
+/*
+Opaque pool of native worker threads, see `crypto_scalarmult_pool_new`
+*/
+typedef struct scalarmult_pool scalarmult_pool;
 
 /*
 Constant time & lookup scalar multiplication over Curve13318
 
+This function and `crypto_scalarmult_base` run on the fastest backend that is
+supported by the CPU, see `crypto_scalarmult_backend`. The other functions in
+this file use AVX2 code. On a CPU without AVX2 they compute the same results
+with `crypto_scalarmult` and `crypto_scalarmult_base` instead, except for
+`crypto_scalarmult_prepare`, `crypto_scalarmult_prepared` and
+`crypto_scalarmult_table_build`, which then fail, because the prepared tables
+only exist for the AVX2 code.
+
 Arguments:
   - q   Pointer to the output point (64 bytes)
   - k   Pointer to the exponent (32 bytes)
@@ -15,4 +169,687 @@ Arguments:
 */
 int crypto_scalarmult(uint8_t *out, const uint8_t *k, const uint8_t *p);
 
+/*
+Batched version of `crypto_scalarmult`
+
+Computes out[i] = k[i] * p[i] for all i < n. The expensive conversion to affine
+coordinates is shared: every group of GE_BATCH_SIZE (see ge.h) results uses
+one inversion instead of one inversion per result.
+
+Arguments:
+  - q   Pointer to the output points (64*n bytes)
+  - k   Pointer to the exponents (32*n bytes)
+  - p   Pointer to the input points (64*n bytes)
+  - n   Amount of scalar multiplications
+Returns:
+  0 on success, -1 if any of the input points was invalid. The output of an
+  invalid point is set to all zeros.
+*/
+int crypto_scalarmult_batch(uint8_t *out, const uint8_t *k, const uint8_t *p, size_t n);
+
+/*
+Same as `crypto_scalarmult`, but with signed windows of `width` bits
+
+Wider windows need fewer additions, but a larger table, which costs more to
+compute and to scan in every constant-time lookup. `crypto_scalarmult` uses 5
+bits; `timeit` reports the fastest width for the current machine.
+
+Arguments:
+  - out     Pointer to the output point (64 bytes)
+  - k       Pointer to the exponent (32 bytes)
+  - p       Pointer to the input point (64 bytes)
+  - width   Window width, 4, 5 or 6
+Returns:
+  0 on success, -1 if `p` is invalid or if `width` is not supported
+*/
+int crypto_scalarmult_windowed(uint8_t *out, const uint8_t *k, const uint8_t *p,
+                               unsigned int width);
+
+/*
+Constant time fixed-base scalar multiplication over Curve13318
+
+Multiplies the base point G = (0, sqrt(13318)) by `k`, i.e. the point with
+y = 0x11f0805e07f348e1acecac69671189be451d5d4cb07ae0894dc9b0cef76a2bb3. This
+uses a static comb table (see gen_base_table.py), which means that no doublings
+and no table precomputation are needed.
+
+Arguments:
+  - q   Pointer to the output point (64 bytes)
+  - k   Pointer to the exponent (32 bytes)
+Returns:
+  Always 0
+*/
+int crypto_scalarmult_base(uint8_t *out, const uint8_t *k);
+
+/*
+Return the name of the backend that is used by `crypto_scalarmult` and
+`crypto_scalarmult_base`
+
+The backends are:
+  - "avx2"      The AVX2 implementation (needs AVX2)
+  - "fe51_affine"
+                The same algorithm using 64-bit limbs (needs x86-64), with an
+                affine lookup table and mixed additions
+  - "fe51"      Like "fe51_affine", but with a projective lookup table
+  - "portable"  The same algorithm in plain C
+
+When the library is loaded, the first supported backend in this list is
+selected, unless the environment variable CURVE13318_BACKEND names another
+supported backend.
+*/
+const char *crypto_scalarmult_backend(void);
+
+/*
+Use the backend `name` for `crypto_scalarmult` and `crypto_scalarmult_base`
+
+Pass NULL to go back to the fastest supported backend. This function is meant
+for testing and benchmarking. It may be called while other threads use the
+library; calls that already started finish on the previous backend.
+
+Returns:
+  0 on success, -1 if the backend does not exist or is not supported by the CPU
+*/
+int crypto_scalarmult_force_backend(const char *name);
+
+/*
+Enable (nonzero) or disable (zero) per-phase cycle profiling
+
+While profiling is enabled, the avx2 backend adds the time stamp counter deltas
+of every phase to a thread-local `scalarmult_profile`. Other backends are not
+profiled. When profiling is disabled, the only overhead is a load and a branch
+per phase. This setting applies to all threads.
+*/
+void crypto_scalarmult_profile_enable(int enable);
+
+/*
+Copy the profile of the calling thread to `out`
+*/
+void crypto_scalarmult_profile_get(scalarmult_profile *out);
+
+/*
+Reset the profile of the calling thread to zero
+*/
+void crypto_scalarmult_profile_reset(void);
+
+/*
+Compute four independent scalar multiplications at once
+
+Every scalar multiplication runs in its own lane of the AVX2 field arithmetic,
+i.e. out[i] = k[i] * p[i] for i < 4. Like `crypto_scalarmult`, this function
+runs in constant time. The four results share a single inversion.
+
+Arguments:
+  - q   Pointer to the output points (4*64 bytes)
+  - k   Pointer to the exponents (4*32 bytes)
+  - p   Pointer to the input points (4*64 bytes)
+Returns:
+  0 on success, -1 if any of the input points was invalid. The output of an
+  invalid point is set to all zeros.
+*/
+int crypto_scalarmult_x4(uint8_t *out, const uint8_t *k, const uint8_t *p);
+
+/*
+Same as `crypto_scalarmult`, but skips the conversion to affine coordinates
+
+The output is the projective point (X : Y : Z) that is serialized as X, Y and Z,
+each reduced modulo p and stored as 32 little-endian bytes. The point at
+infinity has Z = 0. Use `crypto_scalarmult_normalize` (or its batched variant)
+to convert the output to the 64-byte encoding.
+
+Arguments:
+  - q   Pointer to the output point (96 bytes)
+  - k   Pointer to the exponent (32 bytes)
+  - p   Pointer to the input point (64 bytes)
+Returns:
+  0 on success, -1 if the input point is invalid
+*/
+int crypto_scalarmult_projective(uint8_t *out, const uint8_t *k, const uint8_t *p);
+
+/*
+Same as `crypto_scalarmult_base`, but with a projective (96-byte) output, see
+`crypto_scalarmult_projective`
+*/
+int crypto_scalarmult_base_projective(uint8_t *out, const uint8_t *k);
+
+/*
+Convert a projective (96-byte) point to the affine 64-byte encoding
+
+The input is not validated; it should be the output of one of the
+`*_projective` functions. The point at infinity is encoded as 64 zero bytes.
+
+Arguments:
+  - q   Pointer to the output point (64 bytes)
+  - p   Pointer to the input point (96 bytes)
+*/
+void crypto_scalarmult_normalize(uint8_t *out, const uint8_t *p);
+
+/*
+Convert `n` projective (96-byte) points to the affine 64-byte encoding
+
+Every group of GE_BATCH_SIZE (see ge.h) points shares a single inversion.
+
+Arguments:
+  - q   Pointer to the output points (64*n bytes)
+  - p   Pointer to the input points (96*n bytes)
+  - n   Amount of points
+*/
+void crypto_scalarmult_normalize_batch(uint8_t *out, const uint8_t *p, size_t n);
+
+/*
+Double-scalar multiplication: computes k*P + l*Q
+
+The doublings are shared between both scalars (Straus-Shamir trick), which
+makes this considerably faster than two calls to `crypto_scalarmult`. This
+function runs in constant time.
+
+Arguments:
+  - out Pointer to the output point (64 bytes)
+  - k   Pointer to the first exponent (32 bytes)
+  - p   Pointer to the first input point (64 bytes)
+  - l   Pointer to the second exponent (32 bytes)
+  - q   Pointer to the second input point (64 bytes)
+Returns:
+  0 on success, -1 if any of the input points is invalid
+*/
+int crypto_scalarmult_double(uint8_t *out, const uint8_t *k, const uint8_t *p,
+                             const uint8_t *l, const uint8_t *q);
+
+/*
+Same as `crypto_scalarmult_double`, but with a projective (96-byte) output, see
+`crypto_scalarmult_projective`
+*/
+int crypto_scalarmult_double_projective(uint8_t *out, const uint8_t *k, const uint8_t *p,
+                                        const uint8_t *l, const uint8_t *q);
+
+/*
+Check if `p` is a valid point, i.e. if it lies on the curve
+
+This does the same check as `crypto_scalarmult` does on its input point.
+
+Arguments:
+  - p   Pointer to the input point (64 bytes)
+Returns:
+  0 if the point is valid, -1 otherwise
+*/
+int crypto_scalarmult_validate(const uint8_t *p);
+
+/*
+Validate `n` concatenated points in one call
+
+Bit (i % 8) of `bitmap[i / 8]` is set if the i-th point is valid and cleared
+otherwise.
+
+Arguments:
+  - bitmap  Pointer to the output bitmap ((n + 7) / 8 bytes)
+  - p       Pointer to the input points (64*n bytes)
+  - n       Amount of points
+Returns:
+  0 if all the points are valid, -1 otherwise
+*/
+int crypto_scalarmult_validate_batch(uint8_t *bitmap, const uint8_t *p, size_t n);
+
+/*
+Compress a point into its 33-byte encoding
+
+The compressed encoding is a prefix byte (0x02 if y is even, 0x03 if y is odd)
+followed by the 32-byte x-coordinate. The point at infinity is encoded as 33
+zero bytes. This function does not validate the input point.
+
+Arguments:
+  - q   Pointer to the output point (33 bytes)
+  - p   Pointer to the input point (64 bytes)
+*/
+void crypto_scalarmult_compress(uint8_t *out, const uint8_t *p);
+
+/*
+Decompress a 33-byte encoding into a 64-byte point
+
+The y-coordinate is recovered with a constant-time square root.
+
+Arguments:
+  - q   Pointer to the output point (64 bytes)
+  - p   Pointer to the input point (33 bytes)
+Returns:
+  0 on success, -1 if the input is not a valid compressed point. In that case,
+  the output is set to all zeros.
+*/
+int crypto_scalarmult_decompress(uint8_t *out, const uint8_t *p);
+
+/*
+Decompress `n` concatenated 33-byte encodings into 64-byte points
+
+Returns:
+  0 on success, -1 if any of the inputs was invalid. The output of an invalid
+  input is set to all zeros.
+*/
+int crypto_scalarmult_decompress_batch(uint8_t *out, const uint8_t *p, size_t n);
+
+/*
+Same as `crypto_scalarmult`, but takes a compressed (33-byte) input point
+
+Arguments:
+  - q   Pointer to the output point (64 bytes)
+  - k   Pointer to the exponent (32 bytes)
+  - p   Pointer to the input point (33 bytes)
+Returns:
+  0 on success, -1 if the input point is invalid
+*/
+int crypto_scalarmult_compressed(uint8_t *out, const uint8_t *k, const uint8_t *p);
+
+/*
+Diffie-Hellman key agreement: compute the x-coordinate of k * p
+
+The y-coordinate of the result is never converted to affine coordinates or
+encoded. Use `crypto_scalarmult_ecdh_compressed` if the peer sends compressed
+points.
+
+Arguments:
+  - out Pointer to the output x-coordinate (32 bytes)
+  - k   Pointer to the secret exponent (32 bytes)
+  - p   Pointer to the peer's point (64 bytes)
+Returns:
+  0 on success, -1 if `p` is invalid or if k * p is the point at infinity. In
+  both cases `out` is set to all zeros.
+*/
+int crypto_scalarmult_ecdh(uint8_t *out, const uint8_t *k, const uint8_t *p);
+
+/*
+Same as `crypto_scalarmult_ecdh`, but with a compressed (33-byte) peer point,
+see `crypto_scalarmult_compress`
+*/
+int crypto_scalarmult_ecdh_compressed(uint8_t *out, const uint8_t *k, const uint8_t *p);
+
+/*
+Hash a message to a point on the curve
+
+Implements hash_to_curve from RFC 9380 with the suite
+CURVE13318_XMD:SHA-256_SSWU_RO_, i.e. `expand_message_xmd` with SHA-256 and the
+simplified SWU map with Z = 2. The result does not leak timing information
+about the message, apart from its length.
+
+Arguments:
+  - out     Pointer to the output point (64 bytes)
+  - msg     Pointer to the message
+  - msglen  Length of the message in bytes
+  - dst     Pointer to the domain separation tag
+  - dstlen  Length of the domain separation tag in bytes, at most 255
+Returns:
+  0 on success, -1 if `dst` is too long
+*/
+int crypto_scalarmult_hash_to_curve(uint8_t *out, const uint8_t *msg, size_t msglen,
+                                    const uint8_t *dst, size_t dstlen);
+
+/*
+Hash `n` messages to the curve with the same domain separation tag
+
+Every group of GE_BATCH_SIZE (see ge.h) points shares a single inversion.
+
+Arguments:
+  - out     Pointer to the output points (64*n bytes)
+  - msgs    Array of pointers to the messages
+  - msglens Array of the lengths of the messages
+  - n       Amount of messages
+  - dst     Pointer to the domain separation tag
+  - dstlen  Length of the domain separation tag in bytes, at most 255
+Returns:
+  0 on success, -1 if `dst` is too long
+*/
+int crypto_scalarmult_hash_to_curve_batch(uint8_t *out, const uint8_t *const *msgs,
+                                          const size_t *msglens, size_t n,
+                                          const uint8_t *dst, size_t dstlen);
+
+/*
+Map a field element to the curve with the simplified SWU map
+
+This is map_to_curve from RFC 9380. Its output is not uniformly distributed,
+use `crypto_scalarmult_hash_to_curve` to hash messages.
+
+Arguments:
+  - out Pointer to the output point (64 bytes)
+  - u   Pointer to the field element (32 bytes, little-endian, reduced modulo p)
+*/
+void crypto_scalarmult_map_to_curve(uint8_t *out, const uint8_t *u);
+
+/*
+Reduce a 64-byte little-endian integer modulo the group order n
+
+Scalars modulo n are 32-byte little-endian integers. Because n is slightly
+larger than 2^255, a reduced scalar may have bit 255 set, which
+`crypto_scalarmult` and friends ignore. All the `crypto_scalarmult_scalar_*`
+functions run in constant time.
+
+Arguments:
+  - out Pointer to the output scalar (32 bytes, reduced)
+  - in  Pointer to the input (64 bytes), e.g. the output of a hash function
+*/
+void crypto_scalarmult_scalar_reduce(uint8_t *out, const uint8_t *in);
+
+/*
+Compute a + b (mod n), the inputs may be any 256-bit integers
+*/
+void crypto_scalarmult_scalar_add(uint8_t *out, const uint8_t *a, const uint8_t *b);
+
+/*
+Compute a * b (mod n), the inputs may be any 256-bit integers
+*/
+void crypto_scalarmult_scalar_mul(uint8_t *out, const uint8_t *a, const uint8_t *b);
+
+/*
+Compute 1 / a (mod n), the inverse of zero is zero
+*/
+void crypto_scalarmult_scalar_invert(uint8_t *out, const uint8_t *a);
+
+/*
+Derive a Schnorr key pair from a secret seed
+
+The scheme is Ed25519-like with SHA-256 and compressed points, see schnorr.c.
+The secret key is the seed followed by the public key.
+
+Arguments:
+  - pk      Pointer to the output public key (SCHNORR_PUBLICKEYBYTES bytes)
+  - sk      Pointer to the output secret key (SCHNORR_SECRETKEYBYTES bytes)
+  - seed    Pointer to a uniformly random seed (SCHNORR_SEEDBYTES bytes)
+Returns:
+  Always 0
+*/
+int crypto_scalarmult_schnorr_keypair(uint8_t *pk, uint8_t *sk, const uint8_t *seed);
+
+/*
+Sign a message in constant time
+
+Signatures are deterministic, the nonce is derived from the secret key and the
+message.
+
+Arguments:
+  - sig     Pointer to the output signature (SCHNORR_SIGNATUREBYTES bytes)
+  - msg     Pointer to the message
+  - msglen  Length of the message in bytes
+  - sk      Pointer to the secret key (SCHNORR_SECRETKEYBYTES bytes)
+Returns:
+  Always 0
+*/
+int crypto_scalarmult_schnorr_sign(uint8_t *sig, const uint8_t *msg, size_t msglen,
+                                   const uint8_t *sk);
+
+/*
+Verify a signature
+
+Uses `crypto_scalarmult_double_vartime`, all the inputs are public anyway.
+
+Arguments:
+  - sig     Pointer to the signature (SCHNORR_SIGNATUREBYTES bytes)
+  - msg     Pointer to the message
+  - msglen  Length of the message in bytes
+  - pk      Pointer to the public key (SCHNORR_PUBLICKEYBYTES bytes)
+Returns:
+  0 if the signature is valid, -1 otherwise
+*/
+int crypto_scalarmult_schnorr_verify(const uint8_t *sig, const uint8_t *msg, size_t msglen,
+                                     const uint8_t *pk);
+
+/*
+Verify `n` signatures at once
+
+Checks a random linear combination of all the verification equations with one
+`crypto_scalarmult_multi`, which is a lot faster than `n` separate calls for
+large `n`. Only tells whether all signatures are valid: if not, use
+`crypto_scalarmult_schnorr_verify` to find the invalid ones.
+
+The weights of the linear combination are derived from fresh bytes of the
+operating system's CSPRNG (getrandom) and a hash of the signatures, so they
+can not be predicted by someone who creates the signatures.
+
+Arguments:
+  - sigs    Pointer to the concatenated signatures (SCHNORR_SIGNATUREBYTES*n
+            bytes)
+  - msgs    Array of pointers to the messages
+  - msglens Array of the lengths of the messages
+  - pks     Pointer to the concatenated public keys (SCHNORR_PUBLICKEYBYTES*n
+            bytes)
+  - n       Amount of signatures
+Returns:
+  0 if all the signatures are valid, -1 if any of them is invalid, if `n` is
+  too large, or if memory allocation or the CSPRNG failed
+*/
+int crypto_scalarmult_schnorr_verify_batch(const uint8_t *sigs, const uint8_t *const *msgs,
+                                           const size_t *msglens, const uint8_t *pks, size_t n);
+
+/*
+Validate a point and precompute its lookup table
+
+Arguments:
+  - pp  Pointer to the output handle
+  - p   Pointer to the input point (64 bytes)
+Returns:
+  0 on success, -1 if the input point is invalid or if the CPU does not
+  support AVX2
+*/
+int crypto_scalarmult_prepare(scalarmult_prepared *pp, const uint8_t *p);
+
+/*
+Constant time scalar multiplication with a prepared point
+
+This skips the validation and the table precomputation of `crypto_scalarmult`,
+which is useful when the same (long-lived) point is multiplied many times.
+
+Arguments:
+  - q   Pointer to the output point (64 bytes)
+  - k   Pointer to the exponent (32 bytes)
+  - pp  Pointer to a handle made by `crypto_scalarmult_prepare`
+Returns:
+  0 on success, -1 if the CPU does not support AVX2
+*/
+int crypto_scalarmult_prepared(uint8_t *out, const uint8_t *k, const scalarmult_prepared *pp);
+
+/*
+Empty the cache
+*/
+void crypto_scalarmult_cache_init(scalarmult_cache *cache);
+
+/*
+Same as `crypto_scalarmult`, but looks up `p` in `cache` first
+
+If `p` is in the cache, its validation and table precomputation are skipped.
+Otherwise, `p` is prepared and replaces the least recently used entry. Invalid
+points are never cached. Note that the lookup time depends on whether `p` is in
+the cache, so only use this function with public points.
+
+Arguments:
+  - q       Pointer to the output point (64 bytes)
+  - k       Pointer to the exponent (32 bytes)
+  - p       Pointer to the input point (64 bytes)
+  - cache   Pointer to an initialized cache
+Returns:
+  0 on success, -1 if the input point is invalid
+*/
+int crypto_scalarmult_cached(uint8_t *out, const uint8_t *k, const uint8_t *p, scalarmult_cache *cache);
+
+/*
+Return the size of a table file with `n` points
+*/
+size_t crypto_scalarmult_table_bytes(size_t n);
+
+/*
+Validate `n` points and write a table file with their lookup tables
+
+The file (see scalarmult_table.c for the format) has a versioned header and a
+checksum, and its entries are sorted by the encodings of their points. It is
+meant for long-lived public keys: write it to disk once, and let every process
+load it with `crypto_scalarmult_table_open` instead of recomputing the tables.
+
+Arguments:
+  - out Pointer to the output (`crypto_scalarmult_table_bytes(n)` bytes)
+  - p   Pointer to the input points (64*n bytes)
+  - n   Amount of points
+Returns:
+  0 on success, -1 if any of the points is invalid, if memory allocation
+  failed or if the CPU does not support AVX2
+*/
+int crypto_scalarmult_table_build(uint8_t *out, const uint8_t *p, size_t n);
+
+/*
+Use a table file that is already in memory, without copying it
+
+Checks the header and the checksum. The buffer must stay valid for as long
+as the table is used.
+
+Table files must be trusted like code. Neither the points nor their
+precomputed tables are checked against the curve. The checksum only catches
+accidental corruption. Someone who can modify a table file can replace an
+entry with a point that is not on the curve, or with a lookup table that does
+not belong to its point. The results of `crypto_scalarmult_prepared` for that
+entry can then leak bits of the secret scalar (an invalid-curve attack). Only
+load files that were written by `crypto_scalarmult_table_build` and stored
+where only trusted users can write.
+
+Arguments:
+  - t   Pointer to the output handle
+  - buf Pointer to the file contents (`len` bytes, 32-byte aligned)
+  - len Length of the file in bytes
+Returns:
+  0 on success, -1 if `buf` is not aligned or not a valid table file
+*/
+int crypto_scalarmult_table_load(scalarmult_table *t, const uint8_t *buf, size_t len);
+
+/*
+Memory-map a table file and check it like `crypto_scalarmult_table_load`
+
+The file is mapped read-only and shared, so processes that open the same file
+share its pages. Release the mapping with `crypto_scalarmult_table_close`. The
+file must be trusted like code, see `crypto_scalarmult_table_load`.
+
+Returns:
+  0 on success, -1 if the file can not be mapped or is not a valid table file
+*/
+int crypto_scalarmult_table_open(scalarmult_table *t, const char *path);
+
+/*
+Unmap a table that was opened with `crypto_scalarmult_table_open`
+*/
+void crypto_scalarmult_table_close(scalarmult_table *t);
+
+/*
+Look up the prepared point for `p` (64 bytes) with a binary search
+
+Pass the result to `crypto_scalarmult_prepared`, which skips the validation
+and the table precomputation. The lookup time depends on `p`, which is fine
+for public keys.
+
+Returns:
+  A pointer into the table, or NULL if `p` is not in the table
+*/
+const scalarmult_prepared *crypto_scalarmult_table_find(const scalarmult_table *t,
+                                                        const uint8_t *p);
+
+/*
+Start a pool of worker threads for `crypto_scalarmult_pool_batch`
+
+Arguments:
+  - nthreads    Amount of threads that work on a batch, including the calling
+                thread. If 0, use one thread per online CPU.
+Returns:
+  The new pool, or NULL if the pool could not be created
+*/
+scalarmult_pool *crypto_scalarmult_pool_new(unsigned int nthreads);
+
+/*
+Stop the worker threads and free the pool
+*/
+void crypto_scalarmult_pool_free(scalarmult_pool *pool);
+
+/*
+Return the amount of threads that work on a batch, including the caller
+*/
+unsigned int crypto_scalarmult_pool_threads(const scalarmult_pool *pool);
+
+/*
+Multi-threaded version of `crypto_scalarmult_batch`
+
+The batch is split into chunks of GE_BATCH_SIZE scalar multiplications, which
+are divided over the pool's threads and the calling thread. Calls from
+different threads on the same pool are processed one after another.
+
+Arguments:
+  - pool    Pointer to a pool made by `crypto_scalarmult_pool_new`
+  - q       Pointer to the output points (64*n bytes)
+  - k       Pointer to the exponents (32*n bytes)
+  - p       Pointer to the input points (64*n bytes)
+  - n       Amount of scalar multiplications
+Returns:
+  0 on success, -1 if any of the input points was invalid. The output of an
+  invalid point is set to all zeros.
+*/
+int crypto_scalarmult_pool_batch(scalarmult_pool *pool, uint8_t *out, const uint8_t *k,
+                                 const uint8_t *p, size_t n);
+
+/*
+----------------------------------------------------------------------------
+Variable-time API
+
+The functions below leak their scalars through timing and memory access
+patterns. They are faster than their constant-time counterparts, but must only
+be used with public scalars, e.g. when verifying signatures.
+----------------------------------------------------------------------------
+*/
+
+/*
+Variable-time version of `crypto_scalarmult`
+
+Uses a width-5 NAF recoding of the scalar, skips the additions for the zero
+digits, and indexes the table of odd multiples directly.
+
+Arguments:
+  - q   Pointer to the output point (64 bytes)
+  - k   Pointer to the exponent (32 bytes)
+  - p   Pointer to the input point (64 bytes)
+Returns:
+  0 on success, -1 if the input point is invalid
+*/
+int crypto_scalarmult_vartime(uint8_t *out, const uint8_t *k, const uint8_t *p);
+
+/*
+Variable-time version of `crypto_scalarmult_projective`
+*/
+int crypto_scalarmult_projective_vartime(uint8_t *out, const uint8_t *k, const uint8_t *p);
+
+/*
+Variable-time version of `crypto_scalarmult_double`
+
+Skips the additions of zero windows and uses direct table lookups. Only use
+this function if `k` and `l` are public, e.g. when verifying a signature.
+*/
+int crypto_scalarmult_double_vartime(uint8_t *out, const uint8_t *k, const uint8_t *p,
+                                     const uint8_t *l, const uint8_t *q);
+
+/*
+Variable-time version of `crypto_scalarmult_double_projective`
+*/
+int crypto_scalarmult_double_projective_vartime(uint8_t *out, const uint8_t *k, const uint8_t *p,
+                                                const uint8_t *l, const uint8_t *q);
+
+/*
+Multi-scalar multiplication: computes sum(k[i] * p[i]) for all i < n
+
+Uses Straus' method for small `n` and Pippenger's bucket method for large `n`,
+the crossover is selected automatically. This function allocates its working
+memory on the heap and does *not* run in constant time, so it must only be
+used with public scalars, e.g. for batch signature verification.
+
+Arguments:
+  - out Pointer to the output point (64 bytes)
+  - k   Pointer to the exponents (32*n bytes)
+  - p   Pointer to the input points (64*n bytes)
+  - n   Amount of points
+Returns:
+  0 on success, -1 if any of the input points is invalid or if memory
+  allocation failed
+*/
+int crypto_scalarmult_multi(uint8_t *out, const uint8_t *k, const uint8_t *p, size_t n);
+
+/*
+Same as `crypto_scalarmult_multi`, but with a projective (96-byte) output, see
+`crypto_scalarmult_projective`
+*/
+int crypto_scalarmult_multi_projective(uint8_t *out, const uint8_t *k, const uint8_t *p, size_t n);
+
 #endif // CURVE13318_SCALARMULT_H_
@@ -0,0 +1,409 @@
+/*
+Constant-time scalar multiplication on radix 2^51 field elements
+
+This file is a template that is shared by the fe51 and the portable backend.
+It does the same computation as the AVX2 implementation: the same signed 5-bit
+windows, the same 16-entry lookup table and the same Renes-Costello-Batina
+formulas, but every coordinate is a single fe51. Before including this file,
+define:
+
+  - FE51_MUL(r, x, y)       Field multiplication (limbs of x and y < 2^54)
+  - FE51_NSQUARE(r, x, n)   Square x for n times
+  - FE51_PACK(s, x)         Fully reduce and encode x into 32 bytes
+  - SCALARMULT51            Name of the function that is defined
+
+Optionally, define SCALARMULT51_AFFINE to normalize the lookup table to Z = 1
+(with one inversion) and to use the Renes-Costello-Batina mixed addition in the
+ladder. This saves a multiplication per addition and makes every table entry a
+third smaller, at the cost of 77 multiplications and an inversion per call.
+
+The coordinates of all points are kept carried (see `fe51_carry`).
+*/
+
+#include "consts.h"
+#include "fe51.h"
+#include "window.h"
+
+// One projective point
+typedef fe51 ge51[3];
+
+// Multiply two carried elements and carry the result
+static void fe_mul(fe51 *z, const fe51 *lhs, const fe51 *rhs)
+{
+    FE51_MUL(z, lhs, rhs);
+    fe51_carry(z);
+}
+
+// Square a carried element and carry the result
+static void fe_square(fe51 *z, const fe51 *element)
+{
+    FE51_NSQUARE(z, element, 1);
+    fe51_carry(z);
+}
+
+// Compute `lhs - rhs` and carry the result, `rhs` may be the sum of two
+// carried elements
+static void fe_sub(fe51 *z, const fe51 *lhs, const fe51 *rhs)
+{
+    fe51_sub(z, lhs, rhs);
+    fe51_carry(z);
+}
+
+// Multiply a carried element by 13318 and carry the result
+static void fe_mul_b(fe51 *z, const fe51 *element)
+{
+    static const fe51 b = {{CURVE13318_B, 0, 0, 0, 0}};
+    fe_mul(z, element, &b);
+}
+
+static void fe_invert(fe51 *r, const fe51 *x)
+{
+    fe51 z2, z9, z11, z2_5_0, z2_10_0, z2_20_0, z2_50_0, z2_100_0, t;
+
+    // Same addition chain as `fe51_invert`
+    fe_square(&z2, x);
+    FE51_NSQUARE(&t, &z2, 2); fe51_carry(&t);
+    fe_mul(&z9, &t, x);
+    fe_mul(&z11, &z9, &z2);
+    fe_square(&t, &z11);
+    fe_mul(&z2_5_0, &t, &z9);
+    FE51_NSQUARE(&t, &z2_5_0, 5); fe51_carry(&t);
+    fe_mul(&z2_10_0, &t, &z2_5_0);
+    FE51_NSQUARE(&t, &z2_10_0, 10); fe51_carry(&t);
+    fe_mul(&z2_20_0, &t, &z2_10_0);
+    FE51_NSQUARE(&t, &z2_20_0, 20); fe51_carry(&t);
+    fe_mul(&t, &t, &z2_20_0);
+    FE51_NSQUARE(&t, &t, 10); fe51_carry(&t);
+    fe_mul(&z2_50_0, &t, &z2_10_0);
+    FE51_NSQUARE(&t, &z2_50_0, 50); fe51_carry(&t);
+    fe_mul(&z2_100_0, &t, &z2_50_0);
+    FE51_NSQUARE(&t, &z2_100_0, 100); fe51_carry(&t);
+    fe_mul(&t, &t, &z2_100_0);
+    FE51_NSQUARE(&t, &t, 50); fe51_carry(&t);
+    fe_mul(&t, &t, &z2_50_0);
+    FE51_NSQUARE(&t, &t, 5); fe51_carry(&t);
+    fe_mul(r, &t, &z11);
+}
+
+static void ge51_add(ge51 p3, ge51 p1, ge51 p2)
+{
+    fe51 x3, y3, z3, t0, t1, t2, t3, t4;
+
+    /*   #: Instruction number as mentioned in the paper */
+             fe_mul(&t0, &p1[0], &p2[0]);
+             fe_mul(&t1, &p1[1], &p2[1]);
+             fe_mul(&t2, &p1[2], &p2[2]);
+             fe51_add(&t3, &p1[0], &p1[1]);
+    /*  5 */ fe51_add(&t4, &p2[0], &p2[1]);
+             fe_mul(&t3, &t3, &t4);
+             fe51_add(&t4, &t0, &t1);
+             fe_sub(&t3, &t3, &t4);
+             fe51_add(&t4, &p1[1], &p1[2]);
+    /* 10 */ fe51_add(&x3, &p2[1], &p2[2]);
+             fe_mul(&t4, &t4, &x3);
+             fe51_add(&x3, &t1, &t2);
+             fe_sub(&t4, &t4, &x3);
+             fe51_add(&x3, &p1[0], &p1[2]);
+    /* 15 */ fe51_add(&y3, &p2[0], &p2[2]);
+             fe_mul(&x3, &x3, &y3);
+             fe51_add(&y3, &t0, &t2);
+             fe_sub(&y3, &x3, &y3);
+             fe_mul_b(&z3, &t2);
+    /* 20 */ fe_sub(&x3, &y3, &z3);
+             fe51_add(&z3, &x3, &x3);
+             fe51_add(&x3, &x3, &z3); fe51_carry(&x3);
+             fe_sub(&z3, &t1, &x3);
+             fe51_add(&x3, &t1, &x3);
+    /* 25 */ fe_mul_b(&y3, &y3);
+             fe51_add(&t1, &t2, &t2);
+             fe51_add(&t2, &t1, &t2); fe51_carry(&t2);
+             fe_sub(&y3, &y3, &t2);
+             fe_sub(&y3, &y3, &t0);
+    /* 30 */ fe51_add(&t1, &y3, &y3);
+             fe51_add(&y3, &t1, &y3); fe51_carry(&y3);
+             fe51_add(&t1, &t0, &t0);
+             fe51_add(&t0, &t1, &t0); fe51_carry(&t0);
+             fe_sub(&t0, &t0, &t2);
+    /* 35 */ fe_mul(&t1, &t4, &y3);
+             fe_mul(&t2, &t0, &y3);
+             fe_mul(&y3, &x3, &z3);
+             fe51_add(&p3[1], &y3, &t2);
+             fe_mul(&x3, &x3, &t3);
+    /* 40 */ fe_sub(&p3[0], &x3, &t1);
+             fe_mul(&z3, &z3, &t4);
+             fe_mul(&t1, &t3, &t0);
+             fe51_add(&p3[2], &z3, &t1);
+
+    fe51_carry(&p3[1]);
+    fe51_carry(&p3[2]);
+}
+
+static void ge51_double(ge51 p3, ge51 p)
+{
+    fe51 x3, y3, z3, t0, t1, t2, t3;
+
+    /*   #: Instruction number as mentioned in the paper */
+             fe_square(&t0, &p[0]);
+             fe_square(&t1, &p[1]);
+             fe_square(&t2, &p[2]);
+             fe_mul(&t3, &p[0], &p[1]);
+    /*  5 */ fe51_add(&t3, &t3, &t3);
+             fe_mul(&z3, &p[0], &p[2]);
+             fe51_add(&z3, &z3, &z3); fe51_carry(&z3);
+             fe_mul_b(&y3, &t2);
+             fe_sub(&y3, &y3, &z3);
+    /* 10 */ fe51_add(&x3, &y3, &y3);
+             fe51_add(&y3, &x3, &y3); fe51_carry(&y3);
+             fe_sub(&x3, &t1, &y3);
+             fe51_add(&y3, &t1, &y3);
+             fe_mul(&y3, &x3, &y3);
+    /* 15 */ fe_mul(&x3, &x3, &t3);
+             fe51_add(&t3, &t2, &t2);
+             fe51_add(&t2, &t2, &t3); fe51_carry(&t2);
+             fe_mul_b(&z3, &z3);
+             fe_sub(&z3, &z3, &t2);
+    /* 20 */ fe_sub(&z3, &z3, &t0);
+             fe51_add(&t3, &z3, &z3);
+             fe51_add(&z3, &z3, &t3); fe51_carry(&z3);
+             fe51_add(&t3, &t0, &t0);
+             fe51_add(&t0, &t3, &t0); fe51_carry(&t0);
+    /* 25 */ fe_sub(&t0, &t0, &t2);
+             fe_mul(&t0, &t0, &z3);
+             fe51_add(&y3, &y3, &t0);
+             fe_mul(&t0, &p[1], &p[2]);
+             fe51_add(&t0, &t0, &t0);
+    /* 30 */ fe_mul(&z3, &t0, &z3);
+             fe_sub(&p3[0], &x3, &z3);
+             fe_mul(&z3, &t0, &t1);
+             fe51_add(&z3, &z3, &z3);
+             fe51_add(&p3[2], &z3, &z3);
+
+    p3[1] = y3;
+    fe51_carry(&p3[1]);
+    fe51_carry(&p3[2]);
+}
+
+static void ge51_cmov(ge51 dest, ge51 src, uint64_t mask)
+{
+    for (unsigned int c = 0; c < 3; c++) fe51_cmov(&dest[c], &src[c], mask);
+}
+
+#ifndef SCALARMULT51_AFFINE
+
+// Constant-time lookup of the signed window `bits`, like `window_select`
+static void ge51_select(ge51 dest, uint8_t bits, ge51 *table)
+{
+    const fe51 zero = {{0}};
+    const uint32_t sign = (bits >> 4) & 0x1;
+    const uint32_t sm = -sign;
+    const uint32_t idx = (((bits - 1) & ~sm) | (~bits & sm)) & 0x1F;
+    fe51 y_neg;
+
+    for (unsigned int c = 0; c < 3; c++) dest[c] = zero;
+    dest[1].v[0] = idx == 0x1F;
+    for (unsigned int j = 0; j < 16; j++) {
+        ge51_cmov(dest, table[j], -(uint64_t)(idx == j));
+    }
+    fe_sub(&y_neg, &zero, &dest[1]);
+    fe51_cmov(&dest[1], &y_neg, -(uint64_t)sign);
+}
+
+#endif // !SCALARMULT51_AFFINE
+
+// Compute the table [P, 2P, ..., 16P]
+static void ge51_precompute(ge51 table[16], ge51 p)
+{
+    for (unsigned int c = 0; c < 3; c++) table[0][c] = p[c];
+    ge51_double(table[1], table[0]);
+    for (unsigned int i = 2; i < 16; i++) {
+        if (i % 2 == 1) {
+            ge51_double(table[i], table[i / 2]);
+        } else {
+            ge51_add(table[i], table[i - 1], table[0]);
+        }
+    }
+}
+
+#ifdef SCALARMULT51_AFFINE
+
+// One affine point, which cannot be the point at infinity
+typedef fe51 ge51_affine[2];
+
+// Mixed addition, `p2` must not be the point at infinity
+static void ge51_madd(ge51 p3, ge51 p1, ge51_affine p2)
+{
+    fe51 x3, y3, z3, t0, t1, t2, t3, t4;
+
+    /*   #: Instruction number as mentioned in the paper (algorithm 5) */
+             fe_mul(&t0, &p1[0], &p2[0]);
+             fe_mul(&t1, &p1[1], &p2[1]);
+             fe51_add(&t3, &p2[0], &p2[1]);
+             fe51_add(&t4, &p1[0], &p1[1]);
+    /*  5 */ fe_mul(&t3, &t3, &t4);
+             fe51_add(&t4, &t0, &t1);
+             fe_sub(&t3, &t3, &t4);
+             fe_mul(&t4, &p2[1], &p1[2]);
+             fe51_add(&t4, &t4, &p1[1]);
+    /* 10 */ fe_mul(&y3, &p2[0], &p1[2]);
+             fe51_add(&y3, &y3, &p1[0]);
+             fe_mul_b(&z3, &p1[2]);
+             fe_sub(&x3, &y3, &z3);
+             fe51_add(&z3, &x3, &x3);
+    /* 15 */ fe51_add(&x3, &x3, &z3); fe51_carry(&x3);
+             fe_sub(&z3, &t1, &x3);
+             fe51_add(&x3, &t1, &x3);
+             fe_mul_b(&y3, &y3);
+             fe51_add(&t1, &p1[2], &p1[2]);
+    /* 20 */ fe51_add(&t2, &t1, &p1[2]); fe51_carry(&t2);
+             fe_sub(&y3, &y3, &t2);
+             fe_sub(&y3, &y3, &t0);
+             fe51_add(&t1, &y3, &y3);
+             fe51_add(&y3, &t1, &y3); fe51_carry(&y3);
+    /* 25 */ fe51_add(&t1, &t0, &t0);
+             fe51_add(&t0, &t1, &t0); fe51_carry(&t0);
+             fe_sub(&t0, &t0, &t2);
+             fe_mul(&t1, &t4, &y3);
+             fe_mul(&t2, &t0, &y3);
+    /* 30 */ fe_mul(&y3, &x3, &z3);
+             fe51_add(&p3[1], &y3, &t2);
+             fe_mul(&x3, &x3, &t3);
+             fe_sub(&p3[0], &x3, &t1);
+             fe_mul(&z3, &z3, &t4);
+    /* 35 */ fe_mul(&t1, &t3, &t0);
+             fe51_add(&p3[2], &z3, &t1);
+
+    fe51_carry(&p3[1]);
+    fe51_carry(&p3[2]);
+}
+
+// Convert the table to affine coordinates with Montgomery's trick. None of the
+// entries is the point at infinity, because the order of the curve is prime.
+static void ge51_normalize_table(ge51_affine dest[16], ge51 table[16])
+{
+    fe51 acc[16], inv, z_inv;
+
+    acc[0] = table[0][2];
+    for (unsigned int i = 1; i < 16; i++) fe_mul(&acc[i], &acc[i - 1], &table[i][2]);
+    fe_invert(&inv, &acc[15]);
+
+    for (unsigned int i = 16; i-- > 0;) {
+        if (i > 0) {
+            fe_mul(&z_inv, &inv, &acc[i - 1]);
+            fe_mul(&inv, &inv, &table[i][2]);
+        } else {
+            z_inv = inv;
+        }
+        fe_mul(&dest[i][0], &table[i][0], &z_inv);
+        fe_mul(&dest[i][1], &table[i][1], &z_inv);
+    }
+}
+
+/*
+Constant-time lookup of the signed window `bits` in an affine table
+
+Returns:
+  All ones if the window is zero (`dest` is then garbage), 0 otherwise
+*/
+static uint64_t ge51_affine_select(ge51_affine dest, uint8_t bits, ge51_affine *table)
+{
+    const fe51 zero = {{0}};
+    const uint32_t sign = (bits >> 4) & 0x1;
+    const uint32_t sm = -sign;
+    const uint32_t idx = (((bits - 1) & ~sm) | (~bits & sm)) & 0x1F;
+    fe51 y_neg;
+
+    dest[0] = dest[1] = zero;
+    for (unsigned int j = 0; j < 16; j++) {
+        const uint64_t mask = -(uint64_t)(idx == j);
+        fe51_cmov(&dest[0], &table[j][0], mask);
+        fe51_cmov(&dest[1], &table[j][1], mask);
+    }
+    fe_sub(&y_neg, &zero, &dest[1]);
+    fe51_cmov(&dest[1], &y_neg, -(uint64_t)sign);
+    return -(uint64_t)(idx == 0x1F);
+}
+
+#endif // SCALARMULT51_AFFINE
+
+// Decode and validate an affine point, like `ge_frombytes`
+static int ge51_frombytes(ge51 p, const uint8_t *s)
+{
+    fe51 lhs, rhs, t;
+    uint8_t lhs_bytes[32], rhs_bytes[32];
+    uint8_t diff = 0;
+
+    fe51_frombytes(&p[0], &s[0]);
+    fe51_frombytes(&p[1], &s[32]);
+    for (unsigned int i = 0; i < 5; i++) p[2].v[i] = 0;
+    p[2].v[0] = 1;
+
+    // y^2 = x^3 - 3*x + 13318
+    fe_square(&lhs, &p[1]);
+    fe_square(&t, &p[0]);
+    fe_mul(&rhs, &t, &p[0]);
+    fe51_add(&t, &p[0], &p[0]);
+    fe51_add(&t, &t, &p[0]);
+    fe_sub(&rhs, &rhs, &t);
+    rhs.v[0] += CURVE13318_B;
+
+    FE51_PACK(lhs_bytes, &lhs);
+    FE51_PACK(rhs_bytes, &rhs);
+    for (unsigned int i = 0; i < 32; i++) diff |= lhs_bytes[i] ^ rhs_bytes[i];
+    return diff == 0 ? 0 : -1;
+}
+
+// Convert to affine coordinates, the point at infinity becomes (0, 0)
+static void ge51_tobytes(uint8_t *s, ge51 p)
+{
+    fe51 z_inv, x, y;
+
+    fe_invert(&z_inv, &p[2]);
+    fe_mul(&x, &p[0], &z_inv);
+    fe_mul(&y, &p[1], &z_inv);
+    FE51_PACK(&s[0], &x);
+    FE51_PACK(&s[32], &y);
+}
+
+int SCALARMULT51(uint8_t *out, const uint8_t *key, const uint8_t *in)
+{
+    ge51 p, q, t;
+    ge51 table[16];
+#ifdef SCALARMULT51_AFFINE
+    ge51_affine table_affine[16], t_affine;
+    uint64_t zero_mask;
+#endif
+    uint8_t w[51], zeroth_window;
+
+    int err = ge51_frombytes(p, in);
+    if (err != 0) {
+        return -1;
+    }
+    window_compute(w, &zeroth_window, key);
+    ge51_precompute(table, p);
+
+    // Start with 𝒪 or P, depending on the zeroth window
+    for (unsigned int c = 0; c < 3; c++) {
+        for (unsigned int i = 0; i < 5; i++) q[c].v[i] = 0;
+    }
+    q[1].v[0] = zeroth_window == 0;
+    ge51_cmov(q, table[0], -(uint64_t)(zeroth_window == 1));
+
+#ifdef SCALARMULT51_AFFINE
+    ge51_normalize_table(table_affine, table);
+    for (unsigned int i = 0; i < 51; i++) {
+        for (unsigned int j = 0; j < 5; j++) ge51_double(q, q);
+        // The mixed addition cannot add 𝒪, so discard the sum for zero windows
+        zero_mask = ge51_affine_select(t_affine, w[i], table_affine);
+        ge51_madd(t, q, t_affine);
+        ge51_cmov(q, t, ~zero_mask);
+    }
+#else
+    for (unsigned int i = 0; i < 51; i++) {
+        for (unsigned int j = 0; j < 5; j++) ge51_double(q, q);
+        ge51_select(t, w[i], table);
+        ge51_add(q, q, t);
+    }
+#endif
+    ge51_tobytes(out, q);
+    return 0;
+}
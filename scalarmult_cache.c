@@ -0,0 +1,51 @@
+/*
+A small LRU cache of prepared points for repeated (public) peer keys
+*/
+
+#include "backend.h"
+#include "scalarmult.h"
+#include <string.h>
+
+void crypto_scalarmult_cache_init(scalarmult_cache *cache)
+{
+    cache->clock = 0;
+    cache->count = 0;
+}
+
+// Return the index of the entry for `p`, or the index of the entry that
+// should be evicted, in which case `*hit` is set to 0
+static unsigned int cache_lookup(scalarmult_cache *cache, const uint8_t *p, int *hit)
+{
+    unsigned int lru = 0;
+
+    for (unsigned int i = 0; i < cache->count; i++) {
+        if (memcmp(cache->encodings[i], p, 64) == 0) {
+            *hit = 1;
+            return i;
+        }
+        if (cache->last_used[i] < cache->last_used[lru]) lru = i;
+    }
+    *hit = 0;
+    if (cache->count < SCALARMULT_CACHE_SIZE) return cache->count;
+    return lru;
+}
+
+int crypto_scalarmult_cached(uint8_t *out, const uint8_t *key, const uint8_t *in, scalarmult_cache *cache)
+{
+    int hit;
+
+    // Without AVX2 there are no prepared points to cache
+    if (!backend_has_avx2()) return crypto_scalarmult(out, key, in);
+
+    const unsigned int i = cache_lookup(cache, in, &hit);
+    if (!hit) {
+        int err = crypto_scalarmult_prepare(&cache->entries[i], in);
+        if (err != 0) {
+            return -1;
+        }
+        memcpy(cache->encodings[i], in, 64);
+        if (i == cache->count) cache->count++;
+    }
+    cache->last_used[i] = ++cache->clock;
+    return crypto_scalarmult_prepared(out, key, &cache->entries[i]);
+}
@@ -0,0 +1,156 @@
+/*
+Double-scalar multiplication k*P + l*Q
+
+This is Straus' (also known as Shamir's) trick: both scalars are split into
+signed 5-bit windows (like in `crypto_scalarmult`), and the windows of both
+scalars are added into one accumulator, such that the 255 doublings are shared
+between the two scalars.
+*/
+
+#include "backend.h"
+#include "ge.h"
+#include "scalarmult.h"
+#include "window.h"
+
+// Compute k*P + l*Q in constant time, where `pp` and `qq` hold the tables
+static void scalarmult_double_prepared(ge r, const uint8_t *k, const scalarmult_prepared *pp,
+                                       const uint8_t *l, const scalarmult_prepared *qq)
+{
+    const ge_opt *ptable = pp->table, *qtable = qq->table;
+    ge_opt r_opt, t;
+    uint8_t wk[51], wl[51], zeroth_k, zeroth_l;
+
+    window_compute(wk, &zeroth_k, k);
+    window_compute(wl, &zeroth_l, l);
+
+    // Initialize with the zeroth windows
+    for (size_t i = 0; i < 30; i++) r_opt[i] = t[i] = 0;
+    window_cmov_neutral(r_opt, -(int32_t)(zeroth_k == 0));
+    window_cmov(r_opt, ptable[0], -(int32_t)(zeroth_k == 1));
+    window_cmov_neutral(t, -(int32_t)(zeroth_l == 0));
+    window_cmov(t, qtable[0], -(int32_t)(zeroth_l == 1));
+    ge_add_asm(r_opt, r_opt, t);
+
+    for (size_t i = 0; i < 51; i++) {
+        for (size_t j = 0; j < 5; j++) ge_double_asm(r_opt, r_opt);
+        for (size_t j = 0; j < 30; j++) t[j] = 0;
+        window_select(t, wk[i], ptable);
+        ge_add_asm(r_opt, r_opt, t);
+        for (size_t j = 0; j < 30; j++) t[j] = 0;
+        window_select(t, wl[i], qtable);
+        ge_add_asm(r_opt, r_opt, t);
+    }
+    ge_opt_into_ge(r, r_opt);
+}
+
+// Variable-time version of `scalarmult_double_prepared`
+static void scalarmult_double_prepared_vartime(ge r, const uint8_t *k, const scalarmult_prepared *pp,
+                                               const uint8_t *l, const scalarmult_prepared *qq)
+{
+    const ge_opt *ptable = pp->table, *qtable = qq->table;
+    ge_opt r_opt, t;
+    uint8_t wk[51], wl[51], zeroth_k, zeroth_l;
+    int started;
+
+    window_compute(wk, &zeroth_k, k);
+    window_compute(wl, &zeroth_l, l);
+
+    for (size_t i = 0; i < 30; i++) r_opt[i] = 0;
+    r_opt[10] = 1;
+    if (zeroth_k) ge_add_asm(r_opt, r_opt, ptable[0]);
+    if (zeroth_l) ge_add_asm(r_opt, r_opt, qtable[0]);
+    started = zeroth_k | zeroth_l;
+
+    for (size_t i = 0; i < 51; i++) {
+        // Doubling the neutral element is a no-op
+        if (started) {
+            for (size_t j = 0; j < 5; j++) ge_double_asm(r_opt, r_opt);
+        }
+        if (window_select_vartime(t, wk[i], ptable)) {
+            ge_add_asm(r_opt, r_opt, t);
+            started = 1;
+        }
+        if (window_select_vartime(t, wl[i], qtable)) {
+            ge_add_asm(r_opt, r_opt, t);
+            started = 1;
+        }
+    }
+    ge_opt_into_ge(r, r_opt);
+}
+
+// Compute k*P + l*Q, returns nonzero if P or Q is invalid
+static int scalarmult_double_projective(ge r, const uint8_t *k, const uint8_t *p,
+                                        const uint8_t *l, const uint8_t *q, int vartime)
+{
+    scalarmult_prepared pp, qq;
+
+    if (crypto_scalarmult_prepare(&pp, p) != 0 || crypto_scalarmult_prepare(&qq, q) != 0) {
+        return -1;
+    }
+    if (vartime) {
+        scalarmult_double_prepared_vartime(r, k, &pp, l, &qq);
+    } else {
+        scalarmult_double_prepared(r, k, &pp, l, &qq);
+    }
+    return 0;
+}
+
+int crypto_scalarmult_double(uint8_t *out, const uint8_t *k, const uint8_t *p,
+                             const uint8_t *l, const uint8_t *q)
+{
+    ge r;
+
+    if (!backend_has_avx2()) return generic_double(out, k, p, l, q, 0);
+
+    int err = scalarmult_double_projective(r, k, p, l, q, 0);
+    if (err != 0) {
+        return -1;
+    }
+    ge_tobytes(out, r);
+    return 0;
+}
+
+int crypto_scalarmult_double_projective(uint8_t *out, const uint8_t *k, const uint8_t *p,
+                                        const uint8_t *l, const uint8_t *q)
+{
+    ge r;
+
+    if (!backend_has_avx2()) return generic_double(out, k, p, l, q, 1);
+
+    int err = scalarmult_double_projective(r, k, p, l, q, 0);
+    if (err != 0) {
+        return -1;
+    }
+    ge_tobytes_projective(out, r);
+    return 0;
+}
+
+int crypto_scalarmult_double_vartime(uint8_t *out, const uint8_t *k, const uint8_t *p,
+                                     const uint8_t *l, const uint8_t *q)
+{
+    ge r;
+
+    if (!backend_has_avx2()) return generic_double(out, k, p, l, q, 0);
+
+    int err = scalarmult_double_projective(r, k, p, l, q, 1);
+    if (err != 0) {
+        return -1;
+    }
+    ge_tobytes(out, r);
+    return 0;
+}
+
+int crypto_scalarmult_double_projective_vartime(uint8_t *out, const uint8_t *k, const uint8_t *p,
+                                                const uint8_t *l, const uint8_t *q)
+{
+    ge r;
+
+    if (!backend_has_avx2()) return generic_double(out, k, p, l, q, 1);
+
+    int err = scalarmult_double_projective(r, k, p, l, q, 1);
+    if (err != 0) {
+        return -1;
+    }
+    ge_tobytes_projective(out, r);
+    return 0;
+}
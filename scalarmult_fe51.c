@@ -0,0 +1,15 @@
+/*
+Scalar multiplication with the amd64-51 field arithmetic
+
+This backend uses only baseline x86-64 instructions, so it also runs on CPUs
+without AVX2.
+*/
+
+#include "backend.h"
+
+#define FE51_MUL fe51_mul
+#define FE51_NSQUARE fe51_nsquare
+#define FE51_PACK fe51_pack
+#define SCALARMULT51 crypto_scalarmult_fe51
+
+#include "scalarmult51.mac.h"
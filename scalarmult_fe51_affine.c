@@ -0,0 +1,17 @@
+/*
+Scalar multiplication with the amd64-51 field arithmetic, an affine lookup
+table and mixed additions
+
+Compared to scalarmult_fe51.c, this trades an inversion (and the batching
+multiplications) for a cheaper addition in every one of the 51 ladder steps.
+*/
+
+#include "backend.h"
+
+#define FE51_MUL fe51_mul
+#define FE51_NSQUARE fe51_nsquare
+#define FE51_PACK fe51_pack
+#define SCALARMULT51 crypto_scalarmult_fe51_affine
+#define SCALARMULT51_AFFINE
+
+#include "scalarmult51.mac.h"
@@ -0,0 +1,157 @@
+/*
+Fallbacks for the entry points that need AVX2
+
+On a CPU without AVX2, the public functions in the AVX2_SRCS files (see the
+Makefile) hand their calls to the functions in this file. Every scalar
+multiplication goes through `crypto_scalarmult` or `crypto_scalarmult_base`,
+so it runs on the backend that was selected by dispatch.c. Combining the
+results only needs the C point addition from ge.c.
+
+This file is compiled for baseline x86-64.
+*/
+
+#include "backend.h"
+#include "ge.h"
+#include "scalarmult.h"
+#include "window.h"
+#include <string.h>
+
+// Return 1 if `affine` (64 bytes) encodes the point at infinity, without
+// branching on its contents
+static uint8_t is_infinity(const uint8_t *affine)
+{
+    unsigned int nonzero = 0;
+
+    for (size_t i = 0; i < 64; i++) nonzero |= affine[i];
+    return (uint8_t)(((nonzero - 1) >> 8) & 1);
+}
+
+// Convert an output of `crypto_scalarmult` to the projective encoding of
+// `ge_tobytes_projective`, where the point at infinity is (0 : 1 : 0)
+static void affine_to_projective(uint8_t *out, const uint8_t *affine)
+{
+    const uint8_t infinity = is_infinity(affine);
+
+    memmove(out, affine, 64);
+    memset(&out[64], 0, 32);
+    out[32] |= infinity;
+    out[64] = infinity ^ 1;
+}
+
+// Compute q = k * p, returns nonzero if `p` is invalid
+static int scalarmult_ge(ge q, const uint8_t *k, const uint8_t *p)
+{
+    uint8_t affine[64], projective[96];
+
+    if (crypto_scalarmult(affine, k, p) != 0) return -1;
+    affine_to_projective(projective, affine);
+    ge_frombytes_projective(q, projective);
+    return 0;
+}
+
+int generic_projective(uint8_t *out, const uint8_t *k, const uint8_t *p)
+{
+    uint8_t affine[64];
+
+    if (crypto_scalarmult(affine, k, p) != 0) return -1;
+    affine_to_projective(out, affine);
+    return 0;
+}
+
+int generic_base_projective(uint8_t *out, const uint8_t *k)
+{
+    uint8_t affine[64];
+
+    crypto_scalarmult_base(affine, k);
+    affine_to_projective(out, affine);
+    return 0;
+}
+
+int generic_compressed(uint8_t *out, const uint8_t *k, const uint8_t *p)
+{
+    uint8_t point[64];
+
+    if (crypto_scalarmult_decompress(point, p) != 0) return -1;
+    return crypto_scalarmult(out, k, point);
+}
+
+int generic_ecdh(uint8_t *out, const uint8_t *k, const uint8_t *p)
+{
+    uint8_t affine[64];
+
+    if (crypto_scalarmult(affine, k, p) != 0) {
+        memset(out, 0, 32);
+        return -1;
+    }
+    // The x-coordinate of the point at infinity is encoded as zero
+    memcpy(out, affine, 32);
+    return is_infinity(affine) ? -1 : 0;
+}
+
+int generic_ecdh_compressed(uint8_t *out, const uint8_t *k, const uint8_t *p)
+{
+    uint8_t point[64];
+
+    if (crypto_scalarmult_decompress(point, p) != 0) {
+        memset(out, 0, 32);
+        return -1;
+    }
+    return generic_ecdh(out, k, point);
+}
+
+int generic_batch(uint8_t *out, const uint8_t *k, const uint8_t *p, size_t n)
+{
+    int ret = 0;
+
+    for (size_t i = 0; i < n; i++) {
+        if (crypto_scalarmult(&out[64*i], &k[32*i], &p[64*i]) != 0) {
+            memset(&out[64*i], 0, 64);
+            ret = -1;
+        }
+    }
+    return ret;
+}
+
+int generic_windowed(uint8_t *out, const uint8_t *k, const uint8_t *p, unsigned int width)
+{
+    // The window width does not change the result
+    if (width < WINDOW_WIDTH_MIN || width > WINDOW_WIDTH_MAX) return -1;
+    return crypto_scalarmult(out, k, p);
+}
+
+// Store `q` like the AVX2 entry points do
+static void ge_tobytes_any(uint8_t *out, ge q, int projective)
+{
+    if (projective) {
+        ge_tobytes_projective(out, q);
+    } else {
+        ge_tobytes(out, q);
+    }
+}
+
+int generic_double(uint8_t *out, const uint8_t *k, const uint8_t *p,
+                   const uint8_t *l, const uint8_t *q, int projective)
+{
+    ge r, t;
+
+    if (scalarmult_ge(r, k, p) != 0 || scalarmult_ge(t, l, q) != 0) return -1;
+    ge_add(r, r, t);
+    ge_tobytes_any(out, r, projective);
+    return 0;
+}
+
+int generic_multi(uint8_t *out, const uint8_t *k, const uint8_t *p, size_t n, int projective)
+{
+    static const uint8_t infinity[64] = {0};
+    uint8_t projective_bytes[96];
+    ge r, t;
+
+    affine_to_projective(projective_bytes, infinity);
+    ge_frombytes_projective(r, projective_bytes);
+    for (size_t i = 0; i < n; i++) {
+        if (scalarmult_ge(t, &k[32*i], &p[64*i]) != 0) return -1;
+        ge_add(r, r, t);
+    }
+    ge_tobytes_any(out, r, projective);
+    return 0;
+}
@@ -0,0 +1,227 @@
+/*
+Multi-scalar multiplication sum(k[i] * P[i])
+
+For a small amount of points, we use Straus' method: all the points get their
+own lookup table, and the signed 5-bit windows of all scalars are added into
+one accumulator, which shares the doublings between all the points. For large
+amounts of points, we use Pippenger's bucket method, which needs no lookup
+tables and only about 255/c additions per point (for c-bit windows). The
+crossover is selected with a simple cost model that counts group operations.
+
+None of these routines run in constant time, so the scalars must be public.
+*/
+
+#include "backend.h"
+#include "ge.h"
+#include "scalarmult.h"
+#include "window.h"
+#include <stdlib.h>
+
+// Largest window width that is considered for Pippenger's method
+#define PIPPENGER_MAX_WIDTH 16
+
+static void ge_opt_copy(ge_opt dest, const ge_opt src)
+{
+    for (unsigned int i = 0; i < 32; i++) dest[i] = src[i];
+}
+
+static void ge_opt_neutral(ge_opt dest)
+{
+    for (unsigned int i = 0; i < 32; i++) dest[i] = 0;
+    dest[10] = 1;
+}
+
+// Add `src` into `dest`, where `dest_used == 0` means that `dest` is neutral
+static void accumulate(ge_opt dest, int *dest_used, const ge_opt src)
+{
+    if (*dest_used) {
+        ge_add_asm(dest, dest, src);
+    } else {
+        ge_opt_copy(dest, src);
+        *dest_used = 1;
+    }
+}
+
+// Cost (in group operations) of Straus' method
+static size_t straus_cost(size_t n)
+{
+    // 15 operations for every lookup table, 51 additions and 255 doublings
+    return n * (15 + 51) + 255;
+}
+
+// Cost (in group operations) of Pippenger's method with c-bit windows
+static size_t pippenger_cost(size_t n, unsigned int c)
+{
+    const size_t windows = (255 + c - 1) / c;
+    return windows * (n + 2 * ((size_t)1 << c)) + 255;
+}
+
+// Return the c-bit window of `key` that starts at bit `pos`, ignoring bit 255
+static uint32_t scalar_bits(const uint8_t *key, unsigned int pos, unsigned int c)
+{
+    uint32_t bits = 0;
+
+    for (unsigned int i = 0; i < 4 && pos/8 + i < 32; i++) {
+        bits |= (uint32_t)key[pos/8 + i] << (8*i);
+    }
+    bits >>= pos % 8;
+    if (pos + c > 255) c = 255 - pos;
+    return bits & ((UINT32_C(1) << c) - 1);
+}
+
+static int multi_straus(ge_opt r, const uint8_t *keys, const ge_opt *points, size_t n)
+{
+    scalarmult_prepared *tables = malloc(n * sizeof(scalarmult_prepared));
+    uint8_t (*w)[51] = malloc(n * sizeof(*w));
+    ge_opt t;
+    uint8_t zeroth_window;
+    int used = 0;
+
+    if (tables == NULL || w == NULL) {
+        free(tables);
+        free(w);
+        return -1;
+    }
+
+    ge_opt_neutral(r);
+    for (size_t i = 0; i < n; i++) {
+        window_precompute(tables[i].table, points[i]);
+        window_compute(w[i], &zeroth_window, &keys[32*i]);
+        if (zeroth_window) accumulate(r, &used, tables[i].table[0]);
+    }
+    for (size_t j = 0; j < 51; j++) {
+        // Doubling the neutral element is a no-op
+        if (used) {
+            for (unsigned int k = 0; k < 5; k++) ge_double_asm(r, r);
+        }
+        for (size_t i = 0; i < n; i++) {
+            const scalarmult_prepared *pp = &tables[i];
+            if (window_select_vartime(t, w[i][j], pp->table)) {
+                accumulate(r, &used, t);
+            }
+        }
+    }
+
+    free(tables);
+    free(w);
+    return 0;
+}
+
+static int multi_pippenger(ge_opt r, const uint8_t *keys, const ge_opt *points, size_t n,
+                           unsigned int c)
+{
+    const size_t nbuckets = ((size_t)1 << c) - 1;
+    ge_opt *buckets = malloc(nbuckets * sizeof(ge_opt));
+    int *bucket_used = malloc(nbuckets * sizeof(int));
+    ge_opt running, sum;
+    int used = 0;
+
+    if (buckets == NULL || bucket_used == NULL) {
+        free(buckets);
+        free(bucket_used);
+        return -1;
+    }
+
+    ge_opt_neutral(r);
+    for (unsigned int window = (255 + c - 1) / c; window-- > 0;) {
+        int running_used = 0, sum_used = 0;
+
+        if (used) {
+            for (unsigned int k = 0; k < c; k++) ge_double_asm(r, r);
+        }
+
+        // Sort the points into buckets
+        for (size_t j = 0; j < nbuckets; j++) bucket_used[j] = 0;
+        for (size_t i = 0; i < n; i++) {
+            const uint32_t bits = scalar_bits(&keys[32*i], c * window, c);
+            if (bits == 0) continue;
+            accumulate(buckets[bits - 1], &bucket_used[bits - 1], points[i]);
+        }
+
+        // sum = 1*B[1] + 2*B[2] + ... using running sums
+        for (size_t j = nbuckets; j-- > 0;) {
+            if (bucket_used[j]) accumulate(running, &running_used, buckets[j]);
+            if (running_used) accumulate(sum, &sum_used, running);
+        }
+        if (sum_used) accumulate(r, &used, sum);
+    }
+
+    free(buckets);
+    free(bucket_used);
+    return 0;
+}
+
+// Compute sum(keys[i] * in[i]), returns nonzero on failure
+static int multi_projective(ge q, const uint8_t *keys, const uint8_t *in, size_t n)
+{
+    ge_opt *points, r;
+    size_t cost = straus_cost(n);
+    unsigned int width = 0;
+    int err = 0;
+
+    if (n == 0) {
+        ge_opt_neutral(r);
+        ge_opt_into_ge(q, r);
+        return 0;
+    }
+    points = malloc(n * sizeof(ge_opt));
+    if (points == NULL) {
+        return -1;
+    }
+    for (size_t i = 0; i < n; i++) {
+        ge p;
+        if (ge_frombytes(p, &in[64*i]) != 0) {
+            free(points);
+            return -1;
+        }
+        ge_into_ge_opt(points[i], p);
+        points[i][30] = points[i][31] = 0;
+    }
+
+    // Pick the cheapest method
+    for (unsigned int c = 2; c <= PIPPENGER_MAX_WIDTH; c++) {
+        if (pippenger_cost(n, c) < cost) {
+            cost = pippenger_cost(n, c);
+            width = c;
+        }
+    }
+    if (width == 0) {
+        err = multi_straus(r, keys, (const ge_opt *)points, n);
+    } else {
+        err = multi_pippenger(r, keys, (const ge_opt *)points, n, width);
+    }
+    free(points);
+    if (err != 0) {
+        return -1;
+    }
+    ge_opt_into_ge(q, r);
+    return 0;
+}
+
+int crypto_scalarmult_multi(uint8_t *out, const uint8_t *keys, const uint8_t *in, size_t n)
+{
+    ge q;
+
+    if (!backend_has_avx2()) return generic_multi(out, keys, in, n, 0);
+
+    int err = multi_projective(q, keys, in, n);
+    if (err != 0) {
+        return -1;
+    }
+    ge_tobytes(out, q);
+    return 0;
+}
+
+int crypto_scalarmult_multi_projective(uint8_t *out, const uint8_t *keys, const uint8_t *in, size_t n)
+{
+    ge q;
+
+    if (!backend_has_avx2()) return generic_multi(out, keys, in, n, 1);
+
+    int err = multi_projective(q, keys, in, n);
+    if (err != 0) {
+        return -1;
+    }
+    ge_tobytes_projective(out, q);
+    return 0;
+}
@@ -0,0 +1,166 @@
+/*
+A native worker pool for batched scalar multiplications
+
+The batch is cut into chunks of GE_BATCH_SIZE scalar multiplications, so that
+every chunk still shares its inversion. The chunks are handed out to the
+workers (and the calling thread) through an atomic counter.
+*/
+
+#define _POSIX_C_SOURCE 200809L
+
+#include "ge.h"
+#include "scalarmult.h"
+#include <pthread.h>
+#include <stdlib.h>
+#include <unistd.h>
+
+struct scalarmult_pool {
+    pthread_mutex_t job_lock; // Serializes calls to the pool
+    pthread_mutex_t lock;
+    pthread_cond_t work_cond;
+    pthread_cond_t done_cond;
+    pthread_t *threads;
+    unsigned int nworkers;
+    int shutdown;
+
+    // The current job
+    uint64_t generation;
+    unsigned int finished;
+    uint8_t *out;
+    const uint8_t *k;
+    const uint8_t *p;
+    size_t n;
+    size_t next_chunk;
+    int ret;
+};
+
+// Process chunks of the current job until there are none left
+static void run_chunks(scalarmult_pool *pool)
+{
+    const size_t nchunks = (pool->n + GE_BATCH_SIZE - 1) / GE_BATCH_SIZE;
+
+    for (;;) {
+        const size_t chunk = __atomic_fetch_add(&pool->next_chunk, 1, __ATOMIC_RELAXED);
+        if (chunk >= nchunks) break;
+        const size_t start = chunk * GE_BATCH_SIZE;
+        const size_t len = pool->n - start < GE_BATCH_SIZE ? pool->n - start : GE_BATCH_SIZE;
+        int err = crypto_scalarmult_batch(&pool->out[64*start], &pool->k[32*start],
+                                          &pool->p[64*start], len);
+        if (err != 0) __atomic_store_n(&pool->ret, -1, __ATOMIC_RELAXED);
+    }
+}
+
+static void *worker(void *arg)
+{
+    scalarmult_pool *pool = arg;
+    uint64_t seen = 0;
+
+    pthread_mutex_lock(&pool->lock);
+    for (;;) {
+        while (pool->generation == seen && !pool->shutdown) {
+            pthread_cond_wait(&pool->work_cond, &pool->lock);
+        }
+        if (pool->shutdown) break;
+        seen = pool->generation;
+        pthread_mutex_unlock(&pool->lock);
+
+        run_chunks(pool);
+
+        pthread_mutex_lock(&pool->lock);
+        if (++pool->finished == pool->nworkers) {
+            pthread_cond_signal(&pool->done_cond);
+        }
+    }
+    pthread_mutex_unlock(&pool->lock);
+    return NULL;
+}
+
+scalarmult_pool *crypto_scalarmult_pool_new(unsigned int nthreads)
+{
+    scalarmult_pool *pool;
+
+    if (nthreads == 0) {
+        long online = sysconf(_SC_NPROCESSORS_ONLN);
+        nthreads = online > 0 ? (unsigned int)online : 1;
+    }
+
+    pool = calloc(1, sizeof(scalarmult_pool));
+    if (pool == NULL) return NULL;
+    // The calling thread does its share of the work as well
+    pool->nworkers = nthreads - 1;
+    pool->threads = calloc(nthreads, sizeof(pthread_t));
+    if (pool->threads == NULL) {
+        free(pool);
+        return NULL;
+    }
+    pthread_mutex_init(&pool->job_lock, NULL);
+    pthread_mutex_init(&pool->lock, NULL);
+    pthread_cond_init(&pool->work_cond, NULL);
+    pthread_cond_init(&pool->done_cond, NULL);
+
+    for (unsigned int i = 0; i < pool->nworkers; i++) {
+        if (pthread_create(&pool->threads[i], NULL, worker, pool) != 0) {
+            pool->nworkers = i;
+            crypto_scalarmult_pool_free(pool);
+            return NULL;
+        }
+    }
+    return pool;
+}
+
+void crypto_scalarmult_pool_free(scalarmult_pool *pool)
+{
+    if (pool == NULL) return;
+
+    pthread_mutex_lock(&pool->lock);
+    pool->shutdown = 1;
+    pthread_cond_broadcast(&pool->work_cond);
+    pthread_mutex_unlock(&pool->lock);
+    for (unsigned int i = 0; i < pool->nworkers; i++) {
+        pthread_join(pool->threads[i], NULL);
+    }
+
+    pthread_cond_destroy(&pool->done_cond);
+    pthread_cond_destroy(&pool->work_cond);
+    pthread_mutex_destroy(&pool->lock);
+    pthread_mutex_destroy(&pool->job_lock);
+    free(pool->threads);
+    free(pool);
+}
+
+unsigned int crypto_scalarmult_pool_threads(const scalarmult_pool *pool)
+{
+    return pool->nworkers + 1;
+}
+
+int crypto_scalarmult_pool_batch(scalarmult_pool *pool, uint8_t *out, const uint8_t *k,
+                                 const uint8_t *p, size_t n)
+{
+    int ret;
+
+    pthread_mutex_lock(&pool->job_lock);
+
+    pthread_mutex_lock(&pool->lock);
+    pool->out = out;
+    pool->k = k;
+    pool->p = p;
+    pool->n = n;
+    pool->next_chunk = 0;
+    pool->finished = 0;
+    pool->ret = 0;
+    pool->generation++;
+    pthread_cond_broadcast(&pool->work_cond);
+    pthread_mutex_unlock(&pool->lock);
+
+    run_chunks(pool);
+
+    pthread_mutex_lock(&pool->lock);
+    while (pool->finished < pool->nworkers) {
+        pthread_cond_wait(&pool->done_cond, &pool->lock);
+    }
+    ret = pool->ret;
+    pthread_mutex_unlock(&pool->lock);
+
+    pthread_mutex_unlock(&pool->job_lock);
+    return ret;
+}
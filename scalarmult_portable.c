@@ -0,0 +1,15 @@
+/*
+Scalar multiplication in portable C
+
+This backend does not use any assembly, so it is the fallback when none of the
+other backends are supported.
+*/
+
+#include "backend.h"
+
+#define FE51_MUL fe51_mul_portable
+#define FE51_NSQUARE fe51_nsquare_portable
+#define FE51_PACK fe51_pack_portable
+#define SCALARMULT51 crypto_scalarmult_portable
+
+#include "scalarmult51.mac.h"
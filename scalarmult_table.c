@@ -0,0 +1,206 @@
+/*
+On-disk tables of prepared points, for long-lived (public) peer keys
+
+A table file is a 64-byte header followed by `count` entries of type
+`scalarmult_table_entry` (a `scalarmult_prepared` and the 64-byte encoding of
+its point), sorted by the encoding. All integers in the header are
+little-endian:
+
+    offset  size  field
+    0       8     magic "C13318TB"
+    8       4     version (SCALARMULT_TABLE_VERSION)
+    12      4     size of an entry in bytes
+    16      8     count
+    24      8     checksum a
+    32      8     checksum b
+    40      24    reserved, zero
+
+The header size and the entry size are multiples of 32, so the entries of a
+file that is mapped at a page boundary are correctly aligned and can be used
+in place. The checksum is a Fletcher-style sum over the 32-bit words of the
+first 24 header bytes and of all entries (a = sum(w_i), b = sum(a_i), both
+modulo 2^64). It is a lot cheaper than a cryptographic hash (which would cost
+as much as recomputing the tables) and catches truncated and corrupted files,
+but not deliberate tampering. The entries are not checked against the curve
+either, so table files must be trusted like code (see
+`crypto_scalarmult_table_load`).
+*/
+
+#define _DEFAULT_SOURCE
+
+#include "scalarmult.h"
+#include <fcntl.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+static const uint8_t magic[8] = {'C', '1', '3', '3', '1', '8', 'T', 'B'};
+
+static uint64_t load_le(const uint8_t *s, unsigned int len)
+{
+    uint64_t r = 0;
+    for (unsigned int i = 0; i < len; i++) r |= (uint64_t)s[i] << (8*i);
+    return r;
+}
+
+static void store_le(uint8_t *s, uint64_t x, unsigned int len)
+{
+    for (unsigned int i = 0; i < len; i++) s[i] = (uint8_t)(x >> (8*i));
+}
+
+// Add the 32-bit words of `buf` (`len` must be a multiple of 4) to the checksum
+static void checksum_update(uint64_t *a, uint64_t *b, const uint8_t *buf, size_t len)
+{
+    uint64_t sum_a = *a, sum_b = *b;
+
+    for (size_t i = 0; i < len; i += 4) {
+        sum_a += load_le(&buf[i], 4);
+        sum_b += sum_a;
+    }
+    *a = sum_a;
+    *b = sum_b;
+}
+
+static void checksum(uint64_t *a, uint64_t *b, const uint8_t *buf, size_t count)
+{
+    *a = *b = 0;
+    checksum_update(a, b, buf, 24);
+    checksum_update(a, b, &buf[SCALARMULT_TABLE_HEADER_BYTES],
+                    count * sizeof(scalarmult_table_entry));
+}
+
+size_t crypto_scalarmult_table_bytes(size_t n)
+{
+    return SCALARMULT_TABLE_HEADER_BYTES + n * sizeof(scalarmult_table_entry);
+}
+
+typedef struct {
+    const uint8_t *point;
+    size_t index;
+} sort_item;
+
+static int compar_point(const void *a_ptr, const void *b_ptr)
+{
+    const sort_item *a = a_ptr, *b = b_ptr;
+    return memcmp(a->point, b->point, 64);
+}
+
+int crypto_scalarmult_table_build(uint8_t *out, const uint8_t *p, size_t n)
+{
+    uint8_t *entries = &out[SCALARMULT_TABLE_HEADER_BYTES];
+    scalarmult_table_entry entry;
+    sort_item *items;
+    uint64_t a, b;
+
+    items = malloc((n > 0 ? n : 1) * sizeof(sort_item));
+    if (items == NULL) return -1;
+    for (size_t i = 0; i < n; i++) {
+        items[i].point = &p[64*i];
+        items[i].index = i;
+    }
+    qsort(items, n, sizeof(sort_item), compar_point);
+
+    // `out` does not have to be aligned, so we prepare the entries on the
+    // stack. The precomputation does not write the padding of the table
+    // entries, clear it such that files do not depend on the stack contents.
+    memset(&entry, 0, sizeof(entry));
+    for (size_t i = 0; i < n; i++) {
+        if (crypto_scalarmult_prepare(&entry.prepared, items[i].point) != 0) {
+            free(items);
+            return -1;
+        }
+        memcpy(entry.point, items[i].point, 64);
+        memcpy(&entries[i * sizeof(entry)], &entry, sizeof(entry));
+    }
+    free(items);
+
+    memset(out, 0, SCALARMULT_TABLE_HEADER_BYTES);
+    memcpy(&out[0], magic, sizeof(magic));
+    store_le(&out[8], SCALARMULT_TABLE_VERSION, 4);
+    store_le(&out[12], sizeof(scalarmult_table_entry), 4);
+    store_le(&out[16], n, 8);
+    checksum(&a, &b, out, n);
+    store_le(&out[24], a, 8);
+    store_le(&out[32], b, 8);
+    return 0;
+}
+
+int crypto_scalarmult_table_load(scalarmult_table *t, const uint8_t *buf, size_t len)
+{
+    uint64_t count, a, b;
+    uint8_t reserved = 0;
+
+    memset(t, 0, sizeof(*t));
+    if ((uintptr_t)buf % 32 != 0 || len < SCALARMULT_TABLE_HEADER_BYTES) return -1;
+    if (memcmp(&buf[0], magic, sizeof(magic)) != 0) return -1;
+    if (load_le(&buf[8], 4) != SCALARMULT_TABLE_VERSION) return -1;
+    if (load_le(&buf[12], 4) != sizeof(scalarmult_table_entry)) return -1;
+    for (unsigned int i = 40; i < SCALARMULT_TABLE_HEADER_BYTES; i++) reserved |= buf[i];
+    if (reserved != 0) return -1;
+
+    count = load_le(&buf[16], 8);
+    if (count > (len - SCALARMULT_TABLE_HEADER_BYTES) / sizeof(scalarmult_table_entry)
+            || len != crypto_scalarmult_table_bytes(count)) {
+        return -1;
+    }
+    checksum(&a, &b, buf, count);
+    if (a != load_le(&buf[24], 8) || b != load_le(&buf[32], 8)) return -1;
+
+    t->entries = (const scalarmult_table_entry *)&buf[SCALARMULT_TABLE_HEADER_BYTES];
+    t->count = count;
+    return 0;
+}
+
+int crypto_scalarmult_table_open(scalarmult_table *t, const char *path)
+{
+    struct stat st;
+    void *map;
+    int fd;
+
+    memset(t, 0, sizeof(*t));
+    fd = open(path, O_RDONLY);
+    if (fd < 0) return -1;
+    if (fstat(fd, &st) != 0 || st.st_size <= 0) {
+        close(fd);
+        return -1;
+    }
+    // The mapping starts at a page boundary, so the entries are aligned. It
+    // stays valid after closing the file.
+    map = mmap(NULL, (size_t)st.st_size, PROT_READ, MAP_SHARED, fd, 0);
+    close(fd);
+    if (map == MAP_FAILED) return -1;
+
+    if (crypto_scalarmult_table_load(t, map, (size_t)st.st_size) != 0) {
+        munmap(map, (size_t)st.st_size);
+        return -1;
+    }
+    t->map = map;
+    t->map_size = (size_t)st.st_size;
+    return 0;
+}
+
+void crypto_scalarmult_table_close(scalarmult_table *t)
+{
+    if (t->map != NULL) munmap(t->map, t->map_size);
+    memset(t, 0, sizeof(*t));
+}
+
+const scalarmult_prepared *crypto_scalarmult_table_find(const scalarmult_table *t,
+                                                        const uint8_t *p)
+{
+    size_t lo = 0, hi = t->count;
+
+    while (lo < hi) {
+        const size_t mid = lo + (hi - lo) / 2;
+        const int cmp = memcmp(t->entries[mid].point, p, 64);
+        if (cmp == 0) return &t->entries[mid].prepared;
+        if (cmp < 0) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+    return NULL;
+}
@@ -0,0 +1,143 @@
+/*
+Variable-time scalar multiplication for public scalars
+
+The scalar is recoded into width-5 NAF form: every nonzero digit is odd and in
+[-15, 15], and every nonzero digit is followed by at least four zero digits.
+This needs a table with only the odd multiples [P, 3P, ..., 15P], which is
+indexed directly. Only the nonzero digits (about 1 in 6) cost an addition.
+
+These functions leak the scalar through their timing and memory access
+patterns. Never use them with secret scalars.
+*/
+
+#include "backend.h"
+#include "ge.h"
+#include "scalarmult.h"
+
+// Width of the NAF windows, and the amount of odd multiples in the table
+#define WNAF_WIDTH 5
+#define WNAF_TABLE_SIZE (1 << (WNAF_WIDTH - 2))
+
+// Return the `n` bits of `key` that start at bit `pos`, ignoring bit 255
+static int scalar_bits(const uint8_t *key, unsigned int pos, unsigned int n)
+{
+    int bits = 0;
+
+    for (unsigned int i = 0; i < n && pos + i < 255; i++) {
+        bits |= ((key[(pos + i) / 8] >> ((pos + i) % 8)) & 0x1) << i;
+    }
+    return bits;
+}
+
+// Recode `key` into 256 width-5 NAF digits, returns the amount of digits
+static unsigned int wnaf_recode(int8_t naf[256], const uint8_t *key)
+{
+    unsigned int len = 0;
+    int carry = 0;
+
+    for (unsigned int i = 0; i < 256; i++) naf[i] = 0;
+    for (unsigned int i = 0; i < 256;) {
+        if (scalar_bits(key, i, 1) == carry) {
+            i++;
+            continue;
+        }
+        const int word = scalar_bits(key, i, WNAF_WIDTH) + carry;
+        carry = (word >> (WNAF_WIDTH - 1)) & 0x1;
+        naf[i] = word - (carry << WNAF_WIDTH);
+        len = i + 1;
+        i += WNAF_WIDTH;
+    }
+    return len;
+}
+
+// Compute the table [P, 3P, ..., 15P]
+static void wnaf_precompute(ge_opt table[WNAF_TABLE_SIZE], const ge_opt p)
+{
+    ge_opt p2;
+
+    for (unsigned int i = 0; i < 32; i++) table[0][i] = p[i];
+    ge_double_asm(p2, p);
+    for (unsigned int i = 1; i < WNAF_TABLE_SIZE; i++) {
+        ge_add_asm(table[i], table[i - 1], p2);
+    }
+}
+
+// Load the point digit * P from the table
+static void wnaf_lookup(ge_opt dest, int digit, const ge_opt table[WNAF_TABLE_SIZE])
+{
+    const int idx = (digit < 0 ? -digit : digit) / 2;
+
+    for (unsigned int i = 0; i < 30; i++) dest[i] = table[idx][i];
+    if (digit < 0) {
+        // Negate Y by computing 4*p - Y
+        for (unsigned int i = 0; i < 10; i++) {
+            const uint32_t fourp = i == 0 ? _4P0 : (i % 2 == 0 ? _4PRestB26 : _4PRestB25);
+            dest[10 + i] = fourp - dest[10 + i];
+        }
+    }
+}
+
+// Compute the projective point key * in, returns nonzero if `in` is invalid
+static int scalarmult_projective_vartime(ge q, const uint8_t *key, const uint8_t *in)
+{
+    ge p;
+    ge_opt p_opt, q_opt, t;
+    ge_opt table[WNAF_TABLE_SIZE];
+    int8_t naf[256];
+
+    int err = ge_frombytes(p, in);
+    if (err != 0) {
+        return -1;
+    }
+    ge_into_ge_opt(p_opt, p);
+    p_opt[30] = p_opt[31] = 0;
+
+    const unsigned int len = wnaf_recode(naf, key);
+    if (len == 0) {
+        // The scalar is zero
+        for (unsigned int i = 0; i < 32; i++) q_opt[i] = 0;
+        q_opt[10] = 1;
+        ge_opt_into_ge(q, q_opt);
+        return 0;
+    }
+
+    wnaf_precompute(table, p_opt);
+    wnaf_lookup(q_opt, naf[len - 1], (const ge_opt *)table);
+    for (unsigned int i = len - 1; i-- > 0;) {
+        ge_double_asm(q_opt, q_opt);
+        if (naf[i] != 0) {
+            wnaf_lookup(t, naf[i], (const ge_opt *)table);
+            ge_add_asm(q_opt, q_opt, t);
+        }
+    }
+    ge_opt_into_ge(q, q_opt);
+    return 0;
+}
+
+int crypto_scalarmult_vartime(uint8_t *out, const uint8_t *key, const uint8_t *in)
+{
+    ge q;
+
+    if (!backend_has_avx2()) return crypto_scalarmult(out, key, in);
+
+    int err = scalarmult_projective_vartime(q, key, in);
+    if (err != 0) {
+        return -1;
+    }
+    ge_tobytes(out, q);
+    return 0;
+}
+
+int crypto_scalarmult_projective_vartime(uint8_t *out, const uint8_t *key, const uint8_t *in)
+{
+    ge q;
+
+    if (!backend_has_avx2()) return generic_projective(out, key, in);
+
+    int err = scalarmult_projective_vartime(q, key, in);
+    if (err != 0) {
+        return -1;
+    }
+    ge_tobytes_projective(out, q);
+    return 0;
+}
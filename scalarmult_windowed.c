@@ -0,0 +1,53 @@
+/*
+Constant-time scalar multiplication with a configurable window width
+
+`crypto_scalarmult` always uses 5-bit windows, because ladder.asm and select.asm
+are specialized for a 16-entry table. This file implements the same ladder in C
+on top of `ge_double_asm` and `ge_add_asm`, so that the window width can be
+chosen at runtime.
+*/
+
+#include "backend.h"
+#include "ge.h"
+#include "scalarmult.h"
+#include "window.h"
+
+int crypto_scalarmult_windowed(uint8_t *out, const uint8_t *key, const uint8_t *in,
+                               unsigned int width)
+{
+    ge p, q;
+    ge_opt p_opt __attribute__((aligned(32)));
+    ge_opt q_opt __attribute__((aligned(32)));
+    ge_opt t __attribute__((aligned(32)));
+    ge_opt table[WINDOW_ENTRIES_MAX] __attribute__((aligned(32)));
+    int8_t digits[WINDOW_DIGITS_MAX];
+    uint8_t zeroth_window;
+    unsigned int n;
+
+    if (!backend_has_avx2()) return generic_windowed(out, key, in, width);
+
+    if (width < WINDOW_WIDTH_MIN || width > WINDOW_WIDTH_MAX) {
+        return -1;
+    }
+    int err = ge_frombytes(p, in);
+    if (err != 0) {
+        return -1;
+    }
+    ge_into_ge_opt(p_opt, p);
+    p_opt[30] = p_opt[31] = 0;
+    window_precompute_width(table, p_opt, width);
+    n = window_compute_width(digits, &zeroth_window, key, width);
+
+    for (size_t i = 0; i < 32; i++) q_opt[i] = 0;
+    window_cmov_neutral(q_opt, -(int32_t)(zeroth_window == 0));
+    window_cmov(q_opt, table[0], -(int32_t)(zeroth_window == 1));
+    for (unsigned int i = n; i-- > 0;) {
+        for (unsigned int j = 0; j < width; j++) ge_double_asm(q_opt, q_opt);
+        for (size_t j = 0; j < 32; j++) t[j] = 0;
+        window_select_width(t, digits[i], (const ge_opt *)table, width);
+        ge_add_asm(q_opt, t, q_opt);
+    }
+    ge_opt_into_ge(q, q_opt);
+    ge_tobytes(out, q);
+    return 0;
+}
@@ -0,0 +1,239 @@
+/*
+Four independent scalar multiplications, one in every lane of the fe10x4 type
+
+Within `ge_add_asm` and `ge_double_asm`, the four lanes hold different
+intermediate values of the same point, so their utilization depends on the
+shape of the formulas. Here, every lane computes the complete Renes-Costello-
+Batina formulas for its own point instead. The lookup tables of the four
+points are interleaved in the same way, such that one constant-time `select`
+loads the entries for all four lanes at once.
+*/
+
+#include "backend.h"
+#include "fe10x4.h"
+#include "ge.h"
+#include "scalarmult.h"
+#include "window.h"
+
+// Four projective points, every lane holds one point
+typedef fe10x4 ge10x4[3];
+
+// Add `p1` and `p2` into `p3`, the coordinates of `p1` and `p2` must be carried
+static void ge10x4_add(ge10x4 p3, ge10x4 p1, ge10x4 p2)
+{
+    fe10x4 x3, y3, z3, t0, t1, t2, t3, t4;
+
+    /*   #: Instruction number as mentioned in the paper */
+             fe10x4_mul(&t0, &p1[0], &p2[0]);
+             fe10x4_mul(&t1, &p1[1], &p2[1]);
+             fe10x4_mul(&t2, &p1[2], &p2[2]);
+             fe10x4_add(&t3, &p1[0], &p1[1]);
+    /*  5 */ fe10x4_add(&t4, &p2[0], &p2[1]);
+             fe10x4_mul(&t3, &t3, &t4);
+             fe10x4_add(&t4, &t0, &t1);
+             fe10x4_sub(&t3, &t3, &t4);
+             fe10x4_add(&t4, &p1[1], &p1[2]);
+    /* 10 */ fe10x4_add(&x3, &p2[1], &p2[2]);
+             fe10x4_mul(&t4, &t4, &x3);
+             fe10x4_add(&x3, &t1, &t2);
+             fe10x4_sub(&t4, &t4, &x3);
+             fe10x4_add(&x3, &p1[0], &p1[2]);
+    /* 15 */ fe10x4_add(&y3, &p2[0], &p2[2]);
+             fe10x4_mul(&x3, &x3, &y3);
+             fe10x4_add(&y3, &t0, &t2);
+             fe10x4_sub(&y3, &x3, &y3);
+             fe10x4_mul_b(&z3, &t2);
+    /* 20 */ fe10x4_sub(&x3, &y3, &z3);
+             fe10x4_add(&z3, &x3, &x3);
+             fe10x4_add(&x3, &x3, &z3); fe10x4_carry(&x3);
+             fe10x4_sub(&z3, &t1, &x3);
+             fe10x4_add(&x3, &t1, &x3);
+    /* 25 */ fe10x4_mul_b(&y3, &y3);
+             fe10x4_add(&t1, &t2, &t2);
+             fe10x4_add(&t2, &t1, &t2); fe10x4_carry(&t2);
+             fe10x4_sub(&y3, &y3, &t2);
+             fe10x4_sub(&y3, &y3, &t0);
+    /* 30 */ fe10x4_add(&t1, &y3, &y3);
+             fe10x4_add(&y3, &t1, &y3); fe10x4_carry(&y3);
+             fe10x4_add(&t1, &t0, &t0);
+             fe10x4_add(&t0, &t1, &t0); fe10x4_carry(&t0);
+             fe10x4_sub(&t0, &t0, &t2);
+    /* 35 */ fe10x4_mul(&t1, &t4, &y3);
+             fe10x4_mul(&t2, &t0, &y3);
+             fe10x4_mul(&y3, &x3, &z3);
+             fe10x4_add(&p3[1], &y3, &t2);
+             fe10x4_mul(&x3, &x3, &t3);
+    /* 40 */ fe10x4_sub(&p3[0], &x3, &t1);
+             fe10x4_mul(&z3, &z3, &t4);
+             fe10x4_mul(&t1, &t3, &t0);
+             fe10x4_add(&p3[2], &z3, &t1);
+
+    fe10x4_carry(&p3[1]);
+    fe10x4_carry(&p3[2]);
+}
+
+// Double `p` into `p3`, the coordinates of `p` must be carried
+static void ge10x4_double(ge10x4 p3, ge10x4 p)
+{
+    fe10x4 x3, y3, z3, t0, t1, t2, t3;
+
+    /*   #: Instruction number as mentioned in the paper */
+             fe10x4_square(&t0, &p[0]);
+             fe10x4_square(&t1, &p[1]);
+             fe10x4_square(&t2, &p[2]);
+             fe10x4_mul(&t3, &p[0], &p[1]);
+    /*  5 */ fe10x4_add(&t3, &t3, &t3);
+             fe10x4_mul(&z3, &p[0], &p[2]);
+             fe10x4_add(&z3, &z3, &z3); fe10x4_carry(&z3);
+             fe10x4_mul_b(&y3, &t2);
+             fe10x4_sub(&y3, &y3, &z3);
+    /* 10 */ fe10x4_add(&x3, &y3, &y3);
+             fe10x4_add(&y3, &x3, &y3); fe10x4_carry(&y3);
+             fe10x4_sub(&x3, &t1, &y3);
+             fe10x4_add(&y3, &t1, &y3);
+             fe10x4_mul(&y3, &x3, &y3);
+    /* 15 */ fe10x4_mul(&x3, &x3, &t3);
+             fe10x4_add(&t3, &t2, &t2);
+             fe10x4_add(&t2, &t2, &t3); fe10x4_carry(&t2);
+             fe10x4_mul_b(&z3, &z3);
+             fe10x4_sub(&z3, &z3, &t2);
+    /* 20 */ fe10x4_sub(&z3, &z3, &t0);
+             fe10x4_add(&t3, &z3, &z3);
+             fe10x4_add(&z3, &z3, &t3); fe10x4_carry(&z3);
+             fe10x4_add(&t3, &t0, &t0);
+             fe10x4_add(&t0, &t3, &t0); fe10x4_carry(&t0);
+    /* 25 */ fe10x4_sub(&t0, &t0, &t2);
+             fe10x4_mul(&t0, &t0, &z3);
+             fe10x4_add(&y3, &y3, &t0);
+             fe10x4_mul(&t0, &p[1], &p[2]);
+             fe10x4_add(&t0, &t0, &t0);
+    /* 30 */ fe10x4_mul(&z3, &t0, &z3);
+             fe10x4_sub(&p3[0], &x3, &z3);
+             fe10x4_mul(&z3, &t0, &t1);
+             fe10x4_add(&z3, &z3, &z3);
+             fe10x4_add(&p3[2], &z3, &z3);
+
+    p3[1] = y3;
+    fe10x4_carry(&p3[1]);
+    fe10x4_carry(&p3[2]);
+}
+
+// Conditionally copy `src` into `dest`, lane by lane, assumes dest == {0}
+static void ge10x4_cmov(ge10x4 dest, ge10x4 src, const uint64_t mask[4])
+{
+    for (unsigned int c = 0; c < 3; c++) {
+        for (unsigned int i = 0; i < 40; i++) {
+            dest[c].v[i] |= src[c].v[i] & mask[i % 4];
+        }
+    }
+}
+
+// Constant-time lookup of the signed windows `bits` in an interleaved table,
+// like `window_select` but with a different window for every lane
+static void ge10x4_select(ge10x4 dest, const uint8_t bits[4], ge10x4 *table)
+{
+    uint64_t mask[4], signmask[4];
+    uint32_t idx[4];
+
+    for (unsigned int l = 0; l < 4; l++) {
+        // Same mapping as `compute_idx` in ladder.asm
+        const uint32_t sign = (bits[l] >> 4) & 0x1;
+        const uint32_t sm = -sign;
+        idx[l] = (((bits[l] - 1) & ~sm) | (~bits[l] & sm)) & 0x1F;
+        signmask[l] = -(uint64_t)sign;
+    }
+
+    for (unsigned int c = 0; c < 3; c++) {
+        for (unsigned int i = 0; i < 40; i++) dest[c].v[i] = 0;
+    }
+    for (unsigned int l = 0; l < 4; l++) {
+        dest[1].v[l] = (uint64_t)(idx[l] == 0x1F);
+    }
+    for (unsigned int j = 0; j < 16; j++) {
+        for (unsigned int l = 0; l < 4; l++) mask[l] = -(uint64_t)(idx[l] == j);
+        ge10x4_cmov(dest, table[j], mask);
+    }
+
+    // Conditionally negate Y by computing 4*p - Y
+    for (unsigned int i = 0; i < 10; i++) {
+        const uint64_t fourp = i == 0 ? _4P0 : (i % 2 == 0 ? _4PRestB26 : _4PRestB25);
+        for (unsigned int l = 0; l < 4; l++) {
+            const uint64_t y = dest[1].v[4*i + l];
+            dest[1].v[4*i + l] = ((fourp - y) & signmask[l]) | (y & ~signmask[l]);
+        }
+    }
+    fe10x4_carry(&dest[1]);
+}
+
+// Compute the interleaved table [P, 2P, ..., 16P] for four points
+static void ge10x4_precompute(ge10x4 table[16], ge10x4 p)
+{
+    for (unsigned int c = 0; c < 3; c++) table[0][c] = p[c];
+    ge10x4_double(table[1], table[0]);
+    for (unsigned int i = 2; i < 16; i++) {
+        if (i % 2 == 1) {
+            ge10x4_double(table[i], table[i / 2]);
+        } else {
+            ge10x4_add(table[i], table[i - 1], table[0]);
+        }
+    }
+}
+
+int crypto_scalarmult_x4(uint8_t *out, const uint8_t *keys, const uint8_t *in)
+{
+    ge10x4 p, q, t;
+    ge10x4 table[16];
+    ge lanes[4];
+    uint8_t w[4][51], zeroth_window[4], bits[4];
+    uint64_t mask[4];
+    int invalid[4];
+    int ret = 0;
+
+    if (!backend_has_avx2()) return generic_batch(out, keys, in, 4);
+
+    // Interleave the input points, an invalid point is replaced by 𝒪
+    for (unsigned int l = 0; l < 4; l++) {
+        invalid[l] = ge_frombytes(lanes[l], &in[64*l]);
+        if (invalid[l]) {
+            ge_zero(lanes[l]);
+            lanes[l][1].v[0] = 1;
+        }
+        for (unsigned int c = 0; c < 3; c++) {
+            for (unsigned int i = 0; i < 10; i++) p[c].v[4*i + l] = lanes[l][c].v[i];
+        }
+        window_compute(w[l], &zeroth_window[l], &keys[32*l]);
+    }
+    ge10x4_precompute(table, p);
+
+    // Initialize every lane with 𝒪 or P, depending on its zeroth window
+    for (unsigned int c = 0; c < 3; c++) {
+        for (unsigned int i = 0; i < 40; i++) q[c].v[i] = 0;
+    }
+    for (unsigned int l = 0; l < 4; l++) {
+        q[1].v[l] = (uint64_t)(zeroth_window[l] == 0);
+        mask[l] = -(uint64_t)(zeroth_window[l] == 1);
+    }
+    ge10x4_cmov(q, table[0], mask);
+
+    for (unsigned int i = 0; i < 51; i++) {
+        for (unsigned int j = 0; j < 5; j++) ge10x4_double(q, q);
+        for (unsigned int l = 0; l < 4; l++) bits[l] = w[l][i];
+        ge10x4_select(t, bits, table);
+        ge10x4_add(q, q, t);
+    }
+
+    // Deinterleave, and convert all four points using a single inversion
+    for (unsigned int l = 0; l < 4; l++) {
+        for (unsigned int c = 0; c < 3; c++) {
+            for (unsigned int i = 0; i < 10; i++) lanes[l][c].v[i] = q[c].v[4*i + l];
+        }
+    }
+    ge_tobytes_batch(out, lanes, 4);
+
+    for (unsigned int l = 0; l < 4; l++) {
+        if (!invalid[l]) continue;
+        for (unsigned int i = 0; i < 64; i++) out[64*l + i] = 0;
+        ret = -1;
+    }
+    return ret;
+}
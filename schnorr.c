@@ -0,0 +1,278 @@
+/*
+Schnorr signatures over Curve13318
+
+The scheme follows the structure of Ed25519 (RFC 8032), with the hash function
+replaced by `expand_message_xmd` with SHA-256 (RFC 9380) and points encoded in
+their compressed 33-byte form:
+
+  - Key generation expands the 32-byte seed into the secret scalar a and a
+    32-byte nonce prefix. The public key is A = a * G.
+  - Signing derives the nonce r from the prefix and the message, computes
+    R = r * G, the challenge c = H(R || A || msg) and s = r + c * a (mod n).
+    The signature is R || s.
+  - Verification checks that s * G - c * A = R.
+
+The group order n is slightly larger than 2^255, but `crypto_scalarmult`
+ignores bit 255 of its scalars. We therefore clear bit 255 of a and r (which
+biases them by less than 2^-127), and the verification negates the point of
+every scalar k >= 2^255, such that it can use n - k < 2^128 instead.
+
+Batch verification checks a random linear combination of the verification
+equations with a single multi-scalar multiplication. The 128-bit weights are
+derived by hashing 32 fresh bytes from the operating system's CSPRNG
+(getrandom) together with all the signatures and challenges. A hash of the
+public inputs alone would let someone who creates the signatures compute the
+weights, and pick invalid signatures whose errors cancel out. As a result, the
+weights differ between calls.
+*/
+
+#define _DEFAULT_SOURCE
+
+#include "fe51.h"
+#include "sc.h"
+#include "scalarmult.h"
+#include "sha256.h"
+#include <errno.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/random.h>
+
+#define DST(name) "CURVE13318-SCHNORR-SHA256-" name
+#define DST_LEN(dst) (sizeof(dst) - 1)
+
+static const uint8_t dst_key[] = DST("KEY");
+static const uint8_t dst_nonce[] = DST("NONCE");
+static const uint8_t dst_challenge[] = DST("CHALLENGE");
+static const uint8_t dst_batch[] = DST("BATCH");
+
+// The base point G, see `crypto_scalarmult_base`
+static const uint8_t base_point[64] = {
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    179, 43, 106, 247, 206, 176, 201, 77, 137, 224, 122, 176, 76, 93, 29, 69,
+    190, 137, 17, 103, 105, 172, 236, 172, 225, 72, 243, 7, 94, 128, 240, 17
+};
+
+// Hash the concatenation of `parts` to a scalar
+static void hash_to_scalar(sc *r, const uint8_t *const *parts, const size_t *partlens,
+                           size_t nparts, const uint8_t *dst, size_t dstlen)
+{
+    uint8_t h[64];
+
+    expand_message_xmd(h, sizeof(h), parts, partlens, nparts, dst, dstlen);
+    sc_frombytes64(r, h);
+}
+
+// Clear bit 255 of `r`, which is ignored by the scalar multiplications, and
+// write the result to `s`
+static void sc_clear_bit255(sc *r, uint8_t *s)
+{
+    sc_tobytes(s, r);
+    s[31] &= 0x7F;
+    sc_frombytes(r, s);
+}
+
+// Derive the secret scalar and the nonce prefix from a seed
+static void derive_key(sc *a, uint8_t *a_bytes, uint8_t *prefix, const uint8_t *seed)
+{
+    const size_t seedlen = SCHNORR_SEEDBYTES;
+    uint8_t h[96];
+
+    expand_message_xmd(h, sizeof(h), &seed, &seedlen, 1, dst_key, DST_LEN(dst_key));
+    sc_frombytes64(a, h);
+    sc_clear_bit255(a, a_bytes);
+    memcpy(prefix, &h[64], 32);
+}
+
+// c = H(R || A || msg)
+static void challenge(sc *c, const uint8_t *r, const uint8_t *pk, const uint8_t *msg, size_t msglen)
+{
+    const uint8_t *parts[3] = {r, pk, msg};
+    const size_t partlens[3] = {SCHNORR_PUBLICKEYBYTES, SCHNORR_PUBLICKEYBYTES, msglen};
+
+    hash_to_scalar(c, parts, partlens, 3, dst_challenge, DST_LEN(dst_challenge));
+}
+
+// Decompress a point and reject non-canonical encodings
+static int decode_point(uint8_t *out, const uint8_t *in)
+{
+    uint8_t recompressed[33];
+
+    if (crypto_scalarmult_decompress(out, in) != 0) return -1;
+    crypto_scalarmult_compress(recompressed, out);
+    return memcmp(recompressed, in, sizeof(recompressed)) == 0 ? 0 : -1;
+}
+
+/*
+Write a scalar (32 bytes) and a point (64 bytes) such that k * p = x * point
+and k < 2^255 to `k` and `p`, where `p` may equal `point`. Runs in variable
+time.
+*/
+static void signed_term(uint8_t *k, uint8_t *p, const sc *x, const uint8_t *point)
+{
+    static const fe51 zero = {{0}};
+    fe51 y;
+    sc neg;
+
+    sc_tobytes(k, x);
+    memmove(p, point, 64);
+    if ((k[31] & 0x80) == 0) return;
+
+    // x * P = (n - x) * (-P)
+    sc_neg(&neg, x);
+    sc_tobytes(k, &neg);
+    fe51_frombytes(&y, &point[32]);
+    fe51_sub(&y, &zero, &y);
+    fe51_carry(&y);
+    fe51_pack(&p[32], &y);
+}
+
+int crypto_scalarmult_schnorr_keypair(uint8_t *pk, uint8_t *sk, const uint8_t *seed)
+{
+    uint8_t a_bytes[32], prefix[32], point[64];
+    sc a;
+
+    derive_key(&a, a_bytes, prefix, seed);
+    crypto_scalarmult_base(point, a_bytes);
+    crypto_scalarmult_compress(pk, point);
+    memmove(&sk[0], seed, SCHNORR_SEEDBYTES);
+    memcpy(&sk[SCHNORR_SEEDBYTES], pk, SCHNORR_PUBLICKEYBYTES);
+    return 0;
+}
+
+int crypto_scalarmult_schnorr_sign(uint8_t *sig, const uint8_t *msg, size_t msglen,
+                                   const uint8_t *sk)
+{
+    const uint8_t *pk = &sk[SCHNORR_SEEDBYTES];
+    uint8_t a_bytes[32], prefix[32], r_bytes[32], point[64];
+    sc a, r, c, s;
+
+    derive_key(&a, a_bytes, prefix, sk);
+
+    // r = H(prefix || msg) and R = r * G
+    const uint8_t *parts[2] = {prefix, msg};
+    const size_t partlens[2] = {sizeof(prefix), msglen};
+    hash_to_scalar(&r, parts, partlens, 2, dst_nonce, DST_LEN(dst_nonce));
+    sc_clear_bit255(&r, r_bytes);
+    crypto_scalarmult_base(point, r_bytes);
+    crypto_scalarmult_compress(&sig[0], point);
+
+    // s = r + c * a
+    challenge(&c, &sig[0], pk, msg, msglen);
+    sc_mul(&s, &c, &a);
+    sc_add(&s, &s, &r);
+    sc_tobytes(&sig[SCHNORR_PUBLICKEYBYTES], &s);
+    return 0;
+}
+
+int crypto_scalarmult_schnorr_verify(const uint8_t *sig, const uint8_t *msg, size_t msglen,
+                                     const uint8_t *pk)
+{
+    uint8_t r[64], a[64], k[32], p[64], l[32], q[64], out[64];
+    sc s, c;
+
+    if (decode_point(r, &sig[0]) != 0) return -1;
+    if (decode_point(a, pk) != 0) return -1;
+    if (sc_frombytes_canonical(&s, &sig[SCHNORR_PUBLICKEYBYTES]) != 0) return -1;
+
+    // s * G + (-c) * A = R
+    challenge(&c, &sig[0], pk, msg, msglen);
+    sc_neg(&c, &c);
+    signed_term(k, p, &s, base_point);
+    signed_term(l, q, &c, a);
+    if (crypto_scalarmult_double_vartime(out, k, p, l, q) != 0) return -1;
+    return memcmp(out, r, sizeof(out)) == 0 ? 0 : -1;
+}
+
+// Fill `buf` with `len` bytes from the operating system's CSPRNG, returns
+// nonzero on failure
+static int random_bytes(uint8_t *buf, size_t len)
+{
+    while (len > 0) {
+        ssize_t ret = getrandom(buf, len, 0);
+        if (ret < 0 && errno == EINTR) continue;
+        if (ret < 0) return -1;
+        buf += ret;
+        len -= (size_t)ret;
+    }
+    return 0;
+}
+
+int crypto_scalarmult_schnorr_verify_batch(const uint8_t *sigs, const uint8_t *const *msgs,
+                                           const size_t *msglens, const uint8_t *pks, size_t n)
+{
+    uint8_t *k, *p, noise[32], seed[SHA256_BYTES], out[64];
+    sc *c, s, sum = {{0}};
+    sha256_state state;
+    int ret = -1;
+
+    if (n == 0) return 0;
+    // The sizes of the 2*n + 1 terms must not overflow
+    if (n > (SIZE_MAX / 64 - 1) / 2) return -1;
+
+    // Term 0 is G, term 1 + 2*i is R_i and term 2 + 2*i is A_i
+    k = malloc(32 * (2*n + 1));
+    p = malloc(64 * (2*n + 1));
+    c = malloc(sizeof(sc) * n);
+    if (k == NULL || p == NULL || c == NULL) goto cleanup;
+    if (random_bytes(noise, sizeof(noise)) != 0) goto cleanup;
+
+    sha256_init(&state);
+    sha256_update(&state, dst_batch, DST_LEN(dst_batch));
+    sha256_update(&state, noise, sizeof(noise));
+    for (size_t i = 0; i < n; i++) {
+        const uint8_t *sig = &sigs[SCHNORR_SIGNATUREBYTES*i], *pk = &pks[SCHNORR_PUBLICKEYBYTES*i];
+        uint8_t c_bytes[32];
+
+        if (decode_point(&p[64*(1 + 2*i)], &sig[0]) != 0) goto cleanup;
+        if (decode_point(&p[64*(2 + 2*i)], pk) != 0) goto cleanup;
+        if (sc_frombytes_canonical(&s, &sig[SCHNORR_PUBLICKEYBYTES]) != 0) goto cleanup;
+        challenge(&c[i], &sig[0], pk, msgs[i], msglens[i]);
+
+        // The challenge commits to R, A and the message
+        sc_tobytes(c_bytes, &c[i]);
+        sha256_update(&state, sig, SCHNORR_SIGNATUREBYTES);
+        sha256_update(&state, c_bytes, sizeof(c_bytes));
+    }
+    sha256_final(&state, seed);
+
+    // sum(z_i * s_i) * G - sum(z_i * R_i) - sum(z_i * c_i * A_i) = 0
+    for (size_t i = 0; i < n; i++) {
+        const uint8_t *sig = &sigs[SCHNORR_SIGNATUREBYTES*i];
+        uint8_t index[8], h[SHA256_BYTES], z_bytes[32] = {0};
+        sc z, t;
+
+        for (unsigned int j = 0; j < 8; j++) index[j] = (uint8_t)((uint64_t)i >> (8*j));
+        sha256_init(&state);
+        sha256_update(&state, seed, sizeof(seed));
+        sha256_update(&state, index, sizeof(index));
+        sha256_final(&state, h);
+        memcpy(z_bytes, h, 16);
+        sc_frombytes(&z, z_bytes);
+
+        sc_frombytes(&s, &sig[SCHNORR_PUBLICKEYBYTES]);
+        sc_mul(&t, &z, &s);
+        sc_add(&sum, &sum, &t);
+
+        sc_neg(&t, &z);
+        signed_term(&k[32*(1 + 2*i)], &p[64*(1 + 2*i)], &t, &p[64*(1 + 2*i)]);
+        sc_mul(&t, &t, &c[i]);
+        signed_term(&k[32*(2 + 2*i)], &p[64*(2 + 2*i)], &t, &p[64*(2 + 2*i)]);
+    }
+    signed_term(&k[0], &p[0], &sum, base_point);
+
+    if (crypto_scalarmult_multi(out, k, p, 2*n + 1) != 0) goto cleanup;
+    // The point at infinity is encoded as all zeros
+    ret = 0;
+    for (size_t i = 0; i < sizeof(out); i++) ret |= out[i];
+    ret = ret == 0 ? 0 : -1;
+
+cleanup:
+    memset(noise, 0, sizeof(noise));
+    memset(seed, 0, sizeof(seed));
+    free(c);
+    free(p);
+    free(k);
+    return ret;
+}
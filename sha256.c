@@ -0,0 +1,144 @@
+/*
+A straightforward portable implementation of SHA-256 (FIPS 180-4)
+
+Hashing is only a small part of hashing to the curve and of signing, so this
+implementation does not use the SHA extensions.
+*/
+
+#include "sha256.h"
+#include <string.h>
+
+static const uint32_t K[64] = {
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
+};
+
+static uint32_t rotr(uint32_t x, unsigned int n)
+{
+    return (x >> n) | (x << (32 - n));
+}
+
+static uint32_t load_be32(const uint8_t *s)
+{
+    return ((uint32_t)s[0] << 24) | ((uint32_t)s[1] << 16) | ((uint32_t)s[2] << 8) | s[3];
+}
+
+static void store_be32(uint8_t *s, uint32_t x)
+{
+    for (unsigned int i = 0; i < 4; i++) s[i] = (uint8_t)(x >> (24 - 8*i));
+}
+
+static void compress(uint32_t h[8], const uint8_t *block)
+{
+    uint32_t w[64], a, b, c, d, e, f, g, hh, t1, t2;
+
+    for (unsigned int i = 0; i < 16; i++) w[i] = load_be32(&block[4*i]);
+    for (unsigned int i = 16; i < 64; i++) {
+        const uint32_t s0 = rotr(w[i-15], 7) ^ rotr(w[i-15], 18) ^ (w[i-15] >> 3);
+        const uint32_t s1 = rotr(w[i-2], 17) ^ rotr(w[i-2], 19) ^ (w[i-2] >> 10);
+        w[i] = w[i-16] + s0 + w[i-7] + s1;
+    }
+
+    a = h[0]; b = h[1]; c = h[2]; d = h[3];
+    e = h[4]; f = h[5]; g = h[6]; hh = h[7];
+    for (unsigned int i = 0; i < 64; i++) {
+        t1 = hh + (rotr(e, 6) ^ rotr(e, 11) ^ rotr(e, 25)) + ((e & f) ^ (~e & g)) + K[i] + w[i];
+        t2 = (rotr(a, 2) ^ rotr(a, 13) ^ rotr(a, 22)) + ((a & b) ^ (a & c) ^ (b & c));
+        hh = g; g = f; f = e; e = d + t1;
+        d = c; c = b; b = a; a = t1 + t2;
+    }
+    h[0] += a; h[1] += b; h[2] += c; h[3] += d;
+    h[4] += e; h[5] += f; h[6] += g; h[7] += hh;
+}
+
+void sha256_init(sha256_state *state)
+{
+    static const uint32_t iv[8] = {
+        0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19
+    };
+    memcpy(state->h, iv, sizeof(iv));
+    state->len = 0;
+    state->buflen = 0;
+}
+
+void sha256_update(sha256_state *state, const uint8_t *data, size_t len)
+{
+    if (len == 0) return;
+    state->len += len;
+    if (state->buflen > 0) {
+        const size_t take = SHA256_BLOCK_BYTES - state->buflen < len
+                            ? SHA256_BLOCK_BYTES - state->buflen : len;
+        memcpy(&state->buf[state->buflen], data, take);
+        state->buflen += take;
+        data += take;
+        len -= take;
+        if (state->buflen < SHA256_BLOCK_BYTES) return;
+        compress(state->h, state->buf);
+        state->buflen = 0;
+    }
+    for (; len >= SHA256_BLOCK_BYTES; data += SHA256_BLOCK_BYTES, len -= SHA256_BLOCK_BYTES) {
+        compress(state->h, data);
+    }
+    memcpy(state->buf, data, len);
+    state->buflen = len;
+}
+
+void sha256_final(sha256_state *state, uint8_t *out)
+{
+    const uint64_t bits = 8 * state->len;
+
+    state->buf[state->buflen++] = 0x80;
+    if (state->buflen > SHA256_BLOCK_BYTES - 8) {
+        memset(&state->buf[state->buflen], 0, SHA256_BLOCK_BYTES - state->buflen);
+        compress(state->h, state->buf);
+        state->buflen = 0;
+    }
+    memset(&state->buf[state->buflen], 0, SHA256_BLOCK_BYTES - 8 - state->buflen);
+    store_be32(&state->buf[56], (uint32_t)(bits >> 32));
+    store_be32(&state->buf[60], (uint32_t)bits);
+    compress(state->h, state->buf);
+
+    for (unsigned int i = 0; i < 8; i++) store_be32(&out[4*i], state->h[i]);
+}
+
+void expand_message_xmd(uint8_t *out, size_t len, const uint8_t *const *parts,
+                        const size_t *partlens, size_t nparts, const uint8_t *dst, size_t dstlen)
+{
+    static const uint8_t z_pad[SHA256_BLOCK_BYTES] = {0};
+    const uint8_t len_zero[3] = {(uint8_t)(len >> 8), (uint8_t)len, 0};
+    const uint8_t dst_len = (uint8_t)dstlen;
+    uint8_t b0[SHA256_BYTES], bi[SHA256_BYTES];
+    sha256_state state;
+
+    // b_0 = H(Z_pad || msg || I2OSP(len, 2) || I2OSP(0, 1) || DST_prime)
+    sha256_init(&state);
+    sha256_update(&state, z_pad, sizeof(z_pad));
+    for (size_t i = 0; i < nparts; i++) sha256_update(&state, parts[i], partlens[i]);
+    sha256_update(&state, len_zero, sizeof(len_zero));
+    sha256_update(&state, dst, dstlen);
+    sha256_update(&state, &dst_len, 1);
+    sha256_final(&state, b0);
+
+    // b_i = H((b_0 ^ b_(i - 1)) || I2OSP(i, 1) || DST_prime), where b_1 is
+    // hashed from b_0 alone
+    memset(bi, 0, sizeof(bi));
+    for (size_t i = 1; 32*(i - 1) < len; i++) {
+        const uint8_t counter = (uint8_t)i;
+        for (size_t j = 0; j < SHA256_BYTES; j++) bi[j] ^= b0[j];
+        sha256_init(&state);
+        sha256_update(&state, bi, sizeof(bi));
+        sha256_update(&state, &counter, 1);
+        sha256_update(&state, dst, dstlen);
+        sha256_update(&state, &dst_len, 1);
+        sha256_final(&state, bi);
+
+        const size_t take = len - 32*(i - 1) < SHA256_BYTES ? len - 32*(i - 1) : SHA256_BYTES;
+        memcpy(&out[32*(i - 1)], bi, take);
+    }
+}
@@ -0,0 +1,65 @@
+/*
+SHA-256 (FIPS 180-4) and expand_message_xmd (RFC 9380), used for hashing to the
+curve and for signatures
+*/
+
+#ifndef CURVE13318_SHA256_H_
+#define CURVE13318_SHA256_H_
+
+#include <stddef.h>
+#include <stdint.h>
+
+#define sha256_init crypto_scalarmult_curve13318_avx2_sha256_init
+#define sha256_update crypto_scalarmult_curve13318_avx2_sha256_update
+#define sha256_final crypto_scalarmult_curve13318_avx2_sha256_final
+#define expand_message_xmd crypto_scalarmult_curve13318_avx2_expand_message_xmd
+
+// Size of a digest in bytes
+#define SHA256_BYTES 32
+// Size of an input block in bytes
+#define SHA256_BLOCK_BYTES 64
+// Maximum length of a domain separation tag for `expand_message_xmd`
+#define EXPAND_DST_MAX_BYTES 255
+
+typedef struct {
+    uint32_t h[8];
+    uint64_t len;
+    uint8_t buf[SHA256_BLOCK_BYTES];
+    size_t buflen;
+} sha256_state;
+
+/*
+Start a new hash computation
+*/
+void sha256_init(sha256_state *state);
+
+/*
+Absorb `len` bytes of `data` into the hash computation
+*/
+void sha256_update(sha256_state *state, const uint8_t *data, size_t len);
+
+/*
+Finish the hash computation and write the digest to `out` (SHA256_BYTES bytes)
+*/
+void sha256_final(sha256_state *state, uint8_t *out);
+
+/*
+expand_message_xmd from RFC 9380 with SHA-256
+
+The message is the concatenation of the `nparts` buffers in `parts`, so that
+callers do not have to copy the inputs of a hash into one buffer.
+
+Arguments:
+  - out         Pointer to the output (`len` bytes, at most 255 * 32)
+  - len         Length of the output in bytes
+  - parts       Array of pointers to the parts of the message
+  - partlens    Array of the lengths of the parts
+  - nparts      Amount of parts
+  - dst         Pointer to the domain separation tag
+  - dstlen      Length of the domain separation tag, at most
+                EXPAND_DST_MAX_BYTES
+*/
+void expand_message_xmd(uint8_t *out, size_t len, const uint8_t *const *parts,
+                        const size_t *partlens, size_t nparts, const uint8_t *dst, size_t dstlen);
+
+#endif // CURVE13318_SHA256_H_
@@ -2,9 +2,13 @@
 # *-* encoding: utf-8 *-*
 
 import ctypes
+import hashlib
 import io
 import os
+import subprocess
 import sys
+import tempfile
+import threading
 import unittest
 
 from sage.all import *
@@ -12,9 +16,14 @@ from sage.all import *
 from hypothesis import *
 from hypothesis import strategies as st
 
+import curve13318 as bindings
+
 P = 2**255 - 19
 F = FiniteField(P)
 E = EllipticCurve(F, [-3, 13318])
+G = E(0, 0x11f0805e07f348e1acecac69671189be451d5d4cb07ae0894dc9b0cef76a2bb3)
+# The order of G (and of E)
+N = 0x80000000000000000000000000000000f4f654f83deb8d16eb7d12dc4dc2cbe3
 
 # Initialize hypothesis
 settings.register_profile('default', settings())
@@ -51,6 +60,10 @@ fe10_reduce.argtypes = [fe10_type]
 
 fe51_mul = curve13318.crypto_scalarmult_curve13318_avx2_fe51_mul
 fe51_mul.argtypes = [fe51_type] * 3
+fe51_invert = curve13318.crypto_scalarmult_curve13318_avx2_fe51_invert
+fe51_invert.argtypes = [fe51_type] * 2
+fe51_invert_safegcd = curve13318.crypto_scalarmult_curve13318_avx2_fe51_invert_safegcd
+fe51_invert_safegcd.argtypes = [fe51_type] * 2
 
 ge_frombytes = curve13318.crypto_scalarmult_curve13318_avx2_ge_frombytes
 ge_frombytes.argtypes = [ge_type, ctypes.c_ubyte * 64]
@@ -77,6 +90,111 @@ ge_double_asm.argtypes = [ge_opt_type] * 2
 
 scalarmult = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult
 scalarmult.argtypes = [ctypes.c_ubyte * 64, ctypes.c_ubyte * 32, ctypes.c_ubyte * 64]
+scalarmult_backend = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_backend
+scalarmult_backend.restype = ctypes.c_char_p
+scalarmult_force_backend = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_force_backend
+scalarmult_force_backend.argtypes = [ctypes.c_char_p]
+scalarmult_profile_type = ctypes.c_uint64 * 7
+scalarmult_profile_enable = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_profile_enable
+scalarmult_profile_enable.argtypes = [ctypes.c_int]
+scalarmult_profile_get = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_profile_get
+scalarmult_profile_get.argtypes = [scalarmult_profile_type]
+scalarmult_profile_reset = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_profile_reset
+scalarmult_batch = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_batch
+scalarmult_batch.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t]
+scalarmult_prepared_type = ctypes.c_uint32 * (16 * 32)
+scalarmult_prepare = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_prepare
+scalarmult_prepare.argtypes = [scalarmult_prepared_type, ctypes.c_ubyte * 64]
+scalarmult_prepared = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_prepared
+scalarmult_prepared.argtypes = [ctypes.c_ubyte * 64, ctypes.c_ubyte * 32, scalarmult_prepared_type]
+scalarmult_cache_type = ctypes.c_ubyte * 40960 # more than sizeof(scalarmult_cache)
+scalarmult_cache_init = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_cache_init
+scalarmult_cache_init.argtypes = [scalarmult_cache_type]
+scalarmult_cached = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_cached
+scalarmult_cached.argtypes = [ctypes.c_ubyte * 64, ctypes.c_ubyte * 32, ctypes.c_ubyte * 64, scalarmult_cache_type]
+scalarmult_table_type = ctypes.c_ubyte * 32 # sizeof(scalarmult_table)
+scalarmult_table_bytes = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_table_bytes
+scalarmult_table_bytes.argtypes = [ctypes.c_size_t]
+scalarmult_table_bytes.restype = ctypes.c_size_t
+scalarmult_table_build = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_table_build
+scalarmult_table_build.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t]
+scalarmult_table_open = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_table_open
+scalarmult_table_open.argtypes = [scalarmult_table_type, ctypes.c_char_p]
+scalarmult_table_close = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_table_close
+scalarmult_table_close.argtypes = [scalarmult_table_type]
+scalarmult_table_find = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_table_find
+scalarmult_table_find.argtypes = [scalarmult_table_type, ctypes.c_ubyte * 64]
+scalarmult_table_find.restype = ctypes.c_void_p
+scalarmult_base = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_base
+scalarmult_base.argtypes = [ctypes.c_ubyte * 64, ctypes.c_ubyte * 32]
+scalarmult_projective = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_projective
+scalarmult_projective.argtypes = [ctypes.c_ubyte * 96, ctypes.c_ubyte * 32, ctypes.c_ubyte * 64]
+scalarmult_base_projective = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_base_projective
+scalarmult_base_projective.argtypes = [ctypes.c_ubyte * 96, ctypes.c_ubyte * 32]
+scalarmult_normalize = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_normalize
+scalarmult_normalize.argtypes = [ctypes.c_ubyte * 64, ctypes.c_ubyte * 96]
+scalarmult_normalize_batch = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_normalize_batch
+scalarmult_normalize_batch.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t]
+scalarmult_double_type = [ctypes.c_ubyte * 32, ctypes.c_ubyte * 64] * 2
+scalarmult_double = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_double
+scalarmult_double.argtypes = [ctypes.c_ubyte * 64] + scalarmult_double_type
+scalarmult_double_projective = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_double_projective
+scalarmult_double_projective.argtypes = [ctypes.c_ubyte * 96] + scalarmult_double_type
+scalarmult_double_vartime = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_double_vartime
+scalarmult_double_vartime.argtypes = [ctypes.c_ubyte * 64] + scalarmult_double_type
+scalarmult_double_projective_vartime = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_double_projective_vartime
+scalarmult_double_projective_vartime.argtypes = [ctypes.c_ubyte * 96] + scalarmult_double_type
+scalarmult_vartime = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_vartime
+scalarmult_vartime.argtypes = [ctypes.c_ubyte * 64, ctypes.c_ubyte * 32, ctypes.c_ubyte * 64]
+scalarmult_projective_vartime = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_projective_vartime
+scalarmult_projective_vartime.argtypes = [ctypes.c_ubyte * 96, ctypes.c_ubyte * 32, ctypes.c_ubyte * 64]
+scalarmult_windowed = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_windowed
+scalarmult_windowed.argtypes = [ctypes.c_ubyte * 64, ctypes.c_ubyte * 32, ctypes.c_ubyte * 64, ctypes.c_uint]
+scalarmult_x4 = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_x4
+scalarmult_x4.argtypes = [ctypes.c_ubyte * 256, ctypes.c_ubyte * 128, ctypes.c_ubyte * 256]
+scalarmult_multi = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_multi
+scalarmult_multi.argtypes = [ctypes.c_ubyte * 64, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t]
+scalarmult_validate = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_validate
+scalarmult_validate.argtypes = [ctypes.c_ubyte * 64]
+scalarmult_validate_batch = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_validate_batch
+scalarmult_validate_batch.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t]
+scalarmult_compress = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_compress
+scalarmult_compress.argtypes = [ctypes.c_ubyte * 33, ctypes.c_ubyte * 64]
+scalarmult_decompress = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_decompress
+scalarmult_decompress.argtypes = [ctypes.c_ubyte * 64, ctypes.c_ubyte * 33]
+scalarmult_decompress_batch = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_decompress_batch
+scalarmult_decompress_batch.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t]
+scalarmult_compressed = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_compressed
+scalarmult_compressed.argtypes = [ctypes.c_ubyte * 64, ctypes.c_ubyte * 32, ctypes.c_ubyte * 33]
+scalarmult_ecdh = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_ecdh
+scalarmult_ecdh.argtypes = [ctypes.c_ubyte * 32, ctypes.c_ubyte * 32, ctypes.c_ubyte * 64]
+scalarmult_ecdh_compressed = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_ecdh_compressed
+scalarmult_ecdh_compressed.argtypes = [ctypes.c_ubyte * 32, ctypes.c_ubyte * 32, ctypes.c_ubyte * 33]
+scalarmult_hash_to_curve = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_hash_to_curve
+scalarmult_hash_to_curve.argtypes = [ctypes.c_ubyte * 64, ctypes.c_char_p, ctypes.c_size_t,
+                                     ctypes.c_char_p, ctypes.c_size_t]
+scalarmult_hash_to_curve_batch = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_hash_to_curve_batch
+scalarmult_hash_to_curve_batch.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p,
+                                           ctypes.c_size_t, ctypes.c_char_p, ctypes.c_size_t]
+scalarmult_map_to_curve = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_map_to_curve
+scalarmult_map_to_curve.argtypes = [ctypes.c_ubyte * 64, ctypes.c_ubyte * 32]
+scalar_reduce = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_scalar_reduce
+scalar_reduce.argtypes = [ctypes.c_ubyte * 32, ctypes.c_ubyte * 64]
+scalar_add = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_scalar_add
+scalar_add.argtypes = [ctypes.c_ubyte * 32] * 3
+scalar_mul = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_scalar_mul
+scalar_mul.argtypes = [ctypes.c_ubyte * 32] * 3
+scalar_invert = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_scalar_invert
+scalar_invert.argtypes = [ctypes.c_ubyte * 32] * 2
+schnorr_keypair = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_schnorr_keypair
+schnorr_keypair.argtypes = [ctypes.c_ubyte * 33, ctypes.c_ubyte * 65, ctypes.c_char_p]
+schnorr_sign = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_schnorr_sign
+schnorr_sign.argtypes = [ctypes.c_ubyte * 65, ctypes.c_char_p, ctypes.c_size_t, ctypes.c_ubyte * 65]
+schnorr_verify = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_schnorr_verify
+schnorr_verify.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_size_t, ctypes.c_char_p]
+schnorr_verify_batch = curve13318.crypto_scalarmult_curve13318_avx2_scalarmult_schnorr_verify_batch
+schnorr_verify_batch.argtypes = [ctypes.c_char_p, ctypes.c_void_p, ctypes.c_void_p,
+                                 ctypes.c_char_p, ctypes.c_size_t]
 select = curve13318.crypto_scalarmult_curve13318_avx2_select
 select.argtypes = [ge_opt_type, ctypes.c_uint64, ge_opt_type * 16]
 
@@ -209,6 +327,21 @@ class TestFE51(unittest.TestCase):
         # note("expected value: 0x{:32X}".format(F(expected)))
         self.assertEqual(F(actual), F(expected))
 
+    @given(st.lists(st.integers(0, 2**52 - 1), min_size=5, max_size=5))
+    @example([0] * 5)
+    @example([2**51 - 19] + [2**51 - 1] * 4)
+    def test_invert_safegcd(self, limbs):
+        vx = make_fe51(limbs)
+        vz = make_fe51([])
+        vz_chain = make_fe51([])
+        fe51_invert_safegcd(vz, vx)
+        fe51_invert(vz_chain, vx)
+        actual = fe51_val(vz)
+        self.assertLess(actual, 2**255 - 19)
+        self.assertEqual(F(actual), F(fe51_val(vz_chain)))
+        if F(fe51_val(vx)) != 0:
+            self.assertEqual(F(actual) * F(fe51_val(vx)), 1)
+
 class TestFE10x4(unittest.TestCase):
     @given(st.lists(st.integers(0, 2**63 - 1), min_size=10, max_size=10), st.integers(0, 3))
     def test_identity(self, limbs, lane):
@@ -623,6 +756,46 @@ class TestGE(unittest.TestCase):
         for limb in c_point3[20:30]:
             self.assertLessEqual(limb, 1.01 * 2**26)
         
+class TestSC(unittest.TestCase):
+    @staticmethod
+    def decode(c_bytes):
+        return int.from_bytes(bytes(c_bytes), 'little')
+
+    @given(st.integers(0, 2**512 - 1))
+    @example(N**2 - 1)
+    @example(2**512 - 1)
+    def test_reduce(self, x):
+        c_out = (ctypes.c_ubyte * 32)(0)
+        scalar_reduce(c_out, (ctypes.c_ubyte * 64)(*x.to_bytes(64, 'little')))
+        self.assertEqual(self.decode(c_out), x % N)
+
+    @given(st.integers(0, 2**256 - 1), st.integers(0, 2**256 - 1))
+    @example(N - 1, N - 1)
+    @example(2**256 - 1, 2**256 - 1)
+    def test_add(self, a, b):
+        c_out = (ctypes.c_ubyte * 32)(0)
+        scalar_add(c_out, TestScalarmult.encode_k(a), TestScalarmult.encode_k(b))
+        self.assertEqual(self.decode(c_out), (a + b) % N)
+
+    @given(st.integers(0, 2**256 - 1), st.integers(0, 2**256 - 1))
+    @example(N - 1, N - 1)
+    @example(2**256 - 1, 2**256 - 1)
+    def test_mul(self, a, b):
+        c_out = (ctypes.c_ubyte * 32)(0)
+        scalar_mul(c_out, TestScalarmult.encode_k(a), TestScalarmult.encode_k(b))
+        self.assertEqual(self.decode(c_out), a * b % N)
+
+    @given(st.integers(0, 2**256 - 1))
+    @example(0)
+    @example(N)
+    @example(N - 1)
+    def test_invert(self, a):
+        c_out = (ctypes.c_ubyte * 32)(0)
+        scalar_invert(c_out, TestScalarmult.encode_k(a))
+        expected = 0 if a % N == 0 else inverse_mod(a, N)
+        self.assertEqual(self.decode(c_out), expected)
+
+
 class TestScalarmult(unittest.TestCase):
     @staticmethod
     def encode_k(k):
@@ -686,6 +859,281 @@ class TestScalarmult(unittest.TestCase):
         
         self.assertEqual(actual, expected)
 
+    @given(st.integers(0, 2**255 - 1), st.integers(0, 2**256 - 1),
+           st.integers(1, 2**256 - 1), st.sampled_from([1, -1]),
+           st.sampled_from([b'avx2', b'fe51', b'fe51_affine', b'portable']))
+    @example(0, 0, 1, 1, b'fe51')
+    @example(0, 0, 1, 1, b'fe51_affine')
+    @example(0, 0, 1, 1, b'portable')
+    def test_scalarmult_backend(self, k, x, z, sign, name):
+        if scalarmult_force_backend(name) != 0:
+            # Not supported by this CPU
+            return
+        try:
+            self.assertEqual(scalarmult_backend(), name)
+            _, point = make_ge(x, z, sign)
+            x, y = point.xy()
+            c_bytes_in = TestGE.ge_to_bytes(x.lift(), y.lift())
+            for fn, args, expected_point in (
+                    (scalarmult, (c_bytes_in,), k * point),
+                    (scalarmult_base, (), k * G)):
+                if expected_point.is_zero():
+                    expected = (F(0), F(0))
+                else:
+                    expected = expected_point.xy()
+                c_bytes_out = (ctypes.c_ubyte * 64)(0)
+                ret = fn(c_bytes_out, self.encode_k(k), *args)
+                self.assertEqual(ret, 0)
+                self.assertEqual(TestGE.decode_bytes(c_bytes_out), expected)
+
+            # (0, 0) is not on the curve
+            c_bytes_in = (ctypes.c_ubyte * 64)(0)
+            c_bytes_out = (ctypes.c_ubyte * 64)(0)
+            self.assertEqual(scalarmult(c_bytes_out, self.encode_k(k), c_bytes_in), -1)
+        finally:
+            scalarmult_force_backend(None)
+
+    @given(st.integers(0, 2**256 - 1), st.integers(0, 2**256 - 1),
+           st.integers(1, 2**256 - 1), st.sampled_from([1, -1]), st.sampled_from([4, 5, 6]))
+    @example(2**255 - 1, 0, 1, 1, 4)
+    @example(2**255 - 1, 0, 1, 1, 6)
+    def test_scalarmult_windowed(self, k, x, z, sign, width):
+        _, point = make_ge(x, z, sign)
+        x, y = point.xy()
+        c_bytes_in = TestGE.ge_to_bytes(x.lift(), y.lift())
+        c_bytes_out = (ctypes.c_ubyte * 64)(0)
+        expected_point = (k % 2**255) * point
+        if expected_point.is_zero():
+            expected = (F(0), F(0))
+        else:
+            expected = expected_point.xy()
+        ret = scalarmult_windowed(c_bytes_out, self.encode_k(k), c_bytes_in, width)
+        self.assertEqual(ret, 0)
+        self.assertEqual(TestGE.decode_bytes(c_bytes_out), expected)
+
+        # Unsupported widths
+        for width in (3, 7):
+            ret = scalarmult_windowed(c_bytes_out, self.encode_k(k), c_bytes_in, width)
+            self.assertEqual(ret, -1)
+
+    def test_profile(self):
+        if scalarmult_force_backend(b'avx2') != 0:
+            # Only the avx2 backend is profiled
+            return
+        try:
+            k_bytes = self.encode_k(12345)
+            c_bytes_in = TestGE.ge_to_bytes(0, G.xy()[1].lift())
+            c_bytes_out = (ctypes.c_ubyte * 64)(0)
+            profile = scalarmult_profile_type()
+
+            scalarmult_profile_reset()
+            scalarmult(c_bytes_out, k_bytes, c_bytes_in)
+            scalarmult_profile_get(profile)
+            self.assertEqual(list(profile), [0] * 7)
+
+            scalarmult_profile_enable(1)
+            for _ in range(3):
+                scalarmult(c_bytes_out, k_bytes, c_bytes_in)
+            scalarmult_profile_enable(0)
+            scalarmult_profile_get(profile)
+            self.assertEqual(profile[0], 3)
+            for cycles in profile[1:]:
+                self.assertGreater(cycles, 0)
+
+            scalarmult_profile_reset()
+            scalarmult_profile_get(profile)
+            self.assertEqual(list(profile), [0] * 7)
+        finally:
+            scalarmult_profile_enable(0)
+            scalarmult_force_backend(None)
+
+    def test_force_backend_unknown(self):
+        self.assertEqual(scalarmult_force_backend(b'sse2'), -1)
+        self.assertIn(scalarmult_backend(), (b'avx2', b'fe51', b'fe51_affine', b'portable'))
+
+    @given(st.lists(st.tuples(st.integers(0, 2**255 - 1),
+                              st.integers(0, 2**256 - 1),
+                              st.integers(1, 2**256 - 1),
+                              st.sampled_from([1, -1])),
+                    min_size=1, max_size=80))
+    def test_scalarmult_batch(self, inputs):
+        n = len(inputs)
+        k_bytes = (ctypes.c_ubyte * (32*n))(0)
+        c_bytes_in = (ctypes.c_ubyte * (64*n))(0)
+        c_bytes_out = (ctypes.c_ubyte * (64*n))(0)
+        expected = []
+        for i, (k, x, z, sign) in enumerate(inputs):
+            _, point = make_ge(x, z, sign)
+            x, y = point.xy()
+            k_bytes[32*i:32*(i+1)] = list(self.encode_k(k))
+            c_bytes_in[64*i:64*(i+1)] = list(TestGE.ge_to_bytes(x.lift(), y.lift()))
+            expected_point = k * point
+            if expected_point.is_zero():
+                expected.append((F(0), F(0)))
+            else:
+                expected.append(expected_point.xy())
+
+        ret = scalarmult_batch(c_bytes_out, k_bytes, c_bytes_in, n)
+        self.assertEqual(ret, 0)
+        for i in range(n):
+            actual = TestGE.decode_bytes(c_bytes_out[64*i:64*(i+1)])
+            self.assertEqual(actual, expected[i])
+
+    @given(st.lists(st.tuples(st.integers(0, 2**256 - 1),
+                              st.integers(0, 2**256 - 1),
+                              st.integers(1, 2**256 - 1),
+                              st.sampled_from([1, -1]),
+                              st.booleans()),
+                    min_size=0, max_size=40),
+           st.integers(0, 200))
+    @settings(max_examples=20, suppress_health_check=[HealthCheck.filter_too_much])
+    def test_bulk(self, inputs, skip):
+        records_in, expected = bytearray(), bytearray()
+        for k, x, z, sign, valid in inputs:
+            _, point = make_ge(x, z, sign)
+            x, y = point.xy()
+            if not valid:
+                # (x, y + 1) is not on the curve, unless y = -1/2
+                assume(point != E(0) and 2*y + 1 != 0)
+                y += 1
+            k_bytes = self.encode_k(k)
+            c_bytes_in = TestGE.ge_to_bytes(x.lift(), y.lift())
+            c_bytes_out = (ctypes.c_ubyte * 64)(0)
+            ret = scalarmult(c_bytes_out, k_bytes, c_bytes_in)
+            self.assertEqual(ret, 0 if valid else -1)
+            records_in += bytes(k_bytes) + bytes(c_bytes_in)
+            expected += (bytes(c_bytes_out) if valid else bytes(64)) + bytes([0 if valid else 1])
+
+        with tempfile.TemporaryDirectory() as directory:
+            in_path = os.path.join(directory, 'in')
+            out_path = os.path.join(directory, 'out')
+
+            # The input from a path starts at the start of the file
+            with open(in_path, 'wb') as f:
+                f.write(records_in)
+            subprocess.run(['./bulk', '--threads', '2', '--batch', '7', in_path, out_path],
+                           check=True, stderr=subprocess.DEVNULL)
+            with open(out_path, 'rb') as f:
+                self.assertEqual(f.read(), expected)
+
+            # The input from stdin starts at its current position
+            with open(in_path, 'wb') as f:
+                f.write(bytes(skip) + records_in)
+            with open(in_path, 'rb', buffering=0) as f:
+                f.seek(skip)
+                result = subprocess.run(['./bulk', '--batch', '7'], stdin=f, check=True,
+                                        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            self.assertEqual(result.stdout, expected)
+
+    @given(st.lists(st.integers(0, 2**255 - 1), min_size=1, max_size=4),
+           st.integers(0, 2**256 - 1), st.integers(1, 2**256 - 1),
+           st.sampled_from([1, -1]))
+    def test_scalarmult_prepared(self, ks, x, z, sign):
+        _, point = make_ge(x, z, sign)
+        x, y = point.xy()
+        c_bytes_in = TestGE.ge_to_bytes(x.lift(), y.lift())
+        pp = allocate_aligned(scalarmult_prepared_type, 32)
+        cache = allocate_aligned(scalarmult_cache_type, 32)
+        self.assertEqual(scalarmult_prepare(pp, c_bytes_in), 0)
+        scalarmult_cache_init(cache)
+
+        for k in ks:
+            expected_point = k * point
+            if expected_point.is_zero():
+                expected = (F(0), F(0))
+            else:
+                expected = expected_point.xy()
+            c_bytes_out = (ctypes.c_ubyte * 64)(0)
+            self.assertEqual(scalarmult_prepared(c_bytes_out, self.encode_k(k), pp), 0)
+            self.assertEqual(TestGE.decode_bytes(c_bytes_out), expected)
+            c_bytes_out = (ctypes.c_ubyte * 64)(0)
+            ret = scalarmult_cached(c_bytes_out, self.encode_k(k), c_bytes_in, cache)
+            self.assertEqual(ret, 0)
+            self.assertEqual(TestGE.decode_bytes(c_bytes_out), expected)
+
+    @given(st.lists(st.tuples(st.integers(0, 2**255 - 1),
+                              st.integers(0, 2**256 - 1),
+                              st.integers(1, 2**256 - 1),
+                              st.sampled_from([1, -1])),
+                    min_size=1, max_size=20),
+           st.integers(0, 2**32))
+    @settings(max_examples=20, suppress_health_check=[HealthCheck.filter_too_much])
+    def test_scalarmult_table(self, inputs, corrupt):
+        points = []
+        for _, x, z, sign in inputs:
+            _, point = make_ge(x, z, sign)
+            x, y = point.xy()
+            points.append((point, TestGE.ge_to_bytes(x.lift(), y.lift())))
+        n = len(points)
+        c_table_bytes = (ctypes.c_ubyte * scalarmult_table_bytes(n))()
+        c_points = b''.join(bytes(c_bytes) for _, c_bytes in points)
+        self.assertEqual(scalarmult_table_build(c_table_bytes, c_points, n), 0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'table').encode()
+            with open(path, 'wb') as f:
+                f.write(bytes(c_table_bytes))
+            table = scalarmult_table_type()
+            self.assertEqual(scalarmult_table_open(table, path), 0)
+            for (k, _, _, _), (point, c_bytes_in) in zip(inputs, points):
+                pp = scalarmult_table_find(table, c_bytes_in)
+                self.assertIsNotNone(pp)
+                expected_point = k * point
+                if expected_point.is_zero():
+                    expected = (F(0), F(0))
+                else:
+                    expected = expected_point.xy()
+                c_bytes_out = (ctypes.c_ubyte * 64)(0)
+                self.assertEqual(scalarmult_prepared(c_bytes_out, self.encode_k(k),
+                                                     ctypes.cast(pp, ctypes.POINTER(scalarmult_prepared_type)).contents), 0)
+                self.assertEqual(TestGE.decode_bytes(c_bytes_out), expected)
+            self.assertIsNone(scalarmult_table_find(table, (ctypes.c_ubyte * 64)(0)))
+            scalarmult_table_close(table)
+
+            # Builds are reproducible, even though the stack has been used by
+            # the scalar multiplications above
+            c_table_bytes_again = (ctypes.c_ubyte * len(c_table_bytes))(0xAA)
+            self.assertEqual(scalarmult_table_build(c_table_bytes_again, c_points, n), 0)
+            self.assertEqual(bytes(c_table_bytes_again), bytes(c_table_bytes))
+
+            # Corrupted files are rejected
+            corrupted = bytearray(c_table_bytes)
+            corrupted[corrupt % len(corrupted)] ^= 1 << (corrupt % 8)
+            with open(path, 'wb') as f:
+                f.write(corrupted)
+            self.assertEqual(scalarmult_table_open(table, path), -1)
+
+        # Tables of invalid points can not be built
+        c_points = bytes(64) + c_points
+        c_table_bytes = (ctypes.c_ubyte * scalarmult_table_bytes(n + 1))()
+        self.assertEqual(scalarmult_table_build(c_table_bytes, c_points, n + 1), -1)
+
+    @given(st.integers(0, 2**256 - 1), st.integers(0, 2**256 - 1))
+    def test_scalarmult_prepare_invalid_point(self, x, y):
+        assume(F(y)**2 != F(x)**3 - 3*F(x) + 13318)
+        c_bytes_in = TestGE.ge_to_bytes(x, y)
+        pp = allocate_aligned(scalarmult_prepared_type, 32)
+        self.assertEqual(scalarmult_prepare(pp, c_bytes_in), -1)
+
+    @given(st.integers(0, 2**255 - 1))
+    @example(0)
+    @example(1)
+    @example(2**255 - 1)
+    def test_scalarmult_base(self, k):
+        k_bytes = self.encode_k(k)
+        c_bytes_out = (ctypes.c_ubyte * 64)(0)
+        ret = scalarmult_base(c_bytes_out, k_bytes)
+        self.assertEqual(ret, 0)
+
+        expected_point = k * G
+        if expected_point.is_zero():
+            expected_x, expected_y = F(0), F(0)
+        else:
+            expected_x, expected_y = expected_point.xy()
+        actual_x, actual_y = TestGE.decode_bytes(c_bytes_out)
+        self.assertEqual(actual_x, expected_x)
+        self.assertEqual(actual_y, expected_y)
+
     @given(st.integers(0, 2**255 - 1), st.integers(0, 2**256 - 1),
            st.integers(0, 2**256 - 1))
     @example(0, 0, 0)
@@ -696,6 +1144,481 @@ class TestScalarmult(unittest.TestCase):
         ret = scalarmult(c_bytes_out, k_bytes, c_bytes_in)
         self.assertEqual(ret, -1)
     
+    @staticmethod
+    def decode_projective(c_bytes):
+        X, Y, Z = [F(sum(c_bytes[32*j + i] << (8*i) for i in range(32))) for j in range(3)]
+        if Z == 0:
+            return (F(0), F(0))
+        return (X / Z, Y / Z)
+
+    @given(st.lists(st.tuples(st.integers(0, 2**255 - 1),
+                              st.integers(0, 2**256 - 1),
+                              st.integers(1, 2**256 - 1),
+                              st.sampled_from([1, -1])),
+                    min_size=1, max_size=80))
+    def test_scalarmult_projective(self, inputs):
+        n = len(inputs)
+        c_bytes_projective = (ctypes.c_ubyte * (96*n))(0)
+        expected = []
+        for i, (k, x, z, sign) in enumerate(inputs):
+            _, point = make_ge(x, z, sign)
+            x, y = point.xy()
+            c_bytes_in = TestGE.ge_to_bytes(x.lift(), y.lift())
+            c_bytes_out = (ctypes.c_ubyte * 96)(0)
+            ret = scalarmult_projective(c_bytes_out, self.encode_k(k), c_bytes_in)
+            self.assertEqual(ret, 0)
+            expected_point = k * point
+            if expected_point.is_zero():
+                expected.append((F(0), F(0)))
+            else:
+                expected.append(expected_point.xy())
+            self.assertEqual(self.decode_projective(c_bytes_out), expected[i])
+            c_bytes_affine = (ctypes.c_ubyte * 64)(0)
+            scalarmult_normalize(c_bytes_affine, c_bytes_out)
+            self.assertEqual(TestGE.decode_bytes(c_bytes_affine), expected[i])
+            c_bytes_projective[96*i:96*(i+1)] = list(c_bytes_out)
+
+        c_bytes_affine = (ctypes.c_ubyte * (64*n))(0)
+        scalarmult_normalize_batch(c_bytes_affine, c_bytes_projective, n)
+        for i in range(n):
+            actual = TestGE.decode_bytes(c_bytes_affine[64*i:64*(i+1)])
+            self.assertEqual(actual, expected[i])
+
+    @given(st.integers(0, 2**255 - 1))
+    @example(0)
+    def test_scalarmult_base_projective(self, k):
+        c_bytes_out = (ctypes.c_ubyte * 96)(0)
+        ret = scalarmult_base_projective(c_bytes_out, self.encode_k(k))
+        self.assertEqual(ret, 0)
+        expected_point = k * G
+        if expected_point.is_zero():
+            expected = (F(0), F(0))
+        else:
+            expected = expected_point.xy()
+        self.assertEqual(self.decode_projective(c_bytes_out), expected)
+
+    @given(st.integers(0, 2**255 - 1), st.integers(0, 2**255 - 1),
+           st.tuples(st.integers(0, 2**256 - 1), st.integers(1, 2**256 - 1),
+                     st.sampled_from([1, -1])),
+           st.tuples(st.integers(0, 2**256 - 1), st.integers(1, 2**256 - 1),
+                     st.sampled_from([1, -1])))
+    @example(0, 0, (0, 1, 1), (0, 1, 1))
+    def test_scalarmult_double(self, k, l, p_args, q_args):
+        _, p = make_ge(*p_args)
+        _, q = make_ge(*q_args)
+        p_bytes = TestGE.ge_to_bytes(p.xy()[0].lift(), p.xy()[1].lift())
+        q_bytes = TestGE.ge_to_bytes(q.xy()[0].lift(), q.xy()[1].lift())
+        expected_point = k * p + l * q
+        if expected_point.is_zero():
+            expected = (F(0), F(0))
+        else:
+            expected = expected_point.xy()
+
+        for fn in (scalarmult_double, scalarmult_double_vartime):
+            c_bytes_out = (ctypes.c_ubyte * 64)(0)
+            ret = fn(c_bytes_out, self.encode_k(k), p_bytes, self.encode_k(l), q_bytes)
+            self.assertEqual(ret, 0)
+            self.assertEqual(TestGE.decode_bytes(c_bytes_out), expected)
+        for fn in (scalarmult_double_projective, scalarmult_double_projective_vartime):
+            c_bytes_out = (ctypes.c_ubyte * 96)(0)
+            ret = fn(c_bytes_out, self.encode_k(k), p_bytes, self.encode_k(l), q_bytes)
+            self.assertEqual(ret, 0)
+            self.assertEqual(self.decode_projective(c_bytes_out), expected)
+
+    @given(st.integers(0, 2**256 - 1), st.integers(0, 2**256 - 1))
+    def test_scalarmult_double_invalid_point(self, x, y):
+        assume(F(y)**2 != F(x)**3 - 3*F(x) + 13318)
+        invalid = TestGE.ge_to_bytes(x, y)
+        valid = TestGE.ge_to_bytes(G.xy()[0].lift(), G.xy()[1].lift())
+        k_bytes = self.encode_k(1)
+        c_bytes_out = (ctypes.c_ubyte * 64)(0)
+        for fn in (scalarmult_double, scalarmult_double_vartime):
+            self.assertEqual(fn(c_bytes_out, k_bytes, invalid, k_bytes, valid), -1)
+            self.assertEqual(fn(c_bytes_out, k_bytes, valid, k_bytes, invalid), -1)
+
+    @given(st.integers(0, 2**255 - 1), st.integers(0, 2**256 - 1),
+           st.integers(1, 2**256 - 1), st.sampled_from([1, -1]))
+    @example(0, 0, 1, 1)
+    @example(1, 0, 1, 1)
+    @example(2**255 - 1, 0, 1, 1)
+    @example(0b1111011111, 0, 1, 1)
+    def test_scalarmult_vartime(self, k, x, z, sign):
+        _, point = make_ge(x, z, sign)
+        x, y = point.xy()
+        c_bytes_in = TestGE.ge_to_bytes(x.lift(), y.lift())
+        expected_point = k * point
+        if expected_point.is_zero():
+            expected = (F(0), F(0))
+        else:
+            expected = expected_point.xy()
+
+        c_bytes_out = (ctypes.c_ubyte * 64)(0)
+        ret = scalarmult_vartime(c_bytes_out, self.encode_k(k), c_bytes_in)
+        self.assertEqual(ret, 0)
+        self.assertEqual(TestGE.decode_bytes(c_bytes_out), expected)
+        c_bytes_out = (ctypes.c_ubyte * 96)(0)
+        ret = scalarmult_projective_vartime(c_bytes_out, self.encode_k(k), c_bytes_in)
+        self.assertEqual(ret, 0)
+        self.assertEqual(self.decode_projective(c_bytes_out), expected)
+
+    @given(st.integers(0, 2**256 - 1), st.integers(0, 2**256 - 1))
+    def test_scalarmult_vartime_invalid_point(self, x, y):
+        assume(F(y)**2 != F(x)**3 - 3*F(x) + 13318)
+        c_bytes_in = TestGE.ge_to_bytes(x, y)
+        c_bytes_out = (ctypes.c_ubyte * 64)(0)
+        ret = scalarmult_vartime(c_bytes_out, self.encode_k(1), c_bytes_in)
+        self.assertEqual(ret, -1)
+
+    @given(st.lists(st.tuples(st.integers(0, 2**256 - 1),
+                              st.integers(0, 2**256 - 1),
+                              st.integers(1, 2**256 - 1),
+                              st.sampled_from([1, -1])),
+                    min_size=4, max_size=4),
+           st.sets(st.integers(0, 3), max_size=2))
+    @example([(0, 0, 1, 1), (1, 0, 1, 1), (2**255 - 1, 0, 1, 1), (2**256 - 1, 0, 1, 1)], set())
+    def test_scalarmult_x4(self, inputs, invalid):
+        k_bytes = (ctypes.c_ubyte * 128)(0)
+        c_bytes_in = (ctypes.c_ubyte * 256)(0)
+        expected = []
+        for i, (k, x, z, sign) in enumerate(inputs):
+            _, point = make_ge(x, z, sign)
+            x, y = point.xy()
+            if i in invalid:
+                # Leave (0, 0) in the input, which is not on the curve
+                expected.append((F(0), F(0)))
+            else:
+                c_bytes_in[64*i:64*(i+1)] = list(TestGE.ge_to_bytes(x.lift(), y.lift()))
+                expected_point = (k % 2**255) * point
+                if expected_point.is_zero():
+                    expected.append((F(0), F(0)))
+                else:
+                    expected.append(expected_point.xy())
+            k_bytes[32*i:32*(i+1)] = list(self.encode_k(k))
+
+        c_bytes_out = (ctypes.c_ubyte * 256)(0)
+        ret = scalarmult_x4(c_bytes_out, k_bytes, c_bytes_in)
+        self.assertEqual(ret, -1 if invalid else 0)
+        for i in range(4):
+            actual = TestGE.decode_bytes(c_bytes_out[64*i:64*(i+1)])
+            self.assertEqual(actual, expected[i])
+
+    def do_test_scalarmult_multi(self, inputs):
+        n = len(inputs)
+        k_bytes = (ctypes.c_ubyte * (32*n))(0)
+        c_bytes_in = (ctypes.c_ubyte * (64*n))(0)
+        expected_point = E(0)
+        for i, (k, x, z, sign) in enumerate(inputs):
+            _, point = make_ge(x, z, sign)
+            x, y = point.xy()
+            k_bytes[32*i:32*(i+1)] = list(self.encode_k(k))
+            c_bytes_in[64*i:64*(i+1)] = list(TestGE.ge_to_bytes(x.lift(), y.lift()))
+            expected_point += k * point
+        if expected_point.is_zero():
+            expected = (F(0), F(0))
+        else:
+            expected = expected_point.xy()
+
+        c_bytes_out = (ctypes.c_ubyte * 64)(0)
+        ret = scalarmult_multi(c_bytes_out, k_bytes, c_bytes_in, n)
+        self.assertEqual(ret, 0)
+        self.assertEqual(TestGE.decode_bytes(c_bytes_out), expected)
+
+    @given(st.lists(st.tuples(st.integers(0, 2**255 - 1),
+                              st.integers(0, 2**256 - 1),
+                              st.integers(1, 2**256 - 1),
+                              st.sampled_from([1, -1])),
+                    min_size=0, max_size=40))
+    def test_scalarmult_multi(self, inputs):
+        self.do_test_scalarmult_multi(inputs)
+
+    @settings(max_examples=5)
+    @given(st.lists(st.tuples(st.integers(0, 2**255 - 1),
+                              st.integers(0, 2**256 - 1),
+                              st.integers(1, 2**256 - 1),
+                              st.sampled_from([1, -1])),
+                    min_size=300, max_size=400))
+    def test_scalarmult_multi_pippenger(self, inputs):
+        # Large enough to select Pippenger's method
+        self.do_test_scalarmult_multi(inputs)
+
+    @given(st.lists(st.one_of(
+        st.tuples(st.integers(0, 2**256 - 1), st.integers(1, 2**256 - 1),
+                  st.sampled_from([1, -1])),
+        st.tuples(st.integers(0, 2**256 - 1), st.integers(0, 2**256 - 1))),
+        min_size=1, max_size=40))
+    def test_validate(self, inputs):
+        n = len(inputs)
+        c_bytes_in = (ctypes.c_ubyte * (64*n))(0)
+        expected = []
+        for i, args in enumerate(inputs):
+            if len(args) == 3:
+                _, point = make_ge(*args)
+                x, y = [v.lift() for v in point.xy()]
+            else:
+                x, y = args
+            valid = F(y)**2 == F(x)**3 - 3*F(x) + 13318
+            c_bytes = TestGE.ge_to_bytes(x, y)
+            self.assertEqual(scalarmult_validate(c_bytes), 0 if valid else -1)
+            c_bytes_in[64*i:64*(i+1)] = list(c_bytes)
+            expected.append(valid)
+
+        bitmap = (ctypes.c_ubyte * ((n + 7) // 8))(0)
+        ret = scalarmult_validate_batch(bitmap, c_bytes_in, n)
+        self.assertEqual(ret, 0 if all(expected) else -1)
+        actual = [bool((bitmap[i // 8] >> (i % 8)) & 1) for i in range(n)]
+        self.assertEqual(actual, expected)
+
+    @staticmethod
+    def encode_compressed(x, y):
+        c_bytes = (ctypes.c_ubyte * 33)(0)
+        c_bytes[0] = 0x02 | (y & 1)
+        for i in range(32):
+            c_bytes[1 + i] = (x >> (8*i)) & 0xFF
+        return c_bytes
+
+    @given(st.integers(0, 2**256 - 1), st.integers(1, 2**256 - 1),
+           st.sampled_from([1, -1]))
+    def test_compress(self, x, z, sign):
+        _, point = make_ge(x, z, sign)
+        x, y = point.xy()
+        c_bytes_in = TestGE.ge_to_bytes(x.lift(), y.lift())
+        c_bytes_compressed = (ctypes.c_ubyte * 33)(0)
+        scalarmult_compress(c_bytes_compressed, c_bytes_in)
+        expected = self.encode_compressed(x.lift(), y.lift())
+        self.assertEqual(list(c_bytes_compressed), list(expected))
+
+        c_bytes_out = (ctypes.c_ubyte * 64)(0)
+        ret = scalarmult_decompress(c_bytes_out, c_bytes_compressed)
+        self.assertEqual(ret, 0)
+        self.assertEqual(list(c_bytes_out), list(c_bytes_in))
+
+    def test_compress_infinity(self):
+        c_bytes_compressed = (ctypes.c_ubyte * 33)(0xFF)
+        scalarmult_compress(c_bytes_compressed, (ctypes.c_ubyte * 64)(0))
+        self.assertEqual(list(c_bytes_compressed), [0] * 33)
+        c_bytes_out = (ctypes.c_ubyte * 64)(0)
+        self.assertEqual(scalarmult_decompress(c_bytes_out, c_bytes_compressed), -1)
+
+    @given(st.integers(0, 2**256 - 1), st.integers(0, 255))
+    def test_decompress_invalid(self, x, prefix):
+        x_mod_p = F(x)
+        is_square = (x_mod_p**3 - 3*x_mod_p + 13318).is_square()
+        assume(prefix not in (0x02, 0x03) or not is_square)
+        c_bytes_in = (ctypes.c_ubyte * 33)(prefix, *[(x >> (8*i)) & 0xFF for i in range(32)])
+        c_bytes_out = (ctypes.c_ubyte * 64)(0xFF)
+        ret = scalarmult_decompress(c_bytes_out, c_bytes_in)
+        self.assertEqual(ret, -1)
+        self.assertEqual(list(c_bytes_out), [0] * 64)
+
+    @given(st.lists(st.tuples(st.integers(0, 2**256 - 1),
+                              st.integers(1, 2**256 - 1),
+                              st.sampled_from([1, -1])),
+                    min_size=1, max_size=20))
+    def test_decompress_batch(self, inputs):
+        n = len(inputs)
+        c_bytes_in = (ctypes.c_ubyte * (33*n))(0)
+        c_bytes_out = (ctypes.c_ubyte * (64*n))(0)
+        expected = []
+        for i, (x, z, sign) in enumerate(inputs):
+            _, point = make_ge(x, z, sign)
+            x, y = point.xy()
+            c_bytes_in[33*i:33*(i+1)] = list(self.encode_compressed(x.lift(), y.lift()))
+            expected.append((x, y))
+        ret = scalarmult_decompress_batch(c_bytes_out, c_bytes_in, n)
+        self.assertEqual(ret, 0)
+        for i in range(n):
+            actual = TestGE.decode_bytes(c_bytes_out[64*i:64*(i+1)])
+            self.assertEqual(actual, expected[i])
+
+    @given(st.integers(0, 2**255 - 1), st.integers(0, 2**256 - 1),
+           st.integers(1, 2**256 - 1), st.sampled_from([1, -1]))
+    def test_scalarmult_compressed(self, k, x, z, sign):
+        _, point = make_ge(x, z, sign)
+        x, y = point.xy()
+        c_bytes_in = self.encode_compressed(x.lift(), y.lift())
+        c_bytes_out = (ctypes.c_ubyte * 64)(0)
+        ret = scalarmult_compressed(c_bytes_out, self.encode_k(k), c_bytes_in)
+        self.assertEqual(ret, 0)
+        expected_point = k * point
+        if expected_point.is_zero():
+            expected = (F(0), F(0))
+        else:
+            expected = expected_point.xy()
+        self.assertEqual(TestGE.decode_bytes(c_bytes_out), expected)
+
+    @given(st.integers(0, 2**255 - 1), st.integers(0, 2**256 - 1),
+           st.integers(1, 2**256 - 1), st.sampled_from([1, -1]))
+    @example(0, 0, 1, 1)
+    @example(1, 0, 1, 1)
+    def test_scalarmult_ecdh(self, k, x, z, sign):
+        _, point = make_ge(x, z, sign)
+        x, y = point.xy()
+        expected_point = k * point
+        for fn, c_bytes_in in ((scalarmult_ecdh, TestGE.ge_to_bytes(x.lift(), y.lift())),
+                               (scalarmult_ecdh_compressed, self.encode_compressed(x.lift(), y.lift()))):
+            c_bytes_out = (ctypes.c_ubyte * 32)(0xFF)
+            ret = fn(c_bytes_out, self.encode_k(k), c_bytes_in)
+            actual, _ = TestGE.decode_bytes(c_bytes_out)
+            if expected_point.is_zero():
+                self.assertEqual(ret, -1)
+                self.assertEqual(actual, F(0))
+            else:
+                self.assertEqual(ret, 0)
+                self.assertEqual(actual, expected_point.xy()[0])
+
+        # (0, 0) is not on the curve
+        c_bytes_out = (ctypes.c_ubyte * 32)(0xFF)
+        ret = scalarmult_ecdh(c_bytes_out, self.encode_k(k), (ctypes.c_ubyte * 64)(0))
+        self.assertEqual(ret, -1)
+        self.assertEqual(list(c_bytes_out), [0] * 32)
+
+    @staticmethod
+    def expand_message_xmd(msg, dst, length):
+        """expand_message_xmd from RFC 9380 with SHA-256"""
+        dst_prime = dst + bytes([len(dst)])
+        b_0 = hashlib.sha256(bytes(64) + msg + length.to_bytes(2, 'big') + b'\x00' +
+                             dst_prime).digest()
+        b_i = hashlib.sha256(b_0 + b'\x01' + dst_prime).digest()
+        uniform = b_i
+        for i in range(2, (length + 31) // 32 + 1):
+            b_i = hashlib.sha256(bytes(x ^ y for x, y in zip(b_0, b_i)) + bytes([i]) +
+                                 dst_prime).digest()
+            uniform += b_i
+        return uniform[:length]
+
+    @staticmethod
+    def sswu(u):
+        """The simplified SWU map from RFC 9380 (section 6.6.2), with Z = 2"""
+        A, B, Z = F(-3), F(13318), F(2)
+        tv1 = Z**2 * u**4 + Z * u**2
+        if tv1 == 0:
+            x1 = B / (Z * A)
+        else:
+            x1 = (-B / A) * (1 + 1 / tv1)
+        gx1 = x1**3 + A * x1 + B
+        if gx1.is_square():
+            x, y = x1, gx1.sqrt()
+        else:
+            x = Z * u**2 * x1
+            y = (x**3 + A * x + B).sqrt()
+        if u.lift() % 2 != y.lift() % 2:
+            y = -y
+        return E(x, y)
+
+    @classmethod
+    def hash_to_curve(cls, msg, dst):
+        uniform = cls.expand_message_xmd(msg, dst, 96)
+        u0 = F(int.from_bytes(uniform[:48], 'big'))
+        u1 = F(int.from_bytes(uniform[48:], 'big'))
+        return cls.sswu(u0) + cls.sswu(u1)
+
+    @given(st.integers(0, 2**255 - 20))
+    @example(0)
+    @example(1)
+    @example(2**255 - 20)
+    def test_scalarmult_map_to_curve(self, u):
+        c_bytes_out = (ctypes.c_ubyte * 64)(0)
+        scalarmult_map_to_curve(c_bytes_out, self.encode_k(u))
+        self.assertEqual(TestGE.decode_bytes(c_bytes_out), self.sswu(F(u)).xy())
+
+    @given(st.lists(st.binary(max_size=300), max_size=80), st.binary(max_size=255))
+    @example([b'', b'abc', b'a' * 512], b'QUUX-V01-CS02-with-curve13318_XMD:SHA-256_SSWU_RO_')
+    def test_scalarmult_hash_to_curve(self, msgs, dst):
+        expected = []
+        for msg in msgs:
+            point = self.hash_to_curve(msg, dst)
+            expected.append((F(0), F(0)) if point.is_zero() else point.xy())
+
+        n = len(msgs)
+        c_msgs = (ctypes.c_char_p * n)(*msgs)
+        c_msglens = (ctypes.c_size_t * n)(*map(len, msgs))
+        c_bytes_out = (ctypes.c_ubyte * (64 * n))()
+        ret = scalarmult_hash_to_curve_batch(c_bytes_out, c_msgs, c_msglens, n, dst, len(dst))
+        self.assertEqual(ret, 0)
+        for i in range(n):
+            point_bytes = (ctypes.c_ubyte * 64).from_buffer(c_bytes_out, 64*i)
+            self.assertEqual(TestGE.decode_bytes(point_bytes), expected[i])
+
+        for msg, expected_point in list(zip(msgs, expected))[:4]:
+            c_bytes_out = (ctypes.c_ubyte * 64)(0)
+            ret = scalarmult_hash_to_curve(c_bytes_out, msg, len(msg), dst, len(dst))
+            self.assertEqual(ret, 0)
+            self.assertEqual(TestGE.decode_bytes(c_bytes_out), expected_point)
+
+        # The domain separation tag is limited to 255 bytes
+        c_bytes_out = (ctypes.c_ubyte * 64)(0)
+        self.assertEqual(scalarmult_hash_to_curve(c_bytes_out, b'', 0, bytes(256), 256), -1)
+
+    @classmethod
+    def schnorr_reference(cls, seed, msg):
+        """Return (pk, sig) as computed by the scheme in schnorr.c"""
+        dst = lambda name: b'CURVE13318-SCHNORR-SHA256-' + name
+        to_int = lambda s: int.from_bytes(s, 'little')
+        compress = lambda point: bytes(cls.encode_compressed(*map(int, point.xy())))
+
+        h = cls.expand_message_xmd(seed, dst(b'KEY'), 96)
+        a = to_int(h[:64]) % N % 2**255
+        pk = compress(a * G)
+        r = to_int(cls.expand_message_xmd(h[64:] + msg, dst(b'NONCE'), 64)) % N % 2**255
+        r_bytes = compress(r * G)
+        c = to_int(cls.expand_message_xmd(r_bytes + pk + msg, dst(b'CHALLENGE'), 64)) % N
+        return pk, r_bytes + ((r + c * a) % N).to_bytes(32, 'little')
+
+    @given(st.binary(min_size=32, max_size=32), st.binary(max_size=200))
+    def test_schnorr_sign(self, seed, msg):
+        expected_pk, expected_sig = self.schnorr_reference(seed, msg)
+        c_pk, c_sk, c_sig = (ctypes.c_ubyte * 33)(), (ctypes.c_ubyte * 65)(), (ctypes.c_ubyte * 65)()
+        self.assertEqual(schnorr_keypair(c_pk, c_sk, seed), 0)
+        self.assertEqual(bytes(c_pk), expected_pk)
+        self.assertEqual(bytes(c_sk), seed + expected_pk)
+        self.assertEqual(schnorr_sign(c_sig, msg, len(msg), c_sk), 0)
+        self.assertEqual(bytes(c_sig), expected_sig)
+        self.assertEqual(schnorr_verify(bytes(c_sig), msg, len(msg), bytes(c_pk)), 0)
+
+    @given(st.binary(min_size=32, max_size=32), st.binary(max_size=200),
+           st.integers(0, 65*8 - 1))
+    def test_schnorr_verify_invalid(self, seed, msg, bit):
+        pk, sig = self.schnorr_reference(seed, msg)
+        bad_sig = bytearray(sig)
+        bad_sig[bit // 8] ^= 1 << (bit % 8)
+        self.assertEqual(schnorr_verify(bytes(bad_sig), msg, len(msg), pk), -1)
+        self.assertEqual(schnorr_verify(sig, msg + b'\x00', len(msg) + 1, pk), -1)
+        # s must be reduced
+        s = int.from_bytes(sig[33:], 'little') + N
+        if s < 2**256:
+            self.assertEqual(schnorr_verify(sig[:33] + s.to_bytes(32, 'little'), msg, len(msg), pk), -1)
+        # The point at infinity is not a valid public key
+        self.assertEqual(schnorr_verify(sig, msg, len(msg), bytes(33)), -1)
+
+    @given(st.lists(st.tuples(st.binary(min_size=32, max_size=32), st.binary(max_size=100)),
+                    max_size=20),
+           st.integers(0, 2**32))
+    def test_schnorr_verify_batch(self, inputs, which):
+        pks, sigs, msgs = [], [], []
+        for seed, msg in inputs:
+            pk, sig = self.schnorr_reference(seed, msg)
+            pks.append(pk)
+            sigs.append(sig)
+            msgs.append(msg)
+
+        def verify_batch(sigs, msgs):
+            n = len(msgs)
+            c_msgs = (ctypes.c_char_p * n)(*msgs)
+            c_msglens = (ctypes.c_size_t * n)(*map(len, msgs))
+            return schnorr_verify_batch(b''.join(sigs), c_msgs, c_msglens, b''.join(pks), n)
+
+        self.assertEqual(verify_batch(sigs, msgs), 0)
+        if inputs:
+            i = which % len(inputs)
+            bad_msgs = list(msgs)
+            bad_msgs[i] += b'\x00'
+            self.assertEqual(verify_batch(sigs, bad_msgs), -1)
+
+        # The sizes of the 2*n + 1 terms would overflow, so nothing is read
+        size_max = 2**(8 * ctypes.sizeof(ctypes.c_size_t)) - 1
+        for n in (size_max // 2, size_max // 64):
+            self.assertEqual(schnorr_verify_batch(None, None, None, None, n), -1)
+
     @given(st.integers(-1, 15))
     def test_select(self, idx):
         dest_c = allocate_aligned(ge_opt_type, 32)
@@ -722,6 +1645,222 @@ class TestScalarmult(unittest.TestCase):
         note('ptable_c: %s' % list(list(x) for x in ptable_c))
         self.assertEqual(actual, expected)
         
+class TestBindings(unittest.TestCase):
+    @given(st.integers(0, 2**255 - 1), st.integers(0, 2**256 - 1),
+           st.integers(1, 2**256 - 1), st.sampled_from([1, -1]),
+           st.sampled_from([bytes, bytearray, memoryview]))
+    def test_scalarmult(self, k, x, z, sign, buffer_type):
+        _, point = make_ge(x, z, sign)
+        x, y = point.xy()
+        k_bytes = buffer_type(bytes(TestScalarmult.encode_k(k)))
+        p_bytes = buffer_type(bytes(TestGE.ge_to_bytes(x.lift(), y.lift())))
+        expected_point = k * point
+        if expected_point.is_zero():
+            expected = (F(0), F(0))
+        else:
+            expected = expected_point.xy()
+
+        actual = bindings.scalarmult(k_bytes, p_bytes)
+        self.assertEqual(TestGE.decode_bytes(actual), expected)
+        actual = bytearray(64)
+        bindings.scalarmult_batch(k_bytes, p_bytes, out=memoryview(actual))
+        self.assertEqual(TestGE.decode_bytes(actual), expected)
+        actual = bindings.Prepared(p_bytes).scalarmult(k_bytes)
+        self.assertEqual(TestGE.decode_bytes(actual), expected)
+        projective = bindings.scalarmult_projective(k_bytes, p_bytes)
+        actual = bindings.normalize(projective)
+        self.assertEqual(TestGE.decode_bytes(actual), expected)
+        actual = bindings.normalize_batch(projective)
+        self.assertEqual(TestGE.decode_bytes(actual), expected)
+        actual = bindings.scalarmult(k_bytes, p_bytes, vartime=True)
+        self.assertEqual(TestGE.decode_bytes(actual), expected)
+        for vartime in (False, True):
+            actual = bindings.scalarmult_double(k_bytes, p_bytes, bytes(32), p_bytes,
+                                                vartime=vartime)
+            self.assertEqual(TestGE.decode_bytes(actual), expected)
+
+    @given(st.lists(st.tuples(st.integers(0, 2**255 - 1),
+                              st.integers(0, 2**256 - 1),
+                              st.integers(1, 2**256 - 1),
+                              st.sampled_from([1, -1])),
+                    min_size=0, max_size=200),
+           st.integers(1, 4))
+    @settings(max_examples=20, suppress_health_check=[HealthCheck.filter_too_much])
+    def test_pool_scalarmult_batch(self, inputs, threads):
+        k_bytes, p_bytes, expected = bytearray(), bytearray(), []
+        for k, x, z, sign in inputs:
+            _, point = make_ge(x, z, sign)
+            x, y = point.xy()
+            k_bytes += bytes(TestScalarmult.encode_k(k))
+            p_bytes += bytes(TestGE.ge_to_bytes(x.lift(), y.lift()))
+            expected_point = k * point
+            if expected_point.is_zero():
+                expected.append((F(0), F(0)))
+            else:
+                expected.append(expected_point.xy())
+
+        with bindings.Pool(threads) as pool:
+            self.assertEqual(pool.threads, threads)
+            actual = pool.scalarmult_batch(k_bytes, p_bytes)
+        for i, point in enumerate(expected):
+            self.assertEqual(TestGE.decode_bytes(actual[64*i:64*(i+1)]), point)
+        with self.assertRaises(ValueError):
+            pool.threads
+        with self.assertRaises(ValueError):
+            pool.scalarmult_batch(k_bytes, p_bytes)
+
+    def test_pool_close_concurrent(self):
+        k_bytes = bytes(TestScalarmult.encode_k(12345)) * 256
+        p_bytes = bytes(TestGE.ge_to_bytes(0, G.xy()[1].lift())) * 256
+        expected = bindings.scalarmult_batch(k_bytes, p_bytes)
+        pool = bindings.Pool(2)
+        results = []
+        started = threading.Event()
+
+        def work():
+            # Every batch either completes or sees the closed pool
+            for _ in range(20):
+                try:
+                    results.append(bytes(pool.scalarmult_batch(k_bytes, p_bytes)))
+                except ValueError:
+                    results.append(None)
+                started.set()
+
+        workers = [threading.Thread(target=work) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        # Close the pool while the other batches are running
+        started.wait()
+        pool.close()
+        for worker in workers:
+            worker.join()
+        self.assertEqual(len(results), 60)
+        self.assertLessEqual(set(results), {bytes(expected), None})
+
+    @given(st.integers(0, 2**256 - 1), st.integers(0, 2**256 - 1))
+    def test_scalarmult_invalid_point(self, x, y):
+        assume(F(y)**2 != F(x)**3 - 3*F(x) + 13318)
+        p_bytes = bytes(TestGE.ge_to_bytes(x, y))
+        with self.assertRaises(ValueError):
+            bindings.scalarmult(bytes(32), p_bytes)
+        with self.assertRaises(ValueError):
+            bindings.Prepared(p_bytes)
+
+    def test_validate(self):
+        p_bytes = bytes(TestGE.ge_to_bytes(G.xy()[0].lift(), G.xy()[1].lift()))
+        self.assertTrue(bindings.validate(p_bytes))
+        self.assertFalse(bindings.validate(bytes(64)))
+        self.assertEqual(bindings.validate_batch(p_bytes + bytes(64) + p_bytes), [True, False, True])
+
+    def test_backend(self):
+        default = bindings.backend()
+        k_bytes = bytes(TestScalarmult.encode_k(12345))
+        expected = bindings.scalarmult_base(k_bytes)
+        try:
+            bindings.force_backend('portable')
+            self.assertEqual(bindings.backend(), 'portable')
+            self.assertEqual(bindings.scalarmult_base(k_bytes), expected)
+            with self.assertRaises(ValueError):
+                bindings.force_backend('sse2')
+        finally:
+            bindings.force_backend()
+        self.assertEqual(bindings.backend(), default)
+
+    def test_profile(self):
+        try:
+            bindings.force_backend('avx2')
+        except ValueError:
+            self.skipTest('only the avx2 backend is profiled')
+        bindings.profile_reset()
+        try:
+            bindings.profile_enable()
+            bindings.scalarmult_projective(bytes(TestScalarmult.encode_k(12345)),
+                                           bytes(TestGE.ge_to_bytes(0, G.xy()[1].lift())))
+        finally:
+            bindings.profile_enable(False)
+            bindings.force_backend()
+        stats = bindings.profile_stats()
+        self.assertEqual(set(stats), {'calls', 'frombytes', 'into_opt', 'precompute',
+                                      'windows', 'ladder', 'tobytes'})
+        self.assertEqual(stats['calls'], 1)
+        self.assertEqual(stats['tobytes'], 0)
+        self.assertGreater(stats['ladder'], 0)
+        bindings.profile_reset()
+        self.assertEqual(set(bindings.profile_stats().values()), {0})
+
+    def test_ecdh(self):
+        k_bytes = bytes(TestScalarmult.encode_k(12345))
+        x, y = (54321 * G).xy()
+        p_bytes = bytes(TestGE.ge_to_bytes(x.lift(), y.lift()))
+        shared_x, _ = (12345 * 54321 * G).xy()
+        expected = bytes(TestGE.ge_to_bytes(shared_x.lift(), 0))[:32]
+        self.assertEqual(bytes(bindings.ecdh(k_bytes, p_bytes)), expected)
+        compressed = bytes(TestScalarmult.encode_compressed(x.lift(), y.lift()))
+        self.assertEqual(bytes(bindings.ecdh(k_bytes, compressed)), expected)
+        with self.assertRaises(ValueError):
+            bindings.ecdh(k_bytes, bytes(64))
+        with self.assertRaises(ValueError):
+            bindings.ecdh(k_bytes, bytes(32))
+
+    def test_hash_to_curve(self):
+        dst = b'QUUX-V01-CS02-with-curve13318_XMD:SHA-256_SSWU_RO_'
+        msgs = [b'', b'abc', bytearray(b'abcdef0123456789')]
+        expected = b''.join(bytes(bindings.hash_to_curve(msg, dst)) for msg in msgs)
+        self.assertEqual(bytes(bindings.hash_to_curve_batch(msgs, dst)), expected)
+        x, y = TestScalarmult.hash_to_curve(b'abc', dst).xy()
+        self.assertEqual(expected[64:128], bytes(TestGE.ge_to_bytes(x.lift(), y.lift())))
+        with self.assertRaises(ValueError):
+            bindings.hash_to_curve(b'abc', bytes(256))
+        with self.assertRaises(ValueError):
+            bindings.map_to_curve(bytes(31))
+
+    def test_schnorr(self):
+        pk, sk = bindings.schnorr_keypair(bytes(range(32)))
+        self.assertEqual(bytes(sk[:32]), bytes(range(32)))
+        msgs = [b'', b'abc', bytearray(b'abcdef0123456789')]
+        sigs = b''.join(bytes(bindings.schnorr_sign(msg, sk)) for msg in msgs)
+        self.assertTrue(bindings.schnorr_verify(sigs[65:130], b'abc', pk))
+        self.assertFalse(bindings.schnorr_verify(sigs[65:130], b'abd', pk))
+        self.assertTrue(bindings.schnorr_verify_batch(sigs, msgs, bytes(pk) * 3))
+        self.assertFalse(bindings.schnorr_verify_batch(sigs, msgs[::-1], bytes(pk) * 3))
+        two = (2).to_bytes(32, 'little')
+        self.assertEqual(bytes(bindings.scalar_mul(two, bindings.scalar_invert(two))),
+                         (1).to_bytes(32, 'little'))
+        self.assertEqual(bytes(bindings.scalar_add(bindings.scalar_reduce(N.to_bytes(64, 'little')), two)), two)
+        with self.assertRaises(ValueError):
+            bindings.schnorr_sign(b'abc', bytes(64))
+
+    def test_table(self):
+        points = []
+        for k in (2, 3, 5):
+            x, y = (k * G).xy()
+            points.append(bytes(TestGE.ge_to_bytes(x.lift(), y.lift())))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'table')
+            with open(path, 'wb') as f:
+                f.write(bindings.build_table(b''.join(points)))
+            with bindings.Table(path) as table:
+                self.assertEqual(len(table), 3)
+                self.assertIn(points[1], table)
+                self.assertNotIn(bytes(64), table)
+                k_bytes = bytes(TestScalarmult.encode_k(7))
+                self.assertEqual(table.scalarmult(k_bytes, points[1]),
+                                 bindings.scalarmult(k_bytes, points[1]))
+                with self.assertRaises(KeyError):
+                    table.scalarmult(k_bytes, bytes(64))
+            with open(path, 'r+b') as f:
+                f.truncate(100)
+            with self.assertRaises(ValueError):
+                bindings.Table(path)
+        with self.assertRaises(ValueError):
+            bindings.build_table(bytes(64))
+
+    def test_wrong_length(self):
+        with self.assertRaises(ValueError):
+            bindings.scalarmult_base(bytes(31))
+        with self.assertRaises(ValueError):
+            bindings.scalarmult_base(bytes(32), out=bytearray(63))
+
 def allocate_aligned(ty, align):
     """
     Python does not do any aligned allocations by default. At least, not
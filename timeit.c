@@ -1,14 +1,54 @@
-// Measure the scalar multiplication cycle count
+// Measure the cycle counts of the public API and of the internal hot paths
+//
+// Usage: timeit [--filter SUBSTRING] [--json FILE] [--compare FILE] [--threshold PERCENT]
+//
+// Every benchmark cycles through INPUTS random (but reproducible) scalars and
+// points. For every benchmark we print percentiles of the cycle count per
+// operation, after subtracting the median overhead of an empty benchmark.
+//
+//   --filter      Only run the benchmarks whose name contains SUBSTRING
+//   --json        Write the results to FILE
+//   --compare     Compare the medians with a file that was written by --json,
+//                 and exit with status 1 if any benchmark became more than
+//                 PERCENT (default 5) percent slower
 
+#include "fe51.h"
+#include "ge.h"
+#include "ladder.h"
 #include "scalarmult.h"
+#include "window.h"
 #include <assert.h>
 #include <inttypes.h>
+#include <math.h>
 #include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
 #include <unistd.h>
 
-const size_t N = 100000;
+#define N 100000
+#define INPUTS 64
+#define MAX_RESULTS 128
+#define NAME_MAX_LEN 64
 
+static double measurements[N];
+
+// Random inputs, the benchmarks use the inputs at index `cur`
+static size_t cur;
+static uint8_t keys[INPUTS][32];
+static uint8_t points[INPUTS][64];
+static uint8_t out[64];
+
+typedef struct {
+    char name[NAME_MAX_LEN];
+    size_t iterations;
+    size_t ops;
+    double min, p10, p25, p50, p75, p90, p99, max, mean, stddev;
+} result;
+
+static result results[MAX_RESULTS];
+static size_t result_count;
+static double blank;
+static const char *filter;
 
 static __inline__ unsigned long long rdtsc(void)
 {
@@ -17,62 +57,617 @@ static __inline__ unsigned long long rdtsc(void)
     return ( (unsigned long long)lo)|( ((unsigned long long)hi)<<32 );
 }
 
-static void __attribute__ ((noinline)) blank_benchmark(void) 
+static void __attribute__ ((noinline)) blank_benchmark(void)
 {
     // Prevent the compiler from optimizing out calls to this function
     __asm__ __volatile__ ("");
 }
 
-static int compar_double(const void *a_ptr, const void *b_ptr) {
+// Internal routines
+
+static fe10 fe10_in[INPUTS], fe10_out;
+static fe51 fe51_in[INPUTS], fe51_out;
+static ge ge_in[INPUTS];
+static ge_opt ge_opt_in[INPUTS] __attribute__((aligned(32)));
+static ge_opt ge_opt_out __attribute__((aligned(32)));
+static scalarmult_prepared tables[INPUTS];
+static uint8_t windows[INPUTS][51];
+
+static void fe10_invert_benchmark(void)
+{
+    fe10_invert(&fe10_out, &fe10_in[cur]);
+}
+
+static void fe51_invert_benchmark(void)
+{
+    fe51_invert(&fe51_out, &fe51_in[cur]);
+}
+
+static void fe51_invert_safegcd_benchmark(void)
+{
+    fe51_invert_safegcd(&fe51_out, &fe51_in[cur]);
+}
+
+static void ge_frombytes_benchmark(void)
+{
+    ge p;
+    int ret = ge_frombytes(p, points[cur]);
+    assert(ret == 0);
+}
+
+static void ge_tobytes_benchmark(void)
+{
+    ge_tobytes(out, ge_in[cur]);
+}
+
+static void ge_add_asm_benchmark(void)
+{
+    ge_add_asm(ge_opt_out, ge_opt_in[cur], ge_opt_in[(cur + 1) % INPUTS]);
+}
+
+static void ge_double_asm_benchmark(void)
+{
+    ge_double_asm(ge_opt_out, ge_opt_in[cur]);
+}
+
+static void select_benchmark(void)
+{
+    crypto_scalarmult_curve13318_avx2_select(ge_opt_out, cur % 16, (const ge_opt *)tables[cur].table);
+}
+
+static void ladder_benchmark(void)
+{
+    crypto_scalarmult_curve13318_avx2_ladder(ge_opt_out, windows[cur], (const ge_opt *)tables[cur].table);
+}
+
+// Public API
+
+static void scalarmult_benchmark(void)
+{
+    int ret = crypto_scalarmult(out, keys[cur], points[cur]);
+    assert(ret == 0);
+}
+
+static void scalarmult_base_benchmark(void)
+{
+    int ret = crypto_scalarmult_base(out, keys[cur]);
+    assert(ret == 0);
+}
+
+static void scalarmult_prepared_benchmark(void)
+{
+    int ret = crypto_scalarmult_prepared(out, keys[cur], &tables[cur]);
+    assert(ret == 0);
+}
+
+static uint8_t projective[INPUTS][96];
+
+static void scalarmult_projective_benchmark(void)
+{
+    int ret = crypto_scalarmult_projective(projective[cur], keys[cur], points[cur]);
+    assert(ret == 0);
+}
+
+static void scalarmult_normalize_benchmark(void)
+{
+    crypto_scalarmult_normalize(out, projective[cur]);
+}
+
+static void scalarmult_vartime_benchmark(void)
+{
+    int ret = crypto_scalarmult_vartime(out, keys[cur], points[cur]);
+    assert(ret == 0);
+}
+
+static unsigned int window_width;
+
+static void scalarmult_windowed_benchmark(void)
+{
+    int ret = crypto_scalarmult_windowed(out, keys[cur], points[cur], window_width);
+    assert(ret == 0);
+}
+
+static uint8_t x4_out[4*64];
+static uint8_t x4_keys[4*32];
+static uint8_t x4_in[4*64];
+
+static void scalarmult_x4_benchmark(void)
+{
+    int ret = crypto_scalarmult_x4(x4_out, x4_keys, x4_in);
+    assert(ret == 0);
+}
+
+static void scalarmult_x4_sequential_benchmark(void)
+{
+    for (unsigned int i = 0; i < 4; i++) {
+        int ret = crypto_scalarmult(&x4_out[64*i], &x4_keys[32*i], &x4_in[64*i]);
+        assert(ret == 0);
+    }
+}
+
+static void scalarmult_double_benchmark(void)
+{
+    const size_t next = (cur + 1) % INPUTS;
+    int ret = crypto_scalarmult_double(out, keys[cur], points[cur], keys[next], points[next]);
+    assert(ret == 0);
+}
+
+static void scalarmult_double_vartime_benchmark(void)
+{
+    const size_t next = (cur + 1) % INPUTS;
+    int ret = crypto_scalarmult_double_vartime(out, keys[cur], points[cur], keys[next], points[next]);
+    assert(ret == 0);
+}
+
+static uint8_t compressed[INPUTS][33];
+
+static void scalarmult_decompress_benchmark(void)
+{
+    int ret = crypto_scalarmult_decompress(out, compressed[cur]);
+    assert(ret == 0);
+}
+
+static void scalarmult_ecdh_benchmark(void)
+{
+    int ret = crypto_scalarmult_ecdh(out, keys[cur], points[cur]);
+    assert(ret == 0);
+}
+
+static void scalarmult_ecdh_compressed_benchmark(void)
+{
+    int ret = crypto_scalarmult_ecdh_compressed(out, keys[cur], compressed[cur]);
+    assert(ret == 0);
+}
+
+static void scalarmult_compressed_benchmark(void)
+{
+    int ret = crypto_scalarmult_compressed(out, keys[cur], compressed[cur]);
+    assert(ret == 0);
+}
+
+static void scalarmult_validate_benchmark(void)
+{
+    int ret = crypto_scalarmult_validate(points[cur]);
+    assert(ret == 0);
+}
+
+static const uint8_t hash_dst[] = "CURVE13318_XMD:SHA-256_SSWU_RO_TIMEIT";
+
+static void hash_to_curve_benchmark(void)
+{
+    int ret = crypto_scalarmult_hash_to_curve(out, keys[cur], 32, hash_dst, sizeof(hash_dst) - 1);
+    assert(ret == 0);
+}
+
+static void map_to_curve_benchmark(void)
+{
+    crypto_scalarmult_map_to_curve(out, keys[cur]);
+}
+
+#define HASH_BATCH 64
+
+static const uint8_t *hash_msgs[HASH_BATCH];
+static size_t hash_msglens[HASH_BATCH];
+static uint8_t hash_out[64*HASH_BATCH];
+
+static void hash_to_curve_batch_benchmark(void)
+{
+    int ret = crypto_scalarmult_hash_to_curve_batch(hash_out, hash_msgs, hash_msglens, HASH_BATCH,
+                                                    hash_dst, sizeof(hash_dst) - 1);
+    assert(ret == 0);
+}
+
+static uint8_t table_file[SCALARMULT_TABLE_HEADER_BYTES + INPUTS * sizeof(scalarmult_table_entry)]
+    __attribute__((aligned(32)));
+static scalarmult_table table;
+
+static void scalarmult_table_find_benchmark(void)
+{
+    const scalarmult_prepared *pp = crypto_scalarmult_table_find(&table, points[cur]);
+    assert(pp != NULL);
+    int ret = crypto_scalarmult_prepared(out, keys[cur], pp);
+    assert(ret == 0);
+}
+
+static uint8_t schnorr_sks[INPUTS][SCHNORR_SECRETKEYBYTES];
+static uint8_t schnorr_pks[INPUTS][SCHNORR_PUBLICKEYBYTES];
+static uint8_t schnorr_sigs[INPUTS][SCHNORR_SIGNATUREBYTES];
+static uint8_t sig_out[SCHNORR_SIGNATUREBYTES];
+
+static void scalar_mul_benchmark(void)
+{
+    crypto_scalarmult_scalar_mul(out, keys[cur], keys[(cur + 1) % INPUTS]);
+}
+
+static void scalar_invert_benchmark(void)
+{
+    crypto_scalarmult_scalar_invert(out, keys[cur]);
+}
+
+static void schnorr_sign_benchmark(void)
+{
+    crypto_scalarmult_schnorr_sign(sig_out, keys[cur], 32, schnorr_sks[cur]);
+}
+
+static void schnorr_verify_benchmark(void)
+{
+    int ret = crypto_scalarmult_schnorr_verify(schnorr_sigs[cur], keys[cur], 32, schnorr_pks[cur]);
+    assert(ret == 0);
+}
+
+static void schnorr_verify_batch_benchmark(void)
+{
+    int ret = crypto_scalarmult_schnorr_verify_batch(&schnorr_sigs[0][0], hash_msgs, hash_msglens,
+                                                     &schnorr_pks[0][0], INPUTS);
+    assert(ret == 0);
+}
+
+#define BACKEND_ITERATIONS 1000
+
+static const char *backends[] = {"avx2", "fe51", "fe51_affine", "portable"};
+
+#define BATCH_MAX 1024
+#define BATCH_ITERATIONS 200
+
+static size_t batch_n;
+static uint8_t batch_out[64*BATCH_MAX];
+static uint8_t batch_keys[32*BATCH_MAX];
+static uint8_t batch_in[64*BATCH_MAX];
+
+static void scalarmult_batch_benchmark(void)
+{
+    int ret = crypto_scalarmult_batch(batch_out, batch_keys, batch_in, batch_n);
+    assert(ret == 0);
+}
+
+#define VALIDATE_BATCH 1024
+
+static uint8_t validate_bitmap[VALIDATE_BATCH / 8];
+
+static void scalarmult_validate_batch_benchmark(void)
+{
+    int ret = crypto_scalarmult_validate_batch(validate_bitmap, batch_in, VALIDATE_BATCH);
+    assert(ret == 0);
+}
+
+#define MULTI_MAX 100000
+#define MULTI_ITERATIONS 5
+
+static const size_t multi_sizes[] = {
+    2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768,
+    65536, MULTI_MAX
+};
+static size_t multi_n;
+static uint8_t *multi_keys;
+static uint8_t *multi_in;
+
+static void scalarmult_multi_benchmark(void)
+{
+    int ret = crypto_scalarmult_multi(out, multi_keys, multi_in, multi_n);
+    assert(ret == 0);
+}
+
+#define POOL_BATCH 4096
+#define POOL_ITERATIONS 20
+
+static scalarmult_pool *pool;
+static uint8_t pool_out[64*POOL_BATCH];
+static uint8_t pool_keys[32*POOL_BATCH];
+static uint8_t pool_in[64*POOL_BATCH];
+
+static void scalarmult_pool_benchmark(void)
+{
+    int ret = crypto_scalarmult_pool_batch(pool, pool_out, pool_keys, pool_in, POOL_BATCH);
+    assert(ret == 0);
+}
+
+static void setup_inputs(void)
+{
+    // Use a fixed seed, such that different runs can be compared
+    srand(13318);
+    for (size_t i = 0; i < INPUTS; i++) {
+        uint8_t bytes[32], zeroth_window;
+
+        for (size_t j = 0; j < 32; j++) keys[i][j] = rand();
+        for (size_t j = 0; j < 32; j++) bytes[j] = rand();
+        int ret = crypto_scalarmult_base(points[i], bytes);
+        assert(ret == 0);
+
+        fe10_frombytes(&fe10_in[i], bytes);
+        fe51_frombytes(&fe51_in[i], bytes);
+        ret = ge_frombytes(ge_in[i], points[i]);
+        assert(ret == 0);
+        ge_into_ge_opt(ge_opt_in[i], ge_in[i]);
+        ge_opt_in[i][30] = ge_opt_in[i][31] = 0;
+        ret = crypto_scalarmult_prepare(&tables[i], points[i]);
+        assert(ret == 0);
+        window_compute(windows[i], &zeroth_window, keys[i]);
+        ret = crypto_scalarmult_projective(projective[i], keys[i], points[i]);
+        assert(ret == 0);
+        crypto_scalarmult_compress(compressed[i], points[i]);
+        crypto_scalarmult_schnorr_keypair(schnorr_pks[i], schnorr_sks[i], bytes);
+        crypto_scalarmult_schnorr_sign(schnorr_sigs[i], keys[i], 32, schnorr_sks[i]);
+    }
+    int ret = crypto_scalarmult_table_build(table_file, &points[0][0], INPUTS);
+    assert(ret == 0);
+    ret = crypto_scalarmult_table_load(&table, table_file, sizeof(table_file));
+    assert(ret == 0);
+}
+
+static int compar_double(const void *a_ptr, const void *b_ptr)
+{
     const double a = *(const double*)a_ptr;
     const double b = *(const double*)b_ptr;
-    return (int)(a - b);
+    return (a > b) - (a < b);
 }
 
-static double median(double *base, size_t nitems) {
-    qsort(base, nitems, sizeof(base[0]), compar_double);
-    
-    if (nitems == 0) {
-        return -1;
+// Percentile `q` (in [0, 1]) of the sorted array `sorted`
+static double percentile(const double *sorted, size_t n, double q)
+{
+    const double pos = q * (double)(n - 1);
+    const size_t lo = (size_t)pos;
+    const size_t hi = lo + 1 < n ? lo + 1 : lo;
+    return sorted[lo] + (pos - (double)lo) * (sorted[hi] - sorted[lo]);
+}
+
+// Run `fn` for `iterations` times, and store the cycle counts in `measurements`
+static void measure(void (*fn)(void), size_t iterations)
+{
+    for (size_t i = 0; i < iterations; i++) {
+        cur = i % INPUTS;
+        __asm__ __volatile__ ("lfence");
+        const unsigned long long start = rdtsc();
+        fn();
+        measurements[i] = (double)(rdtsc() - start);
     }
-    const size_t m = nitems / 2 - 1;
-    if (nitems % 2 == 0) {
-        return (base[m] + base[m+1]) / 2;
+}
+
+// Measure `fn`, where one call does `ops` operations, and print the statistics
+// per operation. Returns the median, or -1 if the benchmark was filtered out.
+static double run(const char *name, void (*fn)(void), size_t iterations, size_t ops)
+{
+    result *r = &results[result_count];
+    double sum = 0, sum_squares = 0;
+
+    if (filter != NULL && strstr(name, filter) == NULL) return -1;
+    assert(result_count < MAX_RESULTS && strlen(name) < NAME_MAX_LEN);
+    assert(iterations <= N);
+
+    measure(fn, iterations);
+    for (size_t i = 0; i < iterations; i++) {
+        measurements[i] = (measurements[i] - blank) / (double)ops;
+        sum += measurements[i];
+        sum_squares += measurements[i] * measurements[i];
+    }
+    qsort(measurements, iterations, sizeof(measurements[0]), compar_double);
+
+    strcpy(r->name, name);
+    r->iterations = iterations;
+    r->ops = ops;
+    r->min = measurements[0];
+    r->p10 = percentile(measurements, iterations, 0.10);
+    r->p25 = percentile(measurements, iterations, 0.25);
+    r->p50 = percentile(measurements, iterations, 0.50);
+    r->p75 = percentile(measurements, iterations, 0.75);
+    r->p90 = percentile(measurements, iterations, 0.90);
+    r->p99 = percentile(measurements, iterations, 0.99);
+    r->max = measurements[iterations - 1];
+    r->mean = sum / (double)iterations;
+    r->stddev = sqrt(fabs(sum_squares / (double)iterations - r->mean * r->mean));
+    result_count++;
+
+    printf("%-44s %10.0f %10.0f %10.0f %10.0f %7.1f%%\n", r->name, r->p50,
+           r->p10, r->p90, r->p99, 100 * (r->p75 - r->p25) / r->p50);
+    return r->p50;
+}
+
+static void write_json(const char *path)
+{
+    FILE *f = fopen(path, "w");
+    if (f == NULL) {
+        perror(path);
+        exit(2);
+    }
+    fprintf(f, "{\n  \"backend\": \"%s\",\n  \"blank\": %.1f,\n  \"benchmarks\": [\n",
+            crypto_scalarmult_backend(), blank);
+    for (size_t i = 0; i < result_count; i++) {
+        const result *r = &results[i];
+        fprintf(f, "    {\"name\": \"%s\", \"iterations\": %zu, \"ops\": %zu, "
+                   "\"min\": %.1f, \"p10\": %.1f, \"p25\": %.1f, \"p50\": %.1f, "
+                   "\"p75\": %.1f, \"p90\": %.1f, \"p99\": %.1f, \"max\": %.1f, "
+                   "\"mean\": %.1f, \"stddev\": %.1f}%s\n",
+                r->name, r->iterations, r->ops, r->min, r->p10, r->p25, r->p50,
+                r->p75, r->p90, r->p99, r->max, r->mean, r->stddev,
+                i + 1 < result_count ? "," : "");
+    }
+    fprintf(f, "  ]\n}\n");
+    fclose(f);
+}
+
+// Compare with a file that was written by `write_json`, returns the amount of
+// regressions
+static int compare(const char *path, double threshold)
+{
+    FILE *f = fopen(path, "r");
+    char *json, *pos;
+    long len;
+    int regressions = 0;
+
+    if (f == NULL) {
+        perror(path);
+        exit(2);
+    }
+    fseek(f, 0, SEEK_END);
+    len = ftell(f);
+    fseek(f, 0, SEEK_SET);
+    json = malloc(len + 1);
+    assert(json != NULL);
+    json[fread(json, 1, len, f)] = '\0';
+    fclose(f);
+
+    printf("----------------------------------------------------------------------\n");
+    printf("%-44s %10s %10s %8s\n", "compared to baseline", "baseline", "current", "change");
+    for (size_t i = 0; i < result_count; i++) {
+        const result *r = &results[i];
+        char needle[NAME_MAX_LEN + 16];
+        double baseline;
+
+        snprintf(needle, sizeof(needle), "\"name\": \"%.*s\",", NAME_MAX_LEN - 1, r->name);
+        pos = strstr(json, needle);
+        if (pos == NULL || (pos = strstr(pos, "\"p50\": ")) == NULL) {
+            printf("%-44s %10s %10.0f %8s\n", r->name, "-", r->p50, "new");
+            continue;
+        }
+        baseline = strtod(pos + strlen("\"p50\": "), NULL);
+        const double change = 100 * (r->p50 - baseline) / baseline;
+        const int regressed = change > threshold;
+        regressions += regressed;
+        printf("%-44s %10.0f %10.0f %+7.1f%%%s\n", r->name, baseline, r->p50, change,
+               regressed ? "  REGRESSION" : "");
     }
-    return base[m];
+    free(json);
+    return regressions;
 }
 
 int main(int argc, char *argv[])
 {
-    uint8_t out[64] = {0};
-    const uint8_t key[32] = {1};
-    const uint8_t in[64] = {0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 179, 43, 106, 247, 206, 176, 201, 77, 137, 224, 122, 176, 76, 93, 29, 69, 190, 137, 17, 103, 105, 172, 236, 172, 225, 72, 243, 7, 94, 128, 240, 17};
-    
+    const char *json_path = NULL, *compare_path = NULL;
+    double threshold = 5, best_median = 0;
+    unsigned int best_width = 0;
+    char name[NAME_MAX_LEN];
+
+    for (int i = 1; i < argc; i++) {
+        if (i + 1 < argc && strcmp(argv[i], "--filter") == 0) {
+            filter = argv[++i];
+        } else if (i + 1 < argc && strcmp(argv[i], "--json") == 0) {
+            json_path = argv[++i];
+        } else if (i + 1 < argc && strcmp(argv[i], "--compare") == 0) {
+            compare_path = argv[++i];
+        } else if (i + 1 < argc && strcmp(argv[i], "--threshold") == 0) {
+            threshold = atof(argv[++i]);
+        } else {
+            fprintf(stderr, "usage: %s [--filter SUBSTRING] [--json FILE] "
+                            "[--compare FILE] [--threshold PERCENT]\n", argv[0]);
+            return 2;
+        }
+    }
+    setup_inputs();
+
     // Estimate the (systematic) error of the measurement device
-    double blank_measurements[N];
-    for (size_t i = 0; i < N; i++) {
-        __asm__ __volatile__ ("lfence");
-        const unsigned long long start = rdtsc();
-        blank_benchmark();
-        blank_measurements[i] = (double)(rdtsc() - start);
+    measure(blank_benchmark, N);
+    qsort(measurements, N, sizeof(measurements[0]), compar_double);
+    blank = percentile(measurements, N, 0.5);
+    printf("MEASURED BLANK: %.0f (backend: %s)\n", blank, crypto_scalarmult_backend());
+    printf("%-44s %10s %10s %10s %10s %8s\n", "cycles/op", "median", "p10", "p90", "p99", "IQR");
+
+    run("fe10_invert", fe10_invert_benchmark, N, 1);
+    run("fe51_invert", fe51_invert_benchmark, N, 1);
+    run("fe51_invert_safegcd", fe51_invert_safegcd_benchmark, N, 1);
+    run("ge_frombytes", ge_frombytes_benchmark, N, 1);
+    run("ge_tobytes", ge_tobytes_benchmark, N, 1);
+    run("ge_add_asm", ge_add_asm_benchmark, N, 1);
+    run("ge_double_asm", ge_double_asm_benchmark, N, 1);
+    run("select", select_benchmark, N, 1);
+    run("ladder", ladder_benchmark, N, 1);
+
+    run("crypto_scalarmult", scalarmult_benchmark, N, 1);
+    run("crypto_scalarmult_hash_to_curve", hash_to_curve_benchmark, N, 1);
+    for (size_t i = 0; i < HASH_BATCH; i++) {
+        hash_msgs[i] = keys[i % INPUTS];
+        hash_msglens[i] = 32;
     }
-    
-    // Measure the scalarmult routine
-    double sample_measurements[N];
-    for (size_t i = 0; i < N; i++) {
-        __asm__ __volatile__ ("lfence");
-        const unsigned long long start = rdtsc();
-        int ret = crypto_scalarmult(out, key, in);
-        sample_measurements[i] = (double)(rdtsc() - start);
-        assert(ret == 0);
+    run("crypto_scalarmult_hash_to_curve_batch", hash_to_curve_batch_benchmark,
+        BATCH_ITERATIONS, HASH_BATCH);
+    run("crypto_scalarmult_map_to_curve", map_to_curve_benchmark, N, 1);
+    for (size_t i = 0; i < sizeof(backends) / sizeof(backends[0]); i++) {
+        if (crypto_scalarmult_force_backend(backends[i]) != 0) continue;
+        snprintf(name, sizeof(name), "crypto_scalarmult (%s backend)", backends[i]);
+        run(name, scalarmult_benchmark, BACKEND_ITERATIONS, 1);
     }
+    crypto_scalarmult_force_backend(NULL);
+    run("crypto_scalarmult_base", scalarmult_base_benchmark, N, 1);
+    run("crypto_scalarmult_prepared", scalarmult_prepared_benchmark, N, 1);
+    run("crypto_scalarmult_table_find + prepared", scalarmult_table_find_benchmark, N, 1);
+    run("crypto_scalarmult_projective", scalarmult_projective_benchmark, N, 1);
+    run("crypto_scalarmult_normalize", scalarmult_normalize_benchmark, N, 1);
+    run("crypto_scalarmult_vartime", scalarmult_vartime_benchmark, N, 1);
+    run("crypto_scalarmult_double", scalarmult_double_benchmark, N, 1);
+    run("crypto_scalarmult_double_vartime", scalarmult_double_vartime_benchmark, N, 1);
+    run("crypto_scalarmult_decompress", scalarmult_decompress_benchmark, N, 1);
+    run("crypto_scalarmult_compressed", scalarmult_compressed_benchmark, N, 1);
+    run("crypto_scalarmult_ecdh", scalarmult_ecdh_benchmark, N, 1);
+    run("crypto_scalarmult_ecdh_compressed", scalarmult_ecdh_compressed_benchmark, N, 1);
+    run("crypto_scalarmult_validate", scalarmult_validate_benchmark, N, 1);
+    run("crypto_scalarmult_scalar_mul", scalar_mul_benchmark, N, 1);
+    run("crypto_scalarmult_scalar_invert", scalar_invert_benchmark, N, 1);
+    run("crypto_scalarmult_schnorr_sign", schnorr_sign_benchmark, N, 1);
+    run("crypto_scalarmult_schnorr_verify", schnorr_verify_benchmark, N, 1);
+    // hash_msgs holds the messages of the signatures
+    run("crypto_scalarmult_schnorr_verify_batch", schnorr_verify_batch_benchmark,
+        BATCH_ITERATIONS, INPUTS);
 
-    const double blank = median(blank_measurements, N);
-    const double sample = median(sample_measurements, N);
-    printf("MEASURED BLANK: %.0f\n", blank);
-    printf("MEASURED SAMPLE: %.0f\n", sample);
-    printf("----------------------------------------------------------------------\n");
-    printf("MEASURED DIFF: %.0f\n", sample - blank);
-    printf("  i.e. %.0fkcc\n", (sample - blank)/1000);
+    // Sweep the window widths and report the fastest one
+    for (window_width = 4; window_width <= 6; window_width++) {
+        snprintf(name, sizeof(name), "crypto_scalarmult_windowed (width = %u)", window_width);
+        const double median = run(name, scalarmult_windowed_benchmark, N, 1);
+        if (median >= 0 && (best_width == 0 || median < best_median)) {
+            best_width = window_width;
+            best_median = median;
+        }
+    }
+    if (best_width != 0) printf("fastest window width: %u\n", best_width);
+
+    // Compare four lane-parallel scalar multiplications with four separate ones
+    for (size_t i = 0; i < 4; i++) {
+        memcpy(&x4_keys[32*i], keys[i], 32);
+        memcpy(&x4_in[64*i], points[i], 64);
+    }
+    run("crypto_scalarmult_x4", scalarmult_x4_benchmark, N, 4);
+    run("crypto_scalarmult_x4 (sequential)", scalarmult_x4_sequential_benchmark, N, 4);
+
+    // Measure the per-operation cost of batches of growing size
+    for (size_t i = 0; i < BATCH_MAX; i++) {
+        memcpy(&batch_keys[32*i], keys[i % INPUTS], 32);
+        memcpy(&batch_in[64*i], points[i % INPUTS], 64);
+    }
+    run("crypto_scalarmult_validate_batch", scalarmult_validate_batch_benchmark,
+        BATCH_ITERATIONS, VALIDATE_BATCH);
+    for (batch_n = 1; batch_n <= BATCH_MAX; batch_n *= 2) {
+        snprintf(name, sizeof(name), "crypto_scalarmult_batch (n = %zu)", batch_n);
+        run(name, scalarmult_batch_benchmark, BATCH_ITERATIONS, batch_n);
+    }
+
+    // Measure how the throughput scales with the amount of threads
+    for (size_t i = 0; i < POOL_BATCH; i++) {
+        memcpy(&pool_keys[32*i], keys[i % INPUTS], 32);
+        memcpy(&pool_in[64*i], points[i % INPUTS], 64);
+    }
+    const long cpus = sysconf(_SC_NPROCESSORS_ONLN);
+    for (long threads = 1; threads <= cpus; threads *= 2) {
+        pool = crypto_scalarmult_pool_new(threads);
+        assert(pool != NULL);
+        snprintf(name, sizeof(name), "crypto_scalarmult_pool_batch (threads = %ld)", threads);
+        run(name, scalarmult_pool_benchmark, POOL_ITERATIONS, POOL_BATCH);
+        crypto_scalarmult_pool_free(pool);
+    }
+
+    // Measure the per-point cost of multi-scalar multiplication
+    multi_keys = malloc(32 * MULTI_MAX);
+    multi_in = malloc(64 * MULTI_MAX);
+    assert(multi_keys != NULL && multi_in != NULL);
+    for (size_t i = 0; i < MULTI_MAX; i++) {
+        for (size_t j = 0; j < 32; j++) multi_keys[32*i + j] = rand();
+        memcpy(&multi_in[64*i], points[i % INPUTS], 64);
+    }
+    for (size_t i = 0; i < sizeof(multi_sizes) / sizeof(multi_sizes[0]); i++) {
+        multi_n = multi_sizes[i];
+        snprintf(name, sizeof(name), "crypto_scalarmult_multi (n = %zu)", multi_n);
+        run(name, scalarmult_multi_benchmark, MULTI_ITERATIONS, multi_n);
+    }
+    free(multi_keys);
+    free(multi_in);
+
+    if (json_path != NULL) write_json(json_path);
+    if (compare_path != NULL && compare(compare_path, threshold) != 0) return 1;
     return 0;
 }
@@ -0,0 +1,24 @@
+/*
+Validation of encoded points without doing any scalar multiplication
+*/
+
+#include "ge.h"
+#include "scalarmult.h"
+
+int crypto_scalarmult_validate(const uint8_t *in)
+{
+    return ge_affine_point_on_curve(in) ? 0 : -1;
+}
+
+int crypto_scalarmult_validate_batch(uint8_t *bitmap, const uint8_t *in, size_t n)
+{
+    int ret = 0;
+
+    for (size_t i = 0; i < (n + 7) / 8; i++) bitmap[i] = 0;
+    for (size_t i = 0; i < n; i++) {
+        const int valid = ge_affine_point_on_curve(&in[64*i]);
+        bitmap[i / 8] |= valid << (i % 8);
+        if (!valid) ret = -1;
+    }
+    return ret;
+}
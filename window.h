@@ -0,0 +1,105 @@
+#ifndef CURVE13318_WINDOW_H_
+#define CURVE13318_WINDOW_H_
+
+#define window_compute crypto_scalarmult_curve13318_avx2_window_compute
+#define window_precompute crypto_scalarmult_curve13318_avx2_window_precompute
+#define window_select crypto_scalarmult_curve13318_avx2_window_select
+#define window_select_vartime crypto_scalarmult_curve13318_avx2_window_select_vartime
+#define window_compute_width crypto_scalarmult_curve13318_avx2_window_compute_width
+#define window_precompute_width crypto_scalarmult_curve13318_avx2_window_precompute_width
+#define window_select_width crypto_scalarmult_curve13318_avx2_window_select_width
+
+#include "ge.h"
+#include <inttypes.h>
+
+// Supported widths for the `*_width` functions below
+#define WINDOW_WIDTH_MIN 4
+#define WINDOW_WIDTH_MAX 6
+
+// Maximum amount of windows (for width 4) and of table entries (for width 6)
+#define WINDOW_DIGITS_MAX 64
+#define WINDOW_ENTRIES_MAX 32
+
+/*
+Decode a scalar into 51 signed 5-bit windows
+
+`w[0]` is the most significant window. Every window is stored in the same
+encoding as used by `ladder.asm`, i.e. a value in [16, 32] represents the
+negative window value (w - 32). The carry that ripples out of the most
+significant window is stored in `zeroth_window`. Bit 255 of the scalar is
+ignored.
+
+Arguments:
+  - w               Output windows
+  - zeroth_window   Output carry (0 or 1)
+  - key             Scalar (32 bytes)
+*/
+void window_compute(uint8_t w[51], uint8_t *zeroth_window, const uint8_t *key);
+
+/*
+Compute the lookup table [P, 2P, ..., 16P] for the point P
+
+The table is computed with the projective AVX2 formulas.
+*/
+void window_precompute(ge_opt ptable[16], const ge_opt p);
+
+/*
+Constant-time lookup of the signed window `bits` in a 16-entry table
+
+Selects the neutral element if the window is zero and negates the Y-coordinate
+if the window is negative. `dest` must be all zeros on entry.
+*/
+void window_select(ge_opt dest, uint8_t bits, const ge_opt *table);
+
+/*
+Variable-time version of `window_select`
+
+Returns:
+  0 if the window is zero (`dest` is not touched), 1 otherwise
+*/
+int window_select_vartime(ge_opt dest, uint8_t bits, const ge_opt *table);
+
+/*
+Decode a scalar into signed windows of `width` bits
+
+`digits[0]` is the *least* significant window, and every window is in
+[-2^(width-1), 2^(width-1)). The carry out of the most significant window is
+stored in `zeroth_window`. Bit 255 of the scalar is ignored.
+
+Returns:
+  The amount of windows, i.e. ceil(255 / width)
+*/
+unsigned int window_compute_width(int8_t digits[WINDOW_DIGITS_MAX], uint8_t *zeroth_window,
+                                  const uint8_t *key, unsigned int width);
+
+/*
+Compute the lookup table [P, 2P, ..., 2^(width-1) P] for the point P
+*/
+void window_precompute_width(ge_opt *ptable, const ge_opt p, unsigned int width);
+
+/*
+Constant-time lookup of the signed window `digit` in a 2^(width-1)-entry table
+
+`dest` must be all zeros on entry.
+*/
+void window_select_width(ge_opt dest, int8_t digit, const ge_opt *table, unsigned int width);
+
+/*
+Conditionally add an element, assumes dest == {0}
+*/
+static inline void window_cmov(ge_opt dest, const ge_opt src, uint32_t mask)
+{
+    for (unsigned int i = 0; i < 30; i++) {
+        dest[i] |= src[i] & mask;
+    }
+}
+
+/*
+Conditionally move the neutral element, assumes dest == {0}
+*/
+static inline void window_cmov_neutral(ge_opt dest, uint32_t mask)
+{
+    dest[10] = 1 & mask;
+}
+
+#endif // CURVE13318_WINDOW_H_